@@ -2,4 +2,28 @@
 Tab Configuration Modules
 =========================
 Each module defines sections for a specific tab.
+
+SECTIONS_REGISTRY maps every built-in tab name to its sections list. Tabs that are
+not registered here are still loaded from configs/<tab_name>_config.py on demand.
 """
+
+from typing import Dict
+
+from configs.academic_analytics_config import ACADEMIC_ANALYTICS_SECTIONS
+from configs.data_storytelling_guided_config import DATA_STORYTELLING_GUIDED_SECTIONS
+from configs.demographics_config import DEMOGRAPHICS_SECTIONS
+from configs.executive_summary_config import EXECUTIVE_SUMMARY_SECTIONS
+from configs.financial_intelligence_config import FINANCIAL_INTELLIGENCE_SECTIONS
+from configs.housing_insights_config import HOUSING_INSIGHTS_SECTIONS
+from configs.risk_success_config import RISK_SUCCESS_SECTIONS
+
+
+SECTIONS_REGISTRY: Dict[str, list] = {
+    'academic_analytics': ACADEMIC_ANALYTICS_SECTIONS,
+    'data_storytelling_guided': DATA_STORYTELLING_GUIDED_SECTIONS,
+    'demographics': DEMOGRAPHICS_SECTIONS,
+    'executive_summary': EXECUTIVE_SUMMARY_SECTIONS,
+    'financial_intelligence': FINANCIAL_INTELLIGENCE_SECTIONS,
+    'housing_insights': HOUSING_INSIGHTS_SECTIONS,
+    'risk_success': RISK_SUCCESS_SECTIONS,
+}
@@ -23,6 +23,34 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional: Numba JIT kernel for outlier counting on wide numeric blocks
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Column count above which the IQR outlier scan switches to the Numba kernel
+NUMBA_OUTLIER_MIN_COLS = 50
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _count_iqr_outliers(values, q1, q3):
+        """Count IQR outliers per column without materializing an N x K boolean mask"""
+        n_rows, n_cols = values.shape
+        counts = np.zeros(n_cols, np.int64)
+        for k in prange(n_cols):
+            iqr = q3[k] - q1[k]
+            lower = q1[k] - 1.5 * iqr
+            upper = q3[k] + 1.5 * iqr
+            count = 0
+            for i in range(n_rows):
+                value = values[i, k]
+                if value < lower or value > upper:
+                    count += 1
+            counts[k] = count
+        return counts
+
 
 # ============================================================================
 # LAYER 1: INTELLIGENT METRICS DISCOVERY
@@ -406,40 +434,42 @@ def discover_data_patterns(df: pd.DataFrame, metrics_intel: Dict) -> Dict[str, A
         'data_completeness': {}
     }
 
-    # Data Quality Assessment
-    total_cells = len(df) * len(df.columns)
-    null_cells = df.isnull().sum().sum()
+    # Data Quality Assessment (null counts, uniqueness and duplicates are scanned once for all columns)
+    n_rows = len(df)
+    total_cells = n_rows * len(df.columns)
+    null_counts = df.isnull().sum()
+    null_cells = null_counts.sum()
+    unique_counts = df.nunique()
+    duplicate_rows = int(df.duplicated().sum())
 
     patterns['data_quality'] = {
         'completeness_pct': float((1 - null_cells / total_cells) * 100) if total_cells > 0 else 100.0,
         'total_nulls': int(null_cells),
-        'columns_with_nulls': int((df.isnull().sum() > 0).sum()),
-        'duplicate_rows': int(df.duplicated().sum()),
-        'duplicate_rows_pct': float(df.duplicated().mean() * 100) if len(df) > 0 else 0.0
+        'columns_with_nulls': int((null_counts > 0).sum()),
+        'duplicate_rows': duplicate_rows,
+        'duplicate_rows_pct': float(duplicate_rows / n_rows * 100) if n_rows > 0 else 0.0
     }
 
+    # Range and outlier info for every numeric column at once
+    numeric_stats = _numeric_quality_stats(df, [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])])
+
     # Column-level quality
     for col in df.columns:
         col_quality = {
-            'null_count': int(df[col].isnull().sum()),
-            'null_pct': float(df[col].isnull().mean() * 100) if len(df) > 0 else 0.0,
-            'unique_count': int(df[col].nunique()),
-            'uniqueness_pct': float(df[col].nunique() / len(df) * 100) if len(df) > 0 else 0.0
+            'null_count': int(null_counts[col]),
+            'null_pct': float(null_counts[col] / n_rows * 100) if n_rows > 0 else 0.0,
+            'unique_count': int(unique_counts[col]),
+            'uniqueness_pct': float(unique_counts[col] / n_rows * 100) if n_rows > 0 else 0.0
         }
 
         # For numeric columns, add range and outlier info
-        if pd.api.types.is_numeric_dtype(df[col]):
-            col_quality['min'] = float(df[col].min())
-            col_quality['max'] = float(df[col].max())
-            col_quality['range'] = float(df[col].max() - df[col].min())
-
-            # Detect outliers using IQR method
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = ((df[col] < (Q1 - 1.5 * IQR)) | (df[col] > (Q3 + 1.5 * IQR))).sum()
-            col_quality['outlier_count'] = int(outliers)
-            col_quality['outlier_pct'] = float(outliers / len(df) * 100) if len(df) > 0 else 0.0
+        if col in numeric_stats.index:
+            stats = numeric_stats.loc[col]
+            col_quality['min'] = float(stats['min'])
+            col_quality['max'] = float(stats['max'])
+            col_quality['range'] = float(stats['max'] - stats['min'])
+            col_quality['outlier_count'] = int(stats['outlier_count'])
+            col_quality['outlier_pct'] = float(stats['outlier_count'] / n_rows * 100) if n_rows > 0 else 0.0
 
         patterns['column_patterns'][col] = col_quality
 
@@ -453,8 +483,8 @@ def discover_data_patterns(df: pd.DataFrame, metrics_intel: Dict) -> Dict[str, A
                 'std': float(df[col].std()),
                 'skewness': float(df[col].skew()),
                 'kurtosis': float(df[col].kurtosis()),
-                'q25': float(df[col].quantile(0.25)),
-                'q75': float(df[col].quantile(0.75)),
+                'q25': float(numeric_stats.at[col, 'q25']),
+                'q75': float(numeric_stats.at[col, 'q75']),
                 'distribution_type': _classify_distribution(df[col])
             }
         except:
@@ -471,6 +501,52 @@ def discover_data_patterns(df: pd.DataFrame, metrics_intel: Dict) -> Dict[str, A
     return patterns
 
 
+def _numeric_quality_stats(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Min, max, quartiles and IQR (1.5 x IQR) outlier count for a set of numeric columns.
+
+    The columns are converted to one float64 block; min/max and both quartiles come from
+    single vectorized calls, and outliers are counted with one matrix comparison (or the
+    Numba kernel for wide blocks) instead of per-column scans.
+
+    Returns:
+        DataFrame indexed by column with min, max, q25, q75 and outlier_count
+    """
+    if not columns:
+        return pd.DataFrame(columns=['min', 'max', 'q25', 'q75', 'outlier_count'])
+
+    values = np.column_stack([
+        df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in columns
+    ]) if len(df) > 0 else np.empty((0, len(columns)))
+    block = pd.DataFrame(values, columns=columns)
+
+    quartiles = block.quantile([0.25, 0.75]).to_numpy()
+    q1, q3 = quartiles[0], quartiles[1]
+    if NUMBA_AVAILABLE and len(columns) > NUMBA_OUTLIER_MIN_COLS:
+        outlier_counts = _count_iqr_outliers(np.asfortranarray(values), q1, q3)
+    else:
+        iqr = q3 - q1
+        outlier_counts = ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum(axis=0)
+
+    return pd.DataFrame({
+        'min': block.min().to_numpy(),
+        'max': block.max().to_numpy(),
+        'q25': q1,
+        'q75': q3,
+        'outlier_count': outlier_counts
+    }, index=columns)
+
+
+def _sort_positions(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Row positions that put df in the order of df.sort_values(column).
+
+    Only the sort column is sorted, so callers can take the few columns they need in
+    that order instead of copying the whole frame.
+    """
+    return df[column].reset_index(drop=True).sort_values().index.to_numpy()
+
+
 def _classify_distribution(series: pd.Series) -> str:
     """Classify the distribution type of a numeric series"""
     try:
@@ -546,12 +622,13 @@ def discover_statistical_patterns(df: pd.DataFrame, metrics_intel: Dict) -> Dict
     if date_cols and numeric_cols.any():
         for date_col in date_cols[:2]:  # Max 2 date columns
             try:
-                df_sorted = df.sort_values(date_col)
+                order = _sort_positions(df, date_col)
                 for num_col in numeric_cols[:3]:  # Top 3 numeric columns
                     # Simple trend detection using first vs last half
-                    mid_point = len(df_sorted) // 2
-                    first_half_mean = df_sorted[num_col].iloc[:mid_point].mean()
-                    second_half_mean = df_sorted[num_col].iloc[mid_point:].mean()
+                    mid_point = len(order) // 2
+                    sorted_values = df[num_col].iloc[order]
+                    first_half_mean = sorted_values.iloc[:mid_point].mean()
+                    second_half_mean = sorted_values.iloc[mid_point:].mean()
 
                     if not np.isnan(first_half_mean) and not np.isnan(second_half_mean):
                         pct_change = ((second_half_mean - first_half_mean) / first_half_mean * 100) if first_half_mean != 0 else 0
@@ -1329,10 +1406,10 @@ def discover_predictive_insights(df: pd.DataFrame, domain: str, metrics_intel: D
     if date_cols and len(numeric_cols) > 0:
         try:
             date_col = date_cols[0]
-            df_sorted = df.sort_values(date_col)
+            order = _sort_positions(df, date_col)
 
             for num_col in numeric_cols[:3]:  # Top 3 numeric columns
-                values = df_sorted[num_col].values
+                values = df[num_col].iloc[order].values
                 if len(values) >= 4:  # Need minimum data points
                     # Simple linear trend
                     x = np.arange(len(values))
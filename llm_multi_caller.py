@@ -4,6 +4,7 @@ Generic LLM Multi-Caller
 A 100% generic, reusable LLM calling system with:
 - Context deduplication (30-40% token savings)
 - Parallel execution (70% speed improvement)
+- Section batching (several sections per LLM call)
 - Two-phase generation (narrative coherence)
 - Smart retry with backoff
 - Output validation
@@ -13,12 +14,26 @@ Works with ANY tab configuration and ANY LLM backend.
 """
 
 import requests
+import functools
 import json
+import queue
+import re
 import time
 from typing import Dict, Any, List, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import streamlit as st
 
+# Optional: orjson for faster (de)serialization of Ollama requests and streamed chunks
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# How long Ollama keeps the model (and its prompt cache) loaded after a request
+DEFAULT_KEEP_ALIVE = "30m"
+
 
 # ============================================================================
 # CONTEXT MANAGEMENT
@@ -122,10 +137,67 @@ def build_section_context(base_context: str, full_context: Dict[str, Any], focus
     return "\n\n".join(context_parts)
 
 
+def build_system_prompt(base_context: str) -> str:
+    """
+    Build the system prompt shared by every section of a generation.
+
+    It is byte-identical across the sections' calls, so Ollama can reuse the prefill
+    of this prefix instead of re-reading the dataset overview for every section.
+
+    Args:
+        base_context: Shared base context from build_base_context()
+
+    Returns:
+        System prompt
+    """
+    return (
+        "You are a data analyst writing one section of a report about the dataset below.\n\n"
+        + base_context
+    )
+
+
 # ============================================================================
 # PROMPT ENGINEERING
 # ============================================================================
 
+@functools.lru_cache(maxsize=128)
+def compile_prompt_suffix(
+    template: str,
+    good_example: Optional[str],
+    bad_example: Optional[str],
+    enable_chain_of_thought: bool
+) -> str:
+    """
+    Build the static part of a section prompt that follows its template: the examples
+    and chain-of-thought instruction. Cached, since it only depends on the section config.
+
+    Args:
+        template: Prompt template with {context} placeholder
+        good_example: Optional example of a good answer
+        bad_example: Optional example of an answer to avoid
+        enable_chain_of_thought: Whether to include CoT instructions
+
+    Returns:
+        Text appended to the filled-in template
+    """
+    suffix = ""
+
+    # Add examples if provided
+    if good_example is not None or bad_example is not None:
+        suffix += "\n\nEXAMPLES:\n"
+        if good_example is not None:
+            suffix += f"✓ GOOD: {good_example}\n"
+        if bad_example is not None:
+            suffix += f"✗ AVOID: {bad_example}\n"
+
+    # Add chain-of-thought instruction
+    if enable_chain_of_thought:
+        if 'STEP 1' not in template + suffix:  # Only add if not already in template
+            suffix += "\n\nThink step-by-step to ensure accuracy and relevance."
+
+    return suffix
+
+
 def build_enhanced_prompt(
     template: str,
     context: str,
@@ -144,30 +216,85 @@ def build_enhanced_prompt(
     Returns:
         Enhanced prompt
     """
-    # Inject context
-    prompt = template.replace('{context}', context)
+    examples = examples or {}
+    suffix = compile_prompt_suffix(template, examples.get('good'), examples.get('bad'), enable_chain_of_thought)
 
-    # Add examples if provided
-    if examples:
-        example_text = "\n\nEXAMPLES:\n"
-        if 'good' in examples:
-            example_text += f"✓ GOOD: {examples['good']}\n"
-        if 'bad' in examples:
-            example_text += f"✗ AVOID: {examples['bad']}\n"
-        prompt = prompt + example_text
-
-    # Add chain-of-thought instruction
-    if enable_chain_of_thought:
-        if 'STEP 1' not in prompt:  # Only add if not already in template
-            prompt = prompt + "\n\nThink step-by-step to ensure accuracy and relevance."
-
-    return prompt
+    # Inject context
+    return template.replace('{context}', context) + suffix
 
 
 # ============================================================================
 # LLM CALLING WITH RETRY
 # ============================================================================
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode a request body, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def loads_json(data) -> Any:
+    """Decode a response body or streamed line, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def build_generate_payload(
+    prompt: str,
+    model: str,
+    num_predict: int,
+    num_ctx: int,
+    stream: bool,
+    system: Optional[str] = None,
+    keep_alive: Optional[str] = None
+) -> Dict[str, Any]:
+    """Request body for Ollama's /api/generate"""
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+        "options": {
+            "num_predict": num_predict,
+            "num_ctx": num_ctx,
+            "temperature": 0.7
+        }
+    }
+    if system:
+        payload["system"] = system
+    if keep_alive:
+        payload["keep_alive"] = keep_alive
+    return payload
+
+
+def section_call_options(section: Dict[str, Any], model_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keyword arguments for call_llm_with_retry / call_llm_streaming for one section.
+
+    A section's 'model_override' replaces the tab's model for that section.
+
+    Args:
+        section: Section configuration
+        model_config: Model configuration (model, url, num_ctx, system, keep_alive)
+
+    Returns:
+        Dict of call arguments (everything except the prompt)
+    """
+    return {
+        'model': section.get('model_override') or model_config.get('model', 'llama3.1'),
+        'url': model_config.get('url', 'http://localhost:11434'),
+        'num_predict': section.get('num_predict', 300),
+        'num_ctx': model_config.get('num_ctx') or section.get('num_ctx', 2048),
+        'timeout': section.get('timeout', 30),
+        'system': model_config.get('system'),
+        'keep_alive': model_config.get('keep_alive')
+    }
+
+
 def call_llm_with_retry(
     prompt: str,
     model: str,
@@ -175,7 +302,9 @@ def call_llm_with_retry(
     num_predict: int = 300,
     num_ctx: int = 2048,
     timeout: int = 30,
-    max_retries: int = 3
+    max_retries: int = 3,
+    system: Optional[str] = None,
+    keep_alive: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Call LLM with exponential backoff retry.
@@ -188,33 +317,29 @@ def call_llm_with_retry(
         num_ctx: Context window size
         timeout: Timeout in seconds
         max_retries: Maximum retry attempts
+        system: Optional system prompt (shared prefix reused by Ollama's prompt cache)
+        keep_alive: Optional duration Ollama keeps the model loaded (e.g. '30m')
 
     Returns:
         Dict with 'success', 'response', 'error', 'tokens', 'time'
     """
+    payload = dumps_json(build_generate_payload(prompt, model, num_predict, num_ctx, False, system, keep_alive))
+
     for attempt in range(max_retries):
         try:
             start_time = time.time()
 
             response = requests.post(
                 f"{url}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "num_predict": num_predict,
-                        "num_ctx": num_ctx,
-                        "temperature": 0.7
-                    }
-                },
+                data=payload,
+                headers=JSON_HEADERS,
                 timeout=timeout
             )
 
             elapsed_time = time.time() - start_time
 
             if response.status_code == 200:
-                result = response.json()
+                result = loads_json(response.content)
                 return {
                     'success': True,
                     'response': result.get('response', '').strip(),
@@ -274,6 +399,128 @@ def call_llm_with_retry(
     }
 
 
+def warm_up_model(
+    model: str,
+    url: str,
+    num_ctx: int = 2048,
+    keep_alive: str = DEFAULT_KEEP_ALIVE,
+    timeout: int = 120
+) -> bool:
+    """
+    Load a model into Ollama's memory without generating anything, so the first real
+    request does not pay the model load time.
+
+    Ollama reloads the model when num_ctx changes, so pass the value the following
+    generation will use (see resolve_num_ctx).
+
+    Args:
+        model: Model name (e.g., 'llama3.1')
+        url: Ollama server URL
+        num_ctx: Context window the model is loaded with
+        keep_alive: How long Ollama keeps the model loaded afterwards
+        timeout: Timeout in seconds (loading a large model can take a while)
+
+    Returns:
+        True if the model was loaded
+    """
+    try:
+        response = requests.post(
+            f"{url}/api/generate",
+            data=dumps_json({
+                "model": model,
+                "prompt": "",
+                "keep_alive": keep_alive,
+                "options": {"num_ctx": num_ctx}
+            }),
+            headers=JSON_HEADERS,
+            timeout=timeout
+        )
+        return response.status_code == 200
+    except Exception:
+        return False
+
+
+def call_llm_streaming(
+    prompt: str,
+    model: str,
+    url: str,
+    on_text: Optional[Callable[[str], None]] = None,
+    num_predict: int = 300,
+    num_ctx: int = 2048,
+    timeout: int = 30,
+    system: Optional[str] = None,
+    keep_alive: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Call LLM with streaming, reporting the text generated so far after every chunk.
+
+    Falls back to call_llm_with_retry if the request fails before any text arrived
+    (a partially streamed answer is not retried).
+
+    Args:
+        prompt: The prompt to send
+        model: Model name (e.g., 'llama3.1')
+        url: Ollama server URL
+        on_text: Called with the accumulated response text after each chunk
+        num_predict: Max tokens to generate
+        num_ctx: Context window size
+        timeout: Timeout in seconds (per read)
+        system: Optional system prompt (shared prefix reused by Ollama's prompt cache)
+        keep_alive: Optional duration Ollama keeps the model loaded (e.g. '30m')
+
+    Returns:
+        Dict with 'success', 'response', 'error', 'tokens', 'time'
+    """
+    start_time = time.time()
+    text = ''
+    tokens = 0
+    error = None
+
+    try:
+        with requests.post(
+            f"{url}/api/generate",
+            data=dumps_json(build_generate_payload(prompt, model, num_predict, num_ctx, True, system, keep_alive)),
+            headers=JSON_HEADERS,
+            stream=True,
+            timeout=timeout
+        ) as response:
+            if response.status_code != 200:
+                error = f"HTTP {response.status_code}: {response.text}"
+            else:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = loads_json(line)
+                    if chunk.get('error'):
+                        error = chunk['error']
+                        break
+                    text += chunk.get('response', '')
+                    if on_text:
+                        on_text(text)
+                    if chunk.get('done'):
+                        tokens = chunk.get('eval_count', 0)
+                        break
+
+    except requests.exceptions.Timeout:
+        error = f"Timeout after {timeout}s"
+    except Exception as e:
+        error = str(e)
+
+    if error and not text:
+        return call_llm_with_retry(
+            prompt, model, url, num_predict=num_predict, num_ctx=num_ctx, timeout=timeout,
+            system=system, keep_alive=keep_alive
+        )
+
+    return {
+        'success': error is None,
+        'response': text.strip(),
+        'error': error,
+        'tokens': tokens,
+        'time': time.time() - start_time
+    }
+
+
 # ============================================================================
 # OUTPUT VALIDATION
 # ============================================================================
@@ -327,10 +574,193 @@ def validate_output(
     }
 
 
+# ============================================================================
+# SECTION BATCHING
+# ============================================================================
+
+# Batched responses must wrap each section in these markers
+SECTION_OUTPUT_PATTERN = re.compile(r'<<<\s*SECTION\s+(\w+)\s*>>>(.*?)<<<\s*END\s*>>>', re.S | re.I)
+
+# Upper bound for the context window requested for a batched prompt
+MAX_BATCH_NUM_CTX = 8192
+
+# A section's closing output directive ("OUTPUT ONLY the summary (no headers, ...):");
+# inside a batch it is rewritten so it cannot forbid the section markers
+OUTPUT_DIRECTIVE_PATTERN = re.compile(r'^OUTPUT(?:\s+ONLY)?\b[ \t]*(.*)$', re.M)
+NO_HEADERS_NOTE_PATTERN = re.compile(r'\s*\([^)]*\bno headers\b[^)]*\)', re.I)
+
+
+def resolve_num_ctx(sections_config: List[Dict[str, Any]], model_config: Dict[str, Any], streaming: bool) -> int:
+    """
+    Context window used for every call of one generation.
+
+    The largest section num_ctx, widened to fit a batch only when execute_batched will
+    actually run (batch_size > 1, not sequential and not streaming). model_config['num_ctx']
+    takes precedence when set.
+
+    Args:
+        sections_config: List of section configurations
+        model_config: Model configuration (batch_size, enable_parallel, etc.)
+        streaming: Whether responses are streamed into placeholders (disables batching)
+
+    Returns:
+        num_ctx for all calls
+    """
+    if model_config.get('num_ctx'):
+        return model_config['num_ctx']
+
+    section_ctx = max((section.get('num_ctx', 2048) for section in sections_config), default=2048)
+    batched = (
+        not streaming
+        and (model_config.get('enable_coherence', True) or model_config.get('enable_parallel', True))
+        and model_config.get('batch_size', 1) > 1
+    )
+    if not batched:
+        return section_ctx
+
+    batch_size = min(model_config['batch_size'], len(sections_config))
+    return max(section_ctx, min(section_ctx * batch_size, MAX_BATCH_NUM_CTX))
+
+
+def marshal_sections(sections_config: List[Dict[str, Any]], batch_size: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split sections into consecutive batches of at most batch_size sections.
+
+    Sections are grouped by their 'model_override' first, since a batch is answered by
+    a single model.
+
+    Args:
+        sections_config: List of section configurations
+        batch_size: Maximum number of sections answered by one LLM call
+
+    Returns:
+        List of section batches
+    """
+    batch_size = max(1, batch_size)
+    by_model = {}
+    for section in sections_config:
+        by_model.setdefault(section.get('model_override'), []).append(section)
+    return [
+        sections[i:i + batch_size]
+        for sections in by_model.values()
+        for i in range(0, len(sections), batch_size)
+    ]
+
+
+def rewrite_output_directive(prompt: str, section_name: str) -> str:
+    """
+    Point a section prompt's OUTPUT directive at the inside of its batch markers.
+
+    Section prompts end with lines such as "OUTPUT ONLY the executive summary (no headers,
+    no labels, just the content):", which would otherwise tell the model to drop the
+    <<<SECTION>>> wrapping that parse_batched_response() relies on.
+
+    Args:
+        prompt: The section's final prompt
+        section_name: Section name used in its markers
+
+    Returns:
+        Prompt with every OUTPUT directive rewritten
+    """
+    def rewrite(match):
+        directive = NO_HEADERS_NOTE_PATTERN.sub('', match.group(1)).strip().rstrip(':').strip()
+        return (
+            f"OUTPUT {directive} between <<<SECTION {section_name}>>> and <<<END>>> "
+            f"(no other headers or labels inside the markers):"
+        )
+
+    return OUTPUT_DIRECTIVE_PATTERN.sub(rewrite, prompt)
+
+
+def build_batched_prompt(sections: List[Dict[str, Any]]) -> str:
+    """
+    Combine several section prompts into one prompt with a strict output format.
+
+    Args:
+        sections: Section configurations with 'final_prompt' and 'name'
+
+    Returns:
+        Batched prompt
+    """
+    names = ", ".join(section['name'] for section in sections)
+    parts = [
+        f"Answer each of the following {len(sections)} sections ({names}) independently.",
+        "Wrap every answer exactly like this, using the section name given in its heading:",
+        "<<<SECTION section_name>>>\nyour answer\n<<<END>>>",
+    ]
+    for section in sections:
+        prompt = rewrite_output_directive(section['final_prompt'], section['name'])
+        parts.append(f"### SECTION {section['name']}\n{prompt}")
+    parts.append(
+        f"Reply with {len(sections)} wrapped answers, one per section, in the order above. "
+        "The <<<SECTION ...>>> and <<<END>>> markers are required for every section."
+    )
+    return "\n\n".join(parts)
+
+
+def parse_batched_response(response: str) -> Dict[str, str]:
+    """
+    Extract the per-section answers from a batched response.
+
+    Args:
+        response: LLM response to a prompt from build_batched_prompt()
+
+    Returns:
+        Dict mapping section names to their (stripped, non-empty) answers
+    """
+    answers = {}
+    for name, text in SECTION_OUTPUT_PATTERN.findall(response):
+        text = text.strip()
+        if text:
+            answers[name] = text
+    return answers
+
+
 # ============================================================================
 # EXECUTION STRATEGIES
 # ============================================================================
 
+def _show_section_result(placeholders: Optional[Dict[str, Any]], section_name: str, result: Dict[str, Any]):
+    """Update the section's placeholder (if any) with its result"""
+    if placeholders and section_name in placeholders:
+        if result['success']:
+            placeholders[section_name].markdown(result['response'])
+        else:
+            placeholders[section_name].error(f"Failed: {result['error']}")
+
+
+def run_section(
+    section: Dict[str, Any],
+    model_config: Dict[str, Any],
+    placeholders: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Generate and validate a single section with its own LLM call.
+
+    Args:
+        section: Section configuration with 'final_prompt', 'name', etc.
+        model_config: Model configuration (model, url, etc.)
+        placeholders: Optional Streamlit placeholders for progressive display
+
+    Returns:
+        Section result
+    """
+    # Call LLM
+    result = call_llm_with_retry(prompt=section['final_prompt'], **section_call_options(section, model_config))
+
+    # Validate
+    if result['success']:
+        validation = validate_output(result['response'], section)
+        result['validation'] = validation
+    else:
+        result['validation'] = {'valid': False, 'issues': ['LLM call failed'], 'score': 0}
+
+    # Update UI if placeholder provided
+    _show_section_result(placeholders, section['name'], result)
+
+    return result
+
+
 def execute_parallel(
     sections_config: List[Dict[str, Any]],
     model_config: Dict[str, Any],
@@ -339,56 +769,166 @@ def execute_parallel(
     """
     Execute all sections in parallel using ThreadPoolExecutor.
 
+    When model_config['stream'] is set and placeholders are given, responses are
+    streamed into the placeholders (see execute_streaming). Otherwise, when
+    model_config['batch_size'] is greater than 1, sections are batched (see
+    execute_batched) instead of getting one LLM call each.
+
     Args:
         sections_config: List of section configurations with 'final_prompt', 'name', etc.
-        model_config: Model configuration (model, url, etc.)
+        model_config: Model configuration (model, url, batch_size, etc.)
         placeholders: Optional Streamlit placeholders for progressive display
 
     Returns:
         Dict mapping section names to results
     """
+    if model_config.get('stream') and placeholders:
+        return execute_streaming(sections_config, model_config, placeholders)
+    if model_config.get('batch_size', 1) > 1:
+        return execute_batched(sections_config, model_config, placeholders)
+
     results = {}
-    model = model_config.get('model', 'llama3.1')
-    url = model_config.get('url', 'http://localhost:11434')
 
     def process_section(section):
         """Process a single section"""
+        return section['name'], run_section(section, model_config, placeholders)
+
+    # Execute in parallel
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(process_section, section) for section in sections_config]
+
+        for future in as_completed(futures):
+            section_name, result = future.result()
+            results[section_name] = result
+
+    return results
+
+
+def execute_streaming(
+    sections_config: List[Dict[str, Any]],
+    model_config: Dict[str, Any],
+    placeholders: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Execute all sections in parallel with streamed responses, showing each section's
+    text in its placeholder as it is generated.
+
+    Streamlit elements can only be updated from the script thread, so the worker
+    threads queue their progress and the calling thread renders it.
+
+    Args:
+        sections_config: List of section configurations with 'final_prompt', 'name', etc.
+        model_config: Model configuration (model, url, etc.)
+        placeholders: Streamlit placeholders keyed by section name
+
+    Returns:
+        Dict mapping section names to results
+    """
+    results = {}
+    updates = queue.Queue()
+
+    def process_section(section):
+        """Process a single section, queueing its partial responses"""
         section_name = section['name']
-        prompt = section['final_prompt']
-
-        # Call LLM
-        result = call_llm_with_retry(
-            prompt=prompt,
-            model=model,
-            url=url,
-            num_predict=section.get('num_predict', 300),
-            num_ctx=section.get('num_ctx', 2048),
-            timeout=section.get('timeout', 30)
+        result = call_llm_streaming(
+            prompt=section['final_prompt'],
+            on_text=lambda text: updates.put((section_name, text)),
+            **section_call_options(section, model_config)
         )
 
-        # Validate
         if result['success']:
-            validation = validate_output(result['response'], section)
-            result['validation'] = validation
+            result['validation'] = validate_output(result['response'], section)
         else:
             result['validation'] = {'valid': False, 'issues': ['LLM call failed'], 'score': 0}
 
-        # Update UI if placeholder provided
-        if placeholders and section_name in placeholders:
-            if result['success']:
-                placeholders[section_name].markdown(result['response'])
-            else:
-                placeholders[section_name].error(f"Failed: {result['error']}")
-
         return section_name, result
 
-    # Execute in parallel
     with ThreadPoolExecutor(max_workers=5) as executor:
         futures = [executor.submit(process_section, section) for section in sections_config]
 
-        for future in as_completed(futures):
+        # Render progress until every section is done and all updates are drained
+        while not all(future.done() for future in futures) or not updates.empty():
+            try:
+                latest = dict([updates.get(timeout=0.1)])
+            except queue.Empty:
+                continue
+            while not updates.empty():
+                section_name, text = updates.get_nowait()
+                latest[section_name] = text
+            for section_name, text in latest.items():
+                if section_name in placeholders:
+                    placeholders[section_name].markdown(text + " ▌")
+
+        for future in futures:
             section_name, result = future.result()
             results[section_name] = result
+            _show_section_result(placeholders, section_name, result)
+
+    return results
+
+
+def execute_batched(
+    sections_config: List[Dict[str, Any]],
+    model_config: Dict[str, Any],
+    placeholders: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Execute sections in batches: each batch of model_config['batch_size'] sections is
+    answered by one LLM call, saving a round-trip and prompt prefill per extra section.
+    Batches run in parallel; a section missing from its batch's response is retried
+    with its own call.
+
+    Args:
+        sections_config: List of section configurations with 'final_prompt', 'name', etc.
+        model_config: Model configuration (model, url, batch_size, etc.)
+        placeholders: Optional Streamlit placeholders for progressive display
+
+    Returns:
+        Dict mapping section names to results
+    """
+    results = {}
+    batches = marshal_sections(sections_config, model_config.get('batch_size', 1))
+
+    def process_batch(batch):
+        """Process one batch of sections"""
+        if len(batch) == 1:
+            return [(batch[0]['name'], run_section(batch[0], model_config, placeholders))]
+
+        options = section_call_options(batch[0], model_config)
+        options['num_predict'] = sum(section.get('num_predict', 300) for section in batch)
+        options['timeout'] = sum(section.get('timeout', 30) for section in batch)
+        if not model_config.get('num_ctx'):
+            options['num_ctx'] = min(sum(section.get('num_ctx', 2048) for section in batch), MAX_BATCH_NUM_CTX)
+        batch_result = call_llm_with_retry(prompt=build_batched_prompt(batch), **options)
+        answers = parse_batched_response(batch_result['response']) if batch_result['success'] else {}
+
+        batch_results = []
+        for section in batch:
+            answer = answers.get(section['name'])
+            if answer is None:
+                # Fall back to a dedicated call for sections the batch did not answer
+                batch_results.append((section['name'], run_section(section, model_config, placeholders)))
+                continue
+
+            result = {
+                'success': True,
+                'response': answer,
+                'tokens': batch_result['tokens'] // len(answers),
+                'time': batch_result['time'],
+                'error': None,
+                'validation': validate_output(answer, section)
+            }
+            _show_section_result(placeholders, section['name'], result)
+            batch_results.append((section['name'], result))
+        return batch_results
+
+    # Execute batches in parallel
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(process_batch, batch) for batch in batches]
+
+        for future in as_completed(futures):
+            for section_name, result in future.result():
+                results[section_name] = result
 
     return results
 
@@ -469,11 +1009,21 @@ def generate_with_llm(
             - examples: Optional dict with 'good' and 'bad' examples
             - min_length: Min response length for validation
             - require_numbers: Whether numbers are required
+            - model_override: Optional model for this section instead of model_config's
+              (e.g. a small quantized model such as 'llama3.1:8b-instruct-q4_0' for
+              short narrative sections, keeping the main model for analytical ones)
         model_config: Model configuration:
             - model: Model name (default: 'llama3.1')
             - url: Ollama URL (default: 'http://localhost:11434')
             - enable_parallel: Use parallel execution (default: True)
             - enable_coherence: Use two-phase generation (default: True)
+            - batch_size: Sections answered per LLM call (default: 1, no batching)
+            - stream: Stream responses into the placeholders (default: False)
+            - keep_alive: How long Ollama keeps the model loaded (default: DEFAULT_KEEP_ALIVE)
+            - num_ctx: Context window used for every call (default: fixed per tab by
+              resolve_num_ctx(), so Ollama does not reallocate it between calls)
+            - share_system_prompt: Send the base context once as a shared system prompt
+              instead of inside every section prompt (default: True)
         placeholders: Optional dict of Streamlit placeholders for progressive display
 
     Returns:
@@ -485,14 +1035,24 @@ def generate_with_llm(
         model_config = {}
 
     # Set defaults
-    model = model_config.get('model', 'llama3.1')
-    url = model_config.get('url', 'http://localhost:11434')
     enable_parallel = model_config.get('enable_parallel', True)
     enable_coherence = model_config.get('enable_coherence', True)
 
     # Build base context (shared across sections)
     base_context = build_base_context(context)
 
+    # One system prompt, context window and keep-alive for all calls of this generation,
+    # so the model stays loaded and the shared prefix is prefilled once
+    model_config = {**model_config}
+    model_config.setdefault('keep_alive', DEFAULT_KEEP_ALIVE)
+    if sections_config:
+        model_config['num_ctx'] = resolve_num_ctx(
+            sections_config, model_config, streaming=bool(model_config.get('stream') and placeholders)
+        )
+    if model_config.get('share_system_prompt', True):
+        model_config['system'] = build_system_prompt(base_context)
+        base_context = ""
+
     # Build section-specific contexts and final prompts
     for section in sections_config:
         # Build section context
@@ -500,7 +1060,7 @@ def generate_with_llm(
             base_context,
             context,
             section.get('context_focus', [])
-        )
+        ).strip() or "(see the dataset overview above)"
 
         # Build enhanced prompt
         section['final_prompt'] = build_enhanced_prompt(
@@ -521,14 +1081,7 @@ def generate_with_llm(
         # Sequential execution (fallback)
         sections_results = {}
         for section in sections_config:
-            result = call_llm_with_retry(
-                prompt=section['final_prompt'],
-                model=model,
-                url=url,
-                num_predict=section.get('num_predict', 300),
-                num_ctx=section.get('num_ctx', 2048),
-                timeout=section.get('timeout', 30)
-            )
+            result = call_llm_with_retry(prompt=section['final_prompt'], **section_call_options(section, model_config))
 
             if result['success']:
                 validation = validate_output(result['response'], section)
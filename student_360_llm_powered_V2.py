@@ -35,11 +35,13 @@ import altair as alt
 import requests
 import json
 import hashlib
+import zlib
 import psutil
 import platform
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 # Import journey generation modules
@@ -67,6 +69,13 @@ except ImportError as e:
     FULLY_DYNAMIC_DISCOVERY_AVAILABLE = False
     print(f"Warning: Fully dynamic discovery system not available: {e}")
 
+# Optional: orjson for faster prompt JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ====================================================================================
 # PAGE CONFIGURATION
 # ====================================================================================
@@ -792,6 +801,39 @@ def check_ollama_connection(ollama_url: str) -> bool:
     except:
         return False
 
+# Seconds a successful /api/tags probe is trusted before re-checking the same URL
+OLLAMA_PROBE_TTL_SECONDS = 30
+
+# _build_ollama_options multiplies the requested timeout by this for Cloudflare endpoints
+CLOUDFLARE_TIMEOUT_MULTIPLIER = 6
+
+# Effective per-attempt Q&A timeouts (about twice the typical answer latency)
+QA_TIMEOUT_LOCAL_SECONDS = 60
+QA_TIMEOUT_CLOUDFLARE_SECONDS = 90
+
+def probe_ollama_connection(ollama_url: str, timeout: int = 3) -> Tuple[bool, str]:
+    """
+    Pre-flight connectivity probe, memoized per URL.
+    A successful probe is remembered in session state for OLLAMA_PROBE_TTL_SECONDS so repeat
+    clicks skip the round-trip; failures are never cached so a restarted server is picked up.
+    """
+    import time
+
+    probe_times = st.session_state.setdefault('ollama_probe_times', {})
+    now = time.time()
+    if now - probe_times.get(ollama_url, 0) < OLLAMA_PROBE_TTL_SECONDS:
+        return True, "Connection OK (recently verified)"
+
+    try:
+        response = requests.get(f"{ollama_url}/api/tags", timeout=timeout)
+    except Exception as e:
+        return False, str(e)
+
+    if response.status_code == 200:
+        probe_times[ollama_url] = now
+        return True, "Connection OK"
+    return False, f"HTTP {response.status_code}"
+
 def verify_ollama_health(ollama_url: str) -> dict:
     """Comprehensive health check of Ollama server"""
     health = {
@@ -887,21 +929,19 @@ def fetch_remote_system_resources(ollama_url: str) -> Optional[dict]:
 # LLM QUERY ENGINE
 # ====================================================================================
 
-def query_ollama(
-    prompt: str,
-    model: str,
+def _build_ollama_options(
     ollama_url: str,
-    temperature: float = 0.3,
-    top_p: float = 0.9,
-    top_k: int = 40,
-    repeat_penalty: float = 1.1,
-    num_predict: int = None,
-    num_ctx: int = None,
-    timeout: int = None,
-    auto_optimize: bool = True,
-    seed: int = None
-) -> str:
-    """Query Ollama with optimized parameters"""
+    temperature: float,
+    top_p: float,
+    top_k: int,
+    repeat_penalty: float,
+    num_predict: int,
+    num_ctx: int,
+    timeout: int,
+    auto_optimize: bool,
+    seed: int
+) -> Tuple[dict, Optional[int]]:
+    """Build the Ollama generation options and effective timeout for a request"""
 
     # Get optimized parameters if enabled
     if auto_optimize:
@@ -942,17 +982,45 @@ def query_ollama(
     # Apply Cloudflare timeout multiplier
     is_cloudflare = "cloudflare" in ollama_url.lower() or "exalio" in ollama_url.lower()
     if is_cloudflare and timeout:
-        timeout = timeout * 6  # 6x multiplier for Cloudflare
+        timeout = timeout * CLOUDFLARE_TIMEOUT_MULTIPLIER
+
+    return options, timeout
+
+def query_ollama(
+    prompt: str,
+    model: str,
+    ollama_url: str,
+    temperature: float = 0.3,
+    top_p: float = 0.9,
+    top_k: int = 40,
+    repeat_penalty: float = 1.1,
+    num_predict: int = None,
+    num_ctx: int = None,
+    timeout: int = None,
+    auto_optimize: bool = True,
+    seed: int = None,
+    response_format: str = None
+) -> str:
+    """Query Ollama with optimized parameters (response_format='json' constrains output to valid JSON)"""
+
+    options, timeout = _build_ollama_options(
+        ollama_url, temperature, top_p, top_k, repeat_penalty,
+        num_predict, num_ctx, timeout, auto_optimize, seed
+    )
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "options": options
+    }
+    if response_format:
+        payload["format"] = response_format
 
     try:
         response = requests.post(
             f"{ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": options
-            },
+            json=payload,
             timeout=timeout or 120
         )
 
@@ -968,6 +1036,117 @@ def query_ollama(
     except Exception as e:
         return f"[ERROR] {str(e)}"
 
+def query_ollama_with_retry(
+    prompt: str,
+    model: str,
+    ollama_url: str,
+    num_predict: int = 600,
+    retries: int = 1,
+    **query_kwargs
+) -> str:
+    """
+    query_ollama with a bounded retry for slow tail requests: a timed-out request is retried
+    with half the token budget, which usually finishes well inside the same timeout.
+    """
+    response = query_ollama(prompt, model, ollama_url, num_predict=num_predict, **query_kwargs)
+    for _ in range(retries):
+        if response != "[ERROR] Request timeout":
+            break
+        num_predict = max(num_predict // 2, 64)
+        response = query_ollama(prompt, model, ollama_url, num_predict=num_predict, **query_kwargs)
+    return response
+
+def query_ollama_stream(
+    prompt: str,
+    model: str,
+    ollama_url: str,
+    temperature: float = 0.3,
+    top_p: float = 0.9,
+    top_k: int = 40,
+    repeat_penalty: float = 1.1,
+    num_predict: int = None,
+    num_ctx: int = None,
+    timeout: int = None,
+    auto_optimize: bool = True,
+    seed: int = None
+):
+    """
+    Stream an Ollama completion token by token.
+    Yields response fragments as they arrive; on failure yields a single "[ERROR] ..." string
+    (same convention as query_ollama) and stops.
+    """
+
+    options, timeout = _build_ollama_options(
+        ollama_url, temperature, top_p, top_k, repeat_penalty,
+        num_predict, num_ctx, timeout, auto_optimize, seed
+    )
+
+    try:
+        with requests.post(
+            f"{ollama_url}/api/generate",
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "options": options
+            },
+            timeout=timeout or 120,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                yield f"[ERROR] HTTP {response.status_code}"
+                return
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    yield f"[ERROR] {chunk['error']}"
+                    return
+                token = chunk.get('response', '')
+                if token:
+                    yield token
+                if chunk.get('done'):
+                    return
+
+    except requests.exceptions.Timeout:
+        yield "[ERROR] Request timeout"
+    except requests.exceptions.ConnectionError:
+        yield "[ERROR] Connection failed"
+    except Exception as e:
+        yield f"[ERROR] {str(e)}"
+
+# Minimum seconds between live redraws of a streamed answer; each redraw re-sends the whole text
+STREAM_REDRAW_INTERVAL_SECONDS = 0.05
+
+def stream_ollama_to_placeholder(placeholder, prompt: str, model: str, ollama_url: str, **query_kwargs) -> str:
+    """
+    Render a query_ollama_stream completion live into a Streamlit placeholder and return the
+    full text (or the "[ERROR] ..." string). The placeholder is cleared once the stream ends.
+    Streamlit elements can only be updated from the script thread, so call this there.
+    Redraws are throttled to STREAM_REDRAW_INTERVAL_SECONDS, since every redraw re-sends and
+    re-parses the accumulated answer.
+    """
+    import time
+
+    tokens = []
+    last_redraw = 0.0
+    for token in query_ollama_stream(prompt, model, ollama_url, **query_kwargs):
+        if token.startswith('[ERROR]'):
+            placeholder.empty()
+            return token
+        tokens.append(token)
+        now = time.monotonic()
+        if now - last_redraw >= STREAM_REDRAW_INTERVAL_SECONDS:
+            placeholder.markdown(''.join(tokens) + " ▌")
+            last_redraw = now
+    text = ''.join(tokens)
+    # Final redraw so the tokens that arrived after the last throttled update are shown
+    placeholder.markdown(text)
+    placeholder.empty()
+    return text
+
 def clean_json_string(json_str: str) -> str:
     """Clean JSON string from markdown code blocks"""
     json_str = re.sub(r'```json\s*', '', json_str)
@@ -1043,12 +1222,12 @@ def extract_json_from_response(response: str) -> Optional[dict]:
 # AI INSIGHTS & RECOMMENDATIONS FUNCTIONS
 # ====================================================================================
 
-def auto_discover_insights(df: pd.DataFrame, model: str, url: str) -> Dict[str, Any]:
-    """Automatically discover deep insights from the dataset with advanced analysis"""
-    # Detect if using Cloudflare (remote) and adjust timeout accordingly
-    is_cloudflare = "cloudflare" in url.lower() or "exalio" in url.lower()
-    llm_timeout = 600 if is_cloudflare else 120  # 10 minutes for Cloudflare, 2 minutes for local
-
+def compute_insight_statistics(df: pd.DataFrame) -> Tuple[Dict[str, Any], str]:
+    """
+    Statistical half of auto_discover_insights (no LLM call): data quality, correlations,
+    outliers, trends and categorical patterns, plus the analysis context used in the prompt.
+    Returns (insights, analysis_context).
+    """
     insights = {
         'data_quality': {},
         'patterns': {},
@@ -1076,38 +1255,34 @@ def auto_discover_insights(df: pd.DataFrame, model: str, url: str) -> Dict[str,
         'quality_issues': quality_issues if quality_issues else ['No significant quality issues']
     }
 
-    # 2. CORRELATION ANALYSIS
+    # 2. CORRELATION ANALYSIS (one matrix over the first 6 numeric columns, upper triangle only)
     if len(numeric_cols) >= 2:
         correlation_findings = []
-        for i, col1 in enumerate(numeric_cols[:5]):
-            for col2 in numeric_cols[i+1:6]:
-                try:
-                    corr = df[col1].corr(df[col2])
-                    if abs(corr) > 0.7:  # Strong correlation
-                        correlation_findings.append({
-                            'col1': col1,
-                            'col2': col2,
-                            'correlation': round(corr, 3),
-                            'strength': 'Strong positive' if corr > 0 else 'Strong negative'
-                        })
-                except:
-                    pass
+        try:
+            corr_matrix = compute_correlation_matrix(df[numeric_cols[:6]])
+            for col1, col2, corr in find_strong_correlations(corr_matrix, threshold=0.7):  # Strong correlation
+                correlation_findings.append({
+                    'col1': col1,
+                    'col2': col2,
+                    'correlation': round(corr, 3),
+                    'strength': 'Strong positive' if corr > 0 else 'Strong negative'
+                })
+        except:
+            pass
         insights['correlations'] = correlation_findings
 
-    # 3. OUTLIER DETECTION
+    # 3. OUTLIER DETECTION (quartiles and counts for all columns in one pass)
     outlier_findings = {}
-    for col in numeric_cols[:5]:
+    if numeric_cols:
         try:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
-            outlier_pct = (len(outliers) / len(df)) * 100
-            if outlier_pct > 5:
-                outlier_findings[col] = {
-                    'count': len(outliers),
-                    'percentage': round(outlier_pct, 1)
-                }
+            outlier_counts = count_iqr_outliers(df[numeric_cols[:5]].astype(np.float64))
+            for col, count in outlier_counts.items():
+                outlier_pct = (count / len(df)) * 100
+                if outlier_pct > 5:
+                    outlier_findings[col] = {
+                        'count': int(count),
+                        'percentage': round(outlier_pct, 1)
+                    }
         except:
             pass
     insights['outliers'] = outlier_findings
@@ -1115,14 +1290,17 @@ def auto_discover_insights(df: pd.DataFrame, model: str, url: str) -> Dict[str,
     # 4. TREND ANALYSIS (if date column exists)
     if date_cols and numeric_cols:
         date_col = date_cols[0]
-        df_sorted = df.sort_values(date_col).copy()
-
-        for num_col in numeric_cols[:3]:
+        trend_cols = numeric_cols[:3]
+        # Sort only the date and trend columns, then average both halves in one call each
+        df_sorted = df[[date_col] + trend_cols].sort_values(date_col)
+        mid_point = len(df_sorted) // 2
+        first_half_avgs = df_sorted.iloc[:mid_point][trend_cols].mean()
+        second_half_avgs = df_sorted.iloc[mid_point:][trend_cols].mean()
+
+        for num_col in trend_cols:
             try:
-                # Split into first and second half
-                mid_point = len(df_sorted) // 2
-                first_half_avg = df_sorted.iloc[:mid_point][num_col].mean()
-                second_half_avg = df_sorted.iloc[mid_point:][num_col].mean()
+                first_half_avg = first_half_avgs[num_col]
+                second_half_avg = second_half_avgs[num_col]
 
                 if first_half_avg > 0:
                     change_pct = ((second_half_avg - first_half_avg) / first_half_avg) * 100
@@ -1162,12 +1340,12 @@ Data Quality:
 Key Statistics:
 """
 
-    # Add detailed statistics
-    for col in numeric_cols[:5]:
-        try:
-            analysis_context += f"- {col}: Range [{df[col].min():.2f} to {df[col].max():.2f}], Avg: {df[col].mean():.2f}, Std: {df[col].std():.2f}\n"
-        except:
-            pass
+    # Add detailed statistics (one describe() for all columns instead of four reductions per column)
+    if numeric_cols:
+        numeric_desc = df[numeric_cols[:5]].describe()
+        for col in numeric_desc.columns:
+            col_stats = numeric_desc[col]
+            analysis_context += f"- {col}: Range [{col_stats['min']:.2f} to {col_stats['max']:.2f}], Avg: {col_stats['mean']:.2f}, Std: {col_stats['std']:.2f}\n"
 
     # Add correlation findings
     if insights['correlations']:
@@ -1187,6 +1365,31 @@ Key Statistics:
         for col, outlier_info in list(insights['outliers'].items())[:3]:
             analysis_context += f"- {col}: {outlier_info['count']} outliers ({outlier_info['percentage']}%)\n"
 
+    return insights, analysis_context
+
+
+def auto_discover_insights(
+    df: pd.DataFrame,
+    model: str,
+    url: str,
+    statistics: Optional[Tuple[Dict[str, Any], str]] = None,
+    stream_placeholder=None
+) -> Dict[str, Any]:
+    """
+    Automatically discover deep insights from the dataset with advanced analysis.
+    When stream_placeholder is given, the findings are streamed into it as they are generated.
+    """
+    # Detect if using Cloudflare (remote) and adjust timeout accordingly
+    is_cloudflare = "cloudflare" in url.lower() or "exalio" in url.lower()
+    llm_timeout = 600 if is_cloudflare else 120  # 10 minutes for Cloudflare, 2 minutes for local
+
+    # Statistics may be precomputed (see generate_insights_and_recommendations)
+    insights, analysis_context = statistics or compute_insight_statistics(df)
+    quality_issues = [
+        issue for issue in insights['data_quality']['quality_issues']
+        if issue != 'No significant quality issues'
+    ]
+
     # AI PROMPT
     prompt = f"""{analysis_context}
 
@@ -1204,7 +1407,12 @@ Focus on:
 
 Format as numbered insights (1., 2., etc.)"""
 
-    response = query_ollama(prompt, model, url, timeout=llm_timeout, auto_optimize=False, seed=42)
+    if stream_placeholder is not None:
+        response = stream_ollama_to_placeholder(
+            stream_placeholder, prompt, model, url, timeout=llm_timeout, auto_optimize=False, seed=42
+        )
+    else:
+        response = query_ollama(prompt, model, url, timeout=llm_timeout, auto_optimize=False, seed=42)
 
     if response and not response.startswith('[ERROR]'):
         insights['key_findings'] = response
@@ -1350,6 +1558,57 @@ Format as numbered recommendations (1., 2., etc.)"""
     return recommendations[:7]  # Return max 7 recommendations
 
 
+# Card background and border color per recommendation priority
+RECOMMENDATION_PRIORITY_COLORS = {
+    'HIGH': ('rgba(239, 68, 68, 0.1)', '#ef4444'),
+    'MEDIUM': ('rgba(245, 158, 11, 0.1)', '#f59e0b'),
+    'LOW': ('rgba(16, 185, 129, 0.1)', '#10b981')
+}
+
+# One card template per priority with the colors already filled in; all cards of a priority
+# are joined and rendered in one st.markdown call
+RECOMMENDATION_CARD_TEMPLATES = {
+    priority: (
+        f"<div style='background: {background}; border-left: 4px solid {border}; padding: 15px; margin: 10px 0; border-radius: 8px;'>"
+        "<p style='margin: 0; color: #e2e8f0;'><strong>{idx}. {recommendation}</strong></p>"
+        "<p style='margin: 5px 0 0 0; color: #94a3b8; font-size: 0.85rem;'>Category: {category}</p>"
+        "</div>"
+    )
+    for priority, (background, border) in RECOMMENDATION_PRIORITY_COLORS.items()
+}
+
+def build_recommendation_cards_html(recommendations: List[Dict[str, str]], priority: str) -> str:
+    """HTML for a numbered run of recommendation cards of one priority"""
+    card_template = RECOMMENDATION_CARD_TEMPLATES[priority]
+    return "".join(
+        card_template.format_map({'idx': idx, **rec})
+        for idx, rec in enumerate(recommendations, 1)
+    )
+
+
+def generate_insights_and_recommendations(
+    df: pd.DataFrame,
+    model: str,
+    url: str,
+    stream_placeholder=None
+) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    """
+    Run auto_discover_insights and generate_business_recommendations concurrently.
+    Recommendations only need the statistical findings (not the LLM narrative), so the
+    statistics are computed once up front and both LLM requests are issued in parallel.
+    The requests overlap on the server when Ollama allows it (OLLAMA_NUM_PARALLEL > 1);
+    otherwise Ollama queues them and the total time matches running them in sequence.
+    Recommendations run on a worker thread; the insights run on the calling thread so they
+    can stream into stream_placeholder.
+    """
+    statistics = compute_insight_statistics(df)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        recommendations_future = executor.submit(generate_business_recommendations, df, statistics[0], model, url)
+        auto_insights = auto_discover_insights(df, model, url, statistics, stream_placeholder)
+        return auto_insights, recommendations_future.result()
+
+
 # ====================================================================================
 # AI-POWERED DATA INSIGHTS & RECOMMENDATIONS FUNCTIONS
 # ====================================================================================
@@ -5216,11 +5475,34 @@ def load_student_data(uploaded_file) -> Optional[pd.DataFrame]:
         st.error(f"Error loading data: {str(e)}")
         return None
 
+# int64 columns are only stored as int32 when every |value| is below this bound, so sums,
+# differences and products of two such columns still fit in int32 without wrapping
+INT32_DOWNCAST_MAX_ABS = 2 ** 15
+
+def downcast_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store small-valued int64 columns (codes, counts, scores) as int32, halving the bytes every
+    later scan (metrics, profiling, charts) reads. Columns that merely fit in int32, such as IDs
+    or amounts in cents, stay int64: derived int32 arithmetic would wrap silently.
+    """
+    int_cols = df.select_dtypes(include=['int64']).columns
+    if len(int_cols) == 0:
+        return df
+
+    bounds = df[int_cols].agg(['min', 'max'])
+    fits = (bounds.loc['min'] > -INT32_DOWNCAST_MAX_ABS) & (bounds.loc['max'] < INT32_DOWNCAST_MAX_ABS)
+    fitting_cols = fits[fits].index
+    if len(fitting_cols) == 0:
+        return df
+    return df.astype({col: np.int32 for col in fitting_cols})
+
 def set_main_data(df: pd.DataFrame):
     """Set main dataframe and update session state"""
     # Apply universal column mapping
     mapped_df, mapping_log = apply_universal_column_mapping(df)
+    mapped_df = downcast_integer_columns(mapped_df)
     st.session_state.data = mapped_df
+    bump_data_generation()
     st.session_state.mapping_log = mapping_log
     st.session_state.metrics = calculate_core_metrics(mapped_df)
 
@@ -5889,7 +6171,7 @@ def _generate_rich_statistical_insight(viz: dict, df: pd.DataFrame, total_studen
         return f"Statistical analysis for {title} provides insights into institutional performance patterns."
 
     # Numeric column insights
-    if df[col_name].dtype in ['int64', 'float64']:
+    if df[col_name].dtype.kind in 'iuf':
         data = df[col_name].dropna()
         if len(data) == 0:
             return f"Insufficient data for {title} analysis."
@@ -6630,7 +6912,7 @@ Return ONLY valid JSON. NO markdown, NO explanations outside JSON."""
                 col_name = viz.get('data_column', '')
                 col_context = ""
                 if col_name and col_name in df.columns:
-                    if df[col_name].dtype in ['int64', 'float64']:
+                    if df[col_name].dtype.kind in 'iuf':
                         col_data = df[col_name].dropna()
                         if len(col_data) > 0:
                             col_context = f"Column stats: mean={col_data.mean():.2f}, median={col_data.median():.2f}, std={col_data.std():.2f}, min={col_data.min():.2f}, max={col_data.max():.2f}"
@@ -7085,7 +7367,7 @@ JSON:
         for viz in visualizations:
             col_name = viz.get('data_column', '')
             if col_name and col_name in df.columns:
-                if df[col_name].dtype in ['int64', 'float64']:
+                if df[col_name].dtype.kind in 'iuf':
                     col_data = df[col_name].dropna()
                     if len(col_data) > 0:
                         viz['insight'] = f"{col_name}: mean {col_data.mean():.2f}, median {col_data.median():.2f}, std {col_data.std():.2f}. Analysis reveals distribution patterns requiring strategic attention."
@@ -7232,6 +7514,24 @@ def find_matching_column(requested_col: str, df: pd.DataFrame) -> str:
     return None
 
 
+# Plotly config for AI-recommended chart loops: drops the mode bar and the
+# zoom/double-click handlers, which are costly on large WebGL traces
+DYNAMIC_CHART_CONFIG = {
+    'displayModeBar': False,
+    'scrollZoom': False,
+    'doubleClick': False,
+    'plotGlPixelRatio': 1
+}
+
+# Traces with more points than this skip per-point hover to avoid building the hover index
+DENSE_TRACE_POINTS = 5000
+
+def compact_trace_values(values: pd.Series) -> np.ndarray:
+    """Return trace data as a NumPy array (nullable numeric dtypes become float64 with NaN gaps)"""
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values.to_numpy()
+
 def build_dynamic_chart(spec: dict, df: pd.DataFrame):
     """
     Dynamically builds a Plotly chart based on LLM specification
@@ -7276,7 +7576,7 @@ def build_dynamic_chart(spec: dict, df: pd.DataFrame):
 
             fig = go.Figure()
             fig.add_trace(go.Histogram(
-                x=data,
+                x=compact_trace_values(data),
                 nbinsx=bins,
                 marker=dict(
                     color='rgba(99, 102, 241, 0.8)',
@@ -7511,11 +7811,14 @@ def build_dynamic_chart(spec: dict, df: pd.DataFrame):
             y_col_matched = find_matching_column(y_col, df) if y_col else None
 
             if x_col_matched and y_col_matched:
+                # WebGL trace: one marker per student row, so SVG rendering does not scale
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=df[x_col_matched],
-                    y=df[y_col_matched],
+                is_dense = len(df) > DENSE_TRACE_POINTS
+                fig.add_trace(go.Scattergl(
+                    x=compact_trace_values(df[x_col_matched]),
+                    y=compact_trace_values(df[y_col_matched]),
                     mode='markers',
+                    hoverinfo='skip' if is_dense else None,
                     marker=dict(
                         size=10,
                         color='#8b5cf6',
@@ -7548,6 +7851,9 @@ def build_dynamic_chart(spec: dict, df: pd.DataFrame):
                     paper_bgcolor='rgba(0,0,0,0)',
                     height=450,
                     margin=dict(l=80, r=40, t=80, b=80),
+                    hovermode=False if is_dense else 'closest',
+                    uirevision='keep',
+                    transition_duration=0,
                     hoverlabel=dict(
                         bgcolor='rgba(30, 41, 59, 0.95)',
                         font_size=14,
@@ -7564,7 +7870,7 @@ def build_dynamic_chart(spec: dict, df: pd.DataFrame):
 
             fig = go.Figure()
             fig.add_trace(go.Box(
-                y=data,
+                y=compact_trace_values(data),
                 marker=dict(
                     color='#8b5cf6',
                     size=8,
@@ -9217,4450 +9523,5000 @@ Focus on data-driven insights, business implications, and actionable recommendat
     }
 
 # ====================================================================================
-# SESSION STATE INITIALIZATION
+# DATA LINEAGE PROFILING
 # ====================================================================================
 
-def initialize_session_state():
-    """Initialize Streamlit session state variables"""
-    if 'data' not in st.session_state:
-        st.session_state.data = None
+# Column-name keyword patterns used to count domain columns in profiling prompts
+DOMAIN_PATTERNS = {
+    'Academic': re.compile(r'grade|gpa|course|credit|enrollment', re.IGNORECASE),
+    'Financial': re.compile(r'amount|fee|aid|tuition|payment', re.IGNORECASE),
+    'Demographics': re.compile(r'age|gender|name|nationality|email|phone', re.IGNORECASE)
+}
 
-    if 'metrics' not in st.session_state:
-        st.session_state.metrics = {}
+# Prompt prefixes are kept free of any dataset interpolation so they stay
+# byte-identical across runs; Ollama can then reuse the KV cache for the whole
+# prefix and only prefill the small per-dataset suffix appended after it.
+QUICK_SYSTEM_PREFIX = """You are a data profiling expert. Provide quick, structured analysis of this student dataset.
 
-    if 'ollama_server_type' not in st.session_state:
-        st.session_state.ollama_server_type = "Local"
+**REPRODUCIBILITY INSTRUCTIONS:**
+1. Use ONLY provided data - no assumptions
+2. Follow exact section structure below
+3. Cite specific column names
+4. Be factual and deterministic
+5. Keep output consistent across runs
 
-    if 'ollama_url' not in st.session_state:
-        st.session_state.ollama_url = "http://localhost:11434"
+**OUTPUT FORMAT (Follow exactly - 250 words max):**
 
-    if 'ollama_connected' not in st.session_state:
-        st.session_state.ollama_connected = False
+## 1. Dataset Overview
+[2-3 sentence factual description of dataset purpose and scope]
 
-    if 'selected_model' not in st.session_state:
-        st.session_state.selected_model = None
+## 2. Data Domains Identified
+- 📚 **Academic** ([count from DOMAIN COLUMN COUNTS] cols): [List actual column names]
+- 💰 **Financial** ([count from DOMAIN COLUMN COUNTS] cols): [List actual column names]
+- 👤 **Demographics** ([count from DOMAIN COLUMN COUNTS] cols): [List actual column names]
+- 📊 **Other**: [Any other domains with column names]
 
-    if 'llm_cache' not in st.session_state:
-        st.session_state.llm_cache = {}
+## 3. Top 3 Quality Concerns
+1. **[Issue Type]**: [Specific columns affected] - [Impact]
+2. **[Issue Type]**: [Specific columns affected] - [Impact]
+3. **[Issue Type]**: [Specific columns affected] - [Impact]
 
-    if 'complete_journeys' not in st.session_state:
-        st.session_state.complete_journeys = None
+## 4. Key Findings
+- [Finding based on missing data table with %]
+- [Finding based on completeness metric with %]
+- [Finding based on column analysis with count]
 
-    if 'journey_generation_metadata' not in st.session_state:
-        st.session_state.journey_generation_metadata = None
+## 5. Immediate Actions
+1. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
+2. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
+3. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
 
-    if 'health_check_count' not in st.session_state:
-        st.session_state.health_check_count = 0
+**RULES**: Use markdown (##). Always cite column names in brackets. Use quantitative data. Be deterministic.
 
-    if 'connection_history' not in st.session_state:
-        st.session_state.connection_history = []
+The dataset profile to analyze follows.
+"""
 
-    if 'auto_refresh' not in st.session_state:
-        st.session_state.auto_refresh = False
+COMP_SYSTEM_PREFIX = """You are a senior data profiling expert. Analyze this student dataset and provide structured, deterministic output.
 
-    if 'uploaded_filename' not in st.session_state:
-        st.session_state.uploaded_filename = None
+**CRITICAL INSTRUCTIONS FOR REPRODUCIBLE OUTPUT:**
+1. Use ONLY the data provided below - do not make assumptions
+2. Follow the EXACT section structure and format specified
+3. Cite specific column names from the data
+4. Use factual, objective language
+5. Keep analysis consistent and deterministic
 
-    if 'show_connection_help' not in st.session_state:
-        st.session_state.show_connection_help = False
+**OUTPUT REQUIREMENTS:**
+Provide exactly 8 sections using markdown headers (##). Be specific, factual, and deterministic. Use 600 words maximum.
 
-# ====================================================================================
-# MAIN APPLICATION
-# ====================================================================================
+**SECTION TEMPLATES (Follow exactly):**
 
-def main():
-    """Main application entry point"""
+## 1. Dataset Purpose & Scope
+**Purpose**: [2-3 sentences describing what this dataset represents]
+**Temporal Scope**: [Time period, refresh frequency]
+**Stakeholders**: [Who uses this data]
+**Integration**: [System integration points inferred from columns]
 
-    # Initialize
-    inject_custom_css()
-    initialize_session_state()
+## 2. Data Domain Breakdown
+**Academic Domain** ([count from DOMAIN COLUMN COUNTS] columns):
+- Columns: [List actual column names found]
+- Metrics: [What is measured]
 
-    # Header
-    st.markdown("""
-    <div class="hero-section">
-        <div class="hero-title">🎓 Student 360 AI-Powered Analytics <span style="font-size: 0.5em; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 4px 12px; border-radius: 20px; margin-left: 10px;">V2.0</span></div>
-        <div class="hero-subtitle">Transform Student Data into Strategic Intelligence with Large Language Models</div>
-    </div>
-    """, unsafe_allow_html=True)
+**Financial Domain** ([count from DOMAIN COLUMN COUNTS] columns):
+- Columns: [List actual column names found]
+- Metrics: [Revenue vs cost identification]
 
-    # ====================================================================================
-    # SIDEBAR - EXACT IMPLEMENTATION FROM GEN_STORYTELLING_APP.PY
-    # ====================================================================================
-    with st.sidebar:
-        st.markdown("### 📚 Help & Documentation")
-        st.caption("🎓 Student 360 AI-Powered Analytics")
+**Demographics** ([count from DOMAIN COLUMN COUNTS] columns):
+- Columns: [List actual column names found]
+- Completeness: [Assess completeness]
 
-        # Version info
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 8px 12px; border-radius: 8px; margin: 10px 0;">
-            <div style="color: white; font-weight: 600; font-size: 0.9em;">Version 2.0</div>
-            <div style="color: rgba(255,255,255,0.8); font-size: 0.75em;">Production Release • Feb 2026</div>
-            <div style="color: rgba(255,255,255,0.9); font-size: 0.7em; margin-top: 4px;">✨ Pre-loaded Dataset</div>
-        </div>
-        """, unsafe_allow_html=True)
+**Other Domains**:
+- [Any other domains with column examples]
 
-        st.divider()
+## 3. Data Quality Assessment
+**Completeness**: [Data Completeness from DATASET METRICS] overall
+- Domain breakdown: [Which domains complete/incomplete]
+- Root cause: [Why data is missing]
 
-        # ====================================================================================
-        # GETTING STARTED GUIDE
-        # ====================================================================================
-        st.markdown("### 📋 Getting Started")
-        st.caption("🔄 **App Version: 3.1** - Function Rename Fix (No More Cache!) ✨")
-        st.caption("---")
+**Missing Pattern Type**: [MCAR/MAR/MNAR] because [reasoning based on missing data table]
 
-        # Status indicators
-        ollama_status = st.session_state.get('ollama_connected', False)
-        data_loaded = st.session_state.data is not None
+**Duplicates**: [Duplicate Rows from DATASET METRICS]
+- Assessment: [Legitimate vs data quality issue]
 
-        if ollama_status:
-            st.success("✅ Ollama Connected")
-            st.caption("Ready to generate AI-powered insights")
-        else:
-            st.warning("⚠️ Ollama Not Connected")
-            st.caption("Configure connection below")
+**Correlations**: [Strong Correlations from STATISTICAL ANALYSIS]
+- Business sense check: [Do correlations make sense?]
 
-        if data_loaded:
-            st.success("✅ Data Loaded")
-            st.caption(f"{len(st.session_state.data):,} student records")
-        else:
-            st.info("📁 No Data Loaded")
-            st.caption("Upload CSV in Data Source section")
+**Distributions**: [Skewed Distributions from STATISTICAL ANALYSIS]
+- Implications: [What skewness indicates]
 
-        st.divider()
+**Outliers**: [Outliers Detected from STATISTICAL ANALYSIS]
+- Assessment: [Errors or valid edge cases?]
 
-        # ====================================================================================
-        # LLM & PROMPT ENHANCEMENT GUIDE
-        # ====================================================================================
-        if st.button("🧠 LLM & Prompt Enhancement Guide", width='stretch', type="secondary"):
-            st.session_state.show_llm_guide = not st.session_state.get('show_llm_guide', False)
+**Severity**: [Critical/High/Medium/Low] because [justification]
 
-        if st.session_state.get('show_llm_guide', False):
-            with st.expander("📖 LLM Enhancement Techniques Used", expanded=True):
-                st.markdown("""
-                <style>
-                .guide-content {
-                    background-color: #1e1e1e;
-                    color: #e0e0e0;
-                    padding: 20px;
-                    border-radius: 10px;
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                }
-                .guide-content h2 {
-                    color: #4CAF50;
-                    border-bottom: 2px solid #4CAF50;
-                    padding-bottom: 10px;
-                }
-                .guide-content h3 {
-                    color: #2196F3;
-                }
-                .guide-content h4 {
-                    color: #FF9800;
-                }
-                .guide-content table {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 10px 0;
-                }
-                .guide-content th {
-                    background-color: #3d3d3d;
-                    color: #4CAF50;
-                    padding: 10px;
-                    border: 1px solid #555;
-                }
-                .guide-content td {
-                    padding: 8px;
-                    border: 1px solid #555;
-                }
-                .guide-content code {
-                    background-color: #2d2d2d;
-                    color: #ffa500;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                }
-                .guide-content pre {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    padding: 15px;
-                    border-radius: 5px;
-                    border-left: 4px solid #4CAF50;
-                    overflow-x: auto;
-                }
-                .guide-content blockquote {
-                    background-color: #2d2d2d;
-                    border-left: 4px solid #2196F3;
-                    padding: 10px 20px;
-                    margin: 10px 0;
-                    color: #e0e0e0;
-                }
-                .guide-content ul, .guide-content ol {
-                    color: #e0e0e0;
-                }
-                .guide-content strong {
-                    color: #FFD700;
-                }
-                </style>
-                <div class="guide-content">
+## 4. Column Relationships
+**Primary Keys**: [List high-cardinality columns] - These are PKs because [reason]
+**Foreign Keys**: [Potential FK relationships identified]
+**Derived Columns**: [Calculated/derived columns] vs Source: [source columns]
+**Hierarchies**: [Parent-child relationships]
+**Temporal**: [Time-series patterns]
 
-                <h2>🎯 Prompt Enhancement Strategies</h2>
+## 5. Business Intelligence Value
+**Predictive Analytics**: Can predict [specific outcomes]. Key features: [column names]
+**Segmentation**: Students can be segmented by [specific criteria/columns]
+**Financial**: [Revenue forecasting/aid optimization opportunities with columns]
+**Operations**: [Process improvements from columns]
+**Compliance**: [FERPA/regulatory capabilities]
+**KPIs**: [List calculable KPIs from columns]
 
-                ### 1. **Modular Prompt System**
-                We use specialized prompts for different narrative types:
+## 6. Action Plan
+**CRITICAL** (today):
+1. [Column]: [Problem] → [Solution] → [Outcome]
+2. [Column]: [Problem] → [Solution] → [Outcome]
+3. [Column]: [Problem] → [Solution] → [Outcome]
 
-                **Example - Business Context Prompt:**
-                ```
-                You are a higher education business analyst...
+**HIGH** (this week):
+1. [Column/Domain]: [Issue] → [Fix] → [Impact]
+2. [Column/Domain]: [Issue] → [Fix] → [Impact]
 
-                Write a compelling 3-4 sentence paragraph that:
-                1. Explains WHY this analysis matters
-                2. Connects to strategic goals
-                3. Sets up business importance
-                4. Uses professional language
+**MEDIUM** (this month):
+1. [Specific improvement]
+2. [Specific improvement]
 
-                Do NOT include raw numbers.
-                Focus on strategic importance.
-                ```
+**LOW** (backlog):
+1. [Enhancement]
 
-                **Example - Data Insights Prompt:**
-                ```
-                You are a university data analyst...
+## 7. Risk Assessment
+**Decision Risk**: With [Data Completeness] completeness, [specific unsafe decisions]
+**Bias Risk**: Missing data in [columns] could bias [specific analyses]
+**Compliance**: [FERPA/privacy concerns with columns]
+**Financial**: [Specific financial risks from data quality]
+**Operational**: [Process failures possible]
+**Reputational**: [Consequences of wrong decisions]
+**Opportunity**: [Impossible insights listed]
 
-                Write comprehensive analysis (6-8 sentences):
-                1. Analyze patterns and trends
-                2. Make comparisons
-                3. Identify correlations
-                4. Include 8-10 specific numbers
-                5. Use "The data reveals...", "Notably..."
-                ```
+## 8. Visualization Recommendations
+1. **[Chart Type]** of [Column X] vs [Column Y] → Reveals: [Specific insight]
+2. **[Chart Type]** of [Columns] grouped by [Column] → Shows: [Pattern]
+3. **[Chart Type]** for [Columns] → Identifies: [Issue]
+4. **[Chart Type]** tracking [Metrics] over [Time column] → Monitors: [KPI]
+5. **[Chart Type]** with [Dimensions] → Supports: [Decision]
 
-                ---
+**CONSISTENCY RULES:**
+- Always reference actual column names in brackets
+- Use quantitative evidence (percentages, counts)
+- Follow section templates exactly
+- Be deterministic and factual
 
-                ## ⚙️ LLM Parameter Optimization
+The dataset profile to analyze follows.
+"""
 
-                ### 2. **Auto-Optimization System**
-                The app detects your hardware and adjusts parameters:
+def compute_profile_primitives(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the base profiling primitives for a DataFrame in as few full scans as possible.
+    Null counts, uniqueness and dtype groups are computed once; every other profiling
+    statistic (columns with nulls, cardinality buckets, totals) is derived from them.
+    """
+    row_count = len(df)
+    # count() reduces per column without materializing a full boolean isnull() frame
+    null_counts = row_count - df.count()
+    nunique = df.nunique()
 
-                | Your Hardware | Context Size | Tokens | Speed |
-                |--------------|--------------|---------|--------|
-                | **High-end** (16GB+ RAM, GPU) | 8192 | 2048 | ⚡⚡⚡ |
-                | **Medium** (8GB+ RAM) | 4096 | 1024 | ⚡⚡ |
-                | **Cloudflare** | 4096 | 1024 | ⚡ |
-                | **Low-end** (<8GB RAM) | 2048 | 512 | ⚡ |
+    return {
+        'numeric_cols': df.select_dtypes(include=['number']).columns.tolist(),
+        'categorical_cols': df.select_dtypes(include=['object']).columns.tolist(),
+        'datetime_cols': df.select_dtypes(include=['datetime64']).columns.tolist(),
+        'dtype_names': df.dtypes.astype(str),
+        'null_counts': null_counts,
+        'columns_with_nulls': int((null_counts > 0).sum()),
+        'complete_cols': int((null_counts == 0).sum()),
+        'total_missing': int(null_counts.sum()),
+        'duplicate_rows': int(df.duplicated().sum()),
+        'nunique': nunique,
+        'high_cardinality_cols': nunique[nunique / max(row_count, 1) > 0.9].index.tolist(),
+        'low_cardinality_cols': nunique[nunique < 20].index.tolist()
+    }
 
-                **Key Parameters:**
-                - `num_ctx`: Context window (2048-8192)
-                - `num_predict`: Max tokens generated
-                - `num_batch`: Parallel processing
-                - `num_thread`: CPU cores used
-                - `timeout`: 6x multiplier for Cloudflare
+def build_kpi_card_html(icon: str, value: str, label: str, gradient: str, label_color: str) -> str:
+    """Build the HTML for one gradient KPI card (cards are joined and emitted in a single st.markdown call)"""
+    return (
+        f"<div style='flex: 1; background: linear-gradient(135deg, {gradient}); border-radius: 12px; "
+        f"padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>"
+        f"<div style='font-size: 2rem; margin-bottom: 5px;'>{icon}</div>"
+        f"<div style='font-size: 2rem; font-weight: bold; color: white;'>{value}</div>"
+        f"<div style='font-size: 0.85rem; color: {label_color}; margin-top: 5px;'>{label}</div>"
+        f"</div>"
+    )
 
-                ---
+def bump_data_generation():
+    """
+    Mark that st.session_state.data was replaced. Part of get_dataframe_fingerprint, so a
+    newly loaded frame never matches a cache entry of a freed one that had the same id.
+    """
+    st.session_state.data_generation = st.session_state.get('data_generation', 0) + 1
 
-                ## 🧠 Temperature Control
+def get_dataframe_fingerprint(df: pd.DataFrame) -> Tuple[int, int, Tuple[int, int], int]:
+    """
+    Cheap cache key for session-state profiling caches: data load generation (see
+    bump_data_generation), object identity, shape and a CRC32 of the column names.
+    O(n_columns), so it can be evaluated on every rerun without touching rows.
+    """
+    return (
+        st.session_state.get('data_generation', 0),
+        id(df),
+        df.shape,
+        zlib.crc32('|'.join(map(str, df.columns)).encode())
+    )
 
-                ### 3. **Task-Specific Temperatures**
+def get_profile_primitives(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Profiling primitives for the active DataFrame, computed once per loaded dataset.
+    Every widget interaction reruns the script, so the null/duplicate/uniqueness scans are
+    kept in session state for as long as the same DataFrame (see get_dataframe_fingerprint) is active.
+    """
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('profile_primitives_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
 
-                | Task | Temp | Why |
-                |------|------|-----|
-                | **Data Analysis** | 0.3-0.4 | Factual, precise |
-                | **Business Context** | 0.4-0.5 | Professional, focused |
-                | **Opening Narrative** | 0.5-0.7 | Engaging, creative |
-                | **Recommendations** | 0.6-0.7 | Strategic variety |
+    primitives = compute_profile_primitives(df)
+    st.session_state.profile_primitives_cache = (cache_key, primitives)
+    return primitives
 
-                **Example Implementation:**
-                ```python
-                # Analytical content
-                query_ollama(prompt, model, url,
-                    temperature=0.3)  # Precise
+def get_column_describe(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    describe() summary for one column, cached per loaded dataset.
+    describe() derives min/quartiles/median/max from a single sort, and the cache means
+    re-selecting a column in the Column-Level Analysis expander is a dict lookup.
+    """
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('column_describe_cache')
+    if not cached or cached[0] != cache_key:
+        cached = (cache_key, {})
+        st.session_state.column_describe_cache = cached
+
+    column_stats = cached[1]
+    if column not in column_stats:
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series):
+            # Booleans describe as categorical; profile them as 0/1 to keep mean/quartiles
+            series = pd.Series(series.to_numpy(dtype=np.float64, na_value=np.nan), index=series.index)
+        column_stats[column] = series.describe()
+    return column_stats[column]
+
+def get_top_value_counts(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Ten most frequent values of one column, cached per loaded dataset.
+    Counts are taken unsorted and the top 10 picked with a partial selection, so high-cardinality
+    (ID-like) columns skip a full sort; the cache makes re-selecting a column a dict lookup.
+    """
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('top_value_counts_cache')
+    if not cached or cached[0] != cache_key:
+        cached = (cache_key, {})
+        st.session_state.top_value_counts_cache = cached
+
+    top_values = cached[1]
+    if column not in top_values:
+        top_values[column] = df[column].value_counts(sort=False).nlargest(10)
+    return top_values[column]
+
+def get_deep_memory_mb(df: pd.DataFrame) -> float:
+    """
+    Deep memory footprint of a DataFrame in MB, computed once per loaded dataset.
+    memory_usage(deep=True) walks every Python string object, so the result is kept in
+    session state for as long as the same DataFrame (object, shape and columns) is active.
+    """
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('deep_memory_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
+    memory_mb = df.memory_usage(deep=True).sum() / (1024 ** 2)
+    st.session_state.deep_memory_cache = (cache_key, memory_mb)
+    return memory_mb
+
+def dumps_indented(obj: Any) -> str:
+    """json.dumps(obj, indent=2) equivalent, using orjson when it is installed and can encode obj"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
 
-                # Creative content
-                query_ollama(prompt, model, url,
-                    temperature=0.7)  # Varied
-                ```
+def build_qa_prompt_prefix(df: pd.DataFrame, metrics: dict) -> str:
+    """Dataset part of the Data Explorer Q&A prompt (metrics plus a numeric data summary); the question is appended per request"""
+    data_summary = {
+        'total_records': len(df),
+        'columns': df.columns.tolist()[:30],
+        'sample_stats': {}
+    }
 
-                ---
+    # Add numeric column stats (one agg() for all columns; plain floats so every value is JSON-serializable,
+    # with missing results from nullable columns as NaN)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns[:10]
+    if len(numeric_cols):
+        numeric_stats = df[numeric_cols].agg(['mean', 'min', 'max']).astype('Float64')
+        data_summary['sample_stats'] = pd.DataFrame(
+            numeric_stats.to_numpy(dtype=np.float64, na_value=np.nan),
+            index=numeric_stats.index,
+            columns=numeric_stats.columns
+        ).to_dict()
 
-                ## 📊 Metrics Formatting
+    return f"""You are analyzing a student dataset with {len(df):,} records.
 
-                ### 4. **Data-Driven Prompts**
+**Available Metrics:**
+{dumps_indented(metrics)}
 
-                We format metrics for LLM consumption:
+**Data Summary:**
+{dumps_indented(data_summary)[:1000]}
+"""
 
-                **Raw Metrics:**
-                ```python
-                {
-                    'total_students': 1000,
-                    'avg_gpa': 3.234567,
-                    'revenue': 75500000
-                }
-                ```
+def get_qa_prompt_prefix(df: pd.DataFrame, metrics: dict) -> str:
+    """
+    Q&A prompt prefix for the active DataFrame and metrics, built once and reused across questions.
+    The describe() pass and both JSON serializations only depend on the dataset, so they are kept
+    in session state for as long as the same DataFrame is active. metrics is recomputed from df on
+    every rerun (a new object each time), so it is deliberately not part of the key.
+    """
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('qa_prompt_prefix_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
+    prompt_prefix = build_qa_prompt_prefix(df, metrics)
+    st.session_state.qa_prompt_prefix_cache = (cache_key, prompt_prefix)
+    return prompt_prefix
+
+def build_missing_data_table(null_counts: pd.Series, row_count: int) -> pd.DataFrame:
+    """Build the per-column missing data table (sorted, most affected first) from precomputed null counts"""
+    return pd.DataFrame({
+        'Column': null_counts.index,
+        'Missing Count': null_counts.values,
+        'Missing %': (null_counts.values / max(row_count, 1) * 100).round(2)
+    }).sort_values('Missing Count', ascending=False)
+
+def build_profile_stats_block(
+    df: pd.DataFrame,
+    primitives: Dict[str, Any],
+    completeness: float,
+    complete_cols: int,
+    columns_sample: str,
+    domain_counts: Dict[str, int],
+    examples_per_type: int
+) -> str:
+    """
+    Build the dataset statistics block shared by the Quick and Comprehensive profiling prompts.
+    All dataset interpolation happens here once; each mode only appends its own extras.
+    """
+    row_count = len(df)
+    column_count = len(df.columns)
+    total_missing = primitives['total_missing']
+    duplicate_rows = primitives['duplicate_rows']
+    numeric_cols = primitives['numeric_cols']
+    categorical_cols = primitives['categorical_cols']
+    numeric_sample = ', '.join(numeric_cols[:examples_per_type]) if numeric_cols else 'None'
+    categorical_sample = ', '.join(categorical_cols[:examples_per_type]) if categorical_cols else 'None'
+    domain_lines = '\n'.join(f"- {domain}: {count} columns" for domain, count in domain_counts.items())
+
+    return f"""
+**DATASET METRICS:**
+- Total Records: {row_count:,}
+- Total Attributes: {column_count}
+- Data Completeness: {completeness:.1f}%
+- Missing Cells: {total_missing:,} ({(total_missing / max(row_count * column_count, 1) * 100):.2f}% of all cells)
+- Complete Columns: {complete_cols}/{column_count} ({(complete_cols / max(column_count, 1) * 100):.1f}%)
+- Duplicate Rows: {duplicate_rows:,} ({(duplicate_rows / max(row_count, 1) * 100):.2f}%)
 
-                **Formatted for Prompt:**
-                ```
-                - Total Students: 1,000
-                - Average GPA: 3.2
-                - Total Revenue: AED 75.5M
-                - High Performers: 450 (45.0%)
-                ```
-
-                ---
+**COLUMN TYPES:**
+- Numeric: {len(numeric_cols)} columns - Examples: {numeric_sample}
+- Categorical: {len(categorical_cols)} columns - Examples: {categorical_sample}
+- Datetime: {len(primitives['datetime_cols'])} columns
+- High Cardinality (IDs): {len(primitives['high_cardinality_cols'])} columns
+- Low Cardinality (Categories): {len(primitives['low_cardinality_cols'])} columns
 
-                ## 🔄 Context Chaining
+**COLUMN NAMES (First 25):** {columns_sample}
 
-                ### 5. **Progressive Context Building**
+**DOMAIN COLUMN COUNTS:**
+{domain_lines}
+"""
 
-                Each component receives context from previous:
+# Row cap for distribution statistics (correlation/skew/IQR); counts and totals always use every row
+PROFILE_STATS_SAMPLE_ROWS = 200_000
 
-                ```python
-                # Step 1: Business Context
-                context = generate_business_context(...)
+# Row cap for raw-data dashboard charts (histograms); larger frames are sampled before plotting
+PROFILE_PLOT_MAX_ROWS = 50_000
 
-                # Step 2: Data Insights (with context)
-                insights = generate_insights(
-                    context={'business': context}
-                )
+# Rows of a profiling table sent to the browser by default; a slider sends more on demand
+PROFILE_TABLE_DEFAULT_ROWS = 50
 
-                # Step 3: Impact (with both)
-                impact = generate_impact(
-                    context={
-                        'business': context,
-                        'insights': insights
-                    }
-                )
-                ```
+def count_iqr_outliers(num_df: pd.DataFrame) -> pd.Series:
+    """
+    IQR (1.5 x IQR) outlier count per column of a float block.
+    Quartiles for every column come from a single quantile() call and outliers are
+    counted with one boolean-matrix reduction instead of a per-column loop.
+    """
+    quartiles = num_df.quantile([0.25, 0.75])
+    q1, q3 = quartiles.loc[0.25], quartiles.loc[0.75]
 
-                **Benefit:** Each narrative builds on previous,
-                creating coherent stories.
+    iqr = q3 - q1
+    return (num_df.lt(q1 - 1.5 * iqr) | num_df.gt(q3 + 1.5 * iqr)).sum()
 
-                ---
+def summarize_numeric_distributions(num_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Vectorized skewness and IQR outlier counts for a block of numeric columns.
+    Values are downcast to float32 first, which is ample precision for profiling
+    and halves the bytes scanned.
+    """
+    num_df = num_df.astype(np.float32)
+    return {
+        'skew': num_df.skew(),
+        'outlier_counts': count_iqr_outliers(num_df)
+    }
 
-                ## 🛡️ Fallback System
+def compute_correlation_matrix(num_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlation matrix for a block of numeric columns.
+    Null-free blocks (the common case) are materialized to one NumPy array and go through
+    np.corrcoef, a single BLAS product; blocks with nulls keep pandas' pairwise-complete corr().
+    """
+    values = num_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        return num_df.corr()
 
-                ### 6. **3-Tier Quality Assurance**
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr_values = np.atleast_2d(np.corrcoef(values, rowvar=False))
+    return pd.DataFrame(corr_values, index=num_df.columns, columns=num_df.columns)
 
-                ```
-                Tier 1: Try LLM Generation
-                   ↓ (if fails)
-                Tier 2: Statistical Enrichment
-                   ↓ (if fails)
-                Tier 3: Template-Based Content
-                ```
+def compute_dashboard_aggregates(df: pd.DataFrame, numeric_cols: List[str]) -> Dict[str, Any]:
+    """
+    Numeric aggregates used by the profiling visualization dashboard: the correlation matrix
+    of the top 15 numeric columns and the box-plot quartiles of the top 4.
+    Pure pandas (no Streamlit calls), so it can run in a worker thread while the LLM decodes.
+    Quartiles come from the original columns so the whiskers agree with the float64 outlier
+    points drawn next to them.
+    """
+    return {
+        'corr': compute_correlation_matrix(df[numeric_cols[:15]]) if len(numeric_cols) >= 2 else None,
+        'box_quartiles': df[numeric_cols[:4]].quantile([0.25, 0.5, 0.75]) if numeric_cols else None
+    }
 
-                **Result:** 100% uptime, always functional
+def get_dashboard_aggregates(df: pd.DataFrame, numeric_cols: List[str]) -> Dict[str, Any]:
+    """Dashboard aggregates for the active DataFrame (prefetched during profiling, else computed now)"""
+    cache_key = get_dataframe_fingerprint(df)
+    cached = st.session_state.get('dashboard_aggregates_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
 
-                ---
+    aggregates = compute_dashboard_aggregates(df, numeric_cols)
+    st.session_state.dashboard_aggregates_cache = (cache_key, aggregates)
+    return aggregates
 
-                ## 🎨 Real-World Example
+# Maximum number of columns described in one batched column-insights request
+COLUMN_INSIGHTS_BATCH_SIZE = 40
 
-                ### Complete Narrative Generation:
+def generate_column_insights_llm(
+    df: pd.DataFrame,
+    primitives: Dict[str, Any],
+    columns: List[str],
+    model: str,
+    url: str
+) -> Dict[str, dict]:
+    """
+    Generate per-column AI insights for many columns with a single Ollama request.
+    Column statistics are row-marshaled into one prompt and the model answers with a JSON
+    object, so profiling N columns costs one round-trip instead of N.
+    Returns {column_name: {'insight': str, 'warnings': [str, ...]}}.
+    """
+    row_count = max(len(df), 1)
+    numeric_batch = [col for col in columns if col in set(primitives['numeric_cols'])]
+    numeric_stats = df[numeric_batch].agg(['mean', 'min', 'max']) if numeric_batch else None
+
+    column_lines = []
+    for col in columns:
+        line = (
+            f"- {col} | type: {df[col].dtype} | nulls: {primitives['null_counts'][col] / row_count * 100:.1f}% "
+            f"| unique: {primitives['nunique'][col]:,}"
+        )
+        if numeric_stats is not None and col in numeric_stats.columns:
+            line += (
+                f" | mean: {numeric_stats.at['mean', col]:.2f} | min: {numeric_stats.at['min', col]:.2f}"
+                f" | max: {numeric_stats.at['max', col]:.2f}"
+            )
+        column_lines.append(line)
 
-                **Input Metrics:**
-                ```
-                total_students: 1000
-                housed_students: 663
-                occupancy_rate: 66.3%
-                avg_gpa_housed: 3.1
-                avg_gpa_not_housed: 2.8
-                ```
+    columns_block = '\n'.join(column_lines)
+    prompt = f"""You are a data quality analyst profiling a student dataset with {len(df):,} records.
 
-                **Generated Opening:**
-                > "Our analysis reveals striking patterns in housing
-                > impact: 663 students (66.3%) live on campus, and
-                > they outperform off-campus peers by 0.3 GPA points
-                > (3.1 vs 2.8). This 10.7% performance advantage
-                > translates to measurable retention value..."
+For EACH column below, write one concise insight about its content or quality and list any data quality warnings.
 
-                **Why it works:**
-                - Specific numbers (663, 66.3%, 3.1, 2.8)
-                - Comparative analysis (10.7% advantage)
-                - Business impact (retention value)
-                - Engaging narrative flow
+COLUMNS:
+{columns_block}
 
-                ---
+Respond with ONLY a JSON object in this exact format:
+{{"columns": [{{"name": "<column name>", "insight": "<one sentence>", "warnings": ["<warning>", ...]}}]}}"""
 
-                ## 📈 Recommendations for Enhancement
+    response = query_ollama(
+        prompt,
+        model,
+        url,
+        temperature=0.0,
+        num_predict=min(80 * len(columns) + 200, 4000),
+        response_format='json'
+    )
+    if not response or response.startswith('[ERROR]'):
+        return {}
 
-                ### **Currently NOT Used (Opportunities):**
+    parsed = extract_json_from_response(response) or {}
+    insights = {}
+    for entry in parsed.get('columns', []):
+        if isinstance(entry, dict) and entry.get('name') in columns:
+            warnings = entry.get('warnings') or []
+            insights[entry['name']] = {
+                'insight': str(entry.get('insight', '')),
+                'warnings': [str(w) for w in warnings] if isinstance(warnings, list) else [str(warnings)]
+            }
+    return insights
 
-                #### A. **RAG (Retrieval Augmented Generation)**
-                - Add vector database for historical insights
-                - Reference past reports automatically
-                - **Expected Impact:** +30% contextual relevance
+def has_value_spread(series: pd.Series) -> bool:
+    """True when a numeric column holds at least two distinct non-null values (constant/empty columns are skipped in charts)"""
+    col_min, col_max = series.min(), series.max()
+    return bool(pd.notna(col_min) and col_min != col_max)
 
-                #### B. **Chain-of-Thought Prompting**
-                ```
-                "Let's analyze this step by step:
-                1. First, identify the trend...
-                2. Then, calculate the impact...
-                3. Finally, recommend actions..."
-                ```
-                - **Expected Impact:** +25% reasoning quality
+def find_strong_correlations(
+    corr_matrix: pd.DataFrame,
+    threshold: float = 0.7,
+    top_n: Optional[int] = None
+) -> List[Tuple[str, str, float]]:
+    """
+    Return (col1, col2, corr) pairs from the upper triangle of a correlation matrix
+    whose absolute correlation exceeds the threshold, in row-major order.
+    When top_n is given, only the top_n strongest pairs are returned, strongest first.
+    """
+    values = corr_matrix.to_numpy()
+    rows, cols = np.triu_indices_from(values, k=1)
+    pair_values = values[rows, cols]
+    mask = np.abs(pair_values) > threshold
+    sel_rows, sel_cols, sel_values = rows[mask], cols[mask], pair_values[mask]
+
+    if top_n is not None:
+        order = np.argsort(-np.abs(sel_values), kind='stable')[:top_n]
+        sel_rows, sel_cols, sel_values = sel_rows[order], sel_cols[order], sel_values[order]
+
+    columns = corr_matrix.columns.to_numpy()
+    return [
+        (columns[i], columns[j], float(val))
+        for i, j, val in zip(sel_rows, sel_cols, sel_values)
+    ]
 
-                #### C. **Few-Shot Learning**
-                ```
-                "Example 1:
-                Input: {...}
-                Output: {...}
+# Dashboard figures below depend only on small aggregates, so they are cached on those values
+# and reruns with unchanged profiling results reuse the built figure (st.plotly_chart copies it)
+@st.cache_resource(show_spinner=False)
+def build_column_type_pie(numeric_count: int, categorical_count: int, datetime_count: int) -> go.Figure:
+    """Column type distribution pie for the profiling dashboard"""
+    type_data = pd.DataFrame({
+        'Type': ['Numeric', 'Categorical', 'Datetime'],
+        'Count': [numeric_count, categorical_count, datetime_count]
+    })
+    type_data = type_data[type_data['Count'] > 0]
+
+    fig_types = go.Figure(go.Pie(
+        values=type_data['Count'].to_numpy(),
+        labels=type_data['Type'].to_numpy(),
+        marker=dict(colors=['#6366f1', '#f59e0b', '#10b981'])
+    ))
+    fig_types.update_layout(
+        title='Column Type Distribution',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+        font=dict(color='white'),
+        height=400
+    )
+    return fig_types
+
+@st.cache_resource(show_spinner=False)
+def build_cardinality_bar(high_cardinality: int, low_cardinality: int, total_columns: int) -> go.Figure:
+    """High/low/other cardinality bucket bar chart for the profiling dashboard"""
+    cardinality_data = pd.DataFrame({
+        'Category': ['High Cardinality\n(Unique IDs)', 'Low Cardinality\n(Categories)', 'Other'],
+        'Count': [
+            high_cardinality,
+            low_cardinality,
+            total_columns - high_cardinality - low_cardinality
+        ]
+    })
 
-                Example 2:
-                Input: {...}
-                Output: {...}
+    fig_card = go.Figure(go.Bar(
+        x=cardinality_data['Category'].to_numpy(),
+        y=cardinality_data['Count'].to_numpy(),
+        marker=dict(color=cardinality_data['Count'].to_numpy(), colorscale='viridis')
+    ))
+    fig_card.update_layout(
+        title='Cardinality Distribution',
+        xaxis_title='Category',
+        yaxis_title='Count',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+        font=dict(color='white'),
+        height=400,
+        showlegend=False
+    )
+    return fig_card
+
+@st.cache_resource(show_spinner=False)
+def build_correlation_heatmap(corr_values: np.ndarray, columns: Tuple[str, ...]) -> go.Figure:
+    """Correlation matrix heatmap for the profiling dashboard"""
+    fig_corr = go.Figure(go.Heatmap(
+        z=corr_values,
+        x=list(columns),
+        y=list(columns),
+        colorscale='RdBu',
+        reversescale=True,
+        zmin=-1, zmax=1,
+        colorbar=dict(title='Correlation')
+    ))
+    fig_corr.update_layout(
+        title="Correlation Matrix - Strong correlations indicate relationships",
+        yaxis=dict(autorange='reversed'),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+        font=dict(color='white', size=9),
+        height=600
+    )
+    return fig_corr
+
+@st.cache_resource(show_spinner=False)
+def build_quality_gauge(quality_score: float) -> go.Figure:
+    """Overall data quality gauge for the profiling dashboard"""
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=quality_score,
+        title={'text': "Data Quality Score", 'font': {'color': 'white'}},
+        delta={'reference': 90, 'increasing': {'color': "green"}},
+        gauge={
+            'axis': {'range': [0, 100], 'tickcolor': 'white'},
+            'bar': {'color': "#10b981" if quality_score >= 90 else "#f59e0b" if quality_score >= 70 else "#ef4444"},
+            'steps': [
+                {'range': [0, 70], 'color': "rgba(239, 68, 68, 0.3)"},
+                {'range': [70, 90], 'color': "rgba(245, 158, 11, 0.3)"},
+                {'range': [90, 100], 'color': "rgba(16, 185, 129, 0.3)"}
+            ],
+            'threshold': {
+                'line': {'color': "white", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig_gauge.update_layout(
+        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+        font={'color': 'white'},
+        height=400
+    )
+    return fig_gauge
 
-                Now analyze: {...}"
-                ```
-                - **Expected Impact:** +20% consistency
+# ====================================================================================
+# TAB FRAGMENTS
+# ====================================================================================
 
-                #### D. **Ensemble Generation**
-                - Generate 3 variants, pick best
-                - Use multiple models for consensus
-                - **Expected Impact:** +35% quality
+# Tab bodies wrapped in @st.fragment rerun on their own when one of their widgets
+# changes, instead of re-executing every tab (and its pandas aggregations) in main().
 
-                #### E. **Fine-Tuning**
-                - Train on higher education reports
-                - Domain-specific vocabulary
-                - **Expected Impact:** +40% relevance
+@st.fragment
+def render_demographics_tab(df: pd.DataFrame, metrics: dict):
+    """Tab 8: Demographics deep dive metrics and AI diversity analysis"""
+    st.header("👥 Demographics Deep Dive - AI-Driven Deep Analysis")
+    st.caption("The AI analyzes diversity patterns, market concentration risks, and inclusion strategies")
 
-                #### F. **Prompt Caching**
-                - Cache expensive prompt processing
-                - Reuse common contexts
-                - **Expected Impact:** +50% speed
+    # Check for demographic data
+    nationality_col = None
+    for col in ['nationality', 'country', 'citizenship', 'origin']:
+        if col in df.columns:
+            nationality_col = col
+            break
 
-                #### G. **Streaming Responses**
-                - Show progressive generation
-                - Better user experience
-                - **Expected Impact:** Perceived -70% latency
+    gender_col = None
+    for col in ['gender', 'sex']:
+        if col in df.columns:
+            gender_col = col
+            break
 
-                ---
+    # Calculate demographic metrics
+    unique_nationalities = metrics.get('unique_nationalities', 0)
+    uae_nationals = metrics.get('uae_nationals', 0)
+    uae_percentage = metrics.get('uae_percentage', 0)
+    international_students = metrics.get('total_students', 0) - uae_nationals
 
-                ## 🔬 Current System Performance
+    # Calculate top 3 concentration if nationality column available
+    top_3_concentration = 0
+    if nationality_col and nationality_col in df.columns:
+        top_nat = df[nationality_col].value_counts().head(3)
+        top_3_concentration = (top_nat.sum() / len(df) * 100) if len(df) > 0 else 0
+
+    # Gender distribution if available (kept as a value_counts Series; idxmax is a vectorized lookup)
+    gender_distribution = pd.Series(dtype='int64')
+    if gender_col and gender_col in df.columns:
+        gender_distribution = df[gender_col].value_counts()
+
+    # Demographics-focused metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Nationalities", f"{unique_nationalities}",
+                 help="Number of different nationalities represented")
+
+    with col2:
+        st.metric("UAE Nationals", f"{uae_nationals:,}",
+                 f"{uae_percentage:.1f}%",
+                 help="UAE national students")
+
+    with col3:
+        st.metric("International Students", f"{international_students:,}",
+                 f"{(international_students/metrics.get('total_students', 1)*100):.1f}%",
+                 help="Non-UAE international students")
+
+    with col4:
+        if top_3_concentration > 0:
+            risk_level = "🔴 High" if top_3_concentration > 60 else "🟠 Moderate" if top_3_concentration > 50 else "🟢 Low"
+            st.metric("Top 3 Concentration", f"{top_3_concentration:.1f}%",
+                     help=f"Concentration risk: {risk_level}")
+        elif len(gender_distribution) > 0:
+            most_common_gender = gender_distribution.idxmax()
+            st.metric("Gender Balance", f"{most_common_gender}: {int(gender_distribution.max()):,}",
+                     help="Gender distribution")
+        else:
+            st.metric("Diversity Index", f"{unique_nationalities}",
+                     help="Number of nationalities")
 
-                **Metrics:**
-                - **108 narratives** generated per journey set
-                - **Avg generation time:** 3-5 minutes (all journeys)
-                - **Success rate:** >95% with fallbacks = 100%
-                - **Context utilization:** 2048-8192 tokens
-                - **Response quality:** Professional grade
+    st.divider()
 
-                **Architecture:**
-                ```
-                Data → Metrics → Prompts → LLM → Narratives → UI
-                         ↓          ↓        ↓
-                    Format    Optimize  Fallback
-                ```
+    # AI Analysis Button
+    if st.session_state.ollama_connected and st.button("🤖 Generate Diversity & Inclusion Analysis & Visualizations", key="demo_btn", type="primary", width='stretch'):
 
-                ---
+        # Generate demographics-focused analysis using hybrid approach
+        st.session_state.llm_cache['demographics_analysis'] = generate_dynamic_visualizations_llm(
+            metrics,
+            df,
+            st.session_state.selected_model,
+            st.session_state.ollama_url,
+            context_type="demographics"  # Demographics-focused context
+        )
 
-                ## 💡 Quick Tips for Best Results
+    elif not st.session_state.ollama_connected:
+        st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered diversity analysis.")
 
-                1. **Use Cloudflare tunnel** for remote access
-                2. **Select larger models** (7B+ params) for quality
-                3. **Ensure >8GB RAM** for optimal performance
-                4. **Enable auto-optimize** (default on)
-                5. **Use sample dataset** to test first
-                6. **Check Ollama logs** if generation fails
+    # Render the last generated analysis on every rerun (not only on the click that produced it)
+    demographics_analysis = st.session_state.llm_cache.get('demographics_analysis')
+    if demographics_analysis:
+        # Display strategic overview
+        st.markdown("### 🌍 Diversity & Inclusion Analysis")
+        st.info(demographics_analysis.get('strategic_overview', ''))
 
-                ---
+        st.divider()
 
-                ## 📚 Technical References
+        # Display visualizations with insights
+        st.markdown("### 📊 AI-Recommended Demographic Visualizations")
+        viz_list = demographics_analysis.get('visualizations', [])
+        st.caption(f"The AI analyzed your data and recommends {len(viz_list)} demographic visualizations")
 
-                **Implemented Techniques:**
-                - ✅ Role-based prompting
-                - ✅ Structured instructions
-                - ✅ Constraint guidance
-                - ✅ Dynamic parameter tuning
-                - ✅ Temperature control
-                - ✅ Context chaining
-                - ✅ Metrics formatting
-                - ✅ Fallback strategies
+        for i, viz_spec in enumerate(viz_list):
+            with st.container():
+                st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
+                st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Demographic indicator')}")
 
-                **Code Locations:**
-                - Prompt engineering: `journey_narratives.py`
-                - LLM optimization: `student_360_llm_powered.py:689-934`
-                - Generation pipeline: `journey_assembler.py`
-                - Metrics formatting: `journey_narratives.py:252-307`
+                # Build and display chart
+                fig = build_dynamic_chart(viz_spec, df)
+                if fig:
+                    st.plotly_chart(fig, width='stretch', key=f"demographics_viz_{i}", config=DYNAMIC_CHART_CONFIG)
+                else:
+                    st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
 
-                ---
+                # Display AI insight
+                insight = viz_spec.get('insight', '')
+                if insight:
+                    st.markdown(f"""
+                            <div class="insight-card">
+                                <div class="insight-title">🌍 Demographic Insight</div>
+                                <div class="insight-text">{insight}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-                <p><em>This guide documents the production-grade LLM
-                enhancement strategies powering Student 360 Analytics.</em></p>
+                st.divider()
 
-                </div>
-                """, unsafe_allow_html=True)
+        # Display key findings
+        st.markdown("### 🔍 Key Demographic Findings")
+        findings = demographics_analysis.get('key_findings', [])
+        for i, finding in enumerate(findings, 1):
+            st.markdown(f"**Finding {i}:** {finding}")
 
         st.divider()
 
-        # ====================================================================================
-        # OLLAMA CONNECTION STATUS (From gen_storytelling_app.py lines 1116-1298)
-        # ====================================================================================
-        st.markdown("### 🔌 Ollama Connection Status")
+        # Display recommendations
+        st.markdown("### 💡 Diversity & Recruitment Strategy Recommendations")
+        recommendations = demographics_analysis.get('recommendations', [])
 
-        # Determine connection status
-        is_connected = False
-        model_count = 0
-        error_msg = None
+        for i, rec in enumerate(recommendations, 1):
+            # Color code by priority (first = high priority)
+            priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
 
-        if st.session_state.get('ollama_url'):
-            if st.session_state.get('ollama_connected'):
-                is_connected = True
-                models = get_available_models(st.session_state.ollama_url)
-                model_count = len(models)
-            else:
-                health = verify_ollama_health(st.session_state.ollama_url)
-                st.session_state.health_check_count += 1
+            with st.container():
+                st.markdown(f"""
+                        <div class="recommendation-card">
+                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
+                            <div class="recommendation-text">{rec}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
 
-                if health['connected']:
-                    is_connected = True
-                    model_count = health['model_count']
-                    st.session_state.ollama_connected = True
-                else:
-                    is_connected = False
-                    error_msg = health.get('error', 'Unknown')
+@st.fragment
+def render_risk_success_tab(df: pd.DataFrame, metrics: dict):
+    """Tab 9: Risk & success metrics and AI intervention analysis"""
+    st.header("⚠️ Risk & Success Analysis - AI-Driven Deep Analysis")
+    st.caption("The AI analyzes at-risk patterns, success predictors, and intervention effectiveness")
 
-        # Display status
-        if is_connected:
-            st.success("✅ Connected & Active")
+    # Calculate risk metrics
+    at_risk = metrics.get('at_risk', 0)
+    high_performers = metrics.get('high_performers', 0)
+    total_students = metrics.get('total_students', 1)
+    mid_performers = total_students - at_risk - high_performers
+    success_rate = ((total_students - at_risk) / total_students * 100) if total_students > 0 else 0
+    at_risk_pct = (at_risk / total_students * 100) if total_students > 0 else 0
+    high_perf_pct = (high_performers / total_students * 100) if total_students > 0 else 0
 
-            current_url = st.session_state.get('ollama_url', 'Unknown')
-            if 'cloudflare' in current_url.lower() or 'exalio' in current_url.lower():
-                endpoint_type = "☁️ Cloudflare"
-            elif 'localhost' in current_url.lower():
-                endpoint_type = "💻 Local"
-            else:
-                endpoint_type = "🔧 Custom"
+    # Determine risk severity
+    risk_severity = "🔴 CRITICAL" if at_risk_pct > 25 else "🟠 HIGH" if at_risk_pct > 15 else "🟢 MODERATE"
+
+    # Risk-focused metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("At-Risk Students", f"{at_risk:,}",
+                 delta=f"{at_risk_pct:.1f}%",
+                 delta_color="inverse",
+                 help="Students with GPA < 2.0")
+
+    with col2:
+        st.metric("Mid-Tier Students", f"{mid_performers:,}",
+                 f"{(mid_performers/total_students*100):.1f}%",
+                 help="Students with 2.0 ≤ GPA < 3.5")
+
+    with col3:
+        st.metric("High Performers", f"{high_performers:,}",
+                 delta=f"{high_perf_pct:.1f}%",
+                 help="Students with GPA ≥ 3.5")
+
+    with col4:
+        st.metric("Risk Severity", risk_severity,
+                 f"Success: {success_rate:.1f}%",
+                 help="Risk level based on at-risk percentage")
+
+    st.divider()
+
+    # AI Analysis Button
+    if st.session_state.ollama_connected and st.button("🤖 Generate Risk & Success Analysis & Visualizations", key="risk_btn", type="primary", width='stretch'):
+
+        # Generate risk-focused analysis using hybrid approach
+        st.session_state.llm_cache['risk_analysis'] = generate_dynamic_visualizations_llm(
+            metrics,
+            df,
+            st.session_state.selected_model,
+            st.session_state.ollama_url,
+            context_type="risk"  # Risk-focused context
+        )
 
-            st.caption(f"📦 {model_count} model(s) available from {endpoint_type}")
-            if st.session_state.get('selected_model'):
-                st.caption(f"🤖 Active: {st.session_state.selected_model}")
-            st.caption(f"🕐 Health checks: {st.session_state.health_check_count}")
-        elif st.session_state.get('ollama_url'):
-            st.error("❌ Disconnected")
-            if error_msg:
-                st.caption(f"Error: {error_msg}")
+    elif not st.session_state.ollama_connected:
+        st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered risk analysis.")
 
-            col_retry1, col_retry2 = st.columns([3, 2])
-            with col_retry1:
-                if st.button("🔄 Reconnect Now", type="primary", width="stretch"):
-                    with st.spinner("🔄 Attempting to reconnect..."):
-                        import time
-                        connected, models, status_msg = ensure_ollama_connection(
-                            st.session_state.ollama_url,
-                            auto_reconnect=True,
-                            max_retries=3
-                        )
+    # Render the last generated analysis on every rerun (not only on the click that produced it)
+    risk_analysis = st.session_state.llm_cache.get('risk_analysis')
+    if risk_analysis:
+        # Display strategic overview
+        st.markdown("### ⚠️ Risk & Success Strategic Analysis")
+        st.info(risk_analysis.get('strategic_overview', ''))
 
-                        if connected:
-                            st.session_state.ollama_connected = True
-                            st.session_state.selected_model = models[0] if models else None
-                            st.success(f"✅ {status_msg}")
-                            st.success(f"📦 Found {len(models)} model(s)")
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            st.error(f"❌ {status_msg}")
-                            st.info("💡 **Troubleshooting:**\n- Check if Ollama is running\n- Verify URL is correct\n- Check network connection")
+        st.divider()
 
-            with col_retry2:
-                if st.button("ℹ️ Help", width="stretch"):
-                    st.session_state.show_connection_help = not st.session_state.get('show_connection_help', False)
+        # Display visualizations with insights
+        st.markdown("### 📊 AI-Recommended Risk Analysis Visualizations")
+        viz_list = risk_analysis.get('visualizations', [])
+        st.caption(f"The AI analyzed your data and recommends {len(viz_list)} risk analysis visualizations")
 
-            if st.session_state.get('show_connection_help', False):
-                with st.expander("🔧 Connection Troubleshooting", expanded=True):
-                    st.markdown("""
-                    **Common Issues:**
+        for i, viz_spec in enumerate(viz_list):
+            with st.container():
+                st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
+                st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Risk indicator')}")
 
-                    1. **Ollama not running**
-                       ```bash
-                       ollama serve
-                       ```
+                # Build and display chart
+                fig = build_dynamic_chart(viz_spec, df)
+                if fig:
+                    st.plotly_chart(fig, width='stretch', key=f"risk_viz_{i}", config=DYNAMIC_CHART_CONFIG)
+                else:
+                    st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
 
-                    2. **Wrong URL**
-                       - Local: `http://localhost:11434`
-                       - Cloudflare: Check tunnel URL
+                # Display AI insight
+                insight = viz_spec.get('insight', '')
+                if insight:
+                    st.markdown(f"""
+                            <div class="insight-card">
+                                <div class="insight-title">⚠️ Risk Insight</div>
+                                <div class="insight-text">{insight}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-                    3. **Firewall blocking**
-                       - Allow port 11434
-                       - Check antivirus settings
+                st.divider()
 
-                    4. **No models installed**
-                       ```bash
-                       ollama pull tinyllama
-                       ```
-                    """)
-        else:
-            st.warning("⚠️ Not configured")
+        # Display key findings
+        st.markdown("### 🔍 Key Risk & Success Findings")
+        findings = risk_analysis.get('key_findings', [])
+        for i, finding in enumerate(findings, 1):
+            st.markdown(f"**Finding {i}:** {finding}")
 
-        # Auto-refresh toggle
-        auto_refresh = st.checkbox(
-            "🔄 Enable Auto-refresh",
-            value=st.session_state.get('auto_refresh', False),
-            help="Automatically refresh connection status"
+        st.divider()
+
+        # Display recommendations
+        st.markdown("### 💡 Intervention & Success Strategy Recommendations")
+        recommendations = risk_analysis.get('recommendations', [])
+
+        for i, rec in enumerate(recommendations, 1):
+            # Color code by priority (first = high priority)
+            priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
+
+            with st.container():
+                st.markdown(f"""
+                        <div class="recommendation-card">
+                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
+                            <div class="recommendation-text">{rec}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+@st.fragment
+def render_generative_profiling(df: pd.DataFrame, model: str, url: str, completeness: float):
+    """Tab 10: Generative data profiling (analysis mode, LLM profile and visualization dashboard)"""
+    # ========== GENERATIVE DATA PROFILING WITH LLM ==========
+    st.subheader("🤖 Generative Data Profiling")
+
+    # Analysis mode selection
+    analysis_mode = "Quick Analysis"
+    if len(df.columns) > 30:
+        st.markdown("### 🎯 Analysis Mode")
+        analysis_mode = st.radio(
+            "Choose analysis approach:",
+            ["Quick Analysis (Fast, top insights)", "Comprehensive Analysis (Detailed, all aspects)"],
+            key="profiling_mode",
+            help="**Quick**: Fast analysis with key insights (1-2 min)\n\n**Comprehensive**: Thorough analysis with detailed recommendations (3-5 min)"
         )
-        st.session_state.auto_refresh = auto_refresh
 
-        if not auto_refresh:
-            st.caption("❌ Auto-refresh disabled")
+    if st.session_state.ollama_connected and st.button("🔬 Generate AI Data Profile", key="lineage_btn", type="primary", width='stretch'):
+        # Test connection first (memoized per URL for a short TTL)
+        connection_ok, connection_msg = probe_ollama_connection(url)
+        if connection_ok:
+            st.success(f"✅ {connection_msg} - Model: {model}")
+        else:
+            st.error(f"❌ Connection test failed: {connection_msg}")
+            st.warning("💡 Make sure Ollama is running and accessible")
+            st.stop()
 
-        # Connection details
-        if st.session_state.get('ollama_url'):
-            with st.expander("📊 Connection Details", expanded=False):
-                st.markdown("**Connection Information:**")
+        # Show estimated time
+        use_comprehensive = "Comprehensive" in analysis_mode
 
-                if is_connected:
-                    st.markdown("- Status: ✅ **Active**")
-                    st.markdown(f"- Endpoint: {endpoint_type}")
-                    st.markdown(f"- Models: {model_count} available")
-                else:
-                    st.markdown("- Status: ❌ **Disconnected**")
-                    if error_msg:
-                        st.markdown(f"- Error: `{error_msg}`")
+        # Calculate dynamic timeout based on dataset size
+        is_large_dataset = len(df.columns) > 100
+        base_timeout = 240 if is_large_dataset else 180
 
-                st.markdown(f"- URL: `{st.session_state.ollama_url}`")
-                st.markdown(f"- Health checks: {st.session_state.health_check_count}")
+        if use_comprehensive:
+            est_time = "4-6 minutes" if is_large_dataset else "3-5 minutes"
+            st.info(f"⏱️ **Comprehensive Mode**: Estimated time {est_time} with {model}")
+        else:
+            est_time = "2-4 minutes" if is_large_dataset else "1-2 minutes"
+            st.info(f"⚡ **Quick Mode**: Estimated time {est_time} with {model}")
+
+        if is_large_dataset:
+            st.warning(f"⚠️ Large dataset detected ({len(df.columns)} columns). Analysis will take longer. Please be patient...")
+
+        # Prepare comprehensive data profile for LLM
+        with st.spinner("🔄 Phase 1/3: Analyzing dataset structure..."):
+            st.info(f"📊 Analyzing {len(df):,} records with {len(df.columns)} columns...")
+
+            # Calculate detailed statistics (each full-frame scan runs once)
+            primitives = get_profile_primitives(df)
+            numeric_cols = primitives['numeric_cols']
+            categorical_cols = primitives['categorical_cols']
+            datetime_cols = primitives['datetime_cols']
+
+            duplicate_rows = primitives['duplicate_rows']
+            columns_with_nulls = primitives['columns_with_nulls']
+
+            # Get missing data statistics (built once; each mode slices its own top-N)
+            missing_df = build_missing_data_table(primitives['null_counts'], len(df))
+
+            # Get sample columns (limit to 15 for large datasets to reduce prompt size)
+            sample_limit = 15 if is_large_dataset else 25
+            columns_sample = ', '.join(df.columns[:sample_limit].tolist())
+            if len(df.columns) > sample_limit:
+                columns_sample += f"... (+{len(df.columns) - sample_limit} more)"
+
+            # Calculate cardinality
+            high_cardinality_cols = primitives['high_cardinality_cols']
+            low_cardinality_cols = primitives['low_cardinality_cols']
+
+            # Shared statistics used by both analysis modes
+            complete_cols = primitives['complete_cols']
+            total_missing = primitives['total_missing']
+
+            # Domain column detection (one vectorized scan per precompiled domain pattern)
+            column_names = df.columns.astype(str)
+            domain_counts = {
+                domain: int(column_names.str.contains(pattern).sum())
+                for domain, pattern in DOMAIN_PATTERNS.items()
+            }
 
-        st.divider()
+            # Get data type summary
+            dtype_summary = df.dtypes.value_counts().to_string()
 
-        # ====================================================================================
-        # SYSTEM RESOURCES & OPTIMIZATION (From gen_storytelling_app.py lines 1300-1434)
-        # ====================================================================================
-        st.markdown("### 🖥️ System Resources & Optimization")
+            # Generate deterministic seed from dataset properties for reproducibility
+            # Same dataset will always produce same seed (CRC32: no cryptographic strength needed)
+            dataset_signature = f"{len(df)}_{len(df.columns)}_{completeness:.1f}_{duplicate_rows}"
+            seed_value = zlib.crc32(dataset_signature.encode()) % 1000000
 
-        is_cloudflare = st.session_state.get('ollama_server_type') == "Cloudflare"
-        cloudflare_connected = is_connected if is_cloudflare else True
+            st.success(f"✅ Phase 1 complete: Identified {len(numeric_cols)} numeric, {len(categorical_cols)} categorical, {len(datetime_cols)} datetime columns")
 
-        if is_cloudflare and not cloudflare_connected:
-            resources = None
-            opt_tier = "⚠️ Unavailable"
-            opt_desc = "Connect to Cloudflare to see resources"
-        elif is_cloudflare and cloudflare_connected:
-            remote_resources = fetch_remote_system_resources(st.session_state.get('ollama_url', ''))
-            if remote_resources:
-                resources = remote_resources
-            else:
-                resources = get_system_resources()
+        # Generate LLM insights
+        with st.spinner("🔄 Phase 2/3: Generating AI-powered insights..."):
+            st.info("🧠 LLM analyzing data patterns, quality, and business context...")
 
-            if resources and resources['gpu_available']:
-                if resources['ram_available_gb'] > 30:
-                    opt_tier = "🚀 High-End"
-                    opt_desc = "Optimal for large models"
-                else:
-                    opt_tier = "⚡ Medium"
-                    opt_desc = "Good for most tasks"
-            else:
-                opt_tier = "💻 Basic"
-                opt_desc = "CPU-only mode"
-        else:
-            resources = get_system_resources()
+            if use_comprehensive:
+                # Comprehensive mode - DEEP analysis (optimized for large datasets)
+                missing_data_rows = 10 if is_large_dataset else 15
 
-            if resources['gpu_available']:
-                if resources['ram_available_gb'] > 30:
-                    opt_tier = "🚀 High-End"
-                    opt_desc = "Optimal for large models"
+                # Distribution statistics are computed on a seeded row sample for very long datasets
+                if len(df) > PROFILE_STATS_SAMPLE_ROWS:
+                    stats_df = df.sample(n=PROFILE_STATS_SAMPLE_ROWS, random_state=seed_value)
+                    sample_note = f" (stats computed on {PROFILE_STATS_SAMPLE_ROWS:,}-row sample)"
                 else:
-                    opt_tier = "⚡ Medium"
-                    opt_desc = "Good for most tasks"
+                    stats_df = df
+                    sample_note = ""
+
+                # Calculate additional depth statistics for comprehensive mode
+                # 1. Correlation analysis for numeric columns
+                correlation_insight = "No numeric columns"
+                if len(numeric_cols) >= 2:
+                    corr_matrix = compute_correlation_matrix(stats_df[numeric_cols[:10]])  # Top 10 to avoid overload
+                    high_corr = [
+                        f"{col_a} ↔ {col_b} ({corr_val:.2f})"
+                        for col_a, col_b, corr_val in find_strong_correlations(corr_matrix, 0.7)[:5]
+                    ]
+                    correlation_insight = ', '.join(high_corr[:5]) if high_corr else "No strong correlations found (>0.7)"
+
+                # 2 & 3. Distribution and outlier statistics for numeric columns (single vectorized pass)
+                distribution_stats = ""
+                outlier_info = ""
+                if numeric_cols:
+                    numeric_summary = summarize_numeric_distributions(stats_df[numeric_cols[:5]])
+
+                    skews = numeric_summary['skew']
+                    skewness_high = [f"{col}({skew:.2f})" for col, skew in skews[skews.abs() > 1].items()]
+                    distribution_stats = f"Skewed distributions: {', '.join(skewness_high)}" if skewness_high else "Distributions appear normal"
+
+                    outlier_counts = numeric_summary['outlier_counts']
+                    outlier_cols = [f"{col}({outliers})" for col, outliers in outlier_counts[outlier_counts > 0].items()]
+                    outlier_info = f"Columns with outliers: {', '.join(outlier_cols)}" if outlier_cols else "No significant outliers"
+
+                # 4. Categorical column analysis
+                categorical_insights = ""
+                if categorical_cols:
+                    # Unique ratios come straight from the cached per-column nunique counts
+                    unique_ratios = primitives['nunique'][categorical_cols[:5]] / len(df)
+                    high_cat_diversity = unique_ratios[unique_ratios > 0.5].index.tolist()
+                    low_cat_diversity = unique_ratios[unique_ratios < 0.05].index.tolist()
+                    categorical_insights = f"High diversity: {', '.join(high_cat_diversity) or 'None'} | Low diversity: {', '.join(low_cat_diversity) or 'None'}"
+
+                prompt = COMP_SYSTEM_PREFIX + build_profile_stats_block(
+                    df, primitives, completeness, complete_cols, columns_sample, domain_counts, examples_per_type=5
+                ) + f"""
+**STATISTICAL ANALYSIS{sample_note}:**
+- Strong Correlations (>0.7): {correlation_insight}
+- Skewed Distributions (|skew|>1): {distribution_stats}
+- Outliers Detected (IQR method): {outlier_info}
+- Categorical Diversity Analysis: {categorical_insights}
+
+**TOP MISSING DATA ({missing_data_rows} columns):**
+{missing_df.head(missing_data_rows).to_string(index=False)}"""
+
             else:
-                opt_tier = "💻 Basic"
-                opt_desc = "CPU-only mode"
+                # Quick mode - focused analysis (optimized for large datasets)
+                # For large datasets, reduce the missing data table size
+                missing_data_rows = 5 if is_large_dataset else 10
 
-        st.info(f"**Optimization Tier:** {opt_tier}")
-        st.caption(opt_desc)
+                prompt = QUICK_SYSTEM_PREFIX + build_profile_stats_block(
+                    df, primitives, completeness, complete_cols, columns_sample, domain_counts, examples_per_type=3
+                ) + f"""
+**TOP MISSING DATA ({missing_data_rows} most affected):**
+{missing_df.head(missing_data_rows).to_string(index=False)}"""
 
-        if resources is None:
-            st.warning("⚠️ **System resources not available**")
-            st.caption("📡 Resources from: ❌ Not connected to Cloudflare")
-            st.caption("💡 Connect to Cloudflare Ollama to view remote resources")
+            # Reuse a previous profile when the same loaded dataset/mode/model was already analyzed
+            profile_mode = 'comprehensive' if use_comprehensive else 'quick'
+            profile_cache_key = ('data_profile', get_dataframe_fingerprint(df), profile_mode, model)
 
-            col_res1, col_res2 = st.columns(2)
-            with col_res1:
-                st.caption("🔲 CPU: N/A")
-                st.caption("💾 RAM: N/A")
-            with col_res2:
-                st.caption("🎮 GPU: N/A")
-                st.caption("⚙️ CPU: N/A")
-        else:
-            if resources.get('source') == 'remote_colab':
-                st.caption(f"📡 Resources from: ☁️ Remote Colab")
+            # Prefetch the visualization dashboard aggregates on a worker thread while the LLM decodes
+            aggregates_executor = ThreadPoolExecutor(max_workers=1)
+            aggregates_future = aggregates_executor.submit(compute_dashboard_aggregates, df, numeric_cols)
+            aggregates_executor.shutdown(wait=False)
+
+            if profile_cache_key in st.session_state.llm_cache:
+                llm_insights = st.session_state.llm_cache[profile_cache_key]
+                st.caption("♻️ Loaded cached profile for this dataset")
             else:
-                device_type = "💻 Laptop" if resources['ram_available_gb'] < 50 else "🖥️ Server"
-                st.caption(f"📡 Resources from: {device_type}")
+                # Stream LLM output with deterministic parameters for reproducible output
+                # (final report is rendered in Phase 3)
+                llm_insights = stream_ollama_to_placeholder(
+                    st.empty(),
+                    prompt,
+                    model,
+                    url,
+                    temperature=0.0,  # Zero temperature for maximum determinism
+                    num_predict=1000 if use_comprehensive else 400,  # Comprehensive needs more tokens for depth
+                    timeout=base_timeout,  # Dynamic: 240s for large datasets, 180s for normal
+                    auto_optimize=False,  # Use our custom timeout instead
+                    seed=seed_value  # Fixed seed based on dataset for reproducibility
+                )
 
-            col_res1, col_res2 = st.columns(2)
-            with col_res1:
-                st.caption(f"🔲 CPU: {resources['cpu_count']} cores")
-                st.caption(f"💾 RAM: {resources['ram_available_gb']:.1f}GB free")
-            with col_res2:
-                if resources['gpu_available']:
-                    st.caption(f"🎮 GPU: {resources.get('gpu_name', 'Available')[:15]}")
-                else:
-                    st.caption("🎮 GPU: N/A")
-                if resources.get('cpu_percent', 0) > 0:
-                    st.caption(f"⚙️ CPU: {resources['cpu_percent']:.0f}% used")
-                else:
-                    st.caption("⚙️ CPU: N/A")
+                if llm_insights and not llm_insights.startswith('[ERROR]'):
+                    st.session_state.llm_cache[profile_cache_key] = llm_insights
 
-        with st.expander("📊 View Optimization Details"):
-            if resources is None:
-                st.markdown("**Current Configuration:**")
-                st.text(f"Tier: {opt_tier}")
-                st.text("Platform: Not available (Cloudflare not connected)")
-                st.text("CPU: N/A")
-                st.text("RAM: N/A")
-                st.text("GPU: N/A")
+            # Usually finished already: the CPU work is shorter than LLM generation
+            st.session_state.dashboard_aggregates_cache = (get_dataframe_fingerprint(df), aggregates_future.result())
 
-                st.markdown("---")
-                st.warning("⚠️ **Connect to Cloudflare Ollama to view remote system resources**")
+            if llm_insights and not llm_insights.startswith('[ERROR]'):
+                st.success("✅ Phase 2 complete: AI insights generated successfully!")
+                st.info(f"🔒 **Reproducibility**: Analysis uses seed {seed_value} - same dataset will produce consistent results")
             else:
-                st.markdown("**Current Configuration:**")
-                st.text(f"Tier: {opt_tier}")
-                st.text(f"Platform: {resources.get('platform', 'Unknown')}")
-                st.text(f"CPU: {resources['cpu_count']} cores ({resources.get('cpu_percent', 0):.1f}% usage)")
-                st.text(f"RAM: {resources['ram_available_gb']:.1f}/{resources.get('ram_total_gb', 0):.1f} GB available")
-                if resources.get('ram_percent', 0) > 0:
-                    st.text(f"RAM Usage: {resources['ram_percent']:.1f}%")
-                if resources['gpu_available']:
-                    st.text(f"GPU: {resources.get('gpu_name', 'Available')}")
-                else:
-                    st.text("GPU: Not detected")
+                st.error(f"❌ LLM analysis failed: {llm_insights}")
+                st.warning("💡 Troubleshooting:")
+                st.warning(f"- Try switching to {'Quick' if use_comprehensive else 'Comprehensive'} mode")
+                st.warning(f"- Large model ({model}) may need more time. Consider smaller model like 'qwen2:7b'")
+                st.warning("- Check Ollama is running and not frozen")
+                st.warning("- For very large datasets, try filtering some rows first")
+                st.stop()
 
-        st.divider()
+        # Compile profiling results (the report itself is rendered from session state below)
+        with st.spinner("🔄 Phase 3/3: Compiling profiling report..."):
+            st.info("📝 Finalizing report...")
+
+            st.success("✅ Phase 3 complete: Generative Data Profiling finished!")
+
+            # Store profiling results in session state for the report and visualization
+            st.session_state['profiling_results'] = {
+                'insights': llm_insights,
+                'mode': 'Comprehensive' if use_comprehensive else 'Quick',
+                'model': model,
+                'seed': seed_value,
+                'columns_analyzed': len(df.columns),
+                'completeness': completeness,
+                'duplicate_rows': duplicate_rows,
+                'columns_with_nulls': columns_with_nulls,
+                'numeric_cols': len(numeric_cols),
+                'categorical_cols': len(categorical_cols),
+                'datetime_cols': len(datetime_cols),
+                'high_cardinality': len(high_cardinality_cols),
+                'low_cardinality': len(low_cardinality_cols),
+                'total_missing': total_missing,
+                'complete_cols': complete_cols
+            }
 
-        # ====================================================================================
-        # VERSION 1.0 RELEASE NOTES
-        # ====================================================================================
-        with st.expander("📝 Version 1.0 Release Notes", expanded=False):
-            st.markdown("""
-            **🎉 What's New in Version 1.0**
+    # Render the last profiling report on every rerun (not only on the click that produced it)
+    if 'profiling_results' in st.session_state:
+        profile_report = st.session_state['profiling_results']
 
-            **Major Features:**
-            - ✅ **5 Advanced AI-Driven Analysis Tabs**
-              - Academic Analytics with AI-driven deep analysis
-              - Housing Insights with impact analysis
-              - Financial Intelligence with sustainability metrics
-              - Demographics Deep Dive with diversity analysis
-              - Risk & Success Analysis with predictive insights
+        # Display LLM-generated insights
+        st.markdown("""
+            <div class="insight-card">
+                <div class="insight-title">🤖 AI-Powered Data Profiling Report</div>
+            </div>
+            """, unsafe_allow_html=True)
 
-            - ✅ **Context-Aware Visualizations**
-              - AI automatically recommends relevant charts for each context
-              - 6 visualization types per analysis tab
-              - Intelligent data column selection
+        st.markdown(profile_report['insights'])
 
-            - ✅ **Strategic Insights & Recommendations**
-              - Root cause analysis for all findings
-              - Business impact quantification
-              - Priority-coded actionable recommendations
-              - LLM-enriched insights for every visualization
+        # Add metadata
+        st.caption(f"Generated using {profile_report['model']} | Mode: {profile_report['mode']} | {profile_report['columns_analyzed']} columns analyzed | Seed: {profile_report['seed']} (reproducible)")
 
-            **Technical Improvements:**
-            - Hybrid approach: Rule-based + LLM enrichment
-            - Optimized for performance and reliability
-            - Enhanced error handling and fallbacks
-            - Deep data profiling for better AI insights
+    st.divider()
 
-            **Release Date:** February 2, 2026
-            **Status:** Production Release
-            """)
+    render_profiling_dashboard(df)
 
-        st.divider()
+@st.fragment
+def render_profiling_dashboard(df: pd.DataFrame):
+    """Visualization dashboard for the last profiling report (its own fragment: the button reruns only this block)"""
+    # ========== VISUALIZE DATA PROFILING BUTTON ==========
+    if 'profiling_results' in st.session_state and st.button("📊 Visualize Data Profiling", key="viz_profiling_btn", type="secondary", width='stretch'):
+        st.subheader("📊 Data Profiling Visualization Dashboard")
+        st.caption("AI-generated visual insights from profiling analysis")
 
-        # ====================================================================================
-        # DATA SOURCE (From gen_storytelling_app.py lines 1436-1632)
-        # ====================================================================================
-        st.markdown("### 📁 Data Source")
+        profile_data = st.session_state['profiling_results']
 
-        if not st.session_state.get('ollama_connected'):
-            st.info("💡 **You can load data without Ollama connection** - AI features will be available once you connect")
+        # Column dtype groups and null counts come from the cached profiling primitives
+        primitives = get_profile_primitives(df)
+        numeric_cols_viz = primitives['numeric_cols']
+        categorical_cols_viz = primitives['categorical_cols']
+        datetime_cols_viz = primitives['datetime_cols']
 
-        data_source = st.radio(
-            "Choose data source:",
-            options=["Upload File", "Pre-loaded Dataset (Student_360_View)", "Use Sample Dataset"],
-            index=0,
-            key="data_source_selector"
+        # Correlation/quartile aggregates, normally prefetched while the AI profile was generating
+        dashboard_aggregates = get_dashboard_aggregates(df, numeric_cols_viz)
+
+        # Create visual dashboard similar to Data Lineage tab
+        st.markdown("---")
+
+        # KPI Cards Row 1 (one flex row, sent as a single element)
+        kpi_cards = [
+            build_kpi_card_html("✅", f"{profile_data['completeness']:.1f}%", "Data Completeness", "#10b981, #059669", "#d1fae5"),
+            build_kpi_card_html("📊", f"{len(df.columns)}", "Total Attributes", "#6366f1, #4f46e5", "#c7d2fe"),
+            build_kpi_card_html("⚠️", f"{profile_data['columns_with_nulls']}", "Columns w/ Nulls", "#f59e0b, #d97706", "#fef3c7"),
+            build_kpi_card_html("🔄", f"{profile_data['duplicate_rows']:,}", "Duplicate Rows", "#ec4899, #db2777", "#fce7f3"),
+            build_kpi_card_html("📁", f"{len(df):,}", "Total Records", "#8b5cf6, #7c3aed", "#ede9fe")
+        ]
+        st.markdown(
+            f"<div style='display: flex; gap: 12px;'>{''.join(kpi_cards)}</div>",
+            unsafe_allow_html=True
         )
 
-        if data_source == "Pre-loaded Dataset (Student_360_View)":
-            st.caption("📊 Student 360 View Dataset - Comprehensive student analytics data")
+        st.markdown("---")
 
-            # Define the path to the pre-loaded dataset (works locally and on cloud)
-            import os
-            # Try multiple path options for flexibility
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+        # Three-column layout for Data Composition
+        st.markdown("### 🎨 Data Composition Breakdown")
 
-            # Option 1: data folder in same directory as script
-            path_option_1 = os.path.join(script_dir, "data", "Student_360_View.csv")
-            # Option 2: data folder in parent directory
-            path_option_2 = os.path.join(os.path.dirname(script_dir), "data", "Student_360_View.csv")
-            # Option 3: Original local path (for backward compatibility)
-            path_option_3 = r"D:\exalio_work\RFP\Ankbut\MVP\cons\Sample DataSet\Student_360_View.csv"
+        col1, col2, col3 = st.columns(3)
 
-            # Find which path exists
-            preloaded_dataset_path = None
-            for path in [path_option_1, path_option_2, path_option_3]:
-                if os.path.exists(path):
-                    preloaded_dataset_path = path
-                    break
+        with col1:
+            st.markdown("""
+                <div style='background: rgba(99, 102, 241, 0.1); border: 2px solid #6366f1;
+                            border-radius: 12px; padding: 20px; height: 100%;'>
+                    <h4 style='text-align: center; background: linear-gradient(135deg, #6366f1, #4f46e5);
+                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
+                        🔢 Numeric Columns
+                    </h4>
+                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
+                        Quantitative measurements and metrics
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
 
-            if preloaded_dataset_path is None:
-                # Default to option 1 for error message
-                preloaded_dataset_path = path_option_1
+            st.metric("Count", profile_data['numeric_cols'],
+                     delta=f"{(profile_data['numeric_cols']/len(df.columns)*100):.1f}% of total")
 
-            # Check if already loaded
-            if st.session_state.get('data') is not None and st.session_state.get('data_source_type') == 'preloaded':
-                df = st.session_state.data
-                st.success(f"📄 ✅ Pre-loaded dataset active | {len(df)} rows × {len(df.columns)} columns")
+            # Show numeric column examples
+            numeric_cols_list = numeric_cols_viz[:10]
+            if numeric_cols_list:
+                st.markdown("**Examples:**")
+                st.markdown("".join(
+                    f"""
+                        <div style='background: rgba(30, 41, 59, 0.8); border-left: 3px solid #6366f1;
+                                    padding: 8px; margin: 5px 0; font-size: 0.8rem;'>
+                            📊 {col}
+                        </div>
+                        """
+                    for col in numeric_cols_list[:5]
+                ), unsafe_allow_html=True)
 
-                with st.expander("📊 Dataset Information"):
-                    st.markdown(f"""
-                    **Dataset:** Student_360_View.csv
-                    **Rows:** {len(df):,}
-                    **Columns:** {len(df.columns)}
-                    **Source:** {preloaded_dataset_path}
-                    """)
+        with col2:
+            st.markdown("""
+                <div style='background: rgba(245, 158, 11, 0.1); border: 2px solid #f59e0b;
+                            border-radius: 12px; padding: 20px; height: 100%;'>
+                    <h4 style='text-align: center; background: linear-gradient(135deg, #f59e0b, #d97706);
+                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
+                        📝 Categorical Columns
+                    </h4>
+                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
+                        Classifications and descriptive attributes
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
 
-                    st.dataframe(df.head(5), width="stretch")
+            st.metric("Count", profile_data['categorical_cols'],
+                     delta=f"{(profile_data['categorical_cols']/len(df.columns)*100):.1f}% of total")
 
-                if st.button("🔄 Reload Dataset", key="reload_preloaded"):
-                    st.session_state.force_reload = True
-                    st.rerun()
-            else:
-                # Load the pre-loaded dataset
-                try:
-                    if os.path.exists(preloaded_dataset_path):
-                        with st.spinner("Loading pre-loaded dataset..."):
-                            df = pd.read_csv(preloaded_dataset_path, encoding='utf-8', low_memory=False)
+            # Show categorical column examples
+            categorical_cols_list = categorical_cols_viz[:10]
+            if categorical_cols_list:
+                st.markdown("**Examples:**")
+                st.markdown("".join(
+                    f"""
+                        <div style='background: rgba(30, 41, 59, 0.8); border-left: 3px solid #f59e0b;
+                                    padding: 8px; margin: 5px 0; font-size: 0.8rem;'>
+                            📝 {col}
+                        </div>
+                        """
+                    for col in categorical_cols_list[:5]
+                ), unsafe_allow_html=True)
 
-                            if df is not None and not df.empty:
-                                set_main_data(df)
-                                st.session_state.data_source_type = 'preloaded'
-                                st.session_state.uploaded_filename = 'Student_360_View.csv'
-                                st.success(f"📄 ✅ Pre-loaded dataset loaded successfully | {len(df)} rows × {len(df.columns)} columns")
+        with col3:
+            st.markdown("""
+                <div style='background: rgba(16, 185, 129, 0.1); border: 2px solid #10b981;
+                            border-radius: 12px; padding: 20px; height: 100%;'>
+                    <h4 style='text-align: center; background: linear-gradient(135deg, #10b981, #059669);
+                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
+                        🆔 Special Columns
+                    </h4>
+                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
+                        Identifiers and unique attributes
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
 
-                                with st.expander("📊 Dataset Preview"):
-                                    st.dataframe(df.head(10), width="stretch")
+            st.metric("High Cardinality", profile_data['high_cardinality'],
+                     help="Likely IDs, unique identifiers, or highly unique fields")
+            st.metric("Low Cardinality", profile_data['low_cardinality'],
+                     help="Likely categories, statuses, or classification fields")
 
-                                st.info("💡 Dataset is ready for analysis. Navigate to Analytics tabs to explore insights.")
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to load dataset - file is empty")
-                    else:
-                        st.error(f"❌ Pre-loaded dataset not found at: {preloaded_dataset_path}")
-                        st.info("💡 Please ensure the dataset file exists at the specified location or use 'Upload File' option.")
-                except Exception as e:
-                    st.error(f"❌ Error loading pre-loaded dataset: {str(e)}")
-                    st.info("💡 Try using 'Upload File' option instead.")
+        st.markdown("---")
 
-        elif data_source == "Upload File":
-            st.caption("Choose a file (CSV, Excel, or TXT)")
+        # Missing Data Heatmap-style visualization
+        st.markdown("### 🔍 Missing Data Analysis")
 
-            uploaded_file = st.file_uploader(
-                "Drag and drop file here",
-                type=['csv', 'xlsx', 'xls', 'txt'],
-                help="Limit 200MB per file • CSV, XLSX, XLS, TXT",
-                label_visibility="collapsed"
-            )
+        # Partial selection (nlargest) of the 15 most affected columns; only those rows are built
+        missing_by_col = primitives['null_counts']
+        top_missing = missing_by_col[missing_by_col > 0].nlargest(15)
 
-            if uploaded_file is not None:
-                st.caption(f"📄 {uploaded_file.name}")
-                st.caption(f"{uploaded_file.size / 1024:.1f}KB")
+        # Create bar chart for missing data
+        if len(top_missing) > 0:
+            missing_display = pd.DataFrame({
+                'Column': top_missing.index,
+                'Missing Count': top_missing.values,
+                'Missing %': (top_missing.values / len(df) * 100).round(2)
+            })
 
-                already_loaded = (
-                    st.session_state.get('uploaded_filename') == uploaded_file.name and
-                    st.session_state.get('data') is not None
+            fig_missing = go.Figure(go.Bar(
+                x=missing_display['Missing %'].to_numpy(),
+                y=missing_display['Column'].to_numpy(),
+                orientation='h',
+                marker=dict(
+                    color=missing_display['Missing %'].to_numpy(),
+                    colorscale='reds',
+                    colorbar=dict(title='Missing Percentage (%)')
                 )
+            ))
+            fig_missing.update_layout(
+                title="Top 15 Columns with Missing Data",
+                xaxis_title='Missing Percentage (%)',
+                yaxis_title='Column',
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                font=dict(color='white'),
+                height=500,
+                yaxis={'categoryorder': 'total ascending'}
+            )
+            st.plotly_chart(fig_missing, width='stretch')
+        else:
+            st.success("✅ No missing data detected! This dataset is 100% complete.")
 
-                if already_loaded:
-                    df = st.session_state.data
-                    st.success(f"📄 ✅ Already loaded (preserving data transformations) | {len(df)} rows × {len(df.columns)} columns")
+        st.markdown("---")
 
-                    datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
-                    if datetime_cols:
-                        st.info(f"🔄 Transformations applied: {len(datetime_cols)} datetime column(s) converted")
+        # Data Type Distribution
+        st.markdown("### 📊 Data Type Distribution")
 
-                    if st.button("🔄 Reload Original File (discard transformations)", width="stretch", key="reload_original_file"):
-                        st.session_state.force_reload = True
-                        st.rerun()
-                else:
-                    try:
-                        if uploaded_file.name.endswith('.csv') or uploaded_file.name.endswith('.txt'):
-                            df = load_csv_file(uploaded_file)
-                        else:
-                            df = load_excel_file(uploaded_file)
+        col1, col2 = st.columns(2)
 
-                        if df is not None:
-                            set_main_data(df)
-                            st.session_state.uploaded_filename = uploaded_file.name
-                            st.session_state.force_reload = False
-                            st.success(f"📄 ✅ Loaded successfully | {len(df)} rows × {len(df.columns)} columns")
+        with col1:
+            # Pie chart for column types (cached on the three counts)
+            fig_types = build_column_type_pie(
+                profile_data['numeric_cols'], profile_data['categorical_cols'], profile_data['datetime_cols']
+            )
+            st.plotly_chart(fig_types, width='stretch')
 
-                            with st.expander("📊 Data Preview (first 5 rows)"):
-                                st.dataframe(df.head(5), width="stretch")
+        with col2:
+            # Bar chart for cardinality distribution (cached on the bucket counts)
+            fig_card = build_cardinality_bar(
+                profile_data['high_cardinality'], profile_data['low_cardinality'], len(df.columns)
+            )
+            st.plotly_chart(fig_card, width='stretch')
 
-                            # Show comprehensive 136-column mapping status
-                            mapping_log = st.session_state.get('mapping_log', [])
-                            with st.expander("📊 Complete 136-Column Catalog Status", expanded=False):
-                                st.markdown("### Universal Column Catalog - Data Availability Report")
-                                st.markdown("*Showing all 136 columns from the universal catalog with their status in your dataset*")
+        st.markdown("---")
 
-                                # Import the universal catalog
-                                try:
-                                    from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
+        # ========== ADVANCED VISUALIZATIONS ==========
+        st.markdown("### 🔬 Advanced Statistical Analysis")
 
-                                    # Categorize columns by status
-                                    mapped_columns = []
-                                    present_columns = []
-                                    missing_columns = []
+        # Correlation Heatmap for Numeric Columns
+        if len(numeric_cols_viz) >= 2:
+            st.markdown("#### 🔗 Correlation Heatmap (Top 15 Numeric Columns)")
+            st.caption("Identify relationships between numeric variables")
 
-                                    for col_name, col_info in UNIVERSAL_COLUMNS_CATALOG.items():
-                                        if col_name in df.columns:
-                                            # Check if it was mapped from a different name
-                                            was_mapped = any(col_name in log for log in mapping_log)
-                                            if was_mapped:
-                                                # Find the original name
-                                                original_name = None
-                                                for log in mapping_log:
-                                                    if col_name in log:
-                                                        original_name = log.split("'")[1]  # Extract original name
-                                                        break
-                                                mapped_columns.append((col_name, col_info.description, original_name))
-                                            else:
-                                                present_columns.append((col_name, col_info.description))
-                                        else:
-                                            missing_columns.append((col_name, col_info.description))
+            # Limit to top 15 for readability
+            corr_data = dashboard_aggregates['corr']
 
-                                    # Summary metrics
-                                    col1, col2, col3, col4 = st.columns(4)
-                                    with col1:
-                                        st.metric("📋 Total Catalog", "136 columns", help="Complete universal catalog size")
-                                    with col2:
-                                        st.metric("✅ Available", f"{len(mapped_columns) + len(present_columns)}",
-                                                 delta=f"{(len(mapped_columns) + len(present_columns))/136*100:.1f}%")
-                                    with col3:
-                                        st.metric("🔄 Mapped", f"{len(mapped_columns)}",
-                                                 help="Columns that were translated from different names")
-                                    with col4:
-                                        st.metric("⚠️ Missing", f"{len(missing_columns)}",
-                                                 delta=f"{len(missing_columns)/136*100:.1f}%", delta_color="inverse")
+            fig_corr = build_correlation_heatmap(corr_data.to_numpy(), tuple(corr_data.columns))
+            st.plotly_chart(fig_corr, width='stretch')
 
-                                    st.markdown("---")
+            # Highlight strong correlations
+            strong_corr = find_strong_correlations(corr_data, 0.7, top_n=5)
 
-                                    # Create tabs for different statuses
-                                    status_tab1, status_tab2, status_tab3 = st.tabs(["✅ Available Columns", "🔄 Mapped Columns", "⚠️ Missing Columns"])
+            if strong_corr:
+                st.info(f"**💡 Strong Correlations Detected (>0.7):**")
+                for col1, col2, val in strong_corr:
+                    emoji = "🔴" if val > 0 else "🔵"
+                    st.markdown(f"{emoji} **{col1}** ↔ **{col2}**: {val:.3f}")
 
-                                    with status_tab1:
-                                        st.markdown(f"**{len(present_columns)} columns present** with standard names (no mapping needed)")
-                                        if present_columns:
-                                            # Group by category
-                                            from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
-                                            for col_name, description in sorted(present_columns):
-                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
-                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
-                                                st.markdown(f"- **`{col_name}`** ({category})")
-                                                if description:
-                                                    st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+        st.markdown("---")
 
-                                    with status_tab2:
-                                        st.markdown(f"**{len(mapped_columns)} columns mapped** from non-standard names")
-                                        if mapped_columns:
-                                            for col_name, description, original_name in sorted(mapped_columns):
-                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
-                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
-                                                st.markdown(f"- **`{original_name}`** → **`{col_name}`** ({category})")
-                                                if description:
-                                                    st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+        # Distribution Analysis for Top Numeric Columns
+        if numeric_cols_viz:
+            st.markdown("#### 📊 Distribution Analysis (Top 6 Numeric Columns)")
+            st.caption("Understand data spread, skewness, and normality")
 
-                                    with status_tab3:
-                                        st.markdown(f"**{len(missing_columns)} columns not present** in your dataset (optional columns)")
-                                        st.info("💡 These columns are part of the universal catalog but not in your current data file. The application will function normally with graceful fallbacks.")
+            col1, col2, col3 = st.columns(3)
+            cols = [col1, col2, col3]
 
-                                        if missing_columns:
-                                            # Group by category
-                                            missing_by_category = {}
-                                            for col_name, description in missing_columns:
-                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
-                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
-                                                if category not in missing_by_category:
-                                                    missing_by_category[category] = []
-                                                missing_by_category[category].append((col_name, description))
+            # Histograms are drawn from a seeded row sample so the chart payload stays bounded
+            if len(df) > PROFILE_PLOT_MAX_ROWS:
+                plot_df = df[numeric_cols_viz[:6]].sample(n=PROFILE_PLOT_MAX_ROWS, random_state=profile_data['seed'])
+                st.caption(f"Histograms drawn from a {PROFILE_PLOT_MAX_ROWS:,}-row sample; statistics use all rows")
+            else:
+                plot_df = df[numeric_cols_viz[:6]]
 
-                                            # Show by category
-                                            for category in sorted(missing_by_category.keys()):
-                                                with st.expander(f"📁 {category} ({len(missing_by_category[category])} columns)", expanded=False):
-                                                    for col_name, description in sorted(missing_by_category[category]):
-                                                        st.markdown(f"- **`{col_name}`**")
-                                                        if description:
-                                                            st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+            for idx, col_name in enumerate(numeric_cols_viz[:6]):
+                with cols[idx % 3]:
+                    if not has_value_spread(df[col_name]):
+                        st.info(f"{col_name}: constant or empty column, skipping")
+                        continue
 
-                                except ImportError:
-                                    # Fallback if catalog not available
-                                    st.warning("⚠️ Universal catalog module not found. Showing basic mapping info.")
-                                    st.success(f"✅ Successfully mapped {len(mapping_log)} columns to standardized format")
-                                    for log_entry in mapping_log[:10]:
-                                        st.text(f"  • {log_entry}")
-                                    if len(mapping_log) > 10:
-                                        st.text(f"  ... and {len(mapping_log) - 10} more")
+                    fig_dist = px.histogram(
+                        plot_df,
+                        x=col_name,
+                        nbins=30,
+                        title=f"{col_name[:20]}...",
+                        marginal="box"  # Add box plot on top
+                    )
+                    fig_dist.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                        font=dict(color='white'),
+                        height=300,
+                        showlegend=False
+                    )
+                    st.plotly_chart(fig_dist, width='stretch')
 
-                    except Exception as e:
-                        st.error(f"❌ Error loading file: {e}")
-        else:
-            st.caption("Load a pre-built sample dataset")
+                    # Show statistics
+                    skew = df[col_name].skew()
+                    skew_label = "Right-skewed" if skew > 0.5 else "Left-skewed" if skew < -0.5 else "Normal"
+                    st.caption(f"Skew: {skew:.2f} ({skew_label})")
 
-            if st.session_state.get('data') is not None and st.session_state.get('uploaded_filename') == 'sample_dataset':
-                df = st.session_state.data
-                # Check if sample dataset is outdated (missing new required fields)
-                required_new_fields = ['visa_status', 'enrollment_type', 'room_number', 'occupancy_status']
-                missing_new_fields = [f for f in required_new_fields if f not in df.columns]
+        st.markdown("---")
 
-                if missing_new_fields:
-                    st.warning(f"⚠️ Sample dataset is outdated (missing {len(missing_new_fields)} new fields)")
-                    if st.button("🔄 Reload Updated Sample Data", width="stretch", type="primary"):
-                        df = create_sample_dataset_v3_final()
-                        set_main_data(df)
-                        st.session_state.uploaded_filename = 'sample_dataset'
-                        st.success(f"✅ Loaded updated sample dataset with ALL REQUIRED FIELDS!")
-                        st.balloons()
-                        st.rerun()
-                else:
-                    st.success(f"✅ Sample dataset already loaded | {len(df)} rows × {len(df.columns)} columns")
-            elif st.button("🔥 Load Fresh Sample Data", width="stretch", type="primary"):
-                # INLINE generation to bypass all caching
-                np.random.seed(42)
-                n = 1000
-                nats = np.random.choice(['United Arab Emirates', 'India', 'Pakistan', 'Egypt', 'Jordan',
-                                        'Saudi Arabia', 'Philippines', 'United States', 'United Kingdom',
-                                        'Canada'], n, p=[0.45, 0.15, 0.10, 0.08, 0.05, 0.05, 0.04, 0.03, 0.03, 0.02])
-                housed = np.random.choice([True, False], n, p=[0.6, 0.4])
+        # Outlier Box Plots
+        if numeric_cols_viz:
+            st.markdown("#### 📦 Outlier Detection (Box Plots)")
+            st.caption("Identify outliers using IQR method (points beyond whiskers)")
 
-                df = pd.DataFrame({
-                    'student_id': [f'S{i:05d}' for i in range(1, n + 1)],
-                    'cumulative_gpa': np.random.normal(3.0, 0.6, n).clip(0, 4.0),
-                    'nationality': nats,
-                    'enrollment_enrollment_status': np.random.choice(['Active', 'Graduated', 'On Leave'], n, p=[0.8, 0.15, 0.05]),
-                    'enrollment_tuition_amount': np.random.uniform(50000, 100000, n),
-                    'financial_aid_monetary_amount': np.random.choice([0, 15000, 25000, 40000, 60000], n, p=[0.4, 0.2, 0.2, 0.15, 0.05]),
-                    'gender': np.random.choice(['Male', 'Female'], n),
-                    'cohort_year': np.random.choice([2020, 2021, 2022, 2023, 2024], n),
-                    'visa_status': ['UAE National' if nat == 'United Arab Emirates' else np.random.choice(['Student Visa', 'Resident Visa', 'Family Visa'])
-                                   for nat in nats],
-                    'enrollment_type': np.random.choice(['Full-Time', 'Part-Time'], n, p=[0.85, 0.15]),
-                    'room_number': [f'R{i:04d}' if h else None for i, h in enumerate(housed, 1)],
-                    'occupancy_status': ['Occupied' if h else None for h in housed],
-                    'rent_amount': [np.random.uniform(8000, 15000) if h else 0 for h in housed],
-                })
+            col1, col2 = st.columns(2)
 
-                st.session_state.data = df
-                st.session_state.mapping_log = ["Fresh inline data - all 13 columns"]
-                st.session_state.uploaded_filename = 'sample_dataset'
-                st.session_state.metrics = calculate_core_metrics(df)
+            # Quartiles for all plotted columns in a single quantile() call
+            box_quartiles = dashboard_aggregates['box_quartiles']
+            outlier_rng = np.random.default_rng(profile_data['seed'])
 
-                st.success(f"✅ {len(df)} rows × {len(df.columns)} columns loaded!")
-                st.balloons()
-                st.rerun()
+            for idx, col_name in enumerate(numeric_cols_viz[:4]):
+                with col1 if idx % 2 == 0 else col2:
+                    if not has_value_spread(df[col_name]):
+                        st.info(f"{col_name}: constant or empty column, skipping")
+                        continue
 
-        st.divider()
+                    # Box statistics are computed server-side; only the summary and outlier points are sent
+                    Q1 = box_quartiles.loc[0.25, col_name]
+                    Q3 = box_quartiles.loc[0.75, col_name]
+                    IQR = Q3 - Q1
+                    col_values = df[col_name].to_numpy(dtype=np.float64, na_value=np.nan)
+                    outlier_mask = (col_values < (Q1 - 1.5 * IQR)) | (col_values > (Q3 + 1.5 * IQR))
+                    outlier_count = np.count_nonzero(outlier_mask)
+
+                    inliers = col_values[~outlier_mask & ~np.isnan(col_values)]
+                    outlier_points = col_values[outlier_mask]
+                    if outlier_points.size > PROFILE_PLOT_MAX_ROWS:
+                        outlier_points = outlier_rng.choice(outlier_points, PROFILE_PLOT_MAX_ROWS, replace=False)
+
+                    fig_box = go.Figure(go.Box(
+                        name=col_name,
+                        q1=[Q1],
+                        median=[box_quartiles.loc[0.5, col_name]],
+                        q3=[Q3],
+                        lowerfence=[inliers.min() if inliers.size else Q1],
+                        upperfence=[inliers.max() if inliers.size else Q3],
+                        boxpoints=False
+                    ))
+                    if outlier_points.size:
+                        fig_box.add_trace(go.Scatter(
+                            x=[col_name] * outlier_points.size,
+                            y=outlier_points,
+                            mode='markers',
+                            name='Outliers'
+                        ))
+                    fig_box.update_layout(
+                        title=f"Outliers in {col_name[:25]}",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                        font=dict(color='white'),
+                        height=350,
+                        showlegend=False
+                    )
+                    st.plotly_chart(fig_box, width='stretch')
 
-        # ====================================================================================
-        # COLUMN MAPPING STATUS (Always show, but content depends on data)
-        # ====================================================================================
-        st.markdown("### 📊 Column Mapping Status")
+                    if outlier_count > 0:
+                        st.warning(f"⚠️ {outlier_count} outliers detected ({(outlier_count/len(df)*100):.2f}%)")
+                    else:
+                        st.success(f"✅ No outliers detected")
+
+        st.markdown("---")
+
+        # Data Completeness by Column Type
+        st.markdown("#### 🎯 Completeness Breakdown by Column Type")
+        st.caption("Which column types have better data quality?")
+
+        # Derived from the cached per-column null counts; no further pass over the data
+        null_counts = primitives['null_counts']
+        completeness_by_type = []
+        for col_type, cols in [
+            ('Numeric', numeric_cols_viz),
+            ('Categorical', categorical_cols_viz),
+            ('Datetime', datetime_cols_viz)
+        ]:
+            if cols:
+                type_cells = len(df) * len(cols)
+                type_completeness = ((type_cells - null_counts[cols].sum()) / type_cells * 100) if type_cells else 0.0
+                completeness_by_type.append({
+                    'Column Type': col_type,
+                    'Completeness %': type_completeness,
+                    'Column Count': len(cols)
+                })
 
-        if st.session_state.get('data') is None:
-            # No data loaded yet
-            st.info("💡 Load data first to see column mapping status")
-            st.caption("The mapping status will appear here after you load data")
-        else:
-            # Get current data and mapping log
-            df = st.session_state.data
-            mapping_log = st.session_state.get('mapping_log', [])
+        if completeness_by_type:
+            comp_df = pd.DataFrame(completeness_by_type)
+            fig_comp = go.Figure(go.Bar(
+                x=comp_df['Column Type'].to_numpy(),
+                y=comp_df['Completeness %'].to_numpy(),
+                text=comp_df['Completeness %'].to_numpy(),
+                texttemplate='%{text:.1f}%',
+                textposition='outside',
+                marker=dict(color=comp_df['Completeness %'].to_numpy(), colorscale='greens')
+            ))
+            fig_comp.update_layout(
+                title='Data Completeness by Column Type',
+                xaxis_title='Column Type',
+                yaxis_title='Completeness %',
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                font=dict(color='white'),
+                height=400,
+                yaxis_range=[0, 105]
+            )
+            st.plotly_chart(fig_comp, width='stretch')
 
-            # Check if required journey fields exist
-            required_journey_fields = [
-                'financial_aid_monetary_amount', 'cohort_year', 'enrollment_enrollment_status',
-                'enrollment_tuition_amount', 'enrollment_type', 'occupancy_status'
-            ]
-            present_required = [f for f in required_journey_fields if f in df.columns]
-            missing_required = [f for f in required_journey_fields if f not in df.columns]
+        st.markdown("---")
 
-            # Show required fields status
-            if len(present_required) == len(required_journey_fields):
-                st.success(f"✅ All {len(required_journey_fields)} journey fields present")
-            elif present_required:
-                st.info(f"ℹ️ {len(present_required)}/{len(required_journey_fields)} journey fields found")
-                st.caption(f"Optional fields not in CSV: {', '.join(missing_required)}")
-            else:
-                st.error(f"❌ 0/{len(required_journey_fields)} fields found")
-                st.caption(f"Missing: {', '.join(missing_required)}")
+        # Quality Score Gauge
+        st.markdown("#### 🎯 Overall Data Quality Score")
 
-            # Show status based on data quality
-            if not mapping_log and missing_required:
-                # Mapping not applied AND missing required fields
-                st.info(f"ℹ️ Column mapping not yet applied")
-                if st.button("🔄 Apply Column Mapping Now", type="primary", width='stretch', key="force_mapping"):
-                    mapped_df, new_mapping_log = apply_universal_column_mapping(df)
-                    st.session_state.data = mapped_df
-                    st.session_state.mapping_log = new_mapping_log if new_mapping_log else ["No mappings needed - all columns standard"]
-                    st.session_state.metrics = calculate_core_metrics(mapped_df)
-                    st.rerun()
-            elif not mapping_log and not missing_required:
-                # No mapping log but data is already perfect
-                st.success("✅ All columns already using standard names")
-                st.caption("No mapping needed - dataset is ready!")
-                st.session_state.mapping_log = ["Dataset already has standard column names"]
-            elif mapping_log and isinstance(mapping_log, list) and len(mapping_log) > 0:
-                # Mapping was applied
-                if mapping_log[0] == "Dataset already has standard column names":
-                    st.success("✅ Dataset uses standard column names")
-                elif mapping_log[0] == "No mappings needed - all columns standard":
-                    st.success("✅ All columns already standardized")
-                else:
-                    st.success(f"✅ Column mapping completed: {len(mapping_log)} columns")
+        col1, col2, col3 = st.columns([2, 2, 1])
 
-            try:
-                from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
+        with col1:
+            quality_score = profile_data['completeness']
+            fig_gauge = build_quality_gauge(quality_score)
+            st.plotly_chart(fig_gauge, width='stretch')
 
-                # Quick summary counts
-                mapped_count = len([log for log in mapping_log if '→' in log])
-                available_count = len([col for col in UNIVERSAL_COLUMNS_CATALOG.keys() if col in df.columns])
-                total_catalog = len(UNIVERSAL_COLUMNS_CATALOG)
+        with col2:
+            st.markdown("**Quality Score Interpretation:**")
+            if quality_score >= 90:
+                st.success("🌟 **EXCELLENT** (90-100%)\nData is highly reliable for analysis and decision-making")
+            elif quality_score >= 70:
+                st.warning("⚠️ **GOOD** (70-90%)\nData is usable but has some quality issues to address")
+            else:
+                st.error("🚨 **NEEDS IMPROVEMENT** (<70%)\nSignificant data quality issues require immediate attention")
 
-                # Display summary metrics
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("✅ Available", f"{available_count}/{total_catalog}",
-                             delta=f"{available_count/total_catalog*100:.0f}%")
-                with col2:
-                    st.metric("🔄 Mapped", mapped_count,
-                             help="Columns translated from different names")
+            st.markdown(f"""
+                **Score Components:**
+                - Completeness: {profile_data['completeness']:.1f}%
+                - Missing Cells: {profile_data['total_missing']:,}
+                - Duplicates: {profile_data['duplicate_rows']:,}
+                - Columns with Nulls: {profile_data['columns_with_nulls']}/{len(df.columns)}
+                """)
 
-                # Show mapping log in expander
-                if mapping_log:
-                    with st.expander(f"📋 View Mapping Details ({len(mapping_log)} mappings)", expanded=False):
-                        st.caption("Columns that were automatically standardized:")
-                        for log_entry in mapping_log:
-                            st.text(f"  • {log_entry}")
+@st.fragment
+def render_column_level_analysis(df: pd.DataFrame, primitives: Dict[str, Any], model: str, url: str):
+    """Column-Level Analysis expander (its own fragment: changing the selected column reruns only this block)"""
+    with st.expander("📋 Column-Level Analysis", expanded=False):
+        st.markdown("#### Detailed Column Profiling")
+
+        # AI column insights: one batched request covers many columns, then every
+        # selectbox change is a cache lookup
+        column_batch = df.columns[:COLUMN_INSIGHTS_BATCH_SIZE].tolist()
+        column_insights_key = (
+            f"column_insights_{zlib.crc32('|'.join(map(str, column_batch)).encode()):08x}_{len(df)}_{model}"
+        )
+        if st.session_state.ollama_connected and column_insights_key not in st.session_state.llm_cache:
+            if st.button(f"🧠 Generate AI Insights for {len(column_batch)} Columns", key="column_insights_btn"):
+                with st.spinner("Profiling columns with AI (single batched request)..."):
+                    column_insights = generate_column_insights_llm(df, primitives, column_batch, model, url)
+                if column_insights:
+                    st.session_state.llm_cache[column_insights_key] = column_insights
                 else:
-                    st.caption("✨ All columns already using standard names")
+                    st.warning("⚠️ Could not generate column insights. Try again or use a different model.")
 
-                # Show detailed catalog status
-                with st.expander("🔍 Complete Catalog Status (136 columns)", expanded=False):
-                    # Categorize columns by status
-                    mapped_columns = []
-                    present_columns = []
-                    missing_columns = []
+        # Select column to profile
+        profile_column = st.selectbox("Select Column to Profile", df.columns, key="profile_col")
 
-                    for col_name, col_info in UNIVERSAL_COLUMNS_CATALOG.items():
-                        if col_name in df.columns:
-                            was_mapped = any(col_name in log for log in mapping_log)
-                            if was_mapped:
-                                # Find the original name
-                                original_name = None
-                                for log in mapping_log:
-                                    if col_name in log:
-                                        original_name = log.split("'")[1]
-                                        break
-                                mapped_columns.append((col_name, col_info.description, original_name))
-                            else:
-                                present_columns.append((col_name, col_info.description))
-                        else:
-                            missing_columns.append((col_name, col_info.description))
+        column_insight = st.session_state.llm_cache.get(column_insights_key, {}).get(profile_column)
+        if column_insight:
+            st.info(f"🧠 **AI Insight:** {column_insight['insight']}")
+            for warning in column_insight['warnings']:
+                st.caption(f"⚠️ {warning}")
 
-                    # Create tabs
-                    tab1, tab2, tab3 = st.tabs([
-                        f"✅ Present ({len(present_columns)})",
-                        f"🔄 Mapped ({len(mapped_columns)})",
-                        f"⚠️ Missing ({len(missing_columns)})"
-                    ])
+        if profile_column:
+            col1, col2 = st.columns(2)
 
-                    with tab1:
-                        if present_columns:
-                            for col_name, description in sorted(present_columns)[:10]:
-                                st.caption(f"• `{col_name}`")
-                            if len(present_columns) > 10:
-                                st.caption(f"... and {len(present_columns) - 10} more")
-                        else:
-                            st.caption("No columns present with standard names")
+            # Null/unique counts come from the cached primitives; one cached value_counts
+            # result serves both the most common value and the top-10 distribution
+            null_count = int(primitives['null_counts'][profile_column])
+            value_counts = get_top_value_counts(df, profile_column)
+            is_numeric_column = pd.api.types.is_numeric_dtype(df[profile_column])
 
-                    with tab2:
-                        if mapped_columns:
-                            for col_name, description, original_name in sorted(mapped_columns)[:10]:
-                                st.caption(f"• `{original_name}` → `{col_name}`")
-                            if len(mapped_columns) > 10:
-                                st.caption(f"... and {len(mapped_columns) - 10} more")
-                        else:
-                            st.caption("No columns were mapped")
+            with col1:
+                # Basic stats
+                st.markdown("**Basic Statistics**")
+                stats_df = pd.DataFrame({
+                    'Metric': ['Count', 'Unique Values', 'Null Count', 'Null %', 'Most Common'],
+                    'Value': [
+                        f"{len(df) - null_count:,}",
+                        f"{primitives['nunique'][profile_column]:,}",
+                        f"{null_count:,}",
+                        f"{(null_count / len(df) * 100):.2f}%",
+                        str(value_counts.index[0]) if len(value_counts) > 0 else 'N/A'
+                    ]
+                })
+                st.dataframe(stats_df, width='stretch', hide_index=True)
+
+                # Numeric statistics if applicable
+                if is_numeric_column:
+                    st.markdown("**Numeric Statistics**")
+                    column_stats = get_column_describe(df, profile_column)
+                    numeric_stats = pd.DataFrame({
+                        'Metric': ['Mean', 'Median', 'Std Dev', 'Min', 'Max', 'Q1', 'Q3'],
+                        'Value': [
+                            f"{column_stats['mean']:.2f}",
+                            f"{column_stats['50%']:.2f}",
+                            f"{column_stats['std']:.2f}",
+                            f"{column_stats['min']:.2f}",
+                            f"{column_stats['max']:.2f}",
+                            f"{column_stats['25%']:.2f}",
+                            f"{column_stats['75%']:.2f}"
+                        ]
+                    })
+                    st.dataframe(numeric_stats, width='stretch', hide_index=True)
 
-                    with tab3:
-                        if missing_columns:
-                            st.caption(f"📌 {len(missing_columns)} optional columns not in dataset")
-                            for col_name, description in sorted(missing_columns)[:5]:
-                                st.caption(f"• `{col_name}`")
-                            if len(missing_columns) > 5:
-                                st.caption(f"... and {len(missing_columns) - 5} more")
-                        else:
-                            st.caption("All catalog columns are present!")
+            with col2:
+                # Value distribution
+                st.markdown("**Value Distribution (Top 10)**")
+
+                if is_numeric_column:
+                    # Histogram for numeric columns, binned server-side over all rows so only
+                    # 30 bar heights reach the browser instead of every raw value
+                    values = df[profile_column].to_numpy(dtype=np.float64, na_value=np.nan)
+                    values = values[np.isfinite(values)]
+                    bin_counts, bin_edges = np.histogram(values, bins=30) if values.size else (np.array([]), np.array([0.0]))
+                    fig_dist = go.Figure(go.Bar(
+                        x=(bin_edges[:-1] + bin_edges[1:]) / 2,
+                        y=bin_counts,
+                        width=np.diff(bin_edges),
+                        marker_line_width=0
+                    ))
+                    fig_dist.update_layout(
+                        title=f"Distribution of {profile_column}",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                        font=dict(color='white'),
+                        height=300,
+                        bargap=0,
+                        transition_duration=0,
+                        hovermode='closest',
+                        xaxis_title=profile_column,
+                        yaxis_title="count"
+                    )
+                    st.plotly_chart(fig_dist, width='stretch')
+                else:
+                    # Bar chart for categorical columns
+                    fig_dist = px.bar(
+                        x=value_counts.index.astype(str),
+                        y=value_counts.values,
+                        title=f"Top 10 Values in {profile_column}"
+                    )
+                    fig_dist.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(30, 41, 59, 0.85)',
+                        font=dict(color='white'),
+                        height=300,
+                        xaxis_title="Value",
+                        yaxis_title="Count",
+                        transition_duration=0,
+                        hovermode='closest'
+                    )
+                    fig_dist.update_traces(marker_line_width=0)
+                    st.plotly_chart(fig_dist, width='stretch')
+
+@st.fragment
+def render_cardinality_analysis(df: pd.DataFrame, primitives: Dict[str, Any]):
+    """Cardinality Analysis expander (its own fragment, so it is skipped by reruns of other blocks)"""
+    with st.expander("🔍 Cardinality Analysis", expanded=False):
+        st.markdown("#### Column Cardinality (Uniqueness)")
+
+        # One cached nunique() Series for all columns; the percentage is a single scaled multiply
+        # (empty frames get 0% instead of a division-by-zero NaN)
+        unique_counts = primitives['nunique'].to_numpy()
+        cardinality_df = pd.DataFrame({
+            'Column': primitives['nunique'].index,
+            'Unique Values': unique_counts,
+            'Cardinality %': unique_counts * (100.0 / max(len(df), 1))
+        })
+        # Partial selection for the chart; only the table below needs the full ordering
+        top_cardinality_df = cardinality_df.nlargest(15, 'Unique Values')
+
+        fig_card = px.bar(
+            top_cardinality_df,
+            x='Column',
+            y='Unique Values',
+            title="Top 15 Columns by Cardinality",
+            color='Cardinality %',
+            color_continuous_scale='viridis'
+        )
+        fig_card.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(30, 41, 59, 0.85)',
+            font=dict(color='white'),
+            height=400
+        )
+        st.plotly_chart(fig_card, width='stretch')
 
-            except ImportError:
-                st.caption("📊 Column mapping applied")
-                if mapping_log:
-                    st.caption(f"✅ {len(mapping_log)} columns standardized")
+        st.dataframe(
+            cardinality_df.sort_values('Unique Values', ascending=False),
+            width='stretch',
+            height=300
+        )
 
-        st.divider()
+@st.fragment
+def render_all_columns_table(df: pd.DataFrame, primitives: Dict[str, Any]):
+    """View All Columns expander (its own fragment: the rows slider reruns only this table)"""
+    with st.expander("📋 View All Columns", expanded=False):
+        # Built from the cached primitives' arrays: no per-rerun scans or index alignment
+        row_count = len(df)
+        null_counts = primitives['null_counts'].to_numpy()
+        all_columns_df = pd.DataFrame({
+            'Column': df.columns,
+            'Type': primitives['dtype_names'].to_numpy(),
+            'Non-Null Count': row_count - null_counts,
+            'Null Count': null_counts,
+            'Null %': (null_counts / row_count * 100).round(2),
+            'Unique Values': primitives['nunique'].to_numpy()
+        })
+        # Wide datasets are sliced server-side: only the rows chosen on the slider reach the browser
+        if len(all_columns_df) > PROFILE_TABLE_DEFAULT_ROWS:
+            rows_to_display = st.slider(
+                "Rows to display",
+                min_value=10,
+                max_value=len(all_columns_df),
+                value=PROFILE_TABLE_DEFAULT_ROWS,
+                key="profile_all_columns_rows"
+            )
+            all_columns_df = all_columns_df.iloc[:rows_to_display]
+        st.dataframe(
+            all_columns_df,
+            width='stretch',
+            height=400,
+            hide_index=True,
+            column_config={
+                'Null %': st.column_config.NumberColumn(format="%.2f%%"),
+                'Unique Values': st.column_config.NumberColumn(format="%d")
+            }
+        )
 
-        # ====================================================================================
-        # AI CONFIGURATION (From gen_storytelling_app.py lines 1648-1768)
-        # ====================================================================================
-        st.markdown("### 🤖 AI Configuration")
-        st.markdown("**Ollama Server Location**")
 
-        previous_server_type = st.session_state.get('previous_ollama_server_type', None)
+# ====================================================================================
+# SESSION STATE INITIALIZATION
+# ====================================================================================
 
-        server_type = st.radio(
-            "Server Type",
-            options=["Cloudflare", "Local"],
-            index=0 if st.session_state.ollama_server_type == "Cloudflare" else 1,
-            help="Choose between Cloudflare (remote) or Local Ollama server",
-            horizontal=True,
-            label_visibility="collapsed"
-        )
+def initialize_session_state():
+    """Initialize Streamlit session state variables"""
+    if 'data' not in st.session_state:
+        st.session_state.data = None
 
-        server_type_changed = (previous_server_type is not None and
-                               previous_server_type != server_type)
+    if 'metrics' not in st.session_state:
+        st.session_state.metrics = {}
 
-        st.session_state.ollama_server_type = server_type
-        st.session_state.previous_ollama_server_type = server_type
-
-        if server_type == "Cloudflare":
-            st.caption("☁️ Using Cloudflare Ollama")
-            default_url = "https://ollama.exaliotechcom.uk"
-        else:
-            st.caption("💻 Using Local Ollama")
-            default_url = "http://localhost:11434"
-
-        st.caption(f"🏠 URL: {default_url}")
-
-        if st.session_state.get('ollama_url') != default_url:
-            if 'custom_url_set' not in st.session_state:
-                st.session_state.ollama_url = default_url
-                st.session_state.ollama_connected = False
-                server_type_changed = True
+    if 'ollama_server_type' not in st.session_state:
+        st.session_state.ollama_server_type = "Local"
 
-        if server_type_changed:
-            with st.spinner(f"🔄 Switching to {server_type} Ollama..."):
-                import time
-                health = verify_ollama_health(default_url)
-                if health['connected']:
-                    st.session_state.ollama_connected = True
-                    st.session_state.ollama_url = default_url
-                    st.success(f"✅ Connected to {server_type} Ollama")
-                    st.caption(f"📦 Found {health['model_count']} model(s)")
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    st.session_state.ollama_connected = False
-                    st.session_state.ollama_url = default_url
-                    st.error(f"❌ Failed to connect to {server_type} Ollama")
-                    st.caption(f"Error: {health.get('error', 'Unknown error')}")
-                    time.sleep(0.5)
-                    st.rerun()
+    if 'ollama_url' not in st.session_state:
+        st.session_state.ollama_url = "http://localhost:11434"
 
-        with st.expander("🔧 Advanced: Custom URL"):
-            ollama_url = st.text_input(
-                "Custom Ollama URL",
-                value=st.session_state.get('ollama_url', default_url),
-                help="URL of your Ollama server"
-            )
-            if ollama_url != default_url:
-                st.session_state.custom_url_set = True
-            else:
-                st.session_state.pop('custom_url_set', None)
+    if 'ollama_connected' not in st.session_state:
+        st.session_state.ollama_connected = False
 
-            st.session_state.ollama_url = ollama_url
+    if 'selected_model' not in st.session_state:
+        st.session_state.selected_model = None
 
-            if st.button("Test Connection", width="stretch"):
-                with st.spinner("Testing connection..."):
-                    health = verify_ollama_health(ollama_url)
-                    if health['connected']:
-                        st.success(f"✅ Connected! Found {health['model_count']} models")
-                        st.session_state.ollama_connected = True
-                    else:
-                        st.error(f"❌ Connection failed: {health.get('error', 'Unknown error')}")
-                        st.session_state.ollama_connected = False
+    if 'llm_cache' not in st.session_state:
+        st.session_state.llm_cache = {}
 
-        if 'ollama_url' not in st.session_state:
-            st.session_state.ollama_url = default_url
+    if 'complete_journeys' not in st.session_state:
+        st.session_state.complete_journeys = None
 
-        st.markdown("**Select AI Model**")
+    if 'journey_generation_metadata' not in st.session_state:
+        st.session_state.journey_generation_metadata = None
 
-        # Custom CSS for BLACK text in model dropdown - AGGRESSIVE OVERRIDE
-        st.markdown("""
-        <style>
-        /* FORCE BLACK TEXT - Override everything */
-        .stSelectbox, .stSelectbox * {
-            color: #000000 !important;
-        }
+    if 'health_check_count' not in st.session_state:
+        st.session_state.health_check_count = 0
 
-        /* Select input field */
-        .stSelectbox [data-baseweb="select"] {
-            background-color: #ffffff !important;
-        }
+    if 'connection_history' not in st.session_state:
+        st.session_state.connection_history = []
 
-        /* All text inside selectbox */
-        .stSelectbox div, .stSelectbox span, .stSelectbox p {
-            color: #000000 !important;
-        }
+    if 'auto_refresh' not in st.session_state:
+        st.session_state.auto_refresh = False
 
-        /* Dropdown options */
-        [data-baseweb="popover"] li,
-        [data-baseweb="popover"] div,
-        [data-baseweb="popover"] span {
-            color: #000000 !important;
-            background-color: #ffffff !important;
-        }
+    if 'uploaded_filename' not in st.session_state:
+        st.session_state.uploaded_filename = None
 
-        /* Selected value display */
-        [data-baseweb="select"] > div > div {
-            color: #000000 !important;
-        }
+    if 'show_connection_help' not in st.session_state:
+        st.session_state.show_connection_help = False
 
-        /* All listbox items */
-        ul[role="listbox"] li,
-        ul[role="listbox"] div,
-        ul[role="listbox"] span {
-            color: #000000 !important;
-        }
+# ====================================================================================
+# MAIN APPLICATION
+# ====================================================================================
 
-        /* Nuclear option - force ALL sidebar selectboxes to black */
-        [data-testid="stSidebar"] .stSelectbox * {
-            color: #000000 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+def main():
+    """Main application entry point"""
 
-        if st.session_state.get('ollama_connected'):
-            models = get_available_models(st.session_state.ollama_url)
-            if models:
-                selected_model = st.selectbox(
-                    "Model",
-                    options=models,
-                    index=0,
-                    help="Choose the LLM model for narrative generation",
-                    label_visibility="collapsed"
-                )
-                st.session_state.selected_model = selected_model
-                st.success(f"✅ Using: {selected_model}")
+    # Initialize
+    inject_custom_css()
+    initialize_session_state()
 
-                # Model recommendations for deep analysis
-                st.caption("💡 **For Deep Analysis:**")
-                if any(x in selected_model.lower() for x in ['llama3.1:70b', 'qwen2.5:72b', 'mixtral:8x22b']):
-                    st.caption("🟢 Excellent - Large model ideal for comprehensive insights")
-                elif any(x in selected_model.lower() for x in ['llama3.1', 'qwen2.5:32b', 'gemma2:27b']):
-                    st.caption("🟡 Good - Balanced performance and quality")
-                else:
-                    st.caption("🟠 Basic - Consider larger model for richer analysis")
-                    with st.expander("📋 Recommended Models"):
-                        st.markdown("""
-                        **For Best Deep Analysis:**
-                        - `llama3.1:70b` - Excellent reasoning
-                        - `qwen2.5:72b` - Superior analytics
-                        - `qwen2.5:32b` - Balanced (good speed/quality)
+    # Header
+    st.markdown("""
+    <div class="hero-section">
+        <div class="hero-title">🎓 Student 360 AI-Powered Analytics <span style="font-size: 0.5em; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 4px 12px; border-radius: 20px; margin-left: 10px;">V2.0</span></div>
+        <div class="hero-subtitle">Transform Student Data into Strategic Intelligence with Large Language Models</div>
+    </div>
+    """, unsafe_allow_html=True)
 
-                        **Pull command:**
-                        ```bash
-                        ollama pull qwen2.5:32b
-                        ```
-                        """)
-            else:
-                st.warning("No models found. Please pull a model first.")
-        else:
-            health = verify_ollama_health(st.session_state.ollama_url)
-            if health['connected']:
-                st.session_state.ollama_connected = True
-                models = get_available_models(st.session_state.ollama_url)
-                if models:
-                    st.session_state.selected_model = models[0]
-                    st.success(f"✅ Auto-connected: {models[0]}")
-            else:
-                st.info("👆 Configure connection above")
+    # ====================================================================================
+    # SIDEBAR - EXACT IMPLEMENTATION FROM GEN_STORYTELLING_APP.PY
+    # ====================================================================================
+    with st.sidebar:
+        st.markdown("### 📚 Help & Documentation")
+        st.caption("🎓 Student 360 AI-Powered Analytics")
 
-    # Main content area - Show welcome message if no data
-    if st.session_state.data is None:
+        # Version info
         st.markdown("""
-        <div style='text-align: center; padding: 3rem 2rem;'>
-            <h2 style='color: #6366f1; margin-bottom: 1rem;'>🎓 Welcome to Student 360 AI-Powered Analytics</h2>
-            <p style='font-size: 1.2rem; color: #94a3b8; margin-bottom: 2rem;'>
-                Your intelligent analytics dashboard powered by advanced AI
-            </p>
-            <p style='font-size: 1rem; color: #e2e8f0; margin-bottom: 0.5rem;'>
-                👈 Check the sidebar's <strong>Getting Started</strong> section to begin
-            </p>
-            <p style='font-size: 0.9rem; color: #94a3b8;'>
-                Configure Ollama connection → Select AI model → Upload student data
-            </p>
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 8px 12px; border-radius: 8px; margin: 10px 0;">
+            <div style="color: white; font-weight: 600; font-size: 0.9em;">Version 2.0</div>
+            <div style="color: rgba(255,255,255,0.8); font-size: 0.75em;">Production Release • Feb 2026</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.7em; margin-top: 4px;">✨ Pre-loaded Dataset</div>
         </div>
         """, unsafe_allow_html=True)
 
-        # Show key features
         st.divider()
-        st.markdown("### ✨ Key Features")
 
-        col1, col2, col3 = st.columns(3)
+        # ====================================================================================
+        # GETTING STARTED GUIDE
+        # ====================================================================================
+        st.markdown("### 📋 Getting Started")
+        st.caption("🔄 **App Version: 3.1** - Function Rename Fix (No More Cache!) ✨")
+        st.caption("---")
 
-        with col1:
-            st.markdown("""
-            <div style='background: rgba(99, 102, 241, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
-                <h4 style='color: #818cf8; margin-top: 0;'>🤖 AI-Driven Insights</h4>
-                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
-                    LLM analyzes your data and recommends optimal visualizations dynamically
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Status indicators
+        ollama_status = st.session_state.get('ollama_connected', False)
+        data_loaded = st.session_state.data is not None
 
-        with col2:
-            st.markdown("""
-            <div style='background: rgba(16, 185, 129, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #10b981;'>
-                <h4 style='color: #34d399; margin-top: 0;'>📊 Dynamic Analytics</h4>
-                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
-                    Adaptive visualizations that change based on your specific data patterns
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        if ollama_status:
+            st.success("✅ Ollama Connected")
+            st.caption("Ready to generate AI-powered insights")
+        else:
+            st.warning("⚠️ Ollama Not Connected")
+            st.caption("Configure connection below")
 
-        with col3:
-            st.markdown("""
-            <div style='background: rgba(245, 158, 11, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
-                <h4 style='color: #fbbf24; margin-top: 0;'>🎯 Strategic Intelligence</h4>
-                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
-                    Comprehensive analysis across academics, financials, and student success
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        if data_loaded:
+            st.success("✅ Data Loaded")
+            st.caption(f"{len(st.session_state.data):,} student records")
+        else:
+            st.info("📁 No Data Loaded")
+            st.caption("Upload CSV in Data Source section")
 
-        return
+        st.divider()
 
-    # Get current data
-    df = st.session_state.data
-
-    # Apply column mapping - check if required fields exist
-    # This ensures mapping is applied even if user has old data
-    required_journey_fields = [
-        'financial_aid_monetary_amount', 'cohort_year', 'enrollment_enrollment_status',
-        'enrollment_tuition_amount', 'enrollment_type', 'occupancy_status'
-    ]
-    missing_required = [f for f in required_journey_fields if f not in df.columns]
+        # ====================================================================================
+        # LLM & PROMPT ENHANCEMENT GUIDE
+        # ====================================================================================
+        if st.button("🧠 LLM & Prompt Enhancement Guide", width='stretch', type="secondary"):
+            st.session_state.show_llm_guide = not st.session_state.get('show_llm_guide', False)
 
-    # Apply mapping if: no mapping_log exists OR required fields are missing
-    if ('mapping_log' not in st.session_state or st.session_state.mapping_log is None) or missing_required:
-        df, mapping_log = apply_universal_column_mapping(df)
-        st.session_state.data = df
+        if st.session_state.get('show_llm_guide', False):
+            with st.expander("📖 LLM Enhancement Techniques Used", expanded=True):
+                st.markdown("""
+                <style>
+                .guide-content {
+                    background-color: #1e1e1e;
+                    color: #e0e0e0;
+                    padding: 20px;
+                    border-radius: 10px;
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                }
+                .guide-content h2 {
+                    color: #4CAF50;
+                    border-bottom: 2px solid #4CAF50;
+                    padding-bottom: 10px;
+                }
+                .guide-content h3 {
+                    color: #2196F3;
+                }
+                .guide-content h4 {
+                    color: #FF9800;
+                }
+                .guide-content table {
+                    background-color: #2d2d2d;
+                    color: #e0e0e0;
+                    border-collapse: collapse;
+                    width: 100%;
+                    margin: 10px 0;
+                }
+                .guide-content th {
+                    background-color: #3d3d3d;
+                    color: #4CAF50;
+                    padding: 10px;
+                    border: 1px solid #555;
+                }
+                .guide-content td {
+                    padding: 8px;
+                    border: 1px solid #555;
+                }
+                .guide-content code {
+                    background-color: #2d2d2d;
+                    color: #ffa500;
+                    padding: 2px 6px;
+                    border-radius: 3px;
+                }
+                .guide-content pre {
+                    background-color: #2d2d2d;
+                    color: #e0e0e0;
+                    padding: 15px;
+                    border-radius: 5px;
+                    border-left: 4px solid #4CAF50;
+                    overflow-x: auto;
+                }
+                .guide-content blockquote {
+                    background-color: #2d2d2d;
+                    border-left: 4px solid #2196F3;
+                    padding: 10px 20px;
+                    margin: 10px 0;
+                    color: #e0e0e0;
+                }
+                .guide-content ul, .guide-content ol {
+                    color: #e0e0e0;
+                }
+                .guide-content strong {
+                    color: #FFD700;
+                }
+                </style>
+                <div class="guide-content">
 
-        # Recheck missing fields after mapping
-        still_missing = [f for f in required_journey_fields if f not in df.columns]
+                <h2>🎯 Prompt Enhancement Strategies</h2>
 
-        if mapping_log and len(mapping_log) > 0:
-            st.session_state.mapping_log = mapping_log
-            st.info(f"🔄 Applied column mapping: {len(mapping_log)} columns standardized")
-        else:
-            st.session_state.mapping_log = ["Dataset already has standard column names"]
-            st.success("✅ Dataset already uses standard column names")
+                ### 1. **Modular Prompt System**
+                We use specialized prompts for different narrative types:
 
-        # If fields still missing after mapping, show informational message
-        if still_missing:
-            st.info(f"""
-            ℹ️ **Dataset Information**: Your CSV file doesn't include {len(still_missing)} optional column(s):
-            {', '.join([f'`{field}`' for field in still_missing])}
+                **Example - Business Context Prompt:**
+                ```
+                You are a higher education business analyst...
 
-            Most analyses will work normally. Some advanced journey generation features may have limited data availability.
+                Write a compelling 3-4 sentence paragraph that:
+                1. Explains WHY this analysis matters
+                2. Connects to strategic goals
+                3. Sets up business importance
+                4. Uses professional language
 
-            💡 **Tip**: If you need these fields, please ensure your source CSV file includes them before uploading.
-            """)
+                Do NOT include raw numbers.
+                Focus on strategic importance.
+                ```
 
-    # FORCE RECALCULATION: Always recalculate metrics to ensure fresh data
-    # This fixes issues with stale cached metrics (especially UAE nationals)
-    metrics = calculate_core_metrics(df)
-    st.session_state.metrics = metrics  # Update session state with fresh metrics
+                **Example - Data Insights Prompt:**
+                ```
+                You are a university data analyst...
 
-    model = st.session_state.selected_model
-    url = st.session_state.ollama_url
+                Write comprehensive analysis (6-8 sentences):
+                1. Analyze patterns and trends
+                2. Make comparisons
+                3. Identify correlations
+                4. Include 8-10 specific numbers
+                5. Use "The data reveals...", "Notably..."
+                ```
 
-    # Application tabs
-    tabs = st.tabs([
-        "📊 Executive Summary",
-        "📖 Data Storytelling AI Driven with Template Guidance",
-        "🔬 Data Storytelling Fully AI Driven",
-        "📚 Data Storytelling (PreDefined+LLM Narrative)",
-        "🎓 Academic Analytics",
-        "🏠 Housing Insights",
-        "💰 Financial Intelligence",
-        "👥 Demographics",
-        "⚠️ Risk & Success",
-        "🔗 Data Lineage",
-        "🔬 Data Explorer"
-    ])
+                ---
 
-    # ====================================================================================
-    # TAB 1: TRUE LLM-DRIVEN EXECUTIVE SUMMARY
-    # ====================================================================================
-    with tabs[0]:
-        st.header("🤖 Executive Summary - AI-Driven Dynamic Analytics")
-        st.markdown("*The AI analyzes your data and decides what visualizations to create*")
+                ## ⚙️ LLM Parameter Optimization
 
-        # Description box
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #6366f1;'>
-            <strong>🧠 True LLM-Driven Approach:</strong> Unlike traditional dashboards where developers hardcode which graphs to show,
-            this system asks the <strong>AI to analyze your {metrics.get('total_students', 0):,} students</strong> and <strong>recommend the most insightful visualizations</strong>.
-            The LLM acts as your data analyst, choosing graph types, data columns, and insights based on what patterns it finds in YOUR data.
-        </div>
-        """, unsafe_allow_html=True)
+                ### 2. **Auto-Optimization System**
+                The app detects your hardware and adjusts parameters:
 
-        if not st.session_state.ollama_connected:
-            st.warning("⚠️ Connect to Ollama to enable AI-driven dynamic visualization generation")
+                | Your Hardware | Context Size | Tokens | Speed |
+                |--------------|--------------|---------|--------|
+                | **High-end** (16GB+ RAM, GPU) | 8192 | 2048 | ⚡⚡⚡ |
+                | **Medium** (8GB+ RAM) | 4096 | 1024 | ⚡⚡ |
+                | **Cloudflare** | 4096 | 1024 | ⚡ |
+                | **Low-end** (<8GB RAM) | 2048 | 512 | ⚡ |
 
-        # Generate dynamic visualizations button
-        if st.session_state.ollama_connected:
-            if st.button("🤖 Let AI Analyze Data & Create Visualizations", key="exec_dynamic_btn", type="primary", width="stretch"):
-                with st.spinner("🔄 AI is analyzing your data, identifying patterns, and recommending optimal visualizations... This may take 20-40 seconds"):
-                    viz_result = generate_dynamic_visualizations_llm(metrics, df, model, url, context_type="executive_summary")
-                    st.session_state.llm_cache['exec_dynamic_viz'] = viz_result
+                **Key Parameters:**
+                - `num_ctx`: Context window (2048-8192)
+                - `num_predict`: Max tokens generated
+                - `num_batch`: Parallel processing
+                - `num_thread`: CPU cores used
+                - `timeout`: 6x multiplier for Cloudflare
 
-        # Display AI-generated visualizations if available
-        if 'exec_dynamic_viz' in st.session_state.llm_cache:
-            viz_result = st.session_state.llm_cache['exec_dynamic_viz']
+                ---
 
-            # AI Strategic Overview
-            st.markdown(f"""
-            <div class="insight-card" style="background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); border-left: 4px solid #6366f1; margin-bottom: 2rem;">
-                <div class="insight-title">🎯 AI Strategic Analysis</div>
-                <div class="insight-text" style="font-size: 1.1rem; line-height: 1.8;">{viz_result.get('strategic_overview', '')}</div>
-            </div>
-            """, unsafe_allow_html=True)
+                ## 🧠 Temperature Control
 
-            st.divider()
+                ### 3. **Task-Specific Temperatures**
 
-            # Key Metrics Dashboard (Static - Always show core metrics)
-            st.markdown("### 📊 Core Institutional Metrics")
+                | Task | Temp | Why |
+                |------|------|-----|
+                | **Data Analysis** | 0.3-0.4 | Factual, precise |
+                | **Business Context** | 0.4-0.5 | Professional, focused |
+                | **Opening Narrative** | 0.5-0.7 | Engaging, creative |
+                | **Recommendations** | 0.6-0.7 | Strategic variety |
 
-            col1, col2, col3, col4, col5 = st.columns(5)
-            with col1:
-                st.metric("Total Students", f"{metrics.get('total_students', 0):,}")
-            with col2:
-                st.metric("Average GPA", f"{metrics.get('avg_gpa', 0):.2f}")
-            with col3:
-                st.metric("High Performers", f"{metrics.get('high_performers', 0):,}",
-                         f"{metrics.get('high_performers', 0)/metrics.get('total_students', 1)*100:.1f}%")
-            with col4:
-                st.metric("UAE Nationals", f"{metrics.get('uae_percentage', 0):.1f}%")
-            with col5:
-                st.metric("At-Risk", f"{metrics.get('at_risk', 0):,}",
-                         f"{metrics.get('at_risk', 0)/metrics.get('total_students', 1)*100:.1f}%",
-                         delta_color="inverse")
+                **Example Implementation:**
+                ```python
+                # Analytical content
+                query_ollama(prompt, model, url,
+                    temperature=0.3)  # Precise
 
-            col1, col2, col3, col4, col5 = st.columns(5)
-            with col1:
-                st.metric("Nationalities", metrics.get('unique_nationalities', 0))
-            with col2:
-                st.metric("Tuition Revenue", f"AED {metrics.get('total_tuition', 0)/1000000:.1f}M")
-            with col3:
-                st.metric("Financial Aid", f"AED {metrics.get('total_aid', 0)/1000000:.1f}M")
-            with col4:
-                st.metric("Aid Coverage", f"{metrics.get('aid_coverage_pct', 0):.1f}%")
-            with col5:
-                st.metric("Revenue/Student", f"AED {metrics.get('total_tuition', 0)/metrics.get('total_students', 1) if metrics.get('total_students', 0) > 0 else 0:,.0f}")
+                # Creative content
+                query_ollama(prompt, model, url,
+                    temperature=0.7)  # Varied
+                ```
 
-            st.divider()
+                ---
 
-            # ========================================================================
-            # DYNAMIC AI-RECOMMENDED VISUALIZATIONS
-            # ========================================================================
-            st.markdown("### 📈 AI-Recommended Visualizations")
-            st.caption(f"The AI analyzed your data and recommends {len(viz_result.get('visualizations', []))} visualizations")
+                ## 📊 Metrics Formatting
 
-            visualizations = viz_result.get('visualizations', [])
+                ### 4. **Data-Driven Prompts**
 
-            if visualizations:
-                # Display visualizations in grid (2 columns)
-                for idx in range(0, len(visualizations), 2):
-                    cols = st.columns(2)
+                We format metrics for LLM consumption:
 
-                    for col_idx, col in enumerate(cols):
-                        viz_idx = idx + col_idx
-                        if viz_idx < len(visualizations):
-                            viz_spec = visualizations[viz_idx]
+                **Raw Metrics:**
+                ```python
+                {
+                    'total_students': 1000,
+                    'avg_gpa': 3.234567,
+                    'revenue': 75500000
+                }
+                ```
 
-                            with col:
-                                st.markdown(f"#### {viz_spec.get('title', 'Visualization')}")
-                                st.caption(f"**Why this matters:** {viz_spec.get('reasoning', '')}")
+                **Formatted for Prompt:**
+                ```
+                - Total Students: 1,000
+                - Average GPA: 3.2
+                - Total Revenue: AED 75.5M
+                - High Performers: 450 (45.0%)
+                ```
 
-                                # Build dynamic chart from AI specification
-                                chart = build_dynamic_chart(viz_spec, df)
+                ---
 
-                                if chart:
-                                    st.plotly_chart(chart, width="stretch")
+                ## 🔄 Context Chaining
 
-                                    # Display AI-generated insight
-                                    st.info(f"**AI Insight:** {viz_spec.get('insight', '')}")
-                                else:
-                                    st.warning(f"Could not generate chart for: {viz_spec.get('data_column', 'unknown column')}")
+                ### 5. **Progressive Context Building**
 
-                st.divider()
+                Each component receives context from previous:
 
-                # ========================================================================
-                # KEY FINDINGS (AI-Generated)
-                # ========================================================================
-                st.markdown("### 🔍 Key Findings")
+                ```python
+                # Step 1: Business Context
+                context = generate_business_context(...)
 
-                key_findings = viz_result.get('key_findings', [])
-                if key_findings:
-                    for idx, finding in enumerate(key_findings, 1):
-                        st.markdown(f"""
-                        <div style='background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 0.8rem;'>
-                            <strong style='color: #60a5fa;'>Finding {idx}:</strong> {finding}
-                        </div>
-                        """, unsafe_allow_html=True)
+                # Step 2: Data Insights (with context)
+                insights = generate_insights(
+                    context={'business': context}
+                )
 
-                st.divider()
+                # Step 3: Impact (with both)
+                impact = generate_impact(
+                    context={
+                        'business': context,
+                        'insights': insights
+                    }
+                )
+                ```
 
-                # ========================================================================
-                # RECOMMENDATIONS (AI-Generated with Priority & ROI)
-                # ========================================================================
-                st.markdown("### 💡 AI-Generated Strategic Recommendations")
+                **Benefit:** Each narrative builds on previous,
+                creating coherent stories.
 
-                recommendations = viz_result.get('recommendations', [])
-                if recommendations:
-                    for idx, rec in enumerate(recommendations, 1):
-                        # Handle both old format (string) and new enriched format (dict)
-                        if isinstance(rec, dict):
-                            # New enriched format with priority, impact, timeline, investment
-                            priority = rec.get('priority', 'MEDIUM')
-                            action = rec.get('action', '')
-                            expected_impact = rec.get('expected_impact', '')
-                            timeline = rec.get('timeline', 'short-term')
-                            investment = rec.get('investment', 'TBD')
+                ---
 
-                            # Color-code by priority
-                            priority_colors = {
-                                'CRITICAL': ('#ef4444', 'rgba(239, 68, 68, 0.15)'),
-                                'HIGH': ('#f59e0b', 'rgba(245, 158, 11, 0.15)'),
-                                'MEDIUM': ('#10b981', 'rgba(16, 185, 129, 0.15)')
-                            }
-                            border_color, bg_gradient = priority_colors.get(priority, priority_colors['MEDIUM'])
+                ## 🛡️ Fallback System
 
-                            st.markdown(f"""
-                            <div style='background: {bg_gradient}; padding: 1.5rem; border-radius: 8px;
-                                        border-left: 4px solid {border_color}; margin-bottom: 1rem;'>
-                                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;'>
-                                    <h4 style='color: {border_color}; margin: 0;'>
-                                        {'🔴' if priority == 'CRITICAL' else '🟠' if priority == 'HIGH' else '🟢'}
-                                        Recommendation {idx} - {priority} Priority
-                                    </h4>
-                                    <span style='background: rgba(0,0,0,0.3); padding: 0.3rem 0.8rem;
-                                                border-radius: 12px; font-size: 0.85rem; color: #cbd5e1;'>
-                                        {timeline.replace('_', ' ').title()}
-                                    </span>
-                                </div>
-                                <p style='color: #e2e8f0; margin-bottom: 0.8rem; line-height: 1.6; font-size: 1.05rem;'>
-                                    <strong>Action:</strong> {action}
-                                </p>
-                                <p style='color: #a5b4fc; margin-bottom: 0.8rem; line-height: 1.6;'>
-                                    <strong>📊 Expected Impact:</strong> {expected_impact}
-                                </p>
-                                <p style='color: #cbd5e1; margin-bottom: 0; line-height: 1.6; font-size: 0.95rem;'>
-                                    <strong>💰 Investment:</strong> {investment}
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            # Old format (simple string) - backwards compatible
-                            st.markdown(f"""
-                            <div style='background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-                                        padding: 1.2rem; border-radius: 8px; border-left: 4px solid #10b981; margin-bottom: 1rem;'>
-                                <h4 style='color: #10b981; margin-top: 0;'>Recommendation {idx}</h4>
-                                <p style='color: #e2e8f0; margin-bottom: 0; line-height: 1.6;'>
-                                    {rec}
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                ### 6. **3-Tier Quality Assurance**
 
-            else:
-                st.warning("No visualizations generated. Try regenerating with the button above.")
+                ```
+                Tier 1: Try LLM Generation
+                   ↓ (if fails)
+                Tier 2: Statistical Enrichment
+                   ↓ (if fails)
+                Tier 3: Template-Based Content
+                ```
 
-    # ====================================================================================
-    # TAB 2: DATA STORYTELLING AI DRIVEN WITH TEMPLATE GUIDANCE
-    # ====================================================================================
-    with tabs[1]:
-        st.header("📖 Data Storytelling AI Driven with Template Guidance")
-        st.caption("AI identifies entities from your data and creates comprehensive journey stories tracking their lifecycle")
+                **Result:** 100% uptime, always functional
 
-        # Explanation box
-        st.markdown(f"""<div style='background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #6366f1;'>
-<p style='margin: 0; color: #e2e8f0;'><strong>🎯 Entity-Based Journey System:</strong> Unlike traditional dashboards that show aggregate statistics,
-this system uses AI to <strong>identify meaningful entities</strong> (student cohorts, programs, services, revenue segments) from your dataset
-and <strong>tracks their complete lifecycle</strong> through multiple stages with data-driven narratives.</p>
-<p style='margin: 0.5rem 0 0 0; color: #cbd5e1; font-size: 0.9rem;'>
-<strong>How it works:</strong><br>
-• <strong>Phase 1:</strong> AI analyzes your {metrics.get('total_students', 0):,} students and identifies exactly 6 meaningful entities<br>
-• <strong>Phase 2:</strong> AI defines 4-6 lifecycle stages for each entity<br>
-• <strong>Phase 3:</strong> AI generates compelling narratives for each stage using actual data
-</p>
-<p style='margin: 0.8rem 0 0 0; padding-top: 0.8rem; border-top: 1px solid rgba(99, 102, 241, 0.3); color: #cbd5e1; font-size: 0.9rem;'>
-<strong>🚀 Journeys are based on:</strong><br>
-• ✅ Dataset structure analysis (all {len(df.columns)} columns examined)<br>
-• ✅ Sample data patterns (first 5 rows analyzed for insights)<br>
-• ✅ Entity lifecycle concept (things that evolve: beginning → middle → end)<br>
-• ✅ Entity types: Student, Program, Financial Aid, Enrollment, Campus, Revenue<br>
-• ✅ AI pattern recognition of what constitutes a meaningful "journey"<br>
-• ✅ Status transitions (Active → At-Risk → Successful/Failed)
-</p>
-<p style='margin: 0.8rem 0 0 0; padding-top: 0.8rem; border-top: 1px solid rgba(99, 102, 241, 0.3); color: #cbd5e1; font-size: 0.9rem;'>
-<strong>📋 Stages within each journey are based on:</strong><br>
-• ✅ Your actual dataset columns and values<br>
-• ✅ The specific entity identified by AI<br>
-• ✅ Chronological/logical progression (enrollment → performance → outcomes)<br>
-• ✅ LLM's understanding of higher education lifecycles<br>
-• ✅ Data-driven insights specific to your institution's context
-</p>
-</div>""", unsafe_allow_html=True)
+                ---
 
-        if not st.session_state.ollama_connected:
-            st.warning("⚠️ Connect to Ollama to generate entity journeys")
-        elif not LLM_ENTITY_JOURNEY_AVAILABLE:
-            st.error("❌ LLM Entity Journey System module not found. Please ensure llm_entity_journey_system.py is available.")
-        else:
-            # Button to generate entity journeys
-            col_btn, col_info = st.columns([2, 3])
-            with col_btn:
-                if st.button("🚀 Generate Entity Journeys", key="generate_entity_journeys_btn", type="primary", width='stretch'):
-                    # Test connection first
-                    st.info(f"🔍 Testing connection to: {url}")
-                    try:
-                        import requests
-                        test_response = requests.get(f"{url}/api/tags", timeout=10)
-                        if test_response.status_code == 200:
-                            st.success(f"✅ Connection OK - {len(test_response.json()['models'])} models available")
-                        else:
-                            st.error(f"❌ Connection failed: HTTP {test_response.status_code}")
-                            st.stop()
-                    except Exception as conn_err:
-                        st.error(f"❌ Connection test failed: {str(conn_err)}")
-                        st.warning("💡 Make sure your Colab tunnel is running if using Cloudflare")
-                        st.stop()
+                ## 🎨 Real-World Example
 
-                    try:
-                        # Capture print logs in a container
-                        log_container = st.container()
-                        import sys
-                        from io import StringIO
+                ### Complete Narrative Generation:
 
-                        # Create a custom stdout to capture prints
-                        captured_output = StringIO()
-                        old_stdout = sys.stdout
-                        sys.stdout = captured_output
+                **Input Metrics:**
+                ```
+                total_students: 1000
+                housed_students: 663
+                occupancy_rate: 66.3%
+                avg_gpa_housed: 3.1
+                avg_gpa_not_housed: 2.8
+                ```
 
-                        try:
-                            with st.spinner("🔄 Phase 1/3: Identifying meaningful entities from dataset..."):
-                                st.info(f"📊 Analyzing {len(df)} rows with {len(df.columns)} columns...")
-                                # Generate complete entity journeys using LLM
-                                entity_journeys = generate_complete_llm_journeys(df, model, url)
-                                st.session_state.llm_cache['entity_journeys'] = entity_journeys
-                        finally:
-                            # Restore stdout
-                            sys.stdout = old_stdout
+                **Generated Opening:**
+                > "Our analysis reveals striking patterns in housing
+                > impact: 663 students (66.3%) live on campus, and
+                > they outperform off-campus peers by 0.3 GPA points
+                > (3.1 vs 2.8). This 10.7% performance advantage
+                > translates to measurable retention value..."
 
-                        # Show captured logs in expander
-                        captured_logs = captured_output.getvalue()
-                        if captured_logs:
-                            with st.expander("📋 Show Generation Logs (for debugging)"):
-                                st.text(captured_logs)
+                **Why it works:**
+                - Specific numbers (663, 66.3%, 3.1, 2.8)
+                - Comparative analysis (10.7% advantage)
+                - Business impact (retention value)
+                - Engaging narrative flow
 
-                        if entity_journeys:
-                            total_stages = sum(j['total_stages'] for j in entity_journeys)
-                            st.success(f"✅ Generated {len(entity_journeys)} entity journeys with {total_stages} total stages!")
-                        else:
-                            st.error("❌ No entity journeys generated (empty result)")
-                            st.warning("💡 The logs above show what happened. Possible causes:")
-                            st.warning("- LLM failed to generate valid JSON (check logs for 'JSON parsing error')")
-                            st.warning("- Dataset too small or lacks clear patterns")
-                            st.warning("- LLM timed out during generation (check logs for 'timeout')")
-                    except Exception as e:
-                        st.error(f"❌ Error generating entity journeys: {str(e)}")
-                        st.error(f"Error type: {type(e).__name__}")
-                        import traceback
-                        with st.expander("🔍 Show detailed error"):
-                            st.code(traceback.format_exc())
-                        st.warning("💡 Troubleshooting:")
-                        st.warning("1. Check Streamlit Cloud logs for full error")
-                        st.warning("2. Verify Colab tunnel is running (if using Cloudflare)")
-                        st.warning("3. Try with a smaller dataset first")
-                        st.warning("4. Check if model exists: " + model)
+                ---
 
-            with col_info:
-                st.info("⏱️ **Estimated time:** 5-15 minutes depending on dataset complexity. The AI will make multiple LLM calls to build comprehensive stories.")
+                ## 📈 Recommendations for Enhancement
 
-            # Display entity journeys if available
-            if 'entity_journeys' in st.session_state.llm_cache:
-                entity_journeys = st.session_state.llm_cache['entity_journeys']
+                ### **Currently NOT Used (Opportunities):**
 
-                if not entity_journeys:
-                    st.warning("No entity journeys generated. Try again or check your dataset.")
-                else:
-                    st.markdown("---")
-                    st.markdown(f"### 🎯 {len(entity_journeys)} Entity Journeys Discovered")
-                    st.caption(f"*AI identified {len(entity_journeys)} meaningful entities and tracked their lifecycle through {sum(j['total_stages'] for j in entity_journeys)} total stages*")
+                #### A. **RAG (Retrieval Augmented Generation)**
+                - Add vector database for historical insights
+                - Reference past reports automatically
+                - **Expected Impact:** +30% contextual relevance
 
-                    # Display each entity journey
-                    for journey_idx, journey in enumerate(entity_journeys, 1):
-                        entity_type_colors = {
-                            # Lifecycle entity types
-                            'student_lifecycle': ('#3b82f6', 'rgba(59, 130, 246, 0.1)'),
-                            'program_lifecycle': ('#8b5cf6', 'rgba(139, 92, 246, 0.1)'),
-                            'aid_lifecycle': ('#10b981', 'rgba(16, 185, 129, 0.1)'),
-                            'enrollment_lifecycle': ('#06b6d4', 'rgba(6, 182, 212, 0.1)'),
-                            'campus_lifecycle': ('#f59e0b', 'rgba(245, 158, 11, 0.1)'),
-                            'revenue_lifecycle': ('#22c55e', 'rgba(34, 197, 94, 0.1)'),
-                            'facility_lifecycle': ('#eab308', 'rgba(234, 179, 8, 0.1)'),
-                            # Legacy types (for backward compatibility)
-                            'student_cohort': ('#3b82f6', 'rgba(59, 130, 246, 0.1)'),
-                            'program': ('#8b5cf6', 'rgba(139, 92, 246, 0.1)'),
-                            'service': ('#06b6d4', 'rgba(6, 182, 212, 0.1)'),
-                            'revenue_segment': ('#10b981', 'rgba(16, 185, 129, 0.1)'),
-                            'operational': ('#f59e0b', 'rgba(245, 158, 11, 0.1)')
-                        }
+                #### B. **Chain-of-Thought Prompting**
+                ```
+                "Let's analyze this step by step:
+                1. First, identify the trend...
+                2. Then, calculate the impact...
+                3. Finally, recommend actions..."
+                ```
+                - **Expected Impact:** +25% reasoning quality
 
-                        entity_type = journey.get('entity_type', 'student_lifecycle')
-                        color, bg_color = entity_type_colors.get(entity_type, ('#6366f1', 'rgba(99, 102, 241, 0.1)'))
+                #### C. **Few-Shot Learning**
+                ```
+                "Example 1:
+                Input: {...}
+                Output: {...}
 
-                        # Priority colors
-                        priority = journey.get('priority', 5)
-                        if priority >= 8:
-                            priority_color = '#dc2626'
-                            priority_label = '🚨 CRITICAL'
-                        elif priority >= 6:
-                            priority_color = '#f97316'
-                            priority_label = '⚡ HIGH'
-                        elif priority >= 4:
-                            priority_color = '#eab308'
-                            priority_label = '💡 MEDIUM'
-                        else:
-                            priority_color = '#10b981'
-                            priority_label = '✅ STANDARD'
+                Example 2:
+                Input: {...}
+                Output: {...}
 
-                        # Entity Journey Card Header
-                        with st.expander(f"**{journey_idx}. {journey['entity_name']}** ({journey['total_stages']} stages) - {priority_label}", expanded=(journey_idx <= 2)):
-                            # Entity Overview
-                            st.markdown(f"""<div style='background: {bg_color}; padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid {color};'>
-<div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;'>
-    <div>
-        <h3 style='font-size: 1.3rem; font-weight: 700; color: {color}; margin: 0 0 0.3rem 0;'>{journey['entity_name']}</h3>
-        <div style='color: #94a3b8; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.5px;'>{journey['entity_type'].replace('_', ' ')}</div>
-    </div>
-    <div style='text-align: right;'>
-        <span style='background: {priority_color}; color: white; padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.75rem; font-weight: 600; display: inline-block;'>{priority_label}</span>
-    </div>
-</div>
-<p style='color: #e2e8f0; font-size: 1rem; line-height: 1.6; margin-bottom: 0.8rem;'>{journey.get('description', '')}</p>
-<div style='background: rgba(0,0,0,0.2); padding: 0.9rem; border-radius: 6px;'>
-    <p style='color: #e2e8f0; margin: 0; line-height: 1.6;'>
-        <strong style='color: #60a5fa;'>📊 Students:</strong> {journey.get('student_count', 'N/A')}
-    </p>
-    <p style='color: #e2e8f0; margin: 0.5rem 0 0 0; line-height: 1.6;'>
-        <strong style='color: #34d399;'>💡 Why Important:</strong> {journey.get('why_important', 'Strategic entity for institutional performance')}
-    </p>
-</div>
-</div>""", unsafe_allow_html=True)
+                Now analyze: {...}"
+                ```
+                - **Expected Impact:** +20% consistency
 
-                            # Journey Stages
-                            st.markdown("#### 📋 Journey Lifecycle Stages")
+                #### D. **Ensemble Generation**
+                - Generate 3 variants, pick best
+                - Use multiple models for consensus
+                - **Expected Impact:** +35% quality
 
-                            for stage_idx, stage in enumerate(journey.get('stages', []), 1):
-                                stage_color = color
-                                stage_icon = ['🔵', '🟢', '🟡', '🟠', '🔴', '🟣'][min(stage_idx - 1, 5)]
+                #### E. **Fine-Tuning**
+                - Train on higher education reports
+                - Domain-specific vocabulary
+                - **Expected Impact:** +40% relevance
 
-                                # Stage Header
-                                st.markdown(f"""<div style='display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem; margin-top: 1.5rem;'>
-    <span style='font-size: 2rem;'>{stage_icon}</span>
-    <div style='flex: 1;'>
-        <h4 style='color: {stage_color}; margin: 0; font-size: 1.2rem;'>Stage {stage.get('stage_order', stage_idx)}: {stage.get('stage_name', 'Unknown Stage')}</h4>
-        <p style='color: #94a3b8; margin: 0.2rem 0 0 0; font-size: 0.9rem;'>{stage.get('description', '')}</p>
-    </div>
-</div>""", unsafe_allow_html=True)
+                #### F. **Prompt Caching**
+                - Cache expensive prompt processing
+                - Reuse common contexts
+                - **Expected Impact:** +50% speed
 
-                                # Stage Narrative (like Executive Summary findings)
-                                st.markdown(f"""<div style='background: rgba(59, 130, 246, 0.1); padding: 1.2rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
-    <strong style='color: #60a5fa; font-size: 0.9rem;'>📖 STAGE NARRATIVE</strong>
-    <p style='color: #e2e8f0; margin: 0.5rem 0 0 0; line-height: 1.6; font-size: 1rem;'>{stage.get('narrative_text', 'No narrative available.')}</p>
-</div>""", unsafe_allow_html=True)
+                #### G. **Streaming Responses**
+                - Show progressive generation
+                - Better user experience
+                - **Expected Impact:** Perceived -70% latency
 
-                                # Key Metrics (like Executive Summary recommendations)
-                                key_metrics = stage.get('key_metrics', [])
-                                if key_metrics:
-                                    st.markdown(f"""<div style='background: rgba(59, 130, 246, 0.15); padding: 1.2rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
-    <h4 style='color: #60a5fa; margin: 0 0 0.8rem 0; font-size: 0.95rem;'>📊 KEY METRICS</h4>
-    {''.join([f"<p style='color: #e2e8f0; margin: 0 0 0.6rem 0; line-height: 1.6;'><strong style='color: #60a5fa;'>{m.get('metric', '')}:</strong> {m.get('value', '')} <span style='color: #a5b4fc; font-size: 0.9rem;'>({m.get('significance', '')})</span></p>" for m in key_metrics])}
-</div>""", unsafe_allow_html=True)
+                ---
 
-                                # Insights (like Executive Summary findings)
-                                insights = stage.get('insights', [])
-                                if insights:
-                                    for idx, insight in enumerate(insights, 1):
-                                        st.markdown(f"""<div style='background: rgba(16, 185, 129, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #10b981; margin-bottom: 0.8rem;'>
-    <strong style='color: #34d399;'>💡 Insight {idx}:</strong> <span style='color: #e2e8f0;'>{insight}</span>
-</div>""", unsafe_allow_html=True)
+                ## 🔬 Current System Performance
 
-                                # Recommendations (like Executive Summary recommendations)
-                                recommendations = stage.get('recommendations', [])
-                                if recommendations:
-                                    st.markdown(f"""<div style='background: rgba(245, 158, 11, 0.15); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #f59e0b; margin-bottom: 1rem;'>
-    <h4 style='color: #fbbf24; margin: 0 0 0.8rem 0; font-size: 0.95rem;'>🎯 RECOMMENDATIONS</h4>
-    {''.join([f"<p style='color: #e2e8f0; margin: 0 0 0.6rem 0; line-height: 1.6;'><strong style='color: #fbbf24;'>→</strong> {rec}</p>" for rec in recommendations])}
-</div>""", unsafe_allow_html=True)
+                **Metrics:**
+                - **108 narratives** generated per journey set
+                - **Avg generation time:** 3-5 minutes (all journeys)
+                - **Success rate:** >95% with fallbacks = 100%
+                - **Context utilization:** 2048-8192 tokens
+                - **Response quality:** Professional grade
 
-                                # Display LLM-recommended visualizations
-                                visualizations = stage.get('visualizations', [])
-                                if visualizations and LLM_ENTITY_JOURNEY_AVAILABLE:
-                                    # Get entity data for visualization
-                                    entity_data = filter_dataset_for_entity(df, journey)
+                **Architecture:**
+                ```
+                Data → Metrics → Prompts → LLM → Narratives → UI
+                         ↓          ↓        ↓
+                    Format    Optimize  Fallback
+                ```
 
-                                    # Try to generate visualizations first
-                                    successful_viz = []
-                                    for viz_idx, viz_spec in enumerate(visualizations, 1):
-                                        fig = generate_visualization(entity_data, viz_spec)
-                                        if fig:
-                                            successful_viz.append((viz_idx, viz_spec, fig))
+                ---
 
-                                    # Only show header if we have successful visualizations
-                                    if successful_viz:
-                                        st.markdown("<h4 style='color: #e2e8f0; margin-top: 1.5rem;'>📊 Data Visualizations</h4>", unsafe_allow_html=True)
-                                        st.caption("*AI-selected visualizations to illustrate this stage*")
+                ## 💡 Quick Tips for Best Results
 
-                                        # Display the successful visualizations
-                                        for viz_idx, viz_spec, fig in successful_viz:
-                                            viz_title = viz_spec.get('title', f'Visualization {viz_idx}')
-                                            viz_desc = viz_spec.get('description', '')
-                                            viz_purpose = viz_spec.get('chart_purpose', '')
+                1. **Use Cloudflare tunnel** for remote access
+                2. **Select larger models** (7B+ params) for quality
+                3. **Ensure >8GB RAM** for optimal performance
+                4. **Enable auto-optimize** (default on)
+                5. **Use sample dataset** to test first
+                6. **Check Ollama logs** if generation fails
 
-                                            # Display chart with description (Executive Summary style)
-                                            st.markdown(f"""<div style='background: rgba(99, 102, 241, 0.1); padding: 1rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #6366f1;'>
-    <h5 style='color: #818cf8; margin: 0 0 0.5rem 0; font-size: 1rem;'>{viz_title}</h5>
-    <p style='color: #cbd5e1; margin: 0; font-size: 0.9rem;'><strong>Why this matters:</strong> {viz_desc}</p>
-    {f"<p style='color: #a5b4fc; margin: 0.5rem 0 0 0; font-size: 0.85rem; font-style: italic;'>💡 {viz_purpose}</p>" if viz_purpose else ''}
-</div>""", unsafe_allow_html=True)
-                                            st.plotly_chart(fig, width='stretch', key=f"viz_{journey_idx}_{stage_idx}_{viz_idx}")
+                ---
 
-                    st.markdown("---")
-                    st.success("✅ All entity journeys loaded successfully!")
+                ## 📚 Technical References
 
-            else:
-                # Show prompt to generate entity journeys
-                st.info("💡 Click 'Generate Entity Journeys' to let the AI analyze your dataset and create comprehensive entity lifecycle stories")
+                **Implemented Techniques:**
+                - ✅ Role-based prompting
+                - ✅ Structured instructions
+                - ✅ Constraint guidance
+                - ✅ Dynamic parameter tuning
+                - ✅ Temperature control
+                - ✅ Context chaining
+                - ✅ Metrics formatting
+                - ✅ Fallback strategies
 
-                # Example entity types
-                st.markdown("### 🎯 Example Lifecycle Entities")
-                st.markdown("""
-                The AI will identify **ENTITIES** that have **LIFECYCLES** and **STATUS CHANGES**:
+                **Code Locations:**
+                - Prompt engineering: `journey_narratives.py`
+                - LLM optimization: `student_360_llm_powered.py:689-934`
+                - Generation pipeline: `journey_assembler.py`
+                - Metrics formatting: `journey_narratives.py:252-307`
 
-                **🎓 Student Entity**
-                - Lifecycle: Enrollment → Academic Progress → Performance Status → Graduation/Dropout
-                - Example Journey: "Student Academic Journey" tracking progression from entry to exit
+                ---
 
-                **📚 Academic Program Entity**
-                - Lifecycle: Program Launch → Growth → Maturity → Optimization
-                - Example Journey: "Academic Program Lifecycle" showing how programs evolve
+                <p><em>This guide documents the production-grade LLM
+                enhancement strategies powering Student 360 Analytics.</em></p>
 
-                **💰 Financial Aid Entity**
-                - Lifecycle: Application → Approval → Disbursement → Impact Assessment
-                - Example Journey: "Financial Aid Journey" tracking aid effectiveness
+                </div>
+                """, unsafe_allow_html=True)
 
-                **🏢 Campus/Facility Entity**
-                - Lifecycle: Opening → Expansion → Optimization
-                - Example Journey: "Campus Operations Journey" or "Dormitory Lifecycle"
+        st.divider()
 
-                **📈 Enrollment Entity**
-                - Lifecycle: Application → Acceptance → Registration → Retention
-                - Example Journey: "Enrollment Journey" tracking student acquisition
+        # ====================================================================================
+        # OLLAMA CONNECTION STATUS (From gen_storytelling_app.py lines 1116-1298)
+        # ====================================================================================
+        st.markdown("### 🔌 Ollama Connection Status")
 
-                **💵 Revenue Entity**
-                - Lifecycle: Tuition Assessment → Payment → Collection → Revenue Recognition
-                - Example Journey: "Revenue Journey" tracking financial flows
+        # Determine connection status
+        is_connected = False
+        model_count = 0
+        error_msg = None
 
-                ---
-
-                **Each entity will have:**
-                - Multiple lifecycle stages showing progression
-                - Data-driven narratives for each stage
-                - Nationality/demographic breakdowns in the stories
-                - Performance metrics and status indicators
-                - Actionable insights and recommendations
-                """)
+        if st.session_state.get('ollama_url'):
+            if st.session_state.get('ollama_connected'):
+                is_connected = True
+                models = get_available_models(st.session_state.ollama_url)
+                model_count = len(models)
+            else:
+                health = verify_ollama_health(st.session_state.ollama_url)
+                st.session_state.health_check_count += 1
 
-    # ====================================================================================
-    # TAB 3: DATA STORYTELLING FULLY AI DRIVEN
-    # ====================================================================================
-    with tabs[2]:
-        st.header("🔬 Data Storytelling Fully AI Driven")
-        st.caption("Pure AI-driven entity discovery with ZERO predefined examples or guidance")
+                if health['connected']:
+                    is_connected = True
+                    model_count = health['model_count']
+                    st.session_state.ollama_connected = True
+                else:
+                    is_connected = False
+                    error_msg = health.get('error', 'Unknown')
 
-        # Explanation box
-        st.markdown(f"""<div style='background: linear-gradient(135deg, rgba(139, 92, 246, 0.15), rgba(236, 72, 153, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #8b5cf6;'>
-<p style='margin: 0; color: #e2e8f0;'><strong>🔬 PURE AUTONOMOUS DISCOVERY:</strong> This system operates with <strong>ZERO predefined templates or examples</strong>.
-The AI analyzes your {metrics.get('total_students', 0):,} students and <strong>discovers entities entirely from data patterns</strong> with no guidance on what to find.</p>
-<p style='margin: 0.5rem 0 0 0; color: #cbd5e1; font-size: 0.9rem;'>
-<strong>How it differs from guided discovery:</strong><br>
-• <strong>Guided System:</strong> AI gets examples like "Student Journey", "Program Lifecycle" → follows patterns<br>
-• <strong>Fully Dynamic:</strong> AI gets NO examples → discovers what exists in YOUR specific data<br>
-<br>
-<strong>What to expect:</strong> Unique entities specific to your institution that may not fit standard categories.
-</p>
-</div>""", unsafe_allow_html=True)
+        # Display status
+        if is_connected:
+            st.success("✅ Connected & Active")
 
-        if not st.session_state.ollama_connected:
-            st.warning("⚠️ Connect to Ollama to enable fully dynamic discovery")
-        elif not FULLY_DYNAMIC_DISCOVERY_AVAILABLE:
-            st.error("❌ Fully Dynamic Discovery module not found. Please ensure fully_dynamic_entity_discovery.py is available.")
-        else:
-            # Button to generate fully dynamic journeys
-            col_btn, col_info = st.columns([2, 3])
-            with col_btn:
-                if st.button("🔬 Discover Entities Autonomously", key="discover_dynamic_entities_btn", type="primary", width='stretch'):
-                    with st.spinner("🔄 AI is analyzing data patterns with NO guidance (this may discover unexpected entities)..."):
-                        # Generate fully dynamic journeys (NO templates, NO examples)
-                        dynamic_journeys = generate_fully_dynamic_journeys(df, model, url)
-                        st.session_state.llm_cache['dynamic_journeys'] = dynamic_journeys
+            current_url = st.session_state.get('ollama_url', 'Unknown')
+            if 'cloudflare' in current_url.lower() or 'exalio' in current_url.lower():
+                endpoint_type = "☁️ Cloudflare"
+            elif 'localhost' in current_url.lower():
+                endpoint_type = "💻 Local"
+            else:
+                endpoint_type = "🔧 Custom"
 
-                        if dynamic_journeys:
-                            total_stages = sum(j['total_stages'] for j in dynamic_journeys)
-                            st.success(f"✅ DISCOVERED {len(dynamic_journeys)} unique entities autonomously with {total_stages} total lifecycle stages!")
-                        else:
-                            st.error("❌ Autonomous discovery failed. Please check your dataset and Ollama connection.")
+            st.caption(f"📦 {model_count} model(s) available from {endpoint_type}")
+            if st.session_state.get('selected_model'):
+                st.caption(f"🤖 Active: {st.session_state.selected_model}")
+            st.caption(f"🕐 Health checks: {st.session_state.health_check_count}")
+        elif st.session_state.get('ollama_url'):
+            st.error("❌ Disconnected")
+            if error_msg:
+                st.caption(f"Error: {error_msg}")
 
-            with col_info:
-                st.info("⏱️ **Estimated time:** 10-20 minutes. The AI will make multiple calls to discover patterns WITHOUT any predefined examples.")
+            col_retry1, col_retry2 = st.columns([3, 2])
+            with col_retry1:
+                if st.button("🔄 Reconnect Now", type="primary", width="stretch"):
+                    with st.spinner("🔄 Attempting to reconnect..."):
+                        import time
+                        connected, models, status_msg = ensure_ollama_connection(
+                            st.session_state.ollama_url,
+                            auto_reconnect=True,
+                            max_retries=3
+                        )
 
-            # Display fully dynamic journeys if available
-            if 'dynamic_journeys' in st.session_state.llm_cache:
-                dynamic_journeys = st.session_state.llm_cache['dynamic_journeys']
+                        if connected:
+                            st.session_state.ollama_connected = True
+                            st.session_state.selected_model = models[0] if models else None
+                            st.success(f"✅ {status_msg}")
+                            st.success(f"📦 Found {len(models)} model(s)")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(f"❌ {status_msg}")
+                            st.info("💡 **Troubleshooting:**\n- Check if Ollama is running\n- Verify URL is correct\n- Check network connection")
 
-                if not dynamic_journeys:
-                    st.warning("No entities discovered autonomously. The AI may need clearer data patterns.")
-                else:
-                    st.markdown("---")
-                    st.markdown(f"### 🔬 {len(dynamic_journeys)} Entities Discovered Autonomously")
-                    st.caption(f"*AI discovered {len(dynamic_journeys)} unique entities by analyzing data patterns with ZERO guidance*")
+            with col_retry2:
+                if st.button("ℹ️ Help", width="stretch"):
+                    st.session_state.show_connection_help = not st.session_state.get('show_connection_help', False)
 
-                    # Display discovery method badge
-                    st.markdown("""<div style='background: rgba(139, 92, 246, 0.15); padding: 0.9rem; border-radius: 6px; margin-bottom: 1rem; border-left: 4px solid #8b5cf6;'>
-<div style='font-size: 0.85rem; font-weight: 600; color: #e2e8f0; margin-bottom: 0.4rem;'>🔬 DISCOVERY METHOD: FULLY AUTONOMOUS</div>
-<div style='font-size: 0.8rem; color: #cbd5e1;'>These entities were discovered purely from data patterns. No predefined templates or examples were used.</div>
-</div>""", unsafe_allow_html=True)
+            if st.session_state.get('show_connection_help', False):
+                with st.expander("🔧 Connection Troubleshooting", expanded=True):
+                    st.markdown("""
+                    **Common Issues:**
 
-                    # Display each discovered journey
-                    for journey_idx, journey in enumerate(dynamic_journeys, 1):
-                        # Use different color scheme for dynamic discoveries
-                        color = '#8b5cf6'  # Purple for dynamic discoveries
-                        bg_color = 'rgba(139, 92, 246, 0.1)'
+                    1. **Ollama not running**
+                       ```bash
+                       ollama serve
+                       ```
 
-                        # Priority colors
-                        priority = journey.get('priority', 5)
-                        if priority >= 8:
-                            priority_color = '#8b5cf6'
-                            priority_label = '🔬 HIGH DISCOVERY'
-                        elif priority >= 6:
-                            priority_color = '#a78bfa'
-                            priority_label = '🔍 MEDIUM DISCOVERY'
-                        else:
-                            priority_color = '#c4b5fd'
-                            priority_label = '💡 STANDARD DISCOVERY'
+                    2. **Wrong URL**
+                       - Local: `http://localhost:11434`
+                       - Cloudflare: Check tunnel URL
 
-                        # Entity Journey Card Header
-                        with st.expander(f"**{journey_idx}. {journey['entity_name']}** (Discovered: {journey.get('entity_type', 'unknown')}) - {priority_label}", expanded=(journey_idx <= 2)):
-                            # Entity Overview with Discovery Rationale
-                            st.markdown(f"""<div style='background: {bg_color}; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid {color};'>
-<div style='display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;'>
-    <div>
-        <div style='font-size: 1.2rem; font-weight: 700; color: #e2e8f0; margin-bottom: 0.3rem;'>{journey['entity_name']}</div>
-        <div style='color: #94a3b8; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.5px;'>{journey.get('entity_type', 'discovered_entity').replace('_', ' ')}</div>
-    </div>
-    <div style='text-align: right;'>
-        <div style='background: {priority_color}; color: white; padding: 0.3rem 0.6rem; border-radius: 6px; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.3rem;'>{priority_label}</div>
-        <div style='color: #94a3b8; font-size: 0.75rem;'>Priority {priority}</div>
-    </div>
-</div>
-<div style='color: #cbd5e1; font-size: 0.95rem; line-height: 1.6; margin-top: 0.75rem;'><strong>What is this entity:</strong> {journey.get('description', '')}</div>
-<div style='background: rgba(139, 92, 246, 0.2); padding: 0.8rem; border-radius: 6px; margin-top: 0.75rem; border-left: 3px solid #8b5cf6;'>
-    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>🔍 Discovery Rationale (Why AI identified this as an entity)</div>
-    <div style='color: #cbd5e1; font-size: 0.85rem; font-style: italic;'>{journey.get('discovery_rationale', 'Discovered from data patterns')}</div>
-</div>
-<div style='background: rgba(0,0,0,0.2); padding: 0.8rem; border-radius: 6px; margin-top: 0.75rem;'>
-    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>📊 Entity Metrics</div>
-    <div style='color: #cbd5e1; font-size: 0.85rem;'>
-        <strong>Students:</strong> {journey.get('student_count', 'N/A')} |
-        <strong>Lifecycle Indicators:</strong> {', '.join(journey.get('lifecycle_indicators', ['N/A']))}
-    </div>
-</div>
-</div>""", unsafe_allow_html=True)
+                    3. **Firewall blocking**
+                       - Allow port 11434
+                       - Check antivirus settings
 
-                            # Journey Stages
-                            st.markdown("#### 📋 Discovered Lifecycle Stages")
+                    4. **No models installed**
+                       ```bash
+                       ollama pull tinyllama
+                       ```
+                    """)
+        else:
+            st.warning("⚠️ Not configured")
 
-                            for stage_idx, stage in enumerate(journey.get('stages', []), 1):
-                                stage_icon = ['🔵', '🟢', '🟡', '🟠', '🔴', '🟣'][min(stage_idx - 1, 5)]
+        # Auto-refresh toggle
+        auto_refresh = st.checkbox(
+            "🔄 Enable Auto-refresh",
+            value=st.session_state.get('auto_refresh', False),
+            help="Automatically refresh connection status"
+        )
+        st.session_state.auto_refresh = auto_refresh
 
-                                st.markdown(f"""<div style='background: rgba(30, 41, 59, 0.6); border: 2px solid {color}; border-radius: 8px; padding: 1.2rem; margin-bottom: 1rem;'>
-<div style='display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.75rem;'>
-    <span style='font-size: 1.5rem;'>{stage_icon}</span>
-    <div style='flex: 1;'>
-        <div style='font-size: 1.1rem; font-weight: 600; color: #e2e8f0;'>Stage {stage.get('stage_order', stage_idx)}: {stage.get('stage_name', 'Unknown Stage')}</div>
-        <div style='color: #94a3b8; font-size: 0.85rem;'>{stage.get('description', '')}</div>
-    </div>
-</div>
+        if not auto_refresh:
+            st.caption("❌ Auto-refresh disabled")
 
-<div style='background: rgba(139, 92, 246, 0.2); padding: 0.8rem; border-radius: 6px; margin-bottom: 0.75rem; border-left: 4px solid #8b5cf6;'>
-    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>🔍 Stage Discovery Rationale</div>
-    <div style='color: #cbd5e1; font-size: 0.85rem; font-style: italic;'>{stage.get('discovery_rationale', 'Discovered from data transitions')}</div>
-</div>
+        # Connection details
+        if st.session_state.get('ollama_url'):
+            with st.expander("📊 Connection Details", expanded=False):
+                st.markdown("**Connection Information:**")
 
-<div style='background: rgba(99, 102, 241, 0.15); padding: 0.9rem; border-radius: 6px; margin-bottom: 0.75rem; border-left: 4px solid #6366f1;'>
-    <div style='color: #e2e8f0; font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;'>📖 Stage Narrative</div>
-    <div style='color: #cbd5e1; font-size: 0.95rem; line-height: 1.7;'>{stage.get('narrative_text', 'No narrative available.')}</div>
-</div>
+                if is_connected:
+                    st.markdown("- Status: ✅ **Active**")
+                    st.markdown(f"- Endpoint: {endpoint_type}")
+                    st.markdown(f"- Models: {model_count} available")
+                else:
+                    st.markdown("- Status: ❌ **Disconnected**")
+                    if error_msg:
+                        st.markdown(f"- Error: `{error_msg}`")
 
-<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; margin-bottom: 0.75rem;'>
-    <div style='background: rgba(59, 130, 246, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #3b82f6;'>
-        <div style='color: #60a5fa; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>📊 Key Metrics</div>
-        {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'><strong style='color: #e2e8f0;'>{m.get('metric', '')}:</strong> {m.get('value', '')} <span style='color: #94a3b8; font-size: 0.8rem;'>({m.get('significance', '')})</span></div>" for m in stage.get('key_metrics', [])])}
-    </div>
-    <div style='background: rgba(16, 185, 129, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #10b981;'>
-        <div style='color: #34d399; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>💡 Insights</div>
-        {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'>• {insight}</div>" for insight in stage.get('insights', [])])}
-    </div>
-</div>
+                st.markdown(f"- URL: `{st.session_state.ollama_url}`")
+                st.markdown(f"- Health checks: {st.session_state.health_check_count}")
 
-<div style='background: rgba(245, 158, 11, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #f59e0b;'>
-    <div style='color: #fbbf24; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>🎯 Recommendations</div>
-    {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'>→ {rec}</div>" for rec in stage.get('recommendations', [])])}
-</div>
-</div>""", unsafe_allow_html=True)
+        st.divider()
 
-                                # Display visualizations if available
-                                visualizations = stage.get('visualizations', [])
-                                if visualizations and LLM_ENTITY_JOURNEY_AVAILABLE:
-                                    # Get entity data for visualization
-                                    entity_data = filter_dataset_for_entity(df, journey)
+        # ====================================================================================
+        # SYSTEM RESOURCES & OPTIMIZATION (From gen_storytelling_app.py lines 1300-1434)
+        # ====================================================================================
+        st.markdown("### 🖥️ System Resources & Optimization")
 
-                                    # Try to generate visualizations first
-                                    successful_viz = []
-                                    for viz_idx, viz_spec in enumerate(visualizations, 1):
-                                        fig = generate_visualization(entity_data, viz_spec)
-                                        if fig:
-                                            successful_viz.append((viz_idx, viz_spec, fig))
-
-                                    # Only show header if we have successful visualizations
-                                    if successful_viz:
-                                        st.markdown("<h4 style='color: #e2e8f0; margin-top: 1.5rem;'>📊 Data Visualizations</h4>", unsafe_allow_html=True)
-                                        st.caption("*AI-selected visualizations for this discovered stage*")
-
-                                        # Display the successful visualizations
-                                        for viz_idx, viz_spec, fig in successful_viz:
-                                            viz_title = viz_spec.get('title', f'Visualization {viz_idx}')
-                                            viz_desc = viz_spec.get('description', '')
-                                            viz_purpose = viz_spec.get('chart_purpose', '')
-
-                                            st.markdown(f"""<div style='background: rgba(139, 92, 246, 0.15); padding: 0.8rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #8b5cf6;'>
-                                                <div style='font-size: 0.9rem; font-weight: 600; color: #e2e8f0; margin-bottom: 0.3rem;'>{viz_title}</div>
-                                                <div style='font-size: 0.8rem; color: #cbd5e1;'>{viz_desc}</div>
-                                                {f"<div style='font-size: 0.8rem; color: #a5b4fc; margin-top: 0.3rem; font-style: italic;'>💡 {viz_purpose}</div>" if viz_purpose else ''}
-                                                </div>""", unsafe_allow_html=True)
-                                            st.plotly_chart(fig, width='stretch', key=f"dyn_viz_{journey_idx}_{stage_idx}_{viz_idx}")
-
-                    st.markdown("---")
-                    st.success(f"✅ All {len(dynamic_journeys)} dynamically discovered journeys loaded successfully!")
+        is_cloudflare = st.session_state.get('ollama_server_type') == "Cloudflare"
+        cloudflare_connected = is_connected if is_cloudflare else True
 
+        if is_cloudflare and not cloudflare_connected:
+            resources = None
+            opt_tier = "⚠️ Unavailable"
+            opt_desc = "Connect to Cloudflare to see resources"
+        elif is_cloudflare and cloudflare_connected:
+            remote_resources = fetch_remote_system_resources(st.session_state.get('ollama_url', ''))
+            if remote_resources:
+                resources = remote_resources
             else:
-                # Show prompt to discover entities
-                st.info("💡 Click 'Discover Entities Autonomously' to let the AI analyze your data with ZERO predefined templates")
+                resources = get_system_resources()
 
-                # Comparison: Guided vs Fully Dynamic
-                st.markdown("### 🆚 Guided vs Fully Dynamic Discovery")
+            if resources and resources['gpu_available']:
+                if resources['ram_available_gb'] > 30:
+                    opt_tier = "🚀 High-End"
+                    opt_desc = "Optimal for large models"
+                else:
+                    opt_tier = "⚡ Medium"
+                    opt_desc = "Good for most tasks"
+            else:
+                opt_tier = "💻 Basic"
+                opt_desc = "CPU-only mode"
+        else:
+            resources = get_system_resources()
 
-                col1, col2 = st.columns(2)
+            if resources['gpu_available']:
+                if resources['ram_available_gb'] > 30:
+                    opt_tier = "🚀 High-End"
+                    opt_desc = "Optimal for large models"
+                else:
+                    opt_tier = "⚡ Medium"
+                    opt_desc = "Good for most tasks"
+            else:
+                opt_tier = "💻 Basic"
+                opt_desc = "CPU-only mode"
 
-                with col1:
-                    st.markdown("""
-                    **📖 Guided Discovery (Tab 2)**
-                    - AI gets examples: "Student Journey", "Program Lifecycle", "Aid Journey"
-                    - Follows proven patterns
-                    - Predictable, consistent results
-                    - Best for: Standard institutional analysis
-                    """)
+        st.info(f"**Optimization Tier:** {opt_tier}")
+        st.caption(opt_desc)
 
-                with col2:
-                    st.markdown("""
-                    **🔬 Fully Dynamic Discovery (This Tab)**
-                    - AI gets ZERO examples or templates
-                    - Discovers entities purely from data patterns
-                    - Unexpected, unique discoveries
-                    - Best for: Finding hidden patterns specific to YOUR data
-                    """)
+        if resources is None:
+            st.warning("⚠️ **System resources not available**")
+            st.caption("📡 Resources from: ❌ Not connected to Cloudflare")
+            st.caption("💡 Connect to Cloudflare Ollama to view remote resources")
 
-                st.markdown("---")
+            col_res1, col_res2 = st.columns(2)
+            with col_res1:
+                st.caption("🔲 CPU: N/A")
+                st.caption("💾 RAM: N/A")
+            with col_res2:
+                st.caption("🎮 GPU: N/A")
+                st.caption("⚙️ CPU: N/A")
+        else:
+            if resources.get('source') == 'remote_colab':
+                st.caption(f"📡 Resources from: ☁️ Remote Colab")
+            else:
+                device_type = "💻 Laptop" if resources['ram_available_gb'] < 50 else "🖥️ Server"
+                st.caption(f"📡 Resources from: {device_type}")
 
-                st.markdown("### 🎯 What AI Might Discover")
-                st.markdown("""
-                Without predefined templates, the AI could discover unique entities like:
-                - **Payment Pattern Clusters** - Students grouped by payment behavior
-                - **Performance Trajectory Groups** - Students following similar GPA patterns
-                - **Aid-to-Success Pathways** - Different aid effectiveness patterns
-                - **Engagement Level Segments** - Students with different participation patterns
-                - **Market Risk Portfolios** - Nationality combinations affecting revenue stability
-                - **Capacity Utilization Zones** - Facility usage patterns
+            col_res1, col_res2 = st.columns(2)
+            with col_res1:
+                st.caption(f"🔲 CPU: {resources['cpu_count']} cores")
+                st.caption(f"💾 RAM: {resources['ram_available_gb']:.1f}GB free")
+            with col_res2:
+                if resources['gpu_available']:
+                    st.caption(f"🎮 GPU: {resources.get('gpu_name', 'Available')[:15]}")
+                else:
+                    st.caption("🎮 GPU: N/A")
+                if resources.get('cpu_percent', 0) > 0:
+                    st.caption(f"⚙️ CPU: {resources['cpu_percent']:.0f}% used")
+                else:
+                    st.caption("⚙️ CPU: N/A")
 
-                **The AI will discover what's ACTUALLY in your data, not what we expect to find!**
-                """)
+        with st.expander("📊 View Optimization Details"):
+            if resources is None:
+                st.markdown("**Current Configuration:**")
+                st.text(f"Tier: {opt_tier}")
+                st.text("Platform: Not available (Cloudflare not connected)")
+                st.text("CPU: N/A")
+                st.text("RAM: N/A")
+                st.text("GPU: N/A")
 
+                st.markdown("---")
+                st.warning("⚠️ **Connect to Cloudflare Ollama to view remote system resources**")
+            else:
+                st.markdown("**Current Configuration:**")
+                st.text(f"Tier: {opt_tier}")
+                st.text(f"Platform: {resources.get('platform', 'Unknown')}")
+                st.text(f"CPU: {resources['cpu_count']} cores ({resources.get('cpu_percent', 0):.1f}% usage)")
+                st.text(f"RAM: {resources['ram_available_gb']:.1f}/{resources.get('ram_total_gb', 0):.1f} GB available")
+                if resources.get('ram_percent', 0) > 0:
+                    st.text(f"RAM Usage: {resources['ram_percent']:.1f}%")
+                if resources['gpu_available']:
+                    st.text(f"GPU: {resources.get('gpu_name', 'Available')}")
+                else:
+                    st.text("GPU: Not detected")
 
-    # TAB 3: DATA STORYTELLING - COMPLETE JOURNEY STORIES (PreDefined+LLM Narrative)
-    # ====================================================================================
-    with tabs[3]:
-        st.header("📚 Complete Journey Stories - PreDefined Structure + AI Narratives")
-        st.caption("Comprehensive analytics with pre-defined journeys enriched by LLM-generated narratives")
+        st.divider()
 
-        if not st.session_state.ollama_connected:
-            st.warning("⚠️ Connect to Ollama to generate journey narratives")
-        else:
+        # ====================================================================================
+        # VERSION 1.0 RELEASE NOTES
+        # ====================================================================================
+        with st.expander("📝 Version 1.0 Release Notes", expanded=False):
             st.markdown("""
-            <div style='background: linear-gradient(135deg, #7c3aed 0%, #a78bfa 100%); padding: 2rem; border-radius: 12px; margin: 2rem 0;'>
-                <h2 style='margin: 0; color: white; display: flex; align-items: center; gap: 0.75rem;'>
-                    📚 Complete Journey Stories
-                    <span style='background: rgba(255,255,255,0.2); padding: 0.35rem 1rem; border-radius: 20px; font-size: 0.65rem; font-weight: normal;'>COMPREHENSIVE ANALYTICS</span>
-                </h2>
-                <p style='margin: 0.75rem 0 0 0; color: #e9d5ff; font-size: 1rem; line-height: 1.6;'>
-                    📖 Deep-dive into 6 comprehensive journeys with detailed stories, metrics, insights, and action plans<br>
-                    🤖 AI-powered narratives combined with precise metric calculations<br>
-                    💼 Executive-ready business context, ROI analysis, and strategic recommendations
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            **🎉 What's New in Version 1.0**
 
-            if not JOURNEY_MODULES_AVAILABLE:
-                st.error("❌ Journey modules not available. Please ensure journey_definitions.py, journey_metrics.py, journey_narratives.py, and journey_assembler.py are in the same directory.")
-            else:
-                # Validate dataset
-                is_valid, missing_fields, journey_validation = validate_dataset_for_journeys(df)
+            **Major Features:**
+            - ✅ **5 Advanced AI-Driven Analysis Tabs**
+              - Academic Analytics with AI-driven deep analysis
+              - Housing Insights with impact analysis
+              - Financial Intelligence with sustainability metrics
+              - Demographics Deep Dive with diversity analysis
+              - Risk & Success Analysis with predictive insights
 
-                if not is_valid:
-                    st.warning(f"⚠️ Dataset is missing some required fields for complete journey generation: {', '.join(missing_fields)}")
-                    st.caption("Some journeys may have incomplete data. The system will work with available fields.")
+            - ✅ **Context-Aware Visualizations**
+              - AI automatically recommends relevant charts for each context
+              - 6 visualization types per analysis tab
+              - Intelligent data column selection
 
-                # Generation button
-                col_gen1, col_gen2 = st.columns([3, 1])
-                with col_gen1:
-                    if st.button("🚀 Generate Complete Journey Stories (All 6 Journeys)", key="generate_complete_journeys", type="primary", width='stretch'):
-                        # Progress container
-                        progress_container = st.empty()
-                        status_container = st.empty()
+            - ✅ **Strategic Insights & Recommendations**
+              - Root cause analysis for all findings
+              - Business impact quantification
+              - Priority-coded actionable recommendations
+              - LLM-enriched insights for every visualization
 
-                        def progress_callback(stage, current, total, message):
-                            """Update progress display"""
-                            if stage == 'validation':
-                                progress_container.progress(5)
-                                status_container.info(f"🔍 {message}")
-                            elif stage == 'metrics':
-                                progress = 5 + int((current / total) * 15)
-                                progress_container.progress(progress)
-                                status_container.info(f"📊 Calculating metrics: {current}/{total} stories")
-                            elif stage == 'narratives':
-                                progress = 20 + int((current / total) * 70)
-                                progress_container.progress(progress)
-                                status_container.info(f"✍️ Generating narratives: {current}/{total} components - {message}")
-                            elif stage == 'assembly':
-                                progress = 90 + int((current / total) * 10)
-                                progress_container.progress(progress)
-                                status_container.info(f"🔧 Assembling journeys: {current}/{total}")
-                            elif stage == 'error':
-                                status_container.error(f"❌ {message}")
+            **Technical Improvements:**
+            - Hybrid approach: Rule-based + LLM enrichment
+            - Optimized for performance and reliability
+            - Enhanced error handling and fallbacks
+            - Deep data profiling for better AI insights
 
-                        with st.spinner("🤖 Generating complete journeys... This may take 5-15 minutes depending on LLM speed"):
-                            from journey_assembler import generate_all_journeys
+            **Release Date:** February 2, 2026
+            **Status:** Production Release
+            """)
 
-                            # Generate all journeys
-                            journeys, metadata = generate_all_journeys(
-                                df,
-                                query_ollama,
-                                model,
-                                url,
-                                temperature=0.4,
-                                timeout=180,
-                                progress_callback=progress_callback
-                            )
+        st.divider()
 
-                            # Store in session state
-                            st.session_state.complete_journeys = journeys
-                            st.session_state.journey_generation_metadata = metadata
+        # ====================================================================================
+        # DATA SOURCE (From gen_storytelling_app.py lines 1436-1632)
+        # ====================================================================================
+        st.markdown("### 📁 Data Source")
 
-                            progress_container.progress(100)
+        if not st.session_state.get('ollama_connected'):
+            st.info("💡 **You can load data without Ollama connection** - AI features will be available once you connect")
 
-                            if metadata.get('success'):
-                                duration = metadata.get('duration_seconds', 0)
-                                minutes = int(duration // 60)
-                                seconds = int(duration % 60)
+        data_source = st.radio(
+            "Choose data source:",
+            options=["Upload File", "Pre-loaded Dataset (Student_360_View)", "Use Sample Dataset"],
+            index=0,
+            key="data_source_selector"
+        )
 
-                                status_container.success(f"""
-                                ✅ **All journeys generated successfully!**
-                                - **{len(journeys)}** complete journeys
-                                - **{metadata['assembly']['total_stories']}** stories with full narratives
-                                - **{metadata['metrics']['total_metrics_calculated']}** metrics calculated
-                                - **{metadata['narratives']['total_components_generated']}** narrative components generated
-                                - **Time:** {minutes}m {seconds}s
-                                """)
-                            else:
-                                status_container.error(f"❌ Generation failed: {', '.join(metadata.get('errors', ['Unknown error']))}")
+        if data_source == "Pre-loaded Dataset (Student_360_View)":
+            st.caption("📊 Student 360 View Dataset - Comprehensive student analytics data")
 
-                with col_gen2:
-                    if st.session_state.complete_journeys:
-                        if st.button("🗑️ Clear", key="clear_journeys"):
-                            st.session_state.complete_journeys = None
-                            st.session_state.journey_generation_metadata = None
-                            st.rerun()
+            # Define the path to the pre-loaded dataset (works locally and on cloud)
+            import os
+            # Try multiple path options for flexibility
+            script_dir = os.path.dirname(os.path.abspath(__file__))
 
-                # Display complete journeys if available
-                if st.session_state.complete_journeys:
-                    journeys = st.session_state.complete_journeys
+            # Option 1: data folder in same directory as script
+            path_option_1 = os.path.join(script_dir, "data", "Student_360_View.csv")
+            # Option 2: data folder in parent directory
+            path_option_2 = os.path.join(os.path.dirname(script_dir), "data", "Student_360_View.csv")
+            # Option 3: Original local path (for backward compatibility)
+            path_option_3 = r"D:\exalio_work\RFP\Ankbut\MVP\cons\Sample DataSet\Student_360_View.csv"
 
-                    st.markdown("---")
+            # Find which path exists
+            preloaded_dataset_path = None
+            for path in [path_option_1, path_option_2, path_option_3]:
+                if os.path.exists(path):
+                    preloaded_dataset_path = path
+                    break
 
-                    # Create tabs for each journey
-                    journey_tabs = st.tabs([
-                        "📊 Journey 1: Enrollment",
-                        "💰 Journey 2: Revenue",
-                        "🏢 Journey 3: Operations",
-                        "🎓 Journey 4: Academics",
-                        "🎯 Journey 5: Retention",
-                        "⚠️ Journey 6: Risk"
-                    ])
+            if preloaded_dataset_path is None:
+                # Default to option 1 for error message
+                preloaded_dataset_path = path_option_1
 
-                    # Display each journey in its tab
-                    for tab_idx, (journey_tab, journey) in enumerate(zip(journey_tabs, journeys)):
-                        with journey_tab:
-                            # Journey header
-                            st.markdown(f"""
-                            <div style='background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;'>
-                                <h2 style='margin: 0; color: white;'>{journey['name']}</h2>
-                                <p style='margin: 0.5rem 0 0 0; color: #ddd6fe; font-size: 0.95rem;'>{journey['subtitle']}</p>
-                                <div style='margin-top: 1rem; display: flex; gap: 1rem;'>
-                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
-                                        📖 {journey['story_count']} Stories
-                                    </span>
-                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
-                                        📊 {journey['total_metrics_calculated']} Metrics
-                                    </span>
-                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
-                                        ✅ {'Complete' if journey['is_complete'] else 'Partial'}
-                                    </span>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Check if already loaded
+            if st.session_state.get('data') is not None and st.session_state.get('data_source_type') == 'preloaded':
+                df = st.session_state.data
+                st.success(f"📄 ✅ Pre-loaded dataset active | {len(df)} rows × {len(df.columns)} columns")
 
-                            # JOURNEY-LEVEL VISUALIZATIONS - Most Important Metrics
-                            st.markdown("""
-                            <div style='background: linear-gradient(135deg, rgba(59, 130, 246, 0.15), rgba(99, 102, 241, 0.15));
-                                        padding: 1.5rem; border-radius: 10px; margin: 2rem 0 1.5rem 0;
-                                        border-left: 5px solid #3b82f6;'>
-                                <h2 style='margin: 0 0 0.5rem 0; color: #1e293b; font-size: 1.5rem;'>
-                                    📊 Journey Insights - Key Metrics Overview
-                                </h2>
-                                <p style='margin: 0; color: #475569; font-size: 0.95rem; line-height: 1.6;'>
-                                    Visual analytics showing the most important performance indicators for this journey.
-                                    These metrics provide a comprehensive view of key trends, patterns, and opportunities.
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                with st.expander("📊 Dataset Information"):
+                    st.markdown(f"""
+                    **Dataset:** Student_360_View.csv
+                    **Rows:** {len(df):,}
+                    **Columns:** {len(df.columns)}
+                    **Source:** {preloaded_dataset_path}
+                    """)
 
-                            # Create 2 rows of 3 columns for 4-6 key metrics per journey
-                            viz_row1 = st.columns(3)
-                            viz_row2 = st.columns(3)
+                    st.dataframe(df.head(5), width="stretch")
 
-                            # JOURNEY 1: ENROLLMENT
-                            if tab_idx == 0:
-                                st.markdown("""
-                                <div style='background: rgba(59, 130, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #3b82f6;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📈 Diversity & Demographics Analysis</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Distribution of students by nationality, region, and enrollment status</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                if st.button("🔄 Reload Dataset", key="reload_preloaded"):
+                    st.session_state.force_reload = True
+                    st.rerun()
+            else:
+                # Load the pre-loaded dataset
+                try:
+                    if os.path.exists(preloaded_dataset_path):
+                        with st.spinner("Loading pre-loaded dataset..."):
+                            df = pd.read_csv(preloaded_dataset_path, encoding='utf-8', low_memory=False)
 
-                                with viz_row1[0]:
-                                    if 'nationality' in df.columns:
-                                        st.caption("🌍 **Nationality Distribution**")
-                                        nat_counts = df['nationality'].value_counts().head(10)
-                                        fig = create_plotly_chart("bar", {"x": nat_counts.index.tolist(), "y": nat_counts.values.tolist()}, "Top 10 Nationalities")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_nat")
+                            if df is not None and not df.empty:
+                                set_main_data(df)
+                                st.session_state.data_source_type = 'preloaded'
+                                st.session_state.uploaded_filename = 'Student_360_View.csv'
+                                st.success(f"📄 ✅ Pre-loaded dataset loaded successfully | {len(df)} rows × {len(df.columns)} columns")
 
-                                with viz_row1[1]:
-                                    if 'nationality' in df.columns:
-                                        st.caption("🇦🇪 **UAE vs International Mix**")
-                                        uae_count = len(df[df['nationality'] == 'United Arab Emirates'])
-                                        intl_count = len(df) - uae_count
-                                        fig = create_plotly_chart("pie", {"labels": ["UAE Nationals", "International"], "values": [uae_count, intl_count]}, "UAE vs International Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_uae_intl")
+                                with st.expander("📊 Dataset Preview"):
+                                    st.dataframe(df.head(10), width="stretch")
 
-                                with viz_row1[2]:
-                                    if 'enrollment_enrollment_status' in df.columns:
-                                        st.caption("📋 **Student Status**")
-                                        status_counts = df['enrollment_enrollment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Enrollment Status")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_status")
+                                st.info("💡 Dataset is ready for analysis. Navigate to Analytics tabs to explore insights.")
+                                st.rerun()
+                            else:
+                                st.error("❌ Failed to load dataset - file is empty")
+                    else:
+                        st.error(f"❌ Pre-loaded dataset not found at: {preloaded_dataset_path}")
+                        st.info("💡 Please ensure the dataset file exists at the specified location or use 'Upload File' option.")
+                except Exception as e:
+                    st.error(f"❌ Error loading pre-loaded dataset: {str(e)}")
+                    st.info("💡 Try using 'Upload File' option instead.")
 
-                                st.markdown("""
-                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin: 1.5rem 0 1rem 0; border-left: 4px solid #8b5cf6;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📊 Enrollment Trends & Program Performance</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Growth patterns by cohort, gender balance, and program popularity</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+        elif data_source == "Upload File":
+            st.caption("Choose a file (CSV, Excel, or TXT)")
 
-                                with viz_row2[0]:
-                                    if 'cohort_year' in df.columns:
-                                        st.caption("📅 **Cohort Trends Over Time**")
-                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
-                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Enrollment Trends by Cohort")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort")
+            uploaded_file = st.file_uploader(
+                "Drag and drop file here",
+                type=['csv', 'xlsx', 'xls', 'txt'],
+                help="Limit 200MB per file • CSV, XLSX, XLS, TXT",
+                label_visibility="collapsed"
+            )
 
-                                with viz_row2[1]:
-                                    if 'gender' in df.columns:
-                                        st.caption("⚖️ **Gender Balance**")
-                                        gender_counts = df['gender'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": gender_counts.index.tolist(), "values": gender_counts.values.tolist()}, "Gender Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gender")
+            if uploaded_file is not None:
+                st.caption(f"📄 {uploaded_file.name}")
+                st.caption(f"{uploaded_file.size / 1024:.1f}KB")
 
-                                with viz_row2[2]:
-                                    if 'current_program' in df.columns:
-                                        st.caption("🎓 **Most Popular Programs**")
-                                        prog_counts = df['current_program'].value_counts().head(8)
-                                        fig = create_plotly_chart("bar", {"x": prog_counts.index.tolist(), "y": prog_counts.values.tolist()}, "Top Programs by Enrollment")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_programs")
+                already_loaded = (
+                    st.session_state.get('uploaded_filename') == uploaded_file.name and
+                    st.session_state.get('data') is not None
+                )
 
-                            # JOURNEY 2: REVENUE
-                            elif tab_idx == 1:
-                                # Try multiple column name variations for tuition
-                                tuition_col = None
-                                for col_name in ['Total_Tuition', 'total_tuition', 'tuition', 'Tuition', 'tuition_fees', 'fees']:
-                                    if col_name in df.columns:
-                                        tuition_col = col_name
-                                        break
+                if already_loaded:
+                    df = st.session_state.data
+                    st.success(f"📄 ✅ Already loaded (preserving data transformations) | {len(df)} rows × {len(df.columns)} columns")
 
-                                # Try multiple column name variations for aid
-                                aid_col = None
-                                for col_name in ['Total_Aid', 'total_aid', 'aid', 'Aid', 'financial_aid', 'scholarship']:
-                                    if col_name in df.columns:
-                                        aid_col = col_name
-                                        break
+                    datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+                    if datetime_cols:
+                        st.info(f"🔄 Transformations applied: {len(datetime_cols)} datetime column(s) converted")
 
-                                st.markdown("""
-                                <div style='background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #10b981;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>💰 Revenue Distribution & Financial Aid Analysis</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Revenue sources, tuition patterns, and financial aid allocation</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                    if st.button("🔄 Reload Original File (discard transformations)", width="stretch", key="reload_original_file"):
+                        st.session_state.force_reload = True
+                        st.rerun()
+                else:
+                    try:
+                        if uploaded_file.name.endswith('.csv') or uploaded_file.name.endswith('.txt'):
+                            df = load_csv_file(uploaded_file)
+                        else:
+                            df = load_excel_file(uploaded_file)
 
-                                with viz_row1[0]:
-                                    if tuition_col and 'nationality' in df.columns:
-                                        st.caption("🌍 **Revenue by Nationality**")
-                                        rev_by_nat = df.groupby('nationality')[tuition_col].sum().sort_values(ascending=False).head(10)
-                                        fig = create_plotly_chart("bar", {"x": rev_by_nat.index.tolist(), "y": rev_by_nat.values.tolist()}, "Revenue by Nationality")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_rev_nat")
-                                    elif 'nationality' in df.columns:
-                                        # Fallback: show nationality distribution
-                                        nat_counts = df['nationality'].value_counts().head(10)
-                                        fig = create_plotly_chart("bar", {"x": nat_counts.index.tolist(), "y": nat_counts.values.tolist()}, "Student Distribution by Nationality")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_nat_dist")
+                        if df is not None:
+                            set_main_data(df)
+                            st.session_state.uploaded_filename = uploaded_file.name
+                            st.session_state.force_reload = False
+                            st.success(f"📄 ✅ Loaded successfully | {len(df)} rows × {len(df.columns)} columns")
 
-                                with viz_row1[1]:
-                                    if tuition_col:
-                                        st.caption("💵 **Tuition Fee Range**")
-                                        fig = create_plotly_chart("histogram", {"values": df[tuition_col].dropna()}, "Tuition Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_tuition_dist")
-                                    elif 'cohort_year' in df.columns:
-                                        st.caption("📅 **Students by Cohort**")
-                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
-                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Students by Cohort")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort_fb")
+                            with st.expander("📊 Data Preview (first 5 rows)"):
+                                st.dataframe(df.head(5), width="stretch")
 
-                                with viz_row1[2]:
-                                    if aid_col:
-                                        st.caption("🎓 **Financial Aid Coverage**")
-                                        aid_recipients = len(df[df[aid_col] > 0])
-                                        no_aid = len(df[df[aid_col] == 0])
-                                        fig = create_plotly_chart("pie", {"labels": ["With Financial Aid", "No Aid"], "values": [aid_recipients, no_aid]}, "Financial Aid Recipients")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_aid")
-                                    elif 'enrollment_enrollment_status' in df.columns:
-                                        # Fallback: show enrollment status
-                                        status_counts = df['enrollment_enrollment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Enrollment Status")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_status_fb")
+                            # Show comprehensive 136-column mapping status
+                            mapping_log = st.session_state.get('mapping_log', [])
+                            with st.expander("📊 Complete 136-Column Catalog Status", expanded=False):
+                                st.markdown("### Universal Column Catalog - Data Availability Report")
+                                st.markdown("*Showing all 136 columns from the universal catalog with their status in your dataset*")
+
+                                # Import the universal catalog
+                                try:
+                                    from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
+
+                                    # Categorize columns by status
+                                    mapped_columns = []
+                                    present_columns = []
+                                    missing_columns = []
+
+                                    for col_name, col_info in UNIVERSAL_COLUMNS_CATALOG.items():
+                                        if col_name in df.columns:
+                                            # Check if it was mapped from a different name
+                                            was_mapped = any(col_name in log for log in mapping_log)
+                                            if was_mapped:
+                                                # Find the original name
+                                                original_name = None
+                                                for log in mapping_log:
+                                                    if col_name in log:
+                                                        original_name = log.split("'")[1]  # Extract original name
+                                                        break
+                                                mapped_columns.append((col_name, col_info.description, original_name))
+                                            else:
+                                                present_columns.append((col_name, col_info.description))
+                                        else:
+                                            missing_columns.append((col_name, col_info.description))
+
+                                    # Summary metrics
+                                    col1, col2, col3, col4 = st.columns(4)
+                                    with col1:
+                                        st.metric("📋 Total Catalog", "136 columns", help="Complete universal catalog size")
+                                    with col2:
+                                        st.metric("✅ Available", f"{len(mapped_columns) + len(present_columns)}",
+                                                 delta=f"{(len(mapped_columns) + len(present_columns))/136*100:.1f}%")
+                                    with col3:
+                                        st.metric("🔄 Mapped", f"{len(mapped_columns)}",
+                                                 help="Columns that were translated from different names")
+                                    with col4:
+                                        st.metric("⚠️ Missing", f"{len(missing_columns)}",
+                                                 delta=f"{len(missing_columns)/136*100:.1f}%", delta_color="inverse")
+
+                                    st.markdown("---")
+
+                                    # Create tabs for different statuses
+                                    status_tab1, status_tab2, status_tab3 = st.tabs(["✅ Available Columns", "🔄 Mapped Columns", "⚠️ Missing Columns"])
+
+                                    with status_tab1:
+                                        st.markdown(f"**{len(present_columns)} columns present** with standard names (no mapping needed)")
+                                        if present_columns:
+                                            # Group by category
+                                            from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
+                                            for col_name, description in sorted(present_columns):
+                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
+                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
+                                                st.markdown(f"- **`{col_name}`** ({category})")
+                                                if description:
+                                                    st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+
+                                    with status_tab2:
+                                        st.markdown(f"**{len(mapped_columns)} columns mapped** from non-standard names")
+                                        if mapped_columns:
+                                            for col_name, description, original_name in sorted(mapped_columns):
+                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
+                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
+                                                st.markdown(f"- **`{original_name}`** → **`{col_name}`** ({category})")
+                                                if description:
+                                                    st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+
+                                    with status_tab3:
+                                        st.markdown(f"**{len(missing_columns)} columns not present** in your dataset (optional columns)")
+                                        st.info("💡 These columns are part of the universal catalog but not in your current data file. The application will function normally with graceful fallbacks.")
+
+                                        if missing_columns:
+                                            # Group by category
+                                            missing_by_category = {}
+                                            for col_name, description in missing_columns:
+                                                col_info = UNIVERSAL_COLUMNS_CATALOG.get(col_name, {})
+                                                category = col_info.category.value if hasattr(col_info, 'category') else 'Other'
+                                                if category not in missing_by_category:
+                                                    missing_by_category[category] = []
+                                                missing_by_category[category].append((col_name, description))
+
+                                            # Show by category
+                                            for category in sorted(missing_by_category.keys()):
+                                                with st.expander(f"📁 {category} ({len(missing_by_category[category])} columns)", expanded=False):
+                                                    for col_name, description in sorted(missing_by_category[category]):
+                                                        st.markdown(f"- **`{col_name}`**")
+                                                        if description:
+                                                            st.markdown(f"  <small style='color: #94a3b8;'>{description}</small>", unsafe_allow_html=True)
+
+                                except ImportError:
+                                    # Fallback if catalog not available
+                                    st.warning("⚠️ Universal catalog module not found. Showing basic mapping info.")
+                                    st.success(f"✅ Successfully mapped {len(mapping_log)} columns to standardized format")
+                                    for log_entry in mapping_log[:10]:
+                                        st.text(f"  • {log_entry}")
+                                    if len(mapping_log) > 10:
+                                        st.text(f"  ... and {len(mapping_log) - 10} more")
+
+                    except Exception as e:
+                        st.error(f"❌ Error loading file: {e}")
+        else:
+            st.caption("Load a pre-built sample dataset")
+
+            if st.session_state.get('data') is not None and st.session_state.get('uploaded_filename') == 'sample_dataset':
+                df = st.session_state.data
+                # Check if sample dataset is outdated (missing new required fields)
+                required_new_fields = ['visa_status', 'enrollment_type', 'room_number', 'occupancy_status']
+                missing_new_fields = [f for f in required_new_fields if f not in df.columns]
+
+                if missing_new_fields:
+                    st.warning(f"⚠️ Sample dataset is outdated (missing {len(missing_new_fields)} new fields)")
+                    if st.button("🔄 Reload Updated Sample Data", width="stretch", type="primary"):
+                        df = create_sample_dataset_v3_final()
+                        set_main_data(df)
+                        st.session_state.uploaded_filename = 'sample_dataset'
+                        st.success(f"✅ Loaded updated sample dataset with ALL REQUIRED FIELDS!")
+                        st.balloons()
+                        st.rerun()
+                else:
+                    st.success(f"✅ Sample dataset already loaded | {len(df)} rows × {len(df.columns)} columns")
+            elif st.button("🔥 Load Fresh Sample Data", width="stretch", type="primary"):
+                # INLINE generation to bypass all caching
+                np.random.seed(42)
+                n = 1000
+                nats = np.random.choice(['United Arab Emirates', 'India', 'Pakistan', 'Egypt', 'Jordan',
+                                        'Saudi Arabia', 'Philippines', 'United States', 'United Kingdom',
+                                        'Canada'], n, p=[0.45, 0.15, 0.10, 0.08, 0.05, 0.05, 0.04, 0.03, 0.03, 0.02])
+                housed = np.random.choice([True, False], n, p=[0.6, 0.4])
+
+                df = pd.DataFrame({
+                    'student_id': [f'S{i:05d}' for i in range(1, n + 1)],
+                    'cumulative_gpa': np.random.normal(3.0, 0.6, n).clip(0, 4.0),
+                    'nationality': nats,
+                    'enrollment_enrollment_status': np.random.choice(['Active', 'Graduated', 'On Leave'], n, p=[0.8, 0.15, 0.05]),
+                    'enrollment_tuition_amount': np.random.uniform(50000, 100000, n),
+                    'financial_aid_monetary_amount': np.random.choice([0, 15000, 25000, 40000, 60000], n, p=[0.4, 0.2, 0.2, 0.15, 0.05]),
+                    'gender': np.random.choice(['Male', 'Female'], n),
+                    'cohort_year': np.random.choice([2020, 2021, 2022, 2023, 2024], n),
+                    'visa_status': ['UAE National' if nat == 'United Arab Emirates' else np.random.choice(['Student Visa', 'Resident Visa', 'Family Visa'])
+                                   for nat in nats],
+                    'enrollment_type': np.random.choice(['Full-Time', 'Part-Time'], n, p=[0.85, 0.15]),
+                    'room_number': [f'R{i:04d}' if h else None for i, h in enumerate(housed, 1)],
+                    'occupancy_status': ['Occupied' if h else None for h in housed],
+                    'rent_amount': [np.random.uniform(8000, 15000) if h else 0 for h in housed],
+                })
+
+                st.session_state.data = df
+                bump_data_generation()
+                st.session_state.mapping_log = ["Fresh inline data - all 13 columns"]
+                st.session_state.uploaded_filename = 'sample_dataset'
+                st.session_state.metrics = calculate_core_metrics(df)
+
+                st.success(f"✅ {len(df)} rows × {len(df.columns)} columns loaded!")
+                st.balloons()
+                st.rerun()
+
+        st.divider()
+
+        # ====================================================================================
+        # COLUMN MAPPING STATUS (Always show, but content depends on data)
+        # ====================================================================================
+        st.markdown("### 📊 Column Mapping Status")
+
+        if st.session_state.get('data') is None:
+            # No data loaded yet
+            st.info("💡 Load data first to see column mapping status")
+            st.caption("The mapping status will appear here after you load data")
+        else:
+            # Get current data and mapping log
+            df = st.session_state.data
+            mapping_log = st.session_state.get('mapping_log', [])
+
+            # Check if required journey fields exist
+            required_journey_fields = [
+                'financial_aid_monetary_amount', 'cohort_year', 'enrollment_enrollment_status',
+                'enrollment_tuition_amount', 'enrollment_type', 'occupancy_status'
+            ]
+            present_required = [f for f in required_journey_fields if f in df.columns]
+            missing_required = [f for f in required_journey_fields if f not in df.columns]
+
+            # Show required fields status
+            if len(present_required) == len(required_journey_fields):
+                st.success(f"✅ All {len(required_journey_fields)} journey fields present")
+            elif present_required:
+                st.info(f"ℹ️ {len(present_required)}/{len(required_journey_fields)} journey fields found")
+                st.caption(f"Optional fields not in CSV: {', '.join(missing_required)}")
+            else:
+                st.error(f"❌ 0/{len(required_journey_fields)} fields found")
+                st.caption(f"Missing: {', '.join(missing_required)}")
+
+            # Show status based on data quality
+            if not mapping_log and missing_required:
+                # Mapping not applied AND missing required fields
+                st.info(f"ℹ️ Column mapping not yet applied")
+                if st.button("🔄 Apply Column Mapping Now", type="primary", width='stretch', key="force_mapping"):
+                    mapped_df, new_mapping_log = apply_universal_column_mapping(df)
+                    st.session_state.data = mapped_df
+                    bump_data_generation()
+                    st.session_state.mapping_log = new_mapping_log if new_mapping_log else ["No mappings needed - all columns standard"]
+                    st.session_state.metrics = calculate_core_metrics(mapped_df)
+                    st.rerun()
+            elif not mapping_log and not missing_required:
+                # No mapping log but data is already perfect
+                st.success("✅ All columns already using standard names")
+                st.caption("No mapping needed - dataset is ready!")
+                st.session_state.mapping_log = ["Dataset already has standard column names"]
+            elif mapping_log and isinstance(mapping_log, list) and len(mapping_log) > 0:
+                # Mapping was applied
+                if mapping_log[0] == "Dataset already has standard column names":
+                    st.success("✅ Dataset uses standard column names")
+                elif mapping_log[0] == "No mappings needed - all columns standard":
+                    st.success("✅ All columns already standardized")
+                else:
+                    st.success(f"✅ Column mapping completed: {len(mapping_log)} columns")
+
+            try:
+                from universal_columns_catalog import UNIVERSAL_COLUMNS_CATALOG
+
+                # Quick summary counts
+                mapped_count = len([log for log in mapping_log if '→' in log])
+                available_count = len([col for col in UNIVERSAL_COLUMNS_CATALOG.keys() if col in df.columns])
+                total_catalog = len(UNIVERSAL_COLUMNS_CATALOG)
+
+                # Display summary metrics
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("✅ Available", f"{available_count}/{total_catalog}",
+                             delta=f"{available_count/total_catalog*100:.0f}%")
+                with col2:
+                    st.metric("🔄 Mapped", mapped_count,
+                             help="Columns translated from different names")
+
+                # Show mapping log in expander
+                if mapping_log:
+                    with st.expander(f"📋 View Mapping Details ({len(mapping_log)} mappings)", expanded=False):
+                        st.caption("Columns that were automatically standardized:")
+                        for log_entry in mapping_log:
+                            st.text(f"  • {log_entry}")
+                else:
+                    st.caption("✨ All columns already using standard names")
+
+                # Show detailed catalog status
+                with st.expander("🔍 Complete Catalog Status (136 columns)", expanded=False):
+                    # Categorize columns by status
+                    mapped_columns = []
+                    present_columns = []
+                    missing_columns = []
+
+                    for col_name, col_info in UNIVERSAL_COLUMNS_CATALOG.items():
+                        if col_name in df.columns:
+                            was_mapped = any(col_name in log for log in mapping_log)
+                            if was_mapped:
+                                # Find the original name
+                                original_name = None
+                                for log in mapping_log:
+                                    if col_name in log:
+                                        original_name = log.split("'")[1]
+                                        break
+                                mapped_columns.append((col_name, col_info.description, original_name))
+                            else:
+                                present_columns.append((col_name, col_info.description))
+                        else:
+                            missing_columns.append((col_name, col_info.description))
+
+                    # Create tabs
+                    tab1, tab2, tab3 = st.tabs([
+                        f"✅ Present ({len(present_columns)})",
+                        f"🔄 Mapped ({len(mapped_columns)})",
+                        f"⚠️ Missing ({len(missing_columns)})"
+                    ])
+
+                    with tab1:
+                        if present_columns:
+                            for col_name, description in sorted(present_columns)[:10]:
+                                st.caption(f"• `{col_name}`")
+                            if len(present_columns) > 10:
+                                st.caption(f"... and {len(present_columns) - 10} more")
+                        else:
+                            st.caption("No columns present with standard names")
+
+                    with tab2:
+                        if mapped_columns:
+                            for col_name, description, original_name in sorted(mapped_columns)[:10]:
+                                st.caption(f"• `{original_name}` → `{col_name}`")
+                            if len(mapped_columns) > 10:
+                                st.caption(f"... and {len(mapped_columns) - 10} more")
+                        else:
+                            st.caption("No columns were mapped")
+
+                    with tab3:
+                        if missing_columns:
+                            st.caption(f"📌 {len(missing_columns)} optional columns not in dataset")
+                            for col_name, description in sorted(missing_columns)[:5]:
+                                st.caption(f"• `{col_name}`")
+                            if len(missing_columns) > 5:
+                                st.caption(f"... and {len(missing_columns) - 5} more")
+                        else:
+                            st.caption("All catalog columns are present!")
+
+            except ImportError:
+                st.caption("📊 Column mapping applied")
+                if mapping_log:
+                    st.caption(f"✅ {len(mapping_log)} columns standardized")
+
+        st.divider()
+
+        # ====================================================================================
+        # AI CONFIGURATION (From gen_storytelling_app.py lines 1648-1768)
+        # ====================================================================================
+        st.markdown("### 🤖 AI Configuration")
+        st.markdown("**Ollama Server Location**")
+
+        previous_server_type = st.session_state.get('previous_ollama_server_type', None)
+
+        server_type = st.radio(
+            "Server Type",
+            options=["Cloudflare", "Local"],
+            index=0 if st.session_state.ollama_server_type == "Cloudflare" else 1,
+            help="Choose between Cloudflare (remote) or Local Ollama server",
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+
+        server_type_changed = (previous_server_type is not None and
+                               previous_server_type != server_type)
+
+        st.session_state.ollama_server_type = server_type
+        st.session_state.previous_ollama_server_type = server_type
+
+        if server_type == "Cloudflare":
+            st.caption("☁️ Using Cloudflare Ollama")
+            default_url = "https://ollama.exaliotechcom.uk"
+        else:
+            st.caption("💻 Using Local Ollama")
+            default_url = "http://localhost:11434"
+
+        st.caption(f"🏠 URL: {default_url}")
+
+        if st.session_state.get('ollama_url') != default_url:
+            if 'custom_url_set' not in st.session_state:
+                st.session_state.ollama_url = default_url
+                st.session_state.ollama_connected = False
+                server_type_changed = True
+
+        if server_type_changed:
+            with st.spinner(f"🔄 Switching to {server_type} Ollama..."):
+                import time
+                health = verify_ollama_health(default_url)
+                if health['connected']:
+                    st.session_state.ollama_connected = True
+                    st.session_state.ollama_url = default_url
+                    st.success(f"✅ Connected to {server_type} Ollama")
+                    st.caption(f"📦 Found {health['model_count']} model(s)")
+                    time.sleep(0.5)
+                    st.rerun()
+                else:
+                    st.session_state.ollama_connected = False
+                    st.session_state.ollama_url = default_url
+                    st.error(f"❌ Failed to connect to {server_type} Ollama")
+                    st.caption(f"Error: {health.get('error', 'Unknown error')}")
+                    time.sleep(0.5)
+                    st.rerun()
+
+        with st.expander("🔧 Advanced: Custom URL"):
+            ollama_url = st.text_input(
+                "Custom Ollama URL",
+                value=st.session_state.get('ollama_url', default_url),
+                help="URL of your Ollama server"
+            )
+            if ollama_url != default_url:
+                st.session_state.custom_url_set = True
+            else:
+                st.session_state.pop('custom_url_set', None)
+
+            st.session_state.ollama_url = ollama_url
+
+            if st.button("Test Connection", width="stretch"):
+                with st.spinner("Testing connection..."):
+                    health = verify_ollama_health(ollama_url)
+                    if health['connected']:
+                        st.success(f"✅ Connected! Found {health['model_count']} models")
+                        st.session_state.ollama_connected = True
+                    else:
+                        st.error(f"❌ Connection failed: {health.get('error', 'Unknown error')}")
+                        st.session_state.ollama_connected = False
+
+        if 'ollama_url' not in st.session_state:
+            st.session_state.ollama_url = default_url
+
+        st.markdown("**Select AI Model**")
+
+        # Custom CSS for BLACK text in model dropdown - AGGRESSIVE OVERRIDE
+        st.markdown("""
+        <style>
+        /* FORCE BLACK TEXT - Override everything */
+        .stSelectbox, .stSelectbox * {
+            color: #000000 !important;
+        }
+
+        /* Select input field */
+        .stSelectbox [data-baseweb="select"] {
+            background-color: #ffffff !important;
+        }
+
+        /* All text inside selectbox */
+        .stSelectbox div, .stSelectbox span, .stSelectbox p {
+            color: #000000 !important;
+        }
+
+        /* Dropdown options */
+        [data-baseweb="popover"] li,
+        [data-baseweb="popover"] div,
+        [data-baseweb="popover"] span {
+            color: #000000 !important;
+            background-color: #ffffff !important;
+        }
+
+        /* Selected value display */
+        [data-baseweb="select"] > div > div {
+            color: #000000 !important;
+        }
+
+        /* All listbox items */
+        ul[role="listbox"] li,
+        ul[role="listbox"] div,
+        ul[role="listbox"] span {
+            color: #000000 !important;
+        }
+
+        /* Nuclear option - force ALL sidebar selectboxes to black */
+        [data-testid="stSidebar"] .stSelectbox * {
+            color: #000000 !important;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+        if st.session_state.get('ollama_connected'):
+            models = get_available_models(st.session_state.ollama_url)
+            if models:
+                selected_model = st.selectbox(
+                    "Model",
+                    options=models,
+                    index=0,
+                    help="Choose the LLM model for narrative generation",
+                    label_visibility="collapsed"
+                )
+                st.session_state.selected_model = selected_model
+                st.success(f"✅ Using: {selected_model}")
+
+                # Model recommendations for deep analysis
+                st.caption("💡 **For Deep Analysis:**")
+                if any(x in selected_model.lower() for x in ['llama3.1:70b', 'qwen2.5:72b', 'mixtral:8x22b']):
+                    st.caption("🟢 Excellent - Large model ideal for comprehensive insights")
+                elif any(x in selected_model.lower() for x in ['llama3.1', 'qwen2.5:32b', 'gemma2:27b']):
+                    st.caption("🟡 Good - Balanced performance and quality")
+                else:
+                    st.caption("🟠 Basic - Consider larger model for richer analysis")
+                    with st.expander("📋 Recommended Models"):
+                        st.markdown("""
+                        **For Best Deep Analysis:**
+                        - `llama3.1:70b` - Excellent reasoning
+                        - `qwen2.5:72b` - Superior analytics
+                        - `qwen2.5:32b` - Balanced (good speed/quality)
+
+                        **Pull command:**
+                        ```bash
+                        ollama pull qwen2.5:32b
+                        ```
+                        """)
+            else:
+                st.warning("No models found. Please pull a model first.")
+        else:
+            health = verify_ollama_health(st.session_state.ollama_url)
+            if health['connected']:
+                st.session_state.ollama_connected = True
+                models = get_available_models(st.session_state.ollama_url)
+                if models:
+                    st.session_state.selected_model = models[0]
+                    st.success(f"✅ Auto-connected: {models[0]}")
+            else:
+                st.info("👆 Configure connection above")
 
-                                st.markdown("**📊 Program Performance & Payment Status**")
-                                with viz_row2[0]:
-                                    if tuition_col and 'current_program' in df.columns:
-                                        rev_by_prog = df.groupby('current_program')[tuition_col].sum().sort_values(ascending=False).head(8)
-                                        fig = create_plotly_chart("bar", {"x": rev_by_prog.index.tolist(), "y": rev_by_prog.values.tolist()}, "Revenue by Program")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_rev_prog")
-                                    elif 'current_program' in df.columns:
-                                        # Fallback: show program enrollment
-                                        prog_counts = df['current_program'].value_counts().head(8)
-                                        fig = create_plotly_chart("bar", {"x": prog_counts.index.tolist(), "y": prog_counts.values.tolist()}, "Students by Program")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_prog_fb")
+    # Main content area - Show welcome message if no data
+    if st.session_state.data is None:
+        st.markdown("""
+        <div style='text-align: center; padding: 3rem 2rem;'>
+            <h2 style='color: #6366f1; margin-bottom: 1rem;'>🎓 Welcome to Student 360 AI-Powered Analytics</h2>
+            <p style='font-size: 1.2rem; color: #94a3b8; margin-bottom: 2rem;'>
+                Your intelligent analytics dashboard powered by advanced AI
+            </p>
+            <p style='font-size: 1rem; color: #e2e8f0; margin-bottom: 0.5rem;'>
+                👈 Check the sidebar's <strong>Getting Started</strong> section to begin
+            </p>
+            <p style='font-size: 0.9rem; color: #94a3b8;'>
+                Configure Ollama connection → Select AI model → Upload student data
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Show key features
+        st.divider()
+        st.markdown("### ✨ Key Features")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown("""
+            <div style='background: rgba(99, 102, 241, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
+                <h4 style='color: #818cf8; margin-top: 0;'>🤖 AI-Driven Insights</h4>
+                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
+                    LLM analyzes your data and recommends optimal visualizations dynamically
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown("""
+            <div style='background: rgba(16, 185, 129, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #10b981;'>
+                <h4 style='color: #34d399; margin-top: 0;'>📊 Dynamic Analytics</h4>
+                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
+                    Adaptive visualizations that change based on your specific data patterns
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            st.markdown("""
+            <div style='background: rgba(245, 158, 11, 0.1); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
+                <h4 style='color: #fbbf24; margin-top: 0;'>🎯 Strategic Intelligence</h4>
+                <p style='color: #cbd5e1; margin-bottom: 0; font-size: 0.9rem;'>
+                    Comprehensive analysis across academics, financials, and student success
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        return
+
+    # Get current data
+    df = st.session_state.data
+
+    # Apply column mapping - check if required fields exist
+    # This ensures mapping is applied even if user has old data
+    required_journey_fields = [
+        'financial_aid_monetary_amount', 'cohort_year', 'enrollment_enrollment_status',
+        'enrollment_tuition_amount', 'enrollment_type', 'occupancy_status'
+    ]
+    missing_required = [f for f in required_journey_fields if f not in df.columns]
+
+    # Apply mapping if: no mapping_log exists OR required fields are missing
+    if ('mapping_log' not in st.session_state or st.session_state.mapping_log is None) or missing_required:
+        df, mapping_log = apply_universal_column_mapping(df)
+        st.session_state.data = df
+        bump_data_generation()
+
+        # Recheck missing fields after mapping
+        still_missing = [f for f in required_journey_fields if f not in df.columns]
+
+        if mapping_log and len(mapping_log) > 0:
+            st.session_state.mapping_log = mapping_log
+            st.info(f"🔄 Applied column mapping: {len(mapping_log)} columns standardized")
+        else:
+            st.session_state.mapping_log = ["Dataset already has standard column names"]
+            st.success("✅ Dataset already uses standard column names")
+
+        # If fields still missing after mapping, show informational message
+        if still_missing:
+            st.info(f"""
+            ℹ️ **Dataset Information**: Your CSV file doesn't include {len(still_missing)} optional column(s):
+            {', '.join([f'`{field}`' for field in still_missing])}
+
+            Most analyses will work normally. Some advanced journey generation features may have limited data availability.
+
+            💡 **Tip**: If you need these fields, please ensure your source CSV file includes them before uploading.
+            """)
+
+    # FORCE RECALCULATION: Always recalculate metrics to ensure fresh data
+    # This fixes issues with stale cached metrics (especially UAE nationals)
+    metrics = calculate_core_metrics(df)
+    st.session_state.metrics = metrics  # Update session state with fresh metrics
+
+    model = st.session_state.selected_model
+    url = st.session_state.ollama_url
+
+    # Application tabs
+    tabs = st.tabs([
+        "📊 Executive Summary",
+        "📖 Data Storytelling AI Driven with Template Guidance",
+        "🔬 Data Storytelling Fully AI Driven",
+        "📚 Data Storytelling (PreDefined+LLM Narrative)",
+        "🎓 Academic Analytics",
+        "🏠 Housing Insights",
+        "💰 Financial Intelligence",
+        "👥 Demographics",
+        "⚠️ Risk & Success",
+        "🔗 Data Lineage",
+        "🔬 Data Explorer"
+    ])
+
+    # ====================================================================================
+    # TAB 1: TRUE LLM-DRIVEN EXECUTIVE SUMMARY
+    # ====================================================================================
+    with tabs[0]:
+        st.header("🤖 Executive Summary - AI-Driven Dynamic Analytics")
+        st.markdown("*The AI analyzes your data and decides what visualizations to create*")
+
+        # Description box
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #6366f1;'>
+            <strong>🧠 True LLM-Driven Approach:</strong> Unlike traditional dashboards where developers hardcode which graphs to show,
+            this system asks the <strong>AI to analyze your {metrics.get('total_students', 0):,} students</strong> and <strong>recommend the most insightful visualizations</strong>.
+            The LLM acts as your data analyst, choosing graph types, data columns, and insights based on what patterns it finds in YOUR data.
+        </div>
+        """, unsafe_allow_html=True)
+
+        if not st.session_state.ollama_connected:
+            st.warning("⚠️ Connect to Ollama to enable AI-driven dynamic visualization generation")
+
+        # Generate dynamic visualizations button
+        if st.session_state.ollama_connected:
+            if st.button("🤖 Let AI Analyze Data & Create Visualizations", key="exec_dynamic_btn", type="primary", width="stretch"):
+                with st.spinner("🔄 AI is analyzing your data, identifying patterns, and recommending optimal visualizations... This may take 20-40 seconds"):
+                    viz_result = generate_dynamic_visualizations_llm(metrics, df, model, url, context_type="executive_summary")
+                    st.session_state.llm_cache['exec_dynamic_viz'] = viz_result
+
+        # Display AI-generated visualizations if available
+        if 'exec_dynamic_viz' in st.session_state.llm_cache:
+            viz_result = st.session_state.llm_cache['exec_dynamic_viz']
+
+            # AI Strategic Overview
+            st.markdown(f"""
+            <div class="insight-card" style="background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); border-left: 4px solid #6366f1; margin-bottom: 2rem;">
+                <div class="insight-title">🎯 AI Strategic Analysis</div>
+                <div class="insight-text" style="font-size: 1.1rem; line-height: 1.8;">{viz_result.get('strategic_overview', '')}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.divider()
+
+            # Key Metrics Dashboard (Static - Always show core metrics)
+            st.markdown("### 📊 Core Institutional Metrics")
+
+            col1, col2, col3, col4, col5 = st.columns(5)
+            with col1:
+                st.metric("Total Students", f"{metrics.get('total_students', 0):,}")
+            with col2:
+                st.metric("Average GPA", f"{metrics.get('avg_gpa', 0):.2f}")
+            with col3:
+                st.metric("High Performers", f"{metrics.get('high_performers', 0):,}",
+                         f"{metrics.get('high_performers', 0)/metrics.get('total_students', 1)*100:.1f}%")
+            with col4:
+                st.metric("UAE Nationals", f"{metrics.get('uae_percentage', 0):.1f}%")
+            with col5:
+                st.metric("At-Risk", f"{metrics.get('at_risk', 0):,}",
+                         f"{metrics.get('at_risk', 0)/metrics.get('total_students', 1)*100:.1f}%",
+                         delta_color="inverse")
+
+            col1, col2, col3, col4, col5 = st.columns(5)
+            with col1:
+                st.metric("Nationalities", metrics.get('unique_nationalities', 0))
+            with col2:
+                st.metric("Tuition Revenue", f"AED {metrics.get('total_tuition', 0)/1000000:.1f}M")
+            with col3:
+                st.metric("Financial Aid", f"AED {metrics.get('total_aid', 0)/1000000:.1f}M")
+            with col4:
+                st.metric("Aid Coverage", f"{metrics.get('aid_coverage_pct', 0):.1f}%")
+            with col5:
+                st.metric("Revenue/Student", f"AED {metrics.get('total_tuition', 0)/metrics.get('total_students', 1) if metrics.get('total_students', 0) > 0 else 0:,.0f}")
+
+            st.divider()
+
+            # ========================================================================
+            # DYNAMIC AI-RECOMMENDED VISUALIZATIONS
+            # ========================================================================
+            st.markdown("### 📈 AI-Recommended Visualizations")
+            st.caption(f"The AI analyzed your data and recommends {len(viz_result.get('visualizations', []))} visualizations")
+
+            visualizations = viz_result.get('visualizations', [])
+
+            if visualizations:
+                # Display visualizations in grid (2 columns)
+                for idx in range(0, len(visualizations), 2):
+                    cols = st.columns(2)
+
+                    for col_idx, col in enumerate(cols):
+                        viz_idx = idx + col_idx
+                        if viz_idx < len(visualizations):
+                            viz_spec = visualizations[viz_idx]
+
+                            with col:
+                                st.markdown(f"#### {viz_spec.get('title', 'Visualization')}")
+                                st.caption(f"**Why this matters:** {viz_spec.get('reasoning', '')}")
+
+                                # Build dynamic chart from AI specification
+                                chart = build_dynamic_chart(viz_spec, df)
+
+                                if chart:
+                                    st.plotly_chart(chart, width="stretch")
+
+                                    # Display AI-generated insight
+                                    st.info(f"**AI Insight:** {viz_spec.get('insight', '')}")
+                                else:
+                                    st.warning(f"Could not generate chart for: {viz_spec.get('data_column', 'unknown column')}")
+
+                st.divider()
+
+                # ========================================================================
+                # KEY FINDINGS (AI-Generated)
+                # ========================================================================
+                st.markdown("### 🔍 Key Findings")
+
+                key_findings = viz_result.get('key_findings', [])
+                if key_findings:
+                    for idx, finding in enumerate(key_findings, 1):
+                        st.markdown(f"""
+                        <div style='background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 0.8rem;'>
+                            <strong style='color: #60a5fa;'>Finding {idx}:</strong> {finding}
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                st.divider()
 
-                                with viz_row2[1]:
-                                    if 'payment_status' in df.columns:
-                                        pay_counts = df['payment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": pay_counts.index.tolist(), "values": pay_counts.values.tolist()}, "Payment Status Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_payment")
-                                    elif 'gender' in df.columns:
-                                        # Fallback: show gender distribution
-                                        gender_counts = df['gender'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": gender_counts.index.tolist(), "values": gender_counts.values.tolist()}, "Gender Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gender_fb")
+                # ========================================================================
+                # RECOMMENDATIONS (AI-Generated with Priority & ROI)
+                # ========================================================================
+                st.markdown("### 💡 AI-Generated Strategic Recommendations")
 
-                            # JOURNEY 3: OPERATIONS
-                            elif tab_idx == 2:
-                                st.markdown("""
-                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #8b5cf6;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>⚙️ Operational Metrics & Cohort Analysis</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Student operational status, cohort distribution, and institutional capacity planning</div>
+                recommendations = viz_result.get('recommendations', [])
+                if recommendations:
+                    for idx, rec in enumerate(recommendations, 1):
+                        # Handle both old format (string) and new enriched format (dict)
+                        if isinstance(rec, dict):
+                            # New enriched format with priority, impact, timeline, investment
+                            priority = rec.get('priority', 'MEDIUM')
+                            action = rec.get('action', '')
+                            expected_impact = rec.get('expected_impact', '')
+                            timeline = rec.get('timeline', 'short-term')
+                            investment = rec.get('investment', 'TBD')
+
+                            # Color-code by priority
+                            priority_colors = {
+                                'CRITICAL': ('#ef4444', 'rgba(239, 68, 68, 0.15)'),
+                                'HIGH': ('#f59e0b', 'rgba(245, 158, 11, 0.15)'),
+                                'MEDIUM': ('#10b981', 'rgba(16, 185, 129, 0.15)')
+                            }
+                            border_color, bg_gradient = priority_colors.get(priority, priority_colors['MEDIUM'])
+
+                            st.markdown(f"""
+                            <div style='background: {bg_gradient}; padding: 1.5rem; border-radius: 8px;
+                                        border-left: 4px solid {border_color}; margin-bottom: 1rem;'>
+                                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;'>
+                                    <h4 style='color: {border_color}; margin: 0;'>
+                                        {'🔴' if priority == 'CRITICAL' else '🟠' if priority == 'HIGH' else '🟢'}
+                                        Recommendation {idx} - {priority} Priority
+                                    </h4>
+                                    <span style='background: rgba(0,0,0,0.3); padding: 0.3rem 0.8rem;
+                                                border-radius: 12px; font-size: 0.85rem; color: #cbd5e1;'>
+                                        {timeline.replace('_', ' ').title()}
+                                    </span>
                                 </div>
-                                """, unsafe_allow_html=True)
+                                <p style='color: #e2e8f0; margin-bottom: 0.8rem; line-height: 1.6; font-size: 1.05rem;'>
+                                    <strong>Action:</strong> {action}
+                                </p>
+                                <p style='color: #a5b4fc; margin-bottom: 0.8rem; line-height: 1.6;'>
+                                    <strong>📊 Expected Impact:</strong> {expected_impact}
+                                </p>
+                                <p style='color: #cbd5e1; margin-bottom: 0; line-height: 1.6; font-size: 0.95rem;'>
+                                    <strong>💰 Investment:</strong> {investment}
+                                </p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        else:
+                            # Old format (simple string) - backwards compatible
+                            st.markdown(f"""
+                            <div style='background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
+                                        padding: 1.2rem; border-radius: 8px; border-left: 4px solid #10b981; margin-bottom: 1rem;'>
+                                <h4 style='color: #10b981; margin-top: 0;'>Recommendation {idx}</h4>
+                                <p style='color: #e2e8f0; margin-bottom: 0; line-height: 1.6;'>
+                                    {rec}
+                                </p>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-                                with viz_row1[0]:
-                                    if 'enrollment_enrollment_status' in df.columns:
-                                        st.caption("📊 **Operational Status Distribution**")
-                                        status_counts = df['enrollment_enrollment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Operational Status")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_op_status")
+            else:
+                st.warning("No visualizations generated. Try regenerating with the button above.")
 
-                                with viz_row1[1]:
-                                    if 'cohort_year' in df.columns:
-                                        st.caption("📅 **Students by Cohort Year**")
-                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
-                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Students by Cohort")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort_ops")
+    # ====================================================================================
+    # TAB 2: DATA STORYTELLING AI DRIVEN WITH TEMPLATE GUIDANCE
+    # ====================================================================================
+    with tabs[1]:
+        st.header("📖 Data Storytelling AI Driven with Template Guidance")
+        st.caption("AI identifies entities from your data and creates comprehensive journey stories tracking their lifecycle")
 
-                            # JOURNEY 4: ACADEMICS
-                            elif tab_idx == 3:
-                                st.markdown("""
-                                <div style='background: rgba(245, 158, 11, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #f59e0b;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>🎓 Academic Performance Overview</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>GPA distribution, performance tiers, and program excellence analysis</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+        # Explanation box
+        st.markdown(f"""<div style='background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #6366f1;'>
+<p style='margin: 0; color: #e2e8f0;'><strong>🎯 Entity-Based Journey System:</strong> Unlike traditional dashboards that show aggregate statistics,
+this system uses AI to <strong>identify meaningful entities</strong> (student cohorts, programs, services, revenue segments) from your dataset
+and <strong>tracks their complete lifecycle</strong> through multiple stages with data-driven narratives.</p>
+<p style='margin: 0.5rem 0 0 0; color: #cbd5e1; font-size: 0.9rem;'>
+<strong>How it works:</strong><br>
+• <strong>Phase 1:</strong> AI analyzes your {metrics.get('total_students', 0):,} students and identifies exactly 6 meaningful entities<br>
+• <strong>Phase 2:</strong> AI defines 4-6 lifecycle stages for each entity<br>
+• <strong>Phase 3:</strong> AI generates compelling narratives for each stage using actual data
+</p>
+<p style='margin: 0.8rem 0 0 0; padding-top: 0.8rem; border-top: 1px solid rgba(99, 102, 241, 0.3); color: #cbd5e1; font-size: 0.9rem;'>
+<strong>🚀 Journeys are based on:</strong><br>
+• ✅ Dataset structure analysis (all {len(df.columns)} columns examined)<br>
+• ✅ Sample data patterns (first 5 rows analyzed for insights)<br>
+• ✅ Entity lifecycle concept (things that evolve: beginning → middle → end)<br>
+• ✅ Entity types: Student, Program, Financial Aid, Enrollment, Campus, Revenue<br>
+• ✅ AI pattern recognition of what constitutes a meaningful "journey"<br>
+• ✅ Status transitions (Active → At-Risk → Successful/Failed)
+</p>
+<p style='margin: 0.8rem 0 0 0; padding-top: 0.8rem; border-top: 1px solid rgba(99, 102, 241, 0.3); color: #cbd5e1; font-size: 0.9rem;'>
+<strong>📋 Stages within each journey are based on:</strong><br>
+• ✅ Your actual dataset columns and values<br>
+• ✅ The specific entity identified by AI<br>
+• ✅ Chronological/logical progression (enrollment → performance → outcomes)<br>
+• ✅ LLM's understanding of higher education lifecycles<br>
+• ✅ Data-driven insights specific to your institution's context
+</p>
+</div>""", unsafe_allow_html=True)
 
-                                with viz_row1[0]:
-                                    if 'cumulative_gpa' in df.columns:
-                                        st.caption("📊 **Overall GPA Distribution**")
-                                        fig = create_plotly_chart("histogram", {"values": df['cumulative_gpa'].dropna()}, "GPA Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_dist")
+        if not st.session_state.ollama_connected:
+            st.warning("⚠️ Connect to Ollama to generate entity journeys")
+        elif not LLM_ENTITY_JOURNEY_AVAILABLE:
+            st.error("❌ LLM Entity Journey System module not found. Please ensure llm_entity_journey_system.py is available.")
+        else:
+            # Button to generate entity journeys
+            col_btn, col_info = st.columns([2, 3])
+            with col_btn:
+                if st.button("🚀 Generate Entity Journeys", key="generate_entity_journeys_btn", type="primary", width='stretch'):
+                    # Test connection first
+                    st.info(f"🔍 Testing connection to: {url}")
+                    try:
+                        import requests
+                        test_response = requests.get(f"{url}/api/tags", timeout=10)
+                        if test_response.status_code == 200:
+                            st.success(f"✅ Connection OK - {len(test_response.json()['models'])} models available")
+                        else:
+                            st.error(f"❌ Connection failed: HTTP {test_response.status_code}")
+                            st.stop()
+                    except Exception as conn_err:
+                        st.error(f"❌ Connection test failed: {str(conn_err)}")
+                        st.warning("💡 Make sure your Colab tunnel is running if using Cloudflare")
+                        st.stop()
 
-                                with viz_row1[1]:
-                                    if 'cumulative_gpa' in df.columns:
-                                        st.caption("🎯 **Performance Tiers**")
-                                        high = len(df[df['cumulative_gpa'] >= 3.5])
-                                        mid = len(df[(df['cumulative_gpa'] >= 2.5) & (df['cumulative_gpa'] < 3.5)])
-                                        low = len(df[df['cumulative_gpa'] < 2.5])
-                                        fig = create_plotly_chart("pie", {"labels": ["High Performers (≥3.5)", "Mid Performers (2.5-3.5)", "At Risk (<2.5)"], "values": [high, mid, low]}, "Performance Tiers")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_perf_tiers")
+                    try:
+                        # Capture print logs in a container
+                        log_container = st.container()
+                        import sys
+                        from io import StringIO
 
-                                with viz_row1[2]:
-                                    if 'cumulative_gpa' in df.columns and 'current_program' in df.columns:
-                                        st.caption("🏆 **Top Performing Programs**")
-                                        gpa_by_prog = df.groupby('current_program')['cumulative_gpa'].mean().sort_values(ascending=False).head(8)
-                                        fig = create_plotly_chart("bar", {"x": gpa_by_prog.index.tolist(), "y": gpa_by_prog.values.tolist()}, "Average GPA by Program")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_prog")
+                        # Create a custom stdout to capture prints
+                        captured_output = StringIO()
+                        old_stdout = sys.stdout
+                        sys.stdout = captured_output
 
-                                st.markdown("""
-                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin: 1.5rem 0 1rem 0; border-left: 4px solid #8b5cf6;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📊 Performance by Demographics & Workload</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Achievement patterns across nationalities and credit hour loads</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                        try:
+                            with st.spinner("🔄 Phase 1/3: Identifying meaningful entities from dataset..."):
+                                st.info(f"📊 Analyzing {len(df)} rows with {len(df.columns)} columns...")
+                                # Generate complete entity journeys using LLM
+                                entity_journeys = generate_complete_llm_journeys(df, model, url)
+                                st.session_state.llm_cache['entity_journeys'] = entity_journeys
+                        finally:
+                            # Restore stdout
+                            sys.stdout = old_stdout
 
-                                with viz_row2[0]:
-                                    if 'cumulative_gpa' in df.columns and 'nationality' in df.columns:
-                                        st.caption("🌍 **GPA by Nationality**")
-                                        gpa_by_nat = df.groupby('nationality')['cumulative_gpa'].mean().sort_values(ascending=False).head(10)
-                                        fig = create_plotly_chart("bar", {"x": gpa_by_nat.index.tolist(), "y": gpa_by_nat.values.tolist()}, "Average GPA by Nationality")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_nat")
+                        # Show captured logs in expander
+                        captured_logs = captured_output.getvalue()
+                        if captured_logs:
+                            with st.expander("📋 Show Generation Logs (for debugging)"):
+                                st.text(captured_logs)
 
-                                with viz_row2[1]:
-                                    if 'total_credit_hours' in df.columns:
-                                        st.caption("📚 **Student Workload**")
-                                        fig = create_plotly_chart("histogram", {"values": df['total_credit_hours'].dropna()}, "Credit Hours Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_credits")
+                        if entity_journeys:
+                            total_stages = sum(j['total_stages'] for j in entity_journeys)
+                            st.success(f"✅ Generated {len(entity_journeys)} entity journeys with {total_stages} total stages!")
+                        else:
+                            st.error("❌ No entity journeys generated (empty result)")
+                            st.warning("💡 The logs above show what happened. Possible causes:")
+                            st.warning("- LLM failed to generate valid JSON (check logs for 'JSON parsing error')")
+                            st.warning("- Dataset too small or lacks clear patterns")
+                            st.warning("- LLM timed out during generation (check logs for 'timeout')")
+                    except Exception as e:
+                        st.error(f"❌ Error generating entity journeys: {str(e)}")
+                        st.error(f"Error type: {type(e).__name__}")
+                        import traceback
+                        with st.expander("🔍 Show detailed error"):
+                            st.code(traceback.format_exc())
+                        st.warning("💡 Troubleshooting:")
+                        st.warning("1. Check Streamlit Cloud logs for full error")
+                        st.warning("2. Verify Colab tunnel is running (if using Cloudflare)")
+                        st.warning("3. Try with a smaller dataset first")
+                        st.warning("4. Check if model exists: " + model)
+
+            with col_info:
+                st.info("⏱️ **Estimated time:** 5-15 minutes depending on dataset complexity. The AI will make multiple LLM calls to build comprehensive stories.")
+
+            # Display entity journeys if available
+            if 'entity_journeys' in st.session_state.llm_cache:
+                entity_journeys = st.session_state.llm_cache['entity_journeys']
+
+                if not entity_journeys:
+                    st.warning("No entity journeys generated. Try again or check your dataset.")
+                else:
+                    st.markdown("---")
+                    st.markdown(f"### 🎯 {len(entity_journeys)} Entity Journeys Discovered")
+                    st.caption(f"*AI identified {len(entity_journeys)} meaningful entities and tracked their lifecycle through {sum(j['total_stages'] for j in entity_journeys)} total stages*")
+
+                    # Display each entity journey
+                    for journey_idx, journey in enumerate(entity_journeys, 1):
+                        entity_type_colors = {
+                            # Lifecycle entity types
+                            'student_lifecycle': ('#3b82f6', 'rgba(59, 130, 246, 0.1)'),
+                            'program_lifecycle': ('#8b5cf6', 'rgba(139, 92, 246, 0.1)'),
+                            'aid_lifecycle': ('#10b981', 'rgba(16, 185, 129, 0.1)'),
+                            'enrollment_lifecycle': ('#06b6d4', 'rgba(6, 182, 212, 0.1)'),
+                            'campus_lifecycle': ('#f59e0b', 'rgba(245, 158, 11, 0.1)'),
+                            'revenue_lifecycle': ('#22c55e', 'rgba(34, 197, 94, 0.1)'),
+                            'facility_lifecycle': ('#eab308', 'rgba(234, 179, 8, 0.1)'),
+                            # Legacy types (for backward compatibility)
+                            'student_cohort': ('#3b82f6', 'rgba(59, 130, 246, 0.1)'),
+                            'program': ('#8b5cf6', 'rgba(139, 92, 246, 0.1)'),
+                            'service': ('#06b6d4', 'rgba(6, 182, 212, 0.1)'),
+                            'revenue_segment': ('#10b981', 'rgba(16, 185, 129, 0.1)'),
+                            'operational': ('#f59e0b', 'rgba(245, 158, 11, 0.1)')
+                        }
 
-                            # JOURNEY 5: RETENTION
-                            elif tab_idx == 4:
-                                st.markdown("""
-                                <div style='background: rgba(34, 197, 94, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #22c55e;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>🎯 Retention & Persistence Indicators</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Student enrollment continuity, academic standing, and retention risk factors</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                        entity_type = journey.get('entity_type', 'student_lifecycle')
+                        color, bg_color = entity_type_colors.get(entity_type, ('#6366f1', 'rgba(99, 102, 241, 0.1)'))
 
-                                with viz_row1[0]:
-                                    if 'enrollment_enrollment_status' in df.columns:
-                                        st.caption("📊 **Student Enrollment Status**")
-                                        status_counts = df['enrollment_enrollment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Student Status")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_retention_status")
+                        # Priority colors
+                        priority = journey.get('priority', 5)
+                        if priority >= 8:
+                            priority_color = '#dc2626'
+                            priority_label = '🚨 CRITICAL'
+                        elif priority >= 6:
+                            priority_color = '#f97316'
+                            priority_label = '⚡ HIGH'
+                        elif priority >= 4:
+                            priority_color = '#eab308'
+                            priority_label = '💡 MEDIUM'
+                        else:
+                            priority_color = '#10b981'
+                            priority_label = '✅ STANDARD'
 
-                                with viz_row1[1]:
-                                    if 'cumulative_gpa' in df.columns:
-                                        st.caption("📈 **Academic Performance Distribution**")
-                                        fig = create_plotly_chart("histogram", {"values": df['cumulative_gpa'].dropna()}, "GPA Distribution")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_retention_gpa")
+                        # Entity Journey Card Header
+                        with st.expander(f"**{journey_idx}. {journey['entity_name']}** ({journey['total_stages']} stages) - {priority_label}", expanded=(journey_idx <= 2)):
+                            # Entity Overview
+                            st.markdown(f"""<div style='background: {bg_color}; padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid {color};'>
+<div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;'>
+    <div>
+        <h3 style='font-size: 1.3rem; font-weight: 700; color: {color}; margin: 0 0 0.3rem 0;'>{journey['entity_name']}</h3>
+        <div style='color: #94a3b8; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.5px;'>{journey['entity_type'].replace('_', ' ')}</div>
+    </div>
+    <div style='text-align: right;'>
+        <span style='background: {priority_color}; color: white; padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.75rem; font-weight: 600; display: inline-block;'>{priority_label}</span>
+    </div>
+</div>
+<p style='color: #e2e8f0; font-size: 1rem; line-height: 1.6; margin-bottom: 0.8rem;'>{journey.get('description', '')}</p>
+<div style='background: rgba(0,0,0,0.2); padding: 0.9rem; border-radius: 6px;'>
+    <p style='color: #e2e8f0; margin: 0; line-height: 1.6;'>
+        <strong style='color: #60a5fa;'>📊 Students:</strong> {journey.get('student_count', 'N/A')}
+    </p>
+    <p style='color: #e2e8f0; margin: 0.5rem 0 0 0; line-height: 1.6;'>
+        <strong style='color: #34d399;'>💡 Why Important:</strong> {journey.get('why_important', 'Strategic entity for institutional performance')}
+    </p>
+</div>
+</div>""", unsafe_allow_html=True)
 
-                            # JOURNEY 6: RISK
-                            elif tab_idx == 5:
-                                st.markdown("""
-                                <div style='background: rgba(239, 68, 68, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #ef4444;'>
-                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>⚠️ Risk Assessment & Early Warning Indicators</div>
-                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Academic performance risk, financial obligations, and student success predictors</div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                            # Journey Stages
+                            st.markdown("#### 📋 Journey Lifecycle Stages")
 
-                                with viz_row1[0]:
-                                    if 'cumulative_gpa' in df.columns:
-                                        st.caption("📉 **Academic Risk Levels**")
-                                        at_risk = len(df[df['cumulative_gpa'] < 2.5])
-                                        ok = len(df[df['cumulative_gpa'] >= 2.5])
-                                        fig = create_plotly_chart("pie", {"labels": ["At Risk (<2.5 GPA)", "Acceptable (≥2.5)"], "values": [at_risk, ok]}, "Academic Risk Assessment")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_risk_gpa")
+                            for stage_idx, stage in enumerate(journey.get('stages', []), 1):
+                                stage_color = color
+                                stage_icon = ['🔵', '🟢', '🟡', '🟠', '🔴', '🟣'][min(stage_idx - 1, 5)]
 
-                                with viz_row1[1]:
-                                    if 'payment_status' in df.columns:
-                                        st.caption("💳 **Payment Status & Financial Risk**")
-                                        pay_counts = df['payment_status'].value_counts()
-                                        fig = create_plotly_chart("pie", {"labels": pay_counts.index.tolist(), "values": pay_counts.values.tolist()}, "Payment Risk")
-                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_risk_payment")
+                                # Stage Header
+                                st.markdown(f"""<div style='display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem; margin-top: 1.5rem;'>
+    <span style='font-size: 2rem;'>{stage_icon}</span>
+    <div style='flex: 1;'>
+        <h4 style='color: {stage_color}; margin: 0; font-size: 1.2rem;'>Stage {stage.get('stage_order', stage_idx)}: {stage.get('stage_name', 'Unknown Stage')}</h4>
+        <p style='color: #94a3b8; margin: 0.2rem 0 0 0; font-size: 0.9rem;'>{stage.get('description', '')}</p>
+    </div>
+</div>""", unsafe_allow_html=True)
 
-                            st.markdown("<br>", unsafe_allow_html=True)
-                            st.markdown("""
-                            <div style='background: linear-gradient(135deg, rgba(139, 92, 246, 0.15), rgba(168, 85, 247, 0.15));
-                                        padding: 1.5rem; border-radius: 10px; margin: 2rem 0 1.5rem 0;
-                                        border-left: 5px solid #8b5cf6;'>
-                                <h2 style='margin: 0 0 0.5rem 0; color: #1e293b; font-size: 1.5rem;'>
-                                    📖 Journey Stories - Detailed Narratives
-                                </h2>
-                                <p style='margin: 0; color: #475569; font-size: 0.95rem; line-height: 1.6;'>
-                                    AI-generated narratives providing business context, strategic insights, and actionable recommendations
-                                    for each aspect of this journey. Expand each story to explore detailed analysis.
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                                # Stage Narrative (like Executive Summary findings)
+                                st.markdown(f"""<div style='background: rgba(59, 130, 246, 0.1); padding: 1.2rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
+    <strong style='color: #60a5fa; font-size: 0.9rem;'>📖 STAGE NARRATIVE</strong>
+    <p style='color: #e2e8f0; margin: 0.5rem 0 0 0; line-height: 1.6; font-size: 1rem;'>{stage.get('narrative_text', 'No narrative available.')}</p>
+</div>""", unsafe_allow_html=True)
 
-                            # Import html for escaping (once per journey)
-                            import html
+                                # Key Metrics (like Executive Summary recommendations)
+                                key_metrics = stage.get('key_metrics', [])
+                                if key_metrics:
+                                    st.markdown(f"""<div style='background: rgba(59, 130, 246, 0.15); padding: 1.2rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
+    <h4 style='color: #60a5fa; margin: 0 0 0.8rem 0; font-size: 0.95rem;'>📊 KEY METRICS</h4>
+    {''.join([f"<p style='color: #e2e8f0; margin: 0 0 0.6rem 0; line-height: 1.6;'><strong style='color: #60a5fa;'>{m.get('metric', '')}:</strong> {m.get('value', '')} <span style='color: #a5b4fc; font-size: 0.9rem;'>({m.get('significance', '')})</span></p>" for m in key_metrics])}
+</div>""", unsafe_allow_html=True)
 
-                            # Display each story
-                            for story_idx, story in enumerate(journey['stories'], 1):
-                                with st.expander(f"📄 Story {story_idx}: {story['title']}", expanded=(story_idx == 1)):
-                                    # Story subtitle
-                                    if story.get('subtitle'):
-                                        st.caption(f"*{story['subtitle']}*")
+                                # Insights (like Executive Summary findings)
+                                insights = stage.get('insights', [])
+                                if insights:
+                                    for idx, insight in enumerate(insights, 1):
+                                        st.markdown(f"""<div style='background: rgba(16, 185, 129, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #10b981; margin-bottom: 0.8rem;'>
+    <strong style='color: #34d399;'>💡 Insight {idx}:</strong> <span style='color: #e2e8f0;'>{insight}</span>
+</div>""", unsafe_allow_html=True)
 
-                                    st.markdown("---")
+                                # Recommendations (like Executive Summary recommendations)
+                                recommendations = stage.get('recommendations', [])
+                                if recommendations:
+                                    st.markdown(f"""<div style='background: rgba(245, 158, 11, 0.15); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #f59e0b; margin-bottom: 1rem;'>
+    <h4 style='color: #fbbf24; margin: 0 0 0.8rem 0; font-size: 0.95rem;'>🎯 RECOMMENDATIONS</h4>
+    {''.join([f"<p style='color: #e2e8f0; margin: 0 0 0.6rem 0; line-height: 1.6;'><strong style='color: #fbbf24;'>→</strong> {rec}</p>" for rec in recommendations])}
+</div>""", unsafe_allow_html=True)
 
-                                    # VISUAL FLOW DIAGRAM - Story Analysis
-                                    st.markdown("#### 📊 Story Analysis Flow")
+                                # Display LLM-recommended visualizations
+                                visualizations = stage.get('visualizations', [])
+                                if visualizations and LLM_ENTITY_JOURNEY_AVAILABLE:
+                                    # Get entity data for visualization
+                                    entity_data = filter_dataset_for_entity(df, journey)
 
-                                    # Extract and escape content properly
-                                    opening = html.escape(story.get('opening_narrative', 'N/A')[:200].replace('\n', ' ').replace('  ', ' '))
-                                    insights = html.escape(story.get('data_insights', 'Key data patterns and trends identified')[:180].replace('\n', ' ').replace('  ', ' '))
-                                    impact = html.escape(story.get('business_impact', 'N/A')[:180].replace('\n', ' ').replace('  ', ' '))
-                                    action = html.escape(story.get('action_plan', 'Strategic recommendations')[:180].replace('\n', ' ').replace('  ', ' '))
+                                    # Try to generate visualizations first
+                                    successful_viz = []
+                                    for viz_idx, viz_spec in enumerate(visualizations, 1):
+                                        fig = generate_visualization(entity_data, viz_spec)
+                                        if fig:
+                                            successful_viz.append((viz_idx, viz_spec, fig))
 
-                                    # Stage 1: Current Situation
-                                    st.markdown(f"""
-                                    <div style='background: linear-gradient(135deg, #3b82f6, #2563eb); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3); margin-bottom: 0.5rem;'>
-                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>📌 CURRENT SITUATION</div>
-                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{opening}...</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                                    # Only show header if we have successful visualizations
+                                    if successful_viz:
+                                        st.markdown("<h4 style='color: #e2e8f0; margin-top: 1.5rem;'>📊 Data Visualizations</h4>", unsafe_allow_html=True)
+                                        st.caption("*AI-selected visualizations to illustrate this stage*")
 
-                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #3b82f6; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
+                                        # Display the successful visualizations
+                                        for viz_idx, viz_spec, fig in successful_viz:
+                                            viz_title = viz_spec.get('title', f'Visualization {viz_idx}')
+                                            viz_desc = viz_spec.get('description', '')
+                                            viz_purpose = viz_spec.get('chart_purpose', '')
 
-                                    # Stage 2: Key Insights
-                                    st.markdown(f"""
-                                    <div style='background: linear-gradient(135deg, #8b5cf6, #7c3aed); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3); margin-bottom: 0.5rem;'>
-                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>📈 KEY INSIGHTS</div>
-                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{insights}...</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                                            # Display chart with description (Executive Summary style)
+                                            st.markdown(f"""<div style='background: rgba(99, 102, 241, 0.1); padding: 1rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #6366f1;'>
+    <h5 style='color: #818cf8; margin: 0 0 0.5rem 0; font-size: 1rem;'>{viz_title}</h5>
+    <p style='color: #cbd5e1; margin: 0; font-size: 0.9rem;'><strong>Why this matters:</strong> {viz_desc}</p>
+    {f"<p style='color: #a5b4fc; margin: 0.5rem 0 0 0; font-size: 0.85rem; font-style: italic;'>💡 {viz_purpose}</p>" if viz_purpose else ''}
+</div>""", unsafe_allow_html=True)
+                                            st.plotly_chart(fig, width='stretch', key=f"viz_{journey_idx}_{stage_idx}_{viz_idx}")
 
-                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #8b5cf6; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
+                    st.markdown("---")
+                    st.success("✅ All entity journeys loaded successfully!")
 
-                                    # Stage 3: Business Impact
-                                    st.markdown(f"""
-                                    <div style='background: linear-gradient(135deg, #10b981, #059669); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3); margin-bottom: 0.5rem;'>
-                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>💼 BUSINESS IMPACT</div>
-                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{impact}...</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+            else:
+                # Show prompt to generate entity journeys
+                st.info("💡 Click 'Generate Entity Journeys' to let the AI analyze your dataset and create comprehensive entity lifecycle stories")
 
-                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #10b981; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
+                # Example entity types
+                st.markdown("### 🎯 Example Lifecycle Entities")
+                st.markdown("""
+                The AI will identify **ENTITIES** that have **LIFECYCLES** and **STATUS CHANGES**:
 
-                                    # Stage 4: Recommended Actions
-                                    st.markdown(f"""
-                                    <div style='background: linear-gradient(135deg, #f59e0b, #d97706); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(245, 158, 11, 0.3); margin-bottom: 1rem;'>
-                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>🎯 RECOMMENDED ACTIONS</div>
-                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{action}...</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                **🎓 Student Entity**
+                - Lifecycle: Enrollment → Academic Progress → Performance Status → Graduation/Dropout
+                - Example Journey: "Student Academic Journey" tracking progression from entry to exit
 
-                                    st.markdown("---")
+                **📚 Academic Program Entity**
+                - Lifecycle: Program Launch → Growth → Maturity → Optimization
+                - Example Journey: "Academic Program Lifecycle" showing how programs evolve
 
-                                    # Detailed sections in expander
-                                    with st.expander("📋 View Full Analysis Details", expanded=False):
-                                        # Complete Narrative
-                                        st.markdown("##### 📖 Complete Narrative")
-                                        full_narrative = html.escape(story.get('opening_narrative', 'N/A')).replace('\n', '<br>')
-                                        st.markdown(f"""
-                                        <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #8b5cf6; margin-bottom: 1rem;'>
-                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_narrative}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                **💰 Financial Aid Entity**
+                - Lifecycle: Application → Approval → Disbursement → Impact Assessment
+                - Example Journey: "Financial Aid Journey" tracking aid effectiveness
 
-                                        # Full Data Insights
-                                        st.markdown("##### 📊 Complete Data Insights")
-                                        full_insights = html.escape(story.get('data_insights', 'N/A')).replace('\n', '<br>')
-                                        st.markdown(f"""
-                                        <div style='background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
-                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_insights}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                **🏢 Campus/Facility Entity**
+                - Lifecycle: Opening → Expansion → Optimization
+                - Example Journey: "Campus Operations Journey" or "Dormitory Lifecycle"
 
-                                        # Full Business Impact
-                                        st.markdown("##### 💼 Full Business Impact Analysis")
-                                        full_impact = html.escape(story.get('business_impact', 'N/A')).replace('\n', '<br>')
-                                        st.markdown(f"""
-                                        <div style='background: rgba(34, 197, 94, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #22c55e; margin-bottom: 1rem;'>
-                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_impact}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                **📈 Enrollment Entity**
+                - Lifecycle: Application → Acceptance → Registration → Retention
+                - Example Journey: "Enrollment Journey" tracking student acquisition
 
-                                        # Key Findings
-                                        st.markdown("##### 🔍 Key Findings")
-                                        full_findings = html.escape(story.get('findings_summary', 'N/A')).replace('\n', '<br>')
-                                        st.markdown(f"""
-                                        <div style='background: rgba(251, 146, 60, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #fb923c; margin-bottom: 1rem;'>
-                                            <div style='color: #1e293b; line-height: 1.8;'>{full_findings}</div>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                **💵 Revenue Entity**
+                - Lifecycle: Tuition Assessment → Payment → Collection → Revenue Recognition
+                - Example Journey: "Revenue Journey" tracking financial flows
 
-                                        # Complete Action Plan
-                                        st.markdown("##### 🎯 Complete Action Plan")
-                                        full_action = html.escape(story.get('action_plan', 'N/A')).replace('\n', '<br>')
-                                        st.markdown(f"""
-                                        <div style='background: rgba(245, 158, 11, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b; margin-bottom: 1rem;'>
-                                            <div style='color: #1e293b; line-height: 1.8;'>{full_action}</div>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                ---
+
+                **Each entity will have:**
+                - Multiple lifecycle stages showing progression
+                - Data-driven narratives for each stage
+                - Nationality/demographic breakdowns in the stories
+                - Performance metrics and status indicators
+                - Actionable insights and recommendations
+                """)
 
     # ====================================================================================
-    # TAB 5: ACADEMIC ANALYTICS - HYBRID AI-DRIVEN
+    # TAB 3: DATA STORYTELLING FULLY AI DRIVEN
     # ====================================================================================
-    with tabs[4]:
-        st.header("🎓 Academic Analytics - AI-Driven Deep Analysis")
-        st.caption("The AI analyzes academic performance patterns and recommends targeted interventions")
+    with tabs[2]:
+        st.header("🔬 Data Storytelling Fully AI Driven")
+        st.caption("Pure AI-driven entity discovery with ZERO predefined examples or guidance")
 
-        # Academic-focused metrics
-        col1, col2, col3, col4 = st.columns(4)
+        # Explanation box
+        st.markdown(f"""<div style='background: linear-gradient(135deg, rgba(139, 92, 246, 0.15), rgba(236, 72, 153, 0.15)); padding: 1.2rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #8b5cf6;'>
+<p style='margin: 0; color: #e2e8f0;'><strong>🔬 PURE AUTONOMOUS DISCOVERY:</strong> This system operates with <strong>ZERO predefined templates or examples</strong>.
+The AI analyzes your {metrics.get('total_students', 0):,} students and <strong>discovers entities entirely from data patterns</strong> with no guidance on what to find.</p>
+<p style='margin: 0.5rem 0 0 0; color: #cbd5e1; font-size: 0.9rem;'>
+<strong>How it differs from guided discovery:</strong><br>
+• <strong>Guided System:</strong> AI gets examples like "Student Journey", "Program Lifecycle" → follows patterns<br>
+• <strong>Fully Dynamic:</strong> AI gets NO examples → discovers what exists in YOUR specific data<br>
+<br>
+<strong>What to expect:</strong> Unique entities specific to your institution that may not fit standard categories.
+</p>
+</div>""", unsafe_allow_html=True)
 
-        with col1:
-            st.metric("High Performers", f"{metrics.get('high_performers', 0):,}",
-                     f"{metrics.get('high_performers', 0)/metrics.get('total_students', 1)*100:.1f}%")
+        if not st.session_state.ollama_connected:
+            st.warning("⚠️ Connect to Ollama to enable fully dynamic discovery")
+        elif not FULLY_DYNAMIC_DISCOVERY_AVAILABLE:
+            st.error("❌ Fully Dynamic Discovery module not found. Please ensure fully_dynamic_entity_discovery.py is available.")
+        else:
+            # Button to generate fully dynamic journeys
+            col_btn, col_info = st.columns([2, 3])
+            with col_btn:
+                if st.button("🔬 Discover Entities Autonomously", key="discover_dynamic_entities_btn", type="primary", width='stretch'):
+                    with st.spinner("🔄 AI is analyzing data patterns with NO guidance (this may discover unexpected entities)..."):
+                        # Generate fully dynamic journeys (NO templates, NO examples)
+                        dynamic_journeys = generate_fully_dynamic_journeys(df, model, url)
+                        st.session_state.llm_cache['dynamic_journeys'] = dynamic_journeys
 
-        with col2:
-            st.metric("Average GPA", f"{metrics.get('avg_gpa', 0):.2f}")
+                        if dynamic_journeys:
+                            total_stages = sum(j['total_stages'] for j in dynamic_journeys)
+                            st.success(f"✅ DISCOVERED {len(dynamic_journeys)} unique entities autonomously with {total_stages} total lifecycle stages!")
+                        else:
+                            st.error("❌ Autonomous discovery failed. Please check your dataset and Ollama connection.")
 
-        with col3:
-            st.metric("At-Risk Students", f"{metrics.get('at_risk', 0):,}",
-                     delta=f"-{metrics.get('at_risk', 0)/metrics.get('total_students', 1)*100:.1f}%",
-                     delta_color="inverse")
+            with col_info:
+                st.info("⏱️ **Estimated time:** 10-20 minutes. The AI will make multiple calls to discover patterns WITHOUT any predefined examples.")
 
-        with col4:
-            # Calculate mid-performers
-            mid_performers = metrics.get('total_students', 0) - metrics.get('high_performers', 0) - metrics.get('at_risk', 0)
-            st.metric("Mid-Performers", f"{mid_performers:,}",
-                     f"{mid_performers/metrics.get('total_students', 1)*100:.1f}%")
+            # Display fully dynamic journeys if available
+            if 'dynamic_journeys' in st.session_state.llm_cache:
+                dynamic_journeys = st.session_state.llm_cache['dynamic_journeys']
 
-        st.divider()
+                if not dynamic_journeys:
+                    st.warning("No entities discovered autonomously. The AI may need clearer data patterns.")
+                else:
+                    st.markdown("---")
+                    st.markdown(f"### 🔬 {len(dynamic_journeys)} Entities Discovered Autonomously")
+                    st.caption(f"*AI discovered {len(dynamic_journeys)} unique entities by analyzing data patterns with ZERO guidance*")
 
-        # AI Analysis Button
-        if st.session_state.ollama_connected and st.button("🤖 Generate Academic Performance Analysis & Visualizations", key="academic_btn", type="primary", width='stretch'):
+                    # Display discovery method badge
+                    st.markdown("""<div style='background: rgba(139, 92, 246, 0.15); padding: 0.9rem; border-radius: 6px; margin-bottom: 1rem; border-left: 4px solid #8b5cf6;'>
+<div style='font-size: 0.85rem; font-weight: 600; color: #e2e8f0; margin-bottom: 0.4rem;'>🔬 DISCOVERY METHOD: FULLY AUTONOMOUS</div>
+<div style='font-size: 0.8rem; color: #cbd5e1;'>These entities were discovered purely from data patterns. No predefined templates or examples were used.</div>
+</div>""", unsafe_allow_html=True)
 
-            # Generate academic-focused analysis using hybrid approach
-            academic_analysis = generate_dynamic_visualizations_llm(
-                metrics,
-                df,
-                st.session_state.selected_model,
-                st.session_state.ollama_url,
-                context_type="academic"  # Academic-focused context
-            )
+                    # Display each discovered journey
+                    for journey_idx, journey in enumerate(dynamic_journeys, 1):
+                        # Use different color scheme for dynamic discoveries
+                        color = '#8b5cf6'  # Purple for dynamic discoveries
+                        bg_color = 'rgba(139, 92, 246, 0.1)'
 
-            if academic_analysis:
-                # Display strategic overview
-                st.markdown("### 🎯 Academic Performance Analysis")
-                st.info(academic_analysis.get('strategic_overview', ''))
+                        # Priority colors
+                        priority = journey.get('priority', 5)
+                        if priority >= 8:
+                            priority_color = '#8b5cf6'
+                            priority_label = '🔬 HIGH DISCOVERY'
+                        elif priority >= 6:
+                            priority_color = '#a78bfa'
+                            priority_label = '🔍 MEDIUM DISCOVERY'
+                        else:
+                            priority_color = '#c4b5fd'
+                            priority_label = '💡 STANDARD DISCOVERY'
 
-                st.divider()
+                        # Entity Journey Card Header
+                        with st.expander(f"**{journey_idx}. {journey['entity_name']}** (Discovered: {journey.get('entity_type', 'unknown')}) - {priority_label}", expanded=(journey_idx <= 2)):
+                            # Entity Overview with Discovery Rationale
+                            st.markdown(f"""<div style='background: {bg_color}; padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid {color};'>
+<div style='display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;'>
+    <div>
+        <div style='font-size: 1.2rem; font-weight: 700; color: #e2e8f0; margin-bottom: 0.3rem;'>{journey['entity_name']}</div>
+        <div style='color: #94a3b8; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.5px;'>{journey.get('entity_type', 'discovered_entity').replace('_', ' ')}</div>
+    </div>
+    <div style='text-align: right;'>
+        <div style='background: {priority_color}; color: white; padding: 0.3rem 0.6rem; border-radius: 6px; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.3rem;'>{priority_label}</div>
+        <div style='color: #94a3b8; font-size: 0.75rem;'>Priority {priority}</div>
+    </div>
+</div>
+<div style='color: #cbd5e1; font-size: 0.95rem; line-height: 1.6; margin-top: 0.75rem;'><strong>What is this entity:</strong> {journey.get('description', '')}</div>
+<div style='background: rgba(139, 92, 246, 0.2); padding: 0.8rem; border-radius: 6px; margin-top: 0.75rem; border-left: 3px solid #8b5cf6;'>
+    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>🔍 Discovery Rationale (Why AI identified this as an entity)</div>
+    <div style='color: #cbd5e1; font-size: 0.85rem; font-style: italic;'>{journey.get('discovery_rationale', 'Discovered from data patterns')}</div>
+</div>
+<div style='background: rgba(0,0,0,0.2); padding: 0.8rem; border-radius: 6px; margin-top: 0.75rem;'>
+    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>📊 Entity Metrics</div>
+    <div style='color: #cbd5e1; font-size: 0.85rem;'>
+        <strong>Students:</strong> {journey.get('student_count', 'N/A')} |
+        <strong>Lifecycle Indicators:</strong> {', '.join(journey.get('lifecycle_indicators', ['N/A']))}
+    </div>
+</div>
+</div>""", unsafe_allow_html=True)
 
-                # Display visualizations with insights
-                st.markdown("### 📊 AI-Recommended Academic Visualizations")
-                viz_list = academic_analysis.get('visualizations', [])
-                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} academic visualizations")
+                            # Journey Stages
+                            st.markdown("#### 📋 Discovered Lifecycle Stages")
 
-                for i, viz_spec in enumerate(viz_list):
-                    with st.container():
-                        st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
-                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Academic performance indicator')}")
+                            for stage_idx, stage in enumerate(journey.get('stages', []), 1):
+                                stage_icon = ['🔵', '🟢', '🟡', '🟠', '🔴', '🟣'][min(stage_idx - 1, 5)]
 
-                        # Build and display chart
-                        fig = build_dynamic_chart(viz_spec, df)
-                        if fig:
-                            st.plotly_chart(fig, width='stretch', key=f"academic_viz_{i}")
-                        else:
-                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
+                                st.markdown(f"""<div style='background: rgba(30, 41, 59, 0.6); border: 2px solid {color}; border-radius: 8px; padding: 1.2rem; margin-bottom: 1rem;'>
+<div style='display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.75rem;'>
+    <span style='font-size: 1.5rem;'>{stage_icon}</span>
+    <div style='flex: 1;'>
+        <div style='font-size: 1.1rem; font-weight: 600; color: #e2e8f0;'>Stage {stage.get('stage_order', stage_idx)}: {stage.get('stage_name', 'Unknown Stage')}</div>
+        <div style='color: #94a3b8; font-size: 0.85rem;'>{stage.get('description', '')}</div>
+    </div>
+</div>
 
-                        # Display AI insight
-                        insight = viz_spec.get('insight', '')
-                        if insight:
-                            st.markdown(f"""
-                            <div class="insight-card">
-                                <div class="insight-title">🎓 Academic Insight</div>
-                                <div class="insight-text">{insight}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
+<div style='background: rgba(139, 92, 246, 0.2); padding: 0.8rem; border-radius: 6px; margin-bottom: 0.75rem; border-left: 4px solid #8b5cf6;'>
+    <div style='color: #e2e8f0; font-size: 0.8rem; font-weight: 600; margin-bottom: 0.4rem;'>🔍 Stage Discovery Rationale</div>
+    <div style='color: #cbd5e1; font-size: 0.85rem; font-style: italic;'>{stage.get('discovery_rationale', 'Discovered from data transitions')}</div>
+</div>
 
-                        st.divider()
+<div style='background: rgba(99, 102, 241, 0.15); padding: 0.9rem; border-radius: 6px; margin-bottom: 0.75rem; border-left: 4px solid #6366f1;'>
+    <div style='color: #e2e8f0; font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;'>📖 Stage Narrative</div>
+    <div style='color: #cbd5e1; font-size: 0.95rem; line-height: 1.7;'>{stage.get('narrative_text', 'No narrative available.')}</div>
+</div>
 
-                # Display key findings
-                st.markdown("### 🔍 Key Academic Findings")
-                findings = academic_analysis.get('key_findings', [])
-                for i, finding in enumerate(findings, 1):
-                    st.markdown(f"**Finding {i}:** {finding}")
+<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; margin-bottom: 0.75rem;'>
+    <div style='background: rgba(59, 130, 246, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #3b82f6;'>
+        <div style='color: #60a5fa; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>📊 Key Metrics</div>
+        {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'><strong style='color: #e2e8f0;'>{m.get('metric', '')}:</strong> {m.get('value', '')} <span style='color: #94a3b8; font-size: 0.8rem;'>({m.get('significance', '')})</span></div>" for m in stage.get('key_metrics', [])])}
+    </div>
+    <div style='background: rgba(16, 185, 129, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #10b981;'>
+        <div style='color: #34d399; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>💡 Insights</div>
+        {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'>• {insight}</div>" for insight in stage.get('insights', [])])}
+    </div>
+</div>
+
+<div style='background: rgba(245, 158, 11, 0.15); padding: 0.8rem; border-radius: 6px; border-left: 3px solid #f59e0b;'>
+    <div style='color: #fbbf24; font-size: 0.75rem; font-weight: 600; margin-bottom: 0.5rem; text-transform: uppercase;'>🎯 Recommendations</div>
+    {''.join([f"<div style='color: #cbd5e1; font-size: 0.85rem; margin-bottom: 0.3rem; line-height: 1.5;'>→ {rec}</div>" for rec in stage.get('recommendations', [])])}
+</div>
+</div>""", unsafe_allow_html=True)
+
+                                # Display visualizations if available
+                                visualizations = stage.get('visualizations', [])
+                                if visualizations and LLM_ENTITY_JOURNEY_AVAILABLE:
+                                    # Get entity data for visualization
+                                    entity_data = filter_dataset_for_entity(df, journey)
+
+                                    # Try to generate visualizations first
+                                    successful_viz = []
+                                    for viz_idx, viz_spec in enumerate(visualizations, 1):
+                                        fig = generate_visualization(entity_data, viz_spec)
+                                        if fig:
+                                            successful_viz.append((viz_idx, viz_spec, fig))
+
+                                    # Only show header if we have successful visualizations
+                                    if successful_viz:
+                                        st.markdown("<h4 style='color: #e2e8f0; margin-top: 1.5rem;'>📊 Data Visualizations</h4>", unsafe_allow_html=True)
+                                        st.caption("*AI-selected visualizations for this discovered stage*")
+
+                                        # Display the successful visualizations
+                                        for viz_idx, viz_spec, fig in successful_viz:
+                                            viz_title = viz_spec.get('title', f'Visualization {viz_idx}')
+                                            viz_desc = viz_spec.get('description', '')
+                                            viz_purpose = viz_spec.get('chart_purpose', '')
 
-                st.divider()
+                                            st.markdown(f"""<div style='background: rgba(139, 92, 246, 0.15); padding: 0.8rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #8b5cf6;'>
+                                                <div style='font-size: 0.9rem; font-weight: 600; color: #e2e8f0; margin-bottom: 0.3rem;'>{viz_title}</div>
+                                                <div style='font-size: 0.8rem; color: #cbd5e1;'>{viz_desc}</div>
+                                                {f"<div style='font-size: 0.8rem; color: #a5b4fc; margin-top: 0.3rem; font-style: italic;'>💡 {viz_purpose}</div>" if viz_purpose else ''}
+                                                </div>""", unsafe_allow_html=True)
+                                            st.plotly_chart(fig, width='stretch', key=f"dyn_viz_{journey_idx}_{stage_idx}_{viz_idx}")
 
-                # Display recommendations
-                st.markdown("### 💡 Academic Intervention Recommendations")
-                recommendations = academic_analysis.get('recommendations', [])
+                    st.markdown("---")
+                    st.success(f"✅ All {len(dynamic_journeys)} dynamically discovered journeys loaded successfully!")
 
-                for i, rec in enumerate(recommendations, 1):
-                    # Color code by priority (first = high priority)
-                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
+            else:
+                # Show prompt to discover entities
+                st.info("💡 Click 'Discover Entities Autonomously' to let the AI analyze your data with ZERO predefined templates")
 
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="recommendation-card">
-                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
-                            <div class="recommendation-text">{rec}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                # Comparison: Guided vs Fully Dynamic
+                st.markdown("### 🆚 Guided vs Fully Dynamic Discovery")
 
-        elif not st.session_state.ollama_connected:
-            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered academic analysis.")
+                col1, col2 = st.columns(2)
 
-    # ====================================================================================
-    # TAB 6: HOUSING INSIGHTS - AI-DRIVEN
-    # ====================================================================================
-    with tabs[5]:
-        st.header("🏠 Housing Insights - AI-Driven Deep Analysis")
-        st.caption("The AI analyzes housing patterns, occupancy trends, and their impact on student success")
+                with col1:
+                    st.markdown("""
+                    **📖 Guided Discovery (Tab 2)**
+                    - AI gets examples: "Student Journey", "Program Lifecycle", "Aid Journey"
+                    - Follows proven patterns
+                    - Predictable, consistent results
+                    - Best for: Standard institutional analysis
+                    """)
 
-        # Check for housing data
-        housing_col = None
-        for col in ['room_number', 'housing_status', 'residence_hall', 'housing', 'residence', 'dormitory']:
-            if col in df.columns:
-                housing_col = col
-                break
+                with col2:
+                    st.markdown("""
+                    **🔬 Fully Dynamic Discovery (This Tab)**
+                    - AI gets ZERO examples or templates
+                    - Discovers entities purely from data patterns
+                    - Unexpected, unique discoveries
+                    - Best for: Finding hidden patterns specific to YOUR data
+                    """)
 
-        if housing_col:
-            on_campus = df[df[housing_col].notna()].shape[0]
-            off_campus = df[df[housing_col].isna()].shape[0]
-            housing_utilization = (on_campus / len(df) * 100) if len(df) > 0 else 0
+                st.markdown("---")
 
-            # Calculate housing impact on GPA if GPA column exists
-            gpa_col = None
-            for col in ['gpa', 'cumulative_gpa', 'cgpa']:
-                if col in df.columns:
-                    gpa_col = col
-                    break
+                st.markdown("### 🎯 What AI Might Discover")
+                st.markdown("""
+                Without predefined templates, the AI could discover unique entities like:
+                - **Payment Pattern Clusters** - Students grouped by payment behavior
+                - **Performance Trajectory Groups** - Students following similar GPA patterns
+                - **Aid-to-Success Pathways** - Different aid effectiveness patterns
+                - **Engagement Level Segments** - Students with different participation patterns
+                - **Market Risk Portfolios** - Nationality combinations affecting revenue stability
+                - **Capacity Utilization Zones** - Facility usage patterns
 
-            on_campus_gpa = 0
-            off_campus_gpa = 0
-            if gpa_col:
-                on_campus_gpa = df[df[housing_col].notna()][gpa_col].mean()
-                off_campus_gpa = df[df[housing_col].isna()][gpa_col].mean()
+                **The AI will discover what's ACTUALLY in your data, not what we expect to find!**
+                """)
 
-            # Housing-focused metrics
-            col1, col2, col3, col4 = st.columns(4)
 
-            with col1:
-                st.metric("On-Campus Residents", f"{on_campus:,}",
-                         f"{housing_utilization:.1f}%")
+    # TAB 3: DATA STORYTELLING - COMPLETE JOURNEY STORIES (PreDefined+LLM Narrative)
+    # ====================================================================================
+    with tabs[3]:
+        st.header("📚 Complete Journey Stories - PreDefined Structure + AI Narratives")
+        st.caption("Comprehensive analytics with pre-defined journeys enriched by LLM-generated narratives")
 
-            with col2:
-                st.metric("Off-Campus Students", f"{off_campus:,}",
-                         f"{(off_campus/len(df)*100):.1f}%")
+        if not st.session_state.ollama_connected:
+            st.warning("⚠️ Connect to Ollama to generate journey narratives")
+        else:
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #7c3aed 0%, #a78bfa 100%); padding: 2rem; border-radius: 12px; margin: 2rem 0;'>
+                <h2 style='margin: 0; color: white; display: flex; align-items: center; gap: 0.75rem;'>
+                    📚 Complete Journey Stories
+                    <span style='background: rgba(255,255,255,0.2); padding: 0.35rem 1rem; border-radius: 20px; font-size: 0.65rem; font-weight: normal;'>COMPREHENSIVE ANALYTICS</span>
+                </h2>
+                <p style='margin: 0.75rem 0 0 0; color: #e9d5ff; font-size: 1rem; line-height: 1.6;'>
+                    📖 Deep-dive into 6 comprehensive journeys with detailed stories, metrics, insights, and action plans<br>
+                    🤖 AI-powered narratives combined with precise metric calculations<br>
+                    💼 Executive-ready business context, ROI analysis, and strategic recommendations
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
 
-            with col3:
-                if gpa_col and on_campus_gpa > 0:
-                    st.metric("On-Campus Avg GPA", f"{on_campus_gpa:.2f}",
-                             delta=f"{on_campus_gpa - off_campus_gpa:+.2f}" if off_campus_gpa > 0 else None)
-                else:
-                    st.metric("Housing Utilization", f"{housing_utilization:.1f}%")
+            if not JOURNEY_MODULES_AVAILABLE:
+                st.error("❌ Journey modules not available. Please ensure journey_definitions.py, journey_metrics.py, journey_narratives.py, and journey_assembler.py are in the same directory.")
+            else:
+                # Validate dataset
+                is_valid, missing_fields, journey_validation = validate_dataset_for_journeys(df)
 
-            with col4:
-                if gpa_col and off_campus_gpa > 0:
-                    st.metric("Off-Campus Avg GPA", f"{off_campus_gpa:.2f}",
-                             delta=f"{off_campus_gpa - on_campus_gpa:+.2f}" if on_campus_gpa > 0 else None)
-                else:
-                    # Count unique residence halls if available
-                    unique_residences = df[housing_col].nunique()
-                    st.metric("Residence Options", f"{unique_residences:,}")
+                if not is_valid:
+                    st.warning(f"⚠️ Dataset is missing some required fields for complete journey generation: {', '.join(missing_fields)}")
+                    st.caption("Some journeys may have incomplete data. The system will work with available fields.")
 
-            st.divider()
+                # Generation button
+                col_gen1, col_gen2 = st.columns([3, 1])
+                with col_gen1:
+                    if st.button("🚀 Generate Complete Journey Stories (All 6 Journeys)", key="generate_complete_journeys", type="primary", width='stretch'):
+                        # Progress container
+                        progress_container = st.empty()
+                        status_container = st.empty()
 
-            # AI Analysis Button
-            if st.session_state.ollama_connected and st.button("🤖 Generate Housing Impact Analysis & Visualizations", key="housing_btn", type="primary", width='stretch'):
+                        def progress_callback(stage, current, total, message):
+                            """Update progress display"""
+                            if stage == 'validation':
+                                progress_container.progress(5)
+                                status_container.info(f"🔍 {message}")
+                            elif stage == 'metrics':
+                                progress = 5 + int((current / total) * 15)
+                                progress_container.progress(progress)
+                                status_container.info(f"📊 Calculating metrics: {current}/{total} stories")
+                            elif stage == 'narratives':
+                                progress = 20 + int((current / total) * 70)
+                                progress_container.progress(progress)
+                                status_container.info(f"✍️ Generating narratives: {current}/{total} components - {message}")
+                            elif stage == 'assembly':
+                                progress = 90 + int((current / total) * 10)
+                                progress_container.progress(progress)
+                                status_container.info(f"🔧 Assembling journeys: {current}/{total}")
+                            elif stage == 'error':
+                                status_container.error(f"❌ {message}")
 
-                # Generate housing-focused analysis using hybrid approach
-                housing_analysis = generate_dynamic_visualizations_llm(
-                    metrics,
-                    df,
-                    st.session_state.selected_model,
-                    st.session_state.ollama_url,
-                    context_type="housing"  # Housing-focused context
-                )
+                        with st.spinner("🤖 Generating complete journeys... This may take 5-15 minutes depending on LLM speed"):
+                            from journey_assembler import generate_all_journeys
 
-                if housing_analysis:
-                    # Display strategic overview
-                    st.markdown("### 🏠 Housing Impact Analysis")
-                    st.info(housing_analysis.get('strategic_overview', ''))
+                            # Generate all journeys
+                            journeys, metadata = generate_all_journeys(
+                                df,
+                                query_ollama,
+                                model,
+                                url,
+                                temperature=0.4,
+                                timeout=180,
+                                progress_callback=progress_callback
+                            )
 
-                    st.divider()
+                            # Store in session state
+                            st.session_state.complete_journeys = journeys
+                            st.session_state.journey_generation_metadata = metadata
 
-                    # Display visualizations with insights
-                    st.markdown("### 📊 AI-Recommended Housing Visualizations")
-                    viz_list = housing_analysis.get('visualizations', [])
-                    st.caption(f"The AI analyzed your data and recommends {len(viz_list)} housing-related visualizations")
+                            progress_container.progress(100)
 
-                    for i, viz_spec in enumerate(viz_list):
-                        with st.container():
-                            st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
-                            st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Housing performance indicator')}")
+                            if metadata.get('success'):
+                                duration = metadata.get('duration_seconds', 0)
+                                minutes = int(duration // 60)
+                                seconds = int(duration % 60)
 
-                            # Build and display chart
-                            fig = build_dynamic_chart(viz_spec, df)
-                            if fig:
-                                st.plotly_chart(fig, width='stretch', key=f"housing_viz_{i}")
+                                status_container.success(f"""
+                                ✅ **All journeys generated successfully!**
+                                - **{len(journeys)}** complete journeys
+                                - **{metadata['assembly']['total_stories']}** stories with full narratives
+                                - **{metadata['metrics']['total_metrics_calculated']}** metrics calculated
+                                - **{metadata['narratives']['total_components_generated']}** narrative components generated
+                                - **Time:** {minutes}m {seconds}s
+                                """)
                             else:
-                                st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
-
-                            # Display AI insight
-                            insight = viz_spec.get('insight', '')
-                            if insight:
-                                st.markdown(f"""
-                                <div class="insight-card">
-                                    <div class="insight-title">🏠 Housing Insight</div>
-                                    <div class="insight-text">{insight}</div>
-                                </div>
-                                """, unsafe_allow_html=True)
-
-                            st.divider()
+                                status_container.error(f"❌ Generation failed: {', '.join(metadata.get('errors', ['Unknown error']))}")
 
-                    # Display key findings
-                    st.markdown("### 🔍 Key Housing Findings")
-                    findings = housing_analysis.get('key_findings', [])
-                    for i, finding in enumerate(findings, 1):
-                        st.markdown(f"**Finding {i}:** {finding}")
+                with col_gen2:
+                    if st.session_state.complete_journeys:
+                        if st.button("🗑️ Clear", key="clear_journeys"):
+                            st.session_state.complete_journeys = None
+                            st.session_state.journey_generation_metadata = None
+                            st.rerun()
 
-                    st.divider()
+                # Display complete journeys if available
+                if st.session_state.complete_journeys:
+                    journeys = st.session_state.complete_journeys
 
-                    # Display recommendations
-                    st.markdown("### 💡 Housing Strategy Recommendations")
-                    recommendations = housing_analysis.get('recommendations', [])
+                    st.markdown("---")
 
-                    for i, rec in enumerate(recommendations, 1):
-                        # Color code by priority (first = high priority)
-                        priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
+                    # Create tabs for each journey
+                    journey_tabs = st.tabs([
+                        "📊 Journey 1: Enrollment",
+                        "💰 Journey 2: Revenue",
+                        "🏢 Journey 3: Operations",
+                        "🎓 Journey 4: Academics",
+                        "🎯 Journey 5: Retention",
+                        "⚠️ Journey 6: Risk"
+                    ])
 
-                        with st.container():
+                    # Display each journey in its tab
+                    for tab_idx, (journey_tab, journey) in enumerate(zip(journey_tabs, journeys)):
+                        with journey_tab:
+                            # Journey header
                             st.markdown(f"""
-                            <div class="recommendation-card">
-                                <div class="recommendation-priority">{priority_color} Priority {i}</div>
-                                <div class="recommendation-text">{rec}</div>
+                            <div style='background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;'>
+                                <h2 style='margin: 0; color: white;'>{journey['name']}</h2>
+                                <p style='margin: 0.5rem 0 0 0; color: #ddd6fe; font-size: 0.95rem;'>{journey['subtitle']}</p>
+                                <div style='margin-top: 1rem; display: flex; gap: 1rem;'>
+                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
+                                        📖 {journey['story_count']} Stories
+                                    </span>
+                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
+                                        📊 {journey['total_metrics_calculated']} Metrics
+                                    </span>
+                                    <span style='background: rgba(255,255,255,0.2); padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.85rem;'>
+                                        ✅ {'Complete' if journey['is_complete'] else 'Partial'}
+                                    </span>
+                                </div>
                             </div>
                             """, unsafe_allow_html=True)
 
-            elif not st.session_state.ollama_connected:
-                st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered housing analysis.")
-        else:
-            st.info("Housing data not available in current dataset. Please ensure your dataset includes housing-related columns (e.g., 'room_number', 'housing_status', 'residence_hall').")
-
-    # ====================================================================================
-    # TAB 7: FINANCIAL INTELLIGENCE - AI-DRIVEN
-    # ====================================================================================
-    with tabs[6]:
-        st.header("💰 Financial Intelligence - AI-Driven Deep Analysis")
-        st.caption("The AI analyzes financial sustainability, aid effectiveness, and revenue optimization strategies")
-
-        # Check for financial data
-        aid_col = None
-        for col in ['financial_aid_monetary_amount', 'financial_aid', 'aid', 'scholarship', 'scholarship_amount']:
-            if col in df.columns:
-                aid_col = col
-                break
+                            # JOURNEY-LEVEL VISUALIZATIONS - Most Important Metrics
+                            st.markdown("""
+                            <div style='background: linear-gradient(135deg, rgba(59, 130, 246, 0.15), rgba(99, 102, 241, 0.15));
+                                        padding: 1.5rem; border-radius: 10px; margin: 2rem 0 1.5rem 0;
+                                        border-left: 5px solid #3b82f6;'>
+                                <h2 style='margin: 0 0 0.5rem 0; color: #1e293b; font-size: 1.5rem;'>
+                                    📊 Journey Insights - Key Metrics Overview
+                                </h2>
+                                <p style='margin: 0; color: #475569; font-size: 0.95rem; line-height: 1.6;'>
+                                    Visual analytics showing the most important performance indicators for this journey.
+                                    These metrics provide a comprehensive view of key trends, patterns, and opportunities.
+                                </p>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-        tuition_col = None
-        for col in ['tuition_fees', 'tuition', 'fees', 'annual_tuition']:
-            if col in df.columns:
-                tuition_col = col
-                break
+                            # Create 2 rows of 3 columns for 4-6 key metrics per journey
+                            viz_row1 = st.columns(3)
+                            viz_row2 = st.columns(3)
 
-        # Calculate financial metrics
-        total_tuition = metrics.get('total_tuition', 0)
-        total_aid = metrics.get('total_aid', 0)
-        aid_coverage_pct = (total_aid / total_tuition * 100) if total_tuition > 0 else 0
+                            # JOURNEY 1: ENROLLMENT
+                            if tab_idx == 0:
+                                st.markdown("""
+                                <div style='background: rgba(59, 130, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #3b82f6;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📈 Diversity & Demographics Analysis</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Distribution of students by nationality, region, and enrollment status</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-        aid_recipients = 0
-        avg_aid_amount = 0
-        net_revenue = total_tuition - total_aid
+                                with viz_row1[0]:
+                                    if 'nationality' in df.columns:
+                                        st.caption("🌍 **Nationality Distribution**")
+                                        nat_counts = df['nationality'].value_counts().head(10)
+                                        fig = create_plotly_chart("bar", {"x": nat_counts.index.tolist(), "y": nat_counts.values.tolist()}, "Top 10 Nationalities")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_nat")
 
-        if aid_col and aid_col in df.columns:
-            aid_recipients = df[df[aid_col] > 0].shape[0]
-            avg_aid_amount = df[df[aid_col] > 0][aid_col].mean() if aid_recipients > 0 else 0
+                                with viz_row1[1]:
+                                    if 'nationality' in df.columns:
+                                        st.caption("🇦🇪 **UAE vs International Mix**")
+                                        uae_count = len(df[df['nationality'] == 'United Arab Emirates'])
+                                        intl_count = len(df) - uae_count
+                                        fig = create_plotly_chart("pie", {"labels": ["UAE Nationals", "International"], "values": [uae_count, intl_count]}, "UAE vs International Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_uae_intl")
 
-        # Financial-focused metrics
-        col1, col2, col3, col4 = st.columns(4)
+                                with viz_row1[2]:
+                                    if 'enrollment_enrollment_status' in df.columns:
+                                        st.caption("📋 **Student Status**")
+                                        status_counts = df['enrollment_enrollment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Enrollment Status")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_status")
 
-        with col1:
-            st.metric("Total Tuition", f"AED {total_tuition:,.0f}",
-                     help="Gross tuition revenue from all students")
+                                st.markdown("""
+                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin: 1.5rem 0 1rem 0; border-left: 4px solid #8b5cf6;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📊 Enrollment Trends & Program Performance</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Growth patterns by cohort, gender balance, and program popularity</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-        with col2:
-            st.metric("Financial Aid", f"AED {total_aid:,.0f}",
-                     delta=f"-{aid_coverage_pct:.1f}%",
-                     delta_color="inverse",
-                     help="Total aid distributed to students")
+                                with viz_row2[0]:
+                                    if 'cohort_year' in df.columns:
+                                        st.caption("📅 **Cohort Trends Over Time**")
+                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
+                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Enrollment Trends by Cohort")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort")
 
-        with col3:
-            st.metric("Net Revenue", f"AED {net_revenue:,.0f}",
-                     help="Tuition revenue after aid distribution")
+                                with viz_row2[1]:
+                                    if 'gender' in df.columns:
+                                        st.caption("⚖️ **Gender Balance**")
+                                        gender_counts = df['gender'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": gender_counts.index.tolist(), "values": gender_counts.values.tolist()}, "Gender Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gender")
 
-        with col4:
-            if aid_recipients > 0:
-                st.metric("Aid Recipients", f"{aid_recipients:,}",
-                         f"{(aid_recipients/len(df)*100):.1f}%",
-                         help="Students receiving financial aid")
-            else:
-                st.metric("Aid Coverage", f"{aid_coverage_pct:.1f}%",
-                         help="Aid as percentage of tuition revenue")
+                                with viz_row2[2]:
+                                    if 'current_program' in df.columns:
+                                        st.caption("🎓 **Most Popular Programs**")
+                                        prog_counts = df['current_program'].value_counts().head(8)
+                                        fig = create_plotly_chart("bar", {"x": prog_counts.index.tolist(), "y": prog_counts.values.tolist()}, "Top Programs by Enrollment")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_programs")
 
-        st.divider()
+                            # JOURNEY 2: REVENUE
+                            elif tab_idx == 1:
+                                # Try multiple column name variations for tuition
+                                tuition_col = None
+                                for col_name in ['Total_Tuition', 'total_tuition', 'tuition', 'Tuition', 'tuition_fees', 'fees']:
+                                    if col_name in df.columns:
+                                        tuition_col = col_name
+                                        break
 
-        # AI Analysis Button
-        if st.session_state.ollama_connected and st.button("🤖 Generate Financial Sustainability Analysis & Visualizations", key="finance_btn", type="primary", width='stretch'):
+                                # Try multiple column name variations for aid
+                                aid_col = None
+                                for col_name in ['Total_Aid', 'total_aid', 'aid', 'Aid', 'financial_aid', 'scholarship']:
+                                    if col_name in df.columns:
+                                        aid_col = col_name
+                                        break
 
-            # Generate financial-focused analysis using hybrid approach
-            financial_analysis = generate_dynamic_visualizations_llm(
-                metrics,
-                df,
-                st.session_state.selected_model,
-                st.session_state.ollama_url,
-                context_type="financial"  # Financial-focused context
-            )
+                                st.markdown("""
+                                <div style='background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #10b981;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>💰 Revenue Distribution & Financial Aid Analysis</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Revenue sources, tuition patterns, and financial aid allocation</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-            if financial_analysis:
-                # Display strategic overview
-                st.markdown("### 💰 Financial Sustainability Analysis")
-                st.info(financial_analysis.get('strategic_overview', ''))
+                                with viz_row1[0]:
+                                    if tuition_col and 'nationality' in df.columns:
+                                        st.caption("🌍 **Revenue by Nationality**")
+                                        rev_by_nat = df.groupby('nationality')[tuition_col].sum().sort_values(ascending=False).head(10)
+                                        fig = create_plotly_chart("bar", {"x": rev_by_nat.index.tolist(), "y": rev_by_nat.values.tolist()}, "Revenue by Nationality")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_rev_nat")
+                                    elif 'nationality' in df.columns:
+                                        # Fallback: show nationality distribution
+                                        nat_counts = df['nationality'].value_counts().head(10)
+                                        fig = create_plotly_chart("bar", {"x": nat_counts.index.tolist(), "y": nat_counts.values.tolist()}, "Student Distribution by Nationality")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_nat_dist")
 
-                st.divider()
+                                with viz_row1[1]:
+                                    if tuition_col:
+                                        st.caption("💵 **Tuition Fee Range**")
+                                        fig = create_plotly_chart("histogram", {"values": df[tuition_col].dropna()}, "Tuition Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_tuition_dist")
+                                    elif 'cohort_year' in df.columns:
+                                        st.caption("📅 **Students by Cohort**")
+                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
+                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Students by Cohort")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort_fb")
 
-                # Display visualizations with insights
-                st.markdown("### 📊 AI-Recommended Financial Visualizations")
-                viz_list = financial_analysis.get('visualizations', [])
-                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} financial visualizations")
+                                with viz_row1[2]:
+                                    if aid_col:
+                                        st.caption("🎓 **Financial Aid Coverage**")
+                                        aid_recipients = len(df[df[aid_col] > 0])
+                                        no_aid = len(df[df[aid_col] == 0])
+                                        fig = create_plotly_chart("pie", {"labels": ["With Financial Aid", "No Aid"], "values": [aid_recipients, no_aid]}, "Financial Aid Recipients")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_aid")
+                                    elif 'enrollment_enrollment_status' in df.columns:
+                                        # Fallback: show enrollment status
+                                        status_counts = df['enrollment_enrollment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Enrollment Status")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_status_fb")
 
-                for i, viz_spec in enumerate(viz_list):
-                    with st.container():
-                        st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
-                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Financial performance indicator')}")
+                                st.markdown("**📊 Program Performance & Payment Status**")
+                                with viz_row2[0]:
+                                    if tuition_col and 'current_program' in df.columns:
+                                        rev_by_prog = df.groupby('current_program')[tuition_col].sum().sort_values(ascending=False).head(8)
+                                        fig = create_plotly_chart("bar", {"x": rev_by_prog.index.tolist(), "y": rev_by_prog.values.tolist()}, "Revenue by Program")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_rev_prog")
+                                    elif 'current_program' in df.columns:
+                                        # Fallback: show program enrollment
+                                        prog_counts = df['current_program'].value_counts().head(8)
+                                        fig = create_plotly_chart("bar", {"x": prog_counts.index.tolist(), "y": prog_counts.values.tolist()}, "Students by Program")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_prog_fb")
 
-                        # Build and display chart
-                        fig = build_dynamic_chart(viz_spec, df)
-                        if fig:
-                            st.plotly_chart(fig, width='stretch', key=f"financial_viz_{i}")
-                        else:
-                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
+                                with viz_row2[1]:
+                                    if 'payment_status' in df.columns:
+                                        pay_counts = df['payment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": pay_counts.index.tolist(), "values": pay_counts.values.tolist()}, "Payment Status Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_payment")
+                                    elif 'gender' in df.columns:
+                                        # Fallback: show gender distribution
+                                        gender_counts = df['gender'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": gender_counts.index.tolist(), "values": gender_counts.values.tolist()}, "Gender Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gender_fb")
 
-                        # Display AI insight
-                        insight = viz_spec.get('insight', '')
-                        if insight:
-                            st.markdown(f"""
-                            <div class="insight-card">
-                                <div class="insight-title">💰 Financial Insight</div>
-                                <div class="insight-text">{insight}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            # JOURNEY 3: OPERATIONS
+                            elif tab_idx == 2:
+                                st.markdown("""
+                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #8b5cf6;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>⚙️ Operational Metrics & Cohort Analysis</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Student operational status, cohort distribution, and institutional capacity planning</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-                        st.divider()
+                                with viz_row1[0]:
+                                    if 'enrollment_enrollment_status' in df.columns:
+                                        st.caption("📊 **Operational Status Distribution**")
+                                        status_counts = df['enrollment_enrollment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Operational Status")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_op_status")
 
-                # Display key findings
-                st.markdown("### 🔍 Key Financial Findings")
-                findings = financial_analysis.get('key_findings', [])
-                for i, finding in enumerate(findings, 1):
-                    st.markdown(f"**Finding {i}:** {finding}")
+                                with viz_row1[1]:
+                                    if 'cohort_year' in df.columns:
+                                        st.caption("📅 **Students by Cohort Year**")
+                                        cohort_counts = df['cohort_year'].value_counts().sort_index()
+                                        fig = create_plotly_chart("bar", {"x": cohort_counts.index.tolist(), "y": cohort_counts.values.tolist()}, "Students by Cohort")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_cohort_ops")
 
-                st.divider()
+                            # JOURNEY 4: ACADEMICS
+                            elif tab_idx == 3:
+                                st.markdown("""
+                                <div style='background: rgba(245, 158, 11, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #f59e0b;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>🎓 Academic Performance Overview</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>GPA distribution, performance tiers, and program excellence analysis</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-                # Display recommendations
-                st.markdown("### 💡 Financial Strategy Recommendations")
-                recommendations = financial_analysis.get('recommendations', [])
+                                with viz_row1[0]:
+                                    if 'cumulative_gpa' in df.columns:
+                                        st.caption("📊 **Overall GPA Distribution**")
+                                        fig = create_plotly_chart("histogram", {"values": df['cumulative_gpa'].dropna()}, "GPA Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_dist")
 
-                for i, rec in enumerate(recommendations, 1):
-                    # Color code by priority (first = high priority)
-                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
+                                with viz_row1[1]:
+                                    if 'cumulative_gpa' in df.columns:
+                                        st.caption("🎯 **Performance Tiers**")
+                                        high = len(df[df['cumulative_gpa'] >= 3.5])
+                                        mid = len(df[(df['cumulative_gpa'] >= 2.5) & (df['cumulative_gpa'] < 3.5)])
+                                        low = len(df[df['cumulative_gpa'] < 2.5])
+                                        fig = create_plotly_chart("pie", {"labels": ["High Performers (≥3.5)", "Mid Performers (2.5-3.5)", "At Risk (<2.5)"], "values": [high, mid, low]}, "Performance Tiers")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_perf_tiers")
 
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="recommendation-card">
-                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
-                            <div class="recommendation-text">{rec}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                                with viz_row1[2]:
+                                    if 'cumulative_gpa' in df.columns and 'current_program' in df.columns:
+                                        st.caption("🏆 **Top Performing Programs**")
+                                        gpa_by_prog = df.groupby('current_program')['cumulative_gpa'].mean().sort_values(ascending=False).head(8)
+                                        fig = create_plotly_chart("bar", {"x": gpa_by_prog.index.tolist(), "y": gpa_by_prog.values.tolist()}, "Average GPA by Program")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_prog")
 
-        elif not st.session_state.ollama_connected:
-            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered financial analysis.")
+                                st.markdown("""
+                                <div style='background: rgba(139, 92, 246, 0.1); padding: 0.75rem; border-radius: 8px; margin: 1.5rem 0 1rem 0; border-left: 4px solid #8b5cf6;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>📊 Performance by Demographics & Workload</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Achievement patterns across nationalities and credit hour loads</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-    # ====================================================================================
-    # TAB 8: DEMOGRAPHICS DEEP DIVE - AI-DRIVEN
-    # ====================================================================================
-    with tabs[7]:
-        st.header("👥 Demographics Deep Dive - AI-Driven Deep Analysis")
-        st.caption("The AI analyzes diversity patterns, market concentration risks, and inclusion strategies")
+                                with viz_row2[0]:
+                                    if 'cumulative_gpa' in df.columns and 'nationality' in df.columns:
+                                        st.caption("🌍 **GPA by Nationality**")
+                                        gpa_by_nat = df.groupby('nationality')['cumulative_gpa'].mean().sort_values(ascending=False).head(10)
+                                        fig = create_plotly_chart("bar", {"x": gpa_by_nat.index.tolist(), "y": gpa_by_nat.values.tolist()}, "Average GPA by Nationality")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_gpa_nat")
 
-        # Check for demographic data
-        nationality_col = None
-        for col in ['nationality', 'country', 'citizenship', 'origin']:
-            if col in df.columns:
-                nationality_col = col
-                break
+                                with viz_row2[1]:
+                                    if 'total_credit_hours' in df.columns:
+                                        st.caption("📚 **Student Workload**")
+                                        fig = create_plotly_chart("histogram", {"values": df['total_credit_hours'].dropna()}, "Credit Hours Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_credits")
 
-        gender_col = None
-        for col in ['gender', 'sex']:
-            if col in df.columns:
-                gender_col = col
-                break
+                            # JOURNEY 5: RETENTION
+                            elif tab_idx == 4:
+                                st.markdown("""
+                                <div style='background: rgba(34, 197, 94, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #22c55e;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>🎯 Retention & Persistence Indicators</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Student enrollment continuity, academic standing, and retention risk factors</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-        # Calculate demographic metrics
-        unique_nationalities = metrics.get('unique_nationalities', 0)
-        uae_nationals = metrics.get('uae_nationals', 0)
-        uae_percentage = metrics.get('uae_percentage', 0)
-        international_students = metrics.get('total_students', 0) - uae_nationals
+                                with viz_row1[0]:
+                                    if 'enrollment_enrollment_status' in df.columns:
+                                        st.caption("📊 **Student Enrollment Status**")
+                                        status_counts = df['enrollment_enrollment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": status_counts.index.tolist(), "values": status_counts.values.tolist()}, "Student Status")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_retention_status")
 
-        # Calculate top 3 concentration if nationality column available
-        top_3_concentration = 0
-        if nationality_col and nationality_col in df.columns:
-            top_nat = df[nationality_col].value_counts().head(3)
-            top_3_concentration = (top_nat.sum() / len(df) * 100) if len(df) > 0 else 0
+                                with viz_row1[1]:
+                                    if 'cumulative_gpa' in df.columns:
+                                        st.caption("📈 **Academic Performance Distribution**")
+                                        fig = create_plotly_chart("histogram", {"values": df['cumulative_gpa'].dropna()}, "GPA Distribution")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_retention_gpa")
 
-        # Gender distribution if available
-        gender_distribution = {}
-        if gender_col and gender_col in df.columns:
-            gender_counts = df[gender_col].value_counts()
-            gender_distribution = {str(k): int(v) for k, v in gender_counts.items()}
+                            # JOURNEY 6: RISK
+                            elif tab_idx == 5:
+                                st.markdown("""
+                                <div style='background: rgba(239, 68, 68, 0.1); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #ef4444;'>
+                                    <div style='font-weight: 600; color: #1e293b; font-size: 0.95rem;'>⚠️ Risk Assessment & Early Warning Indicators</div>
+                                    <div style='font-size: 0.85rem; color: #475569; margin-top: 0.25rem;'>Academic performance risk, financial obligations, and student success predictors</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-        # Demographics-focused metrics
-        col1, col2, col3, col4 = st.columns(4)
+                                with viz_row1[0]:
+                                    if 'cumulative_gpa' in df.columns:
+                                        st.caption("📉 **Academic Risk Levels**")
+                                        at_risk = len(df[df['cumulative_gpa'] < 2.5])
+                                        ok = len(df[df['cumulative_gpa'] >= 2.5])
+                                        fig = create_plotly_chart("pie", {"labels": ["At Risk (<2.5 GPA)", "Acceptable (≥2.5)"], "values": [at_risk, ok]}, "Academic Risk Assessment")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_risk_gpa")
 
-        with col1:
-            st.metric("Total Nationalities", f"{unique_nationalities}",
-                     help="Number of different nationalities represented")
+                                with viz_row1[1]:
+                                    if 'payment_status' in df.columns:
+                                        st.caption("💳 **Payment Status & Financial Risk**")
+                                        pay_counts = df['payment_status'].value_counts()
+                                        fig = create_plotly_chart("pie", {"labels": pay_counts.index.tolist(), "values": pay_counts.values.tolist()}, "Payment Risk")
+                                        st.plotly_chart(fig, width='stretch', key=f"journey_{tab_idx}_risk_payment")
 
-        with col2:
-            st.metric("UAE Nationals", f"{uae_nationals:,}",
-                     f"{uae_percentage:.1f}%",
-                     help="UAE national students")
+                            st.markdown("<br>", unsafe_allow_html=True)
+                            st.markdown("""
+                            <div style='background: linear-gradient(135deg, rgba(139, 92, 246, 0.15), rgba(168, 85, 247, 0.15));
+                                        padding: 1.5rem; border-radius: 10px; margin: 2rem 0 1.5rem 0;
+                                        border-left: 5px solid #8b5cf6;'>
+                                <h2 style='margin: 0 0 0.5rem 0; color: #1e293b; font-size: 1.5rem;'>
+                                    📖 Journey Stories - Detailed Narratives
+                                </h2>
+                                <p style='margin: 0; color: #475569; font-size: 0.95rem; line-height: 1.6;'>
+                                    AI-generated narratives providing business context, strategic insights, and actionable recommendations
+                                    for each aspect of this journey. Expand each story to explore detailed analysis.
+                                </p>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-        with col3:
-            st.metric("International Students", f"{international_students:,}",
-                     f"{(international_students/metrics.get('total_students', 1)*100):.1f}%",
-                     help="Non-UAE international students")
+                            # Import html for escaping (once per journey)
+                            import html
 
-        with col4:
-            if top_3_concentration > 0:
-                risk_level = "🔴 High" if top_3_concentration > 60 else "🟠 Moderate" if top_3_concentration > 50 else "🟢 Low"
-                st.metric("Top 3 Concentration", f"{top_3_concentration:.1f}%",
-                         help=f"Concentration risk: {risk_level}")
-            elif len(gender_distribution) > 0:
-                most_common_gender = max(gender_distribution, key=gender_distribution.get)
-                st.metric("Gender Balance", f"{most_common_gender}: {gender_distribution[most_common_gender]:,}",
-                         help="Gender distribution")
-            else:
-                st.metric("Diversity Index", f"{unique_nationalities}",
-                         help="Number of nationalities")
+                            # Display each story
+                            for story_idx, story in enumerate(journey['stories'], 1):
+                                with st.expander(f"📄 Story {story_idx}: {story['title']}", expanded=(story_idx == 1)):
+                                    # Story subtitle
+                                    if story.get('subtitle'):
+                                        st.caption(f"*{story['subtitle']}*")
 
-        st.divider()
+                                    st.markdown("---")
 
-        # AI Analysis Button
-        if st.session_state.ollama_connected and st.button("🤖 Generate Diversity & Inclusion Analysis & Visualizations", key="demo_btn", type="primary", width='stretch'):
+                                    # VISUAL FLOW DIAGRAM - Story Analysis
+                                    st.markdown("#### 📊 Story Analysis Flow")
 
-            # Generate demographics-focused analysis using hybrid approach
-            demographics_analysis = generate_dynamic_visualizations_llm(
-                metrics,
-                df,
-                st.session_state.selected_model,
-                st.session_state.ollama_url,
-                context_type="demographics"  # Demographics-focused context
-            )
+                                    # Extract and escape content properly
+                                    opening = html.escape(story.get('opening_narrative', 'N/A')[:200].replace('\n', ' ').replace('  ', ' '))
+                                    insights = html.escape(story.get('data_insights', 'Key data patterns and trends identified')[:180].replace('\n', ' ').replace('  ', ' '))
+                                    impact = html.escape(story.get('business_impact', 'N/A')[:180].replace('\n', ' ').replace('  ', ' '))
+                                    action = html.escape(story.get('action_plan', 'Strategic recommendations')[:180].replace('\n', ' ').replace('  ', ' '))
 
-            if demographics_analysis:
-                # Display strategic overview
-                st.markdown("### 🌍 Diversity & Inclusion Analysis")
-                st.info(demographics_analysis.get('strategic_overview', ''))
+                                    # Stage 1: Current Situation
+                                    st.markdown(f"""
+                                    <div style='background: linear-gradient(135deg, #3b82f6, #2563eb); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3); margin-bottom: 0.5rem;'>
+                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>📌 CURRENT SITUATION</div>
+                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{opening}...</div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
 
-                st.divider()
+                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #3b82f6; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
 
-                # Display visualizations with insights
-                st.markdown("### 📊 AI-Recommended Demographic Visualizations")
-                viz_list = demographics_analysis.get('visualizations', [])
-                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} demographic visualizations")
+                                    # Stage 2: Key Insights
+                                    st.markdown(f"""
+                                    <div style='background: linear-gradient(135deg, #8b5cf6, #7c3aed); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3); margin-bottom: 0.5rem;'>
+                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>📈 KEY INSIGHTS</div>
+                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{insights}...</div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
 
-                for i, viz_spec in enumerate(viz_list):
-                    with st.container():
-                        st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
-                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Demographic indicator')}")
+                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #8b5cf6; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
 
-                        # Build and display chart
-                        fig = build_dynamic_chart(viz_spec, df)
-                        if fig:
-                            st.plotly_chart(fig, width='stretch', key=f"demographics_viz_{i}")
-                        else:
-                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
+                                    # Stage 3: Business Impact
+                                    st.markdown(f"""
+                                    <div style='background: linear-gradient(135deg, #10b981, #059669); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3); margin-bottom: 0.5rem;'>
+                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>💼 BUSINESS IMPACT</div>
+                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{impact}...</div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
 
-                        # Display AI insight
-                        insight = viz_spec.get('insight', '')
-                        if insight:
-                            st.markdown(f"""
-                            <div class="insight-card">
-                                <div class="insight-title">🌍 Demographic Insight</div>
-                                <div class="insight-text">{insight}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                                    st.markdown("<div style='text-align: center; font-size: 2rem; color: #10b981; margin: 0.5rem 0;'>↓</div>", unsafe_allow_html=True)
 
-                        st.divider()
+                                    # Stage 4: Recommended Actions
+                                    st.markdown(f"""
+                                    <div style='background: linear-gradient(135deg, #f59e0b, #d97706); color: white; padding: 1.2rem; border-radius: 12px; box-shadow: 0 4px 12px rgba(245, 158, 11, 0.3); margin-bottom: 1rem;'>
+                                        <div style='font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.9; margin-bottom: 0.4rem; font-weight: 600;'>🎯 RECOMMENDED ACTIONS</div>
+                                        <div style='font-size: 0.95rem; line-height: 1.6; opacity: 0.95;'>{action}...</div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
 
-                # Display key findings
-                st.markdown("### 🔍 Key Demographic Findings")
-                findings = demographics_analysis.get('key_findings', [])
-                for i, finding in enumerate(findings, 1):
-                    st.markdown(f"**Finding {i}:** {finding}")
+                                    st.markdown("---")
 
-                st.divider()
+                                    # Detailed sections in expander
+                                    with st.expander("📋 View Full Analysis Details", expanded=False):
+                                        # Complete Narrative
+                                        st.markdown("##### 📖 Complete Narrative")
+                                        full_narrative = html.escape(story.get('opening_narrative', 'N/A')).replace('\n', '<br>')
+                                        st.markdown(f"""
+                                        <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #8b5cf6; margin-bottom: 1rem;'>
+                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_narrative}</p>
+                                        </div>
+                                        """, unsafe_allow_html=True)
 
-                # Display recommendations
-                st.markdown("### 💡 Diversity & Recruitment Strategy Recommendations")
-                recommendations = demographics_analysis.get('recommendations', [])
+                                        # Full Data Insights
+                                        st.markdown("##### 📊 Complete Data Insights")
+                                        full_insights = html.escape(story.get('data_insights', 'N/A')).replace('\n', '<br>')
+                                        st.markdown(f"""
+                                        <div style='background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
+                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_insights}</p>
+                                        </div>
+                                        """, unsafe_allow_html=True)
 
-                for i, rec in enumerate(recommendations, 1):
-                    # Color code by priority (first = high priority)
-                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
+                                        # Full Business Impact
+                                        st.markdown("##### 💼 Full Business Impact Analysis")
+                                        full_impact = html.escape(story.get('business_impact', 'N/A')).replace('\n', '<br>')
+                                        st.markdown(f"""
+                                        <div style='background: rgba(34, 197, 94, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #22c55e; margin-bottom: 1rem;'>
+                                            <p style='margin: 0; color: #1e293b; line-height: 1.6;'>{full_impact}</p>
+                                        </div>
+                                        """, unsafe_allow_html=True)
 
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="recommendation-card">
-                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
-                            <div class="recommendation-text">{rec}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                                        # Key Findings
+                                        st.markdown("##### 🔍 Key Findings")
+                                        full_findings = html.escape(story.get('findings_summary', 'N/A')).replace('\n', '<br>')
+                                        st.markdown(f"""
+                                        <div style='background: rgba(251, 146, 60, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #fb923c; margin-bottom: 1rem;'>
+                                            <div style='color: #1e293b; line-height: 1.8;'>{full_findings}</div>
+                                        </div>
+                                        """, unsafe_allow_html=True)
 
-        elif not st.session_state.ollama_connected:
-            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered diversity analysis.")
+                                        # Complete Action Plan
+                                        st.markdown("##### 🎯 Complete Action Plan")
+                                        full_action = html.escape(story.get('action_plan', 'N/A')).replace('\n', '<br>')
+                                        st.markdown(f"""
+                                        <div style='background: rgba(245, 158, 11, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b; margin-bottom: 1rem;'>
+                                            <div style='color: #1e293b; line-height: 1.8;'>{full_action}</div>
+                                        </div>
+                                        """, unsafe_allow_html=True)
 
     # ====================================================================================
-    # TAB 9: RISK & SUCCESS ANALYSIS - AI-DRIVEN
+    # TAB 5: ACADEMIC ANALYTICS - HYBRID AI-DRIVEN
     # ====================================================================================
-    with tabs[8]:
-        st.header("⚠️ Risk & Success Analysis - AI-Driven Deep Analysis")
-        st.caption("The AI analyzes at-risk patterns, success predictors, and intervention effectiveness")
-
-        # Calculate risk metrics
-        at_risk = metrics.get('at_risk', 0)
-        high_performers = metrics.get('high_performers', 0)
-        total_students = metrics.get('total_students', 1)
-        mid_performers = total_students - at_risk - high_performers
-        success_rate = ((total_students - at_risk) / total_students * 100) if total_students > 0 else 0
-        at_risk_pct = (at_risk / total_students * 100) if total_students > 0 else 0
-        high_perf_pct = (high_performers / total_students * 100) if total_students > 0 else 0
-
-        # Determine risk severity
-        risk_severity = "🔴 CRITICAL" if at_risk_pct > 25 else "🟠 HIGH" if at_risk_pct > 15 else "🟢 MODERATE"
+    with tabs[4]:
+        st.header("🎓 Academic Analytics - AI-Driven Deep Analysis")
+        st.caption("The AI analyzes academic performance patterns and recommends targeted interventions")
 
-        # Risk-focused metrics
+        # Academic-focused metrics
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("At-Risk Students", f"{at_risk:,}",
-                     delta=f"{at_risk_pct:.1f}%",
-                     delta_color="inverse",
-                     help="Students with GPA < 2.0")
+            st.metric("High Performers", f"{metrics.get('high_performers', 0):,}",
+                     f"{metrics.get('high_performers', 0)/metrics.get('total_students', 1)*100:.1f}%")
 
         with col2:
-            st.metric("Mid-Tier Students", f"{mid_performers:,}",
-                     f"{(mid_performers/total_students*100):.1f}%",
-                     help="Students with 2.0 ≤ GPA < 3.5")
+            st.metric("Average GPA", f"{metrics.get('avg_gpa', 0):.2f}")
 
         with col3:
-            st.metric("High Performers", f"{high_performers:,}",
-                     delta=f"{high_perf_pct:.1f}%",
-                     help="Students with GPA ≥ 3.5")
+            st.metric("At-Risk Students", f"{metrics.get('at_risk', 0):,}",
+                     delta=f"-{metrics.get('at_risk', 0)/metrics.get('total_students', 1)*100:.1f}%",
+                     delta_color="inverse")
 
         with col4:
-            st.metric("Risk Severity", risk_severity,
-                     f"Success: {success_rate:.1f}%",
-                     help="Risk level based on at-risk percentage")
+            # Calculate mid-performers
+            mid_performers = metrics.get('total_students', 0) - metrics.get('high_performers', 0) - metrics.get('at_risk', 0)
+            st.metric("Mid-Performers", f"{mid_performers:,}",
+                     f"{mid_performers/metrics.get('total_students', 1)*100:.1f}%")
 
         st.divider()
 
         # AI Analysis Button
-        if st.session_state.ollama_connected and st.button("🤖 Generate Risk & Success Analysis & Visualizations", key="risk_btn", type="primary", width='stretch'):
+        if st.session_state.ollama_connected and st.button("🤖 Generate Academic Performance Analysis & Visualizations", key="academic_btn", type="primary", width='stretch'):
 
-            # Generate risk-focused analysis using hybrid approach
-            risk_analysis = generate_dynamic_visualizations_llm(
+            # Generate academic-focused analysis using hybrid approach
+            academic_analysis = generate_dynamic_visualizations_llm(
                 metrics,
                 df,
                 st.session_state.selected_model,
                 st.session_state.ollama_url,
-                context_type="risk"  # Risk-focused context
+                context_type="academic"  # Academic-focused context
             )
 
-            if risk_analysis:
+            if academic_analysis:
                 # Display strategic overview
-                st.markdown("### ⚠️ Risk & Success Strategic Analysis")
-                st.info(risk_analysis.get('strategic_overview', ''))
+                st.markdown("### 🎯 Academic Performance Analysis")
+                st.info(academic_analysis.get('strategic_overview', ''))
 
                 st.divider()
 
                 # Display visualizations with insights
-                st.markdown("### 📊 AI-Recommended Risk Analysis Visualizations")
-                viz_list = risk_analysis.get('visualizations', [])
-                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} risk analysis visualizations")
+                st.markdown("### 📊 AI-Recommended Academic Visualizations")
+                viz_list = academic_analysis.get('visualizations', [])
+                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} academic visualizations")
 
                 for i, viz_spec in enumerate(viz_list):
                     with st.container():
                         st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
-                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Risk indicator')}")
+                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Academic performance indicator')}")
 
                         # Build and display chart
                         fig = build_dynamic_chart(viz_spec, df)
                         if fig:
-                            st.plotly_chart(fig, width='stretch', key=f"risk_viz_{i}")
-                        else:
-                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
-
-                        # Display AI insight
-                        insight = viz_spec.get('insight', '')
-                        if insight:
-                            st.markdown(f"""
-                            <div class="insight-card">
-                                <div class="insight-title">⚠️ Risk Insight</div>
-                                <div class="insight-text">{insight}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                        st.divider()
-
-                # Display key findings
-                st.markdown("### 🔍 Key Risk & Success Findings")
-                findings = risk_analysis.get('key_findings', [])
-                for i, finding in enumerate(findings, 1):
-                    st.markdown(f"**Finding {i}:** {finding}")
-
-                st.divider()
-
-                # Display recommendations
-                st.markdown("### 💡 Intervention & Success Strategy Recommendations")
-                recommendations = risk_analysis.get('recommendations', [])
-
-                for i, rec in enumerate(recommendations, 1):
-                    # Color code by priority (first = high priority)
-                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
-
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="recommendation-card">
-                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
-                            <div class="recommendation-text">{rec}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-        elif not st.session_state.ollama_connected:
-            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered risk analysis.")
-
-    # ====================================================================================
-    # TAB 10: DATA LINEAGE & GENERATIVE DATA PROFILING
-    # ====================================================================================
-    with tabs[9]:
-        st.header("🔗 Data Lineage & Architecture")
-
-        st.info("📊 Dataset Overview - Comprehensive Statistics")
-
-        # Overall table statistics
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("Total Records", f"{len(df):,}")
-
-        with col2:
-            st.metric("Total Columns", len(df.columns))
-
-        with col3:
-            completeness = (df.count().sum() / (len(df) * len(df.columns)) * 100)
-            st.metric("Completeness", f"{completeness:.1f}%")
-
-        with col4:
-            memory_usage = df.memory_usage(deep=True).sum() / (1024 ** 2)
-            st.metric("Memory Usage", f"{memory_usage:.2f} MB")
-
-        st.divider()
-
-        # ========== GENERATIVE DATA PROFILING WITH LLM ==========
-        st.subheader("🤖 Generative Data Profiling")
-
-        # Analysis mode selection
-        analysis_mode = "Quick Analysis"
-        if len(df.columns) > 30:
-            st.markdown("### 🎯 Analysis Mode")
-            analysis_mode = st.radio(
-                "Choose analysis approach:",
-                ["Quick Analysis (Fast, top insights)", "Comprehensive Analysis (Detailed, all aspects)"],
-                key="profiling_mode",
-                help="**Quick**: Fast analysis with key insights (1-2 min)\n\n**Comprehensive**: Thorough analysis with detailed recommendations (3-5 min)"
-            )
-
-        if st.session_state.ollama_connected and st.button("🔬 Generate AI Data Profile", key="lineage_btn", type="primary", width='stretch'):
-            # Test connection first
-            st.info(f"🔍 Testing connection to: {url}")
-            try:
-                import requests
-                test_response = requests.get(f"{url}/api/tags", timeout=10)
-                if test_response.status_code == 200:
-                    st.success(f"✅ Connection OK - Model: {model}")
-                else:
-                    st.error(f"❌ Connection failed: HTTP {test_response.status_code}")
-                    st.stop()
-            except Exception as conn_err:
-                st.error(f"❌ Connection test failed: {str(conn_err)}")
-                st.warning("💡 Make sure Ollama is running and accessible")
-                st.stop()
-
-            # Show estimated time
-            use_comprehensive = "Comprehensive" in analysis_mode
-
-            # Calculate dynamic timeout based on dataset size
-            is_large_dataset = len(df.columns) > 100
-            base_timeout = 240 if is_large_dataset else 180
-
-            if use_comprehensive:
-                est_time = "4-6 minutes" if is_large_dataset else "3-5 minutes"
-                st.info(f"⏱️ **Comprehensive Mode**: Estimated time {est_time} with {model}")
-            else:
-                est_time = "2-4 minutes" if is_large_dataset else "1-2 minutes"
-                st.info(f"⚡ **Quick Mode**: Estimated time {est_time} with {model}")
-
-            if is_large_dataset:
-                st.warning(f"⚠️ Large dataset detected ({len(df.columns)} columns). Analysis will take longer. Please be patient...")
-
-            # Prepare comprehensive data profile for LLM
-            with st.spinner("🔄 Phase 1/3: Analyzing dataset structure..."):
-                st.info(f"📊 Analyzing {len(df):,} records with {len(df.columns)} columns...")
-
-                # Calculate detailed statistics
-                numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-                categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-                datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
-
-                duplicate_rows = df.duplicated().sum()
-                columns_with_nulls = df.isnull().any().sum()
-
-                # Get missing data statistics
-                missing_by_col = df.isnull().sum()
-                missing_pct = (missing_by_col / len(df) * 100).round(2)
-                missing_df = pd.DataFrame({
-                    'Column': missing_by_col.index,
-                    'Missing Count': missing_by_col.values,
-                    'Missing %': missing_pct.values
-                }).sort_values('Missing Count', ascending=False).head(15)
-
-                # Get sample columns (limit to 15 for large datasets to reduce prompt size)
-                sample_limit = 15 if is_large_dataset else 25
-                columns_sample = ', '.join(df.columns[:sample_limit].tolist())
-                if len(df.columns) > sample_limit:
-                    columns_sample += f"... (+{len(df.columns) - sample_limit} more)"
-
-                # Calculate cardinality
-                high_cardinality_cols = [col for col in df.columns if df[col].nunique() / len(df) > 0.9]
-                low_cardinality_cols = [col for col in df.columns if df[col].nunique() < 20]
-
-                # Get data type summary
-                dtype_summary = df.dtypes.value_counts().to_string()
-
-                st.success(f"✅ Phase 1 complete: Identified {len(numeric_cols)} numeric, {len(categorical_cols)} categorical, {len(datetime_cols)} datetime columns")
-
-            # Generate LLM insights
-            with st.spinner("🔄 Phase 2/3: Generating AI-powered insights..."):
-                st.info("🧠 LLM analyzing data patterns, quality, and business context...")
-
-                if use_comprehensive:
-                    # Comprehensive mode - DEEP analysis (optimized for large datasets)
-                    missing_data_rows = 10 if is_large_dataset else 15
-
-                    # Get additional statistics for richer analysis
-                    complete_cols = len([col for col in df.columns if df[col].notna().all()])
-                    total_missing = df.isnull().sum().sum()
-
-                    # Get top 5 numeric columns by name for context
-                    numeric_sample = ', '.join(numeric_cols[:5]) if numeric_cols else 'None'
-                    categorical_sample = ', '.join(categorical_cols[:5]) if categorical_cols else 'None'
-
-                    # Calculate additional depth statistics for comprehensive mode
-                    # 1. Correlation analysis for numeric columns
-                    correlation_insight = "No numeric columns"
-                    if len(numeric_cols) >= 2:
-                        corr_matrix = df[numeric_cols[:10]].corr()  # Top 10 to avoid overload
-                        high_corr = []
-                        for i in range(len(corr_matrix.columns)):
-                            for j in range(i+1, len(corr_matrix.columns)):
-                                corr_val = corr_matrix.iloc[i, j]
-                                if abs(corr_val) > 0.7:
-                                    high_corr.append(f"{corr_matrix.columns[i]} ↔ {corr_matrix.columns[j]} ({corr_val:.2f})")
-                        correlation_insight = ', '.join(high_corr[:5]) if high_corr else "No strong correlations found (>0.7)"
-
-                    # 2. Distribution statistics for numeric columns
-                    distribution_stats = ""
-                    if numeric_cols:
-                        skewness_high = []
-                        for col in numeric_cols[:5]:
-                            skew = df[col].skew()
-                            if abs(skew) > 1:
-                                skewness_high.append(f"{col}({skew:.2f})")
-                        distribution_stats = f"Skewed distributions: {', '.join(skewness_high)}" if skewness_high else "Distributions appear normal"
-
-                    # 3. Outlier detection
-                    outlier_info = ""
-                    if numeric_cols:
-                        outlier_cols = []
-                        for col in numeric_cols[:5]:
-                            Q1 = df[col].quantile(0.25)
-                            Q3 = df[col].quantile(0.75)
-                            IQR = Q3 - Q1
-                            outliers = ((df[col] < (Q1 - 1.5 * IQR)) | (df[col] > (Q3 + 1.5 * IQR))).sum()
-                            if outliers > 0:
-                                outlier_cols.append(f"{col}({outliers})")
-                        outlier_info = f"Columns with outliers: {', '.join(outlier_cols)}" if outlier_cols else "No significant outliers"
-
-                    # 4. Categorical column analysis
-                    categorical_insights = ""
-                    if categorical_cols:
-                        high_cat_diversity = []
-                        low_cat_diversity = []
-                        for col in categorical_cols[:5]:
-                            unique_ratio = df[col].nunique() / len(df)
-                            if unique_ratio > 0.5:
-                                high_cat_diversity.append(col)
-                            elif unique_ratio < 0.05:
-                                low_cat_diversity.append(col)
-                        categorical_insights = f"High diversity: {', '.join(high_cat_diversity) or 'None'} | Low diversity: {', '.join(low_cat_diversity) or 'None'}"
-
-                    prompt = f"""You are a senior data profiling expert. Analyze this student dataset and provide structured, deterministic output.
-
-**CRITICAL INSTRUCTIONS FOR REPRODUCIBLE OUTPUT:**
-1. Use ONLY the data provided below - do not make assumptions
-2. Follow the EXACT section structure and format specified
-3. Cite specific column names from the data
-4. Use factual, objective language
-5. Keep analysis consistent and deterministic
-
-**DATASET METRICS:**
-- Total Records: {len(df):,}
-- Total Attributes: {len(df.columns)}
-- Data Completeness: {completeness:.1f}%
-- Missing Cells: {total_missing:,} ({(total_missing/(len(df)*len(df.columns))*100):.2f}% of all cells)
-- Complete Columns: {complete_cols}/{len(df.columns)} ({(complete_cols/len(df.columns)*100):.1f}%)
-- Duplicate Rows: {duplicate_rows:,} ({(duplicate_rows/len(df)*100):.2f}%)
-
-**COLUMN TYPES:**
-- Numeric: {len(numeric_cols)} columns - Examples: {numeric_sample}
-- Categorical: {len(categorical_cols)} columns - Examples: {categorical_sample}
-- Datetime: {len(datetime_cols)} columns
-- High Cardinality (IDs): {len(high_cardinality_cols)} columns
-- Low Cardinality (Categories): {len(low_cardinality_cols)} columns
-
-**COLUMN NAMES (First 25):** {columns_sample}
-
-**STATISTICAL ANALYSIS:**
-- Strong Correlations (>0.7): {correlation_insight}
-- Skewed Distributions (|skew|>1): {distribution_stats}
-- Outliers Detected (IQR method): {outlier_info}
-- Categorical Diversity Analysis: {categorical_insights}
-
-**TOP MISSING DATA ({missing_data_rows} columns):**
-{missing_df.head(missing_data_rows).to_string(index=False)}
-
-**OUTPUT REQUIREMENTS:**
-Provide exactly 8 sections using markdown headers (##). Be specific, factual, and deterministic. Use 600 words maximum.
-
-**SECTION TEMPLATES (Follow exactly):**
-
-## 1. Dataset Purpose & Scope
-**Purpose**: [2-3 sentences describing what this dataset represents]
-**Temporal Scope**: [Time period, refresh frequency]
-**Stakeholders**: [Who uses this data]
-**Integration**: [System integration points inferred from columns]
-
-## 2. Data Domain Breakdown
-**Academic Domain** ({len([c for c in df.columns if any(x in c.lower() for x in ['grade', 'gpa', 'course', 'credit', 'enrollment'])])} columns):
-- Columns: [List actual column names found]
-- Metrics: [What is measured]
-
-**Financial Domain** ({len([c for c in df.columns if any(x in c.lower() for x in ['amount', 'fee', 'aid', 'tuition', 'payment'])])} columns):
-- Columns: [List actual column names found]
-- Metrics: [Revenue vs cost identification]
-
-**Demographics** ({len([c for c in df.columns if any(x in c.lower() for x in ['age', 'gender', 'name', 'nationality', 'email', 'phone'])])} columns):
-- Columns: [List actual column names found]
-- Completeness: [Assess completeness]
-
-**Other Domains**:
-- [Any other domains with column examples]
-
-## 3. Data Quality Assessment
-**Completeness**: {completeness:.1f}% overall
-- Domain breakdown: [Which domains complete/incomplete]
-- Root cause: [Why data is missing]
-
-**Missing Pattern Type**: [MCAR/MAR/MNAR] because [reasoning based on missing data table]
-
-**Duplicates**: {duplicate_rows:,} records ({(duplicate_rows/len(df)*100):.2f}%)
-- Assessment: [Legitimate vs data quality issue]
-
-**Correlations**: {correlation_insight}
-- Business sense check: [Do correlations make sense?]
-
-**Distributions**: {distribution_stats}
-- Implications: [What skewness indicates]
-
-**Outliers**: {outlier_info}
-- Assessment: [Errors or valid edge cases?]
-
-**Severity**: [Critical/High/Medium/Low] because [justification]
-
-## 4. Column Relationships
-**Primary Keys**: [List high-cardinality columns] - These are PKs because [reason]
-**Foreign Keys**: [Potential FK relationships identified]
-**Derived Columns**: [Calculated/derived columns] vs Source: [source columns]
-**Hierarchies**: [Parent-child relationships]
-**Temporal**: [Time-series patterns]
-
-## 5. Business Intelligence Value
-**Predictive Analytics**: Can predict [specific outcomes]. Key features: [column names]
-**Segmentation**: Students can be segmented by [specific criteria/columns]
-**Financial**: [Revenue forecasting/aid optimization opportunities with columns]
-**Operations**: [Process improvements from columns]
-**Compliance**: [FERPA/regulatory capabilities]
-**KPIs**: [List calculable KPIs from columns]
-
-## 6. Action Plan
-**CRITICAL** (today):
-1. [Column]: [Problem] → [Solution] → [Outcome]
-2. [Column]: [Problem] → [Solution] → [Outcome]
-3. [Column]: [Problem] → [Solution] → [Outcome]
-
-**HIGH** (this week):
-1. [Column/Domain]: [Issue] → [Fix] → [Impact]
-2. [Column/Domain]: [Issue] → [Fix] → [Impact]
-
-**MEDIUM** (this month):
-1. [Specific improvement]
-2. [Specific improvement]
-
-**LOW** (backlog):
-1. [Enhancement]
-
-## 7. Risk Assessment
-**Decision Risk**: With {completeness:.1f}% completeness, [specific unsafe decisions]
-**Bias Risk**: Missing data in [columns] could bias [specific analyses]
-**Compliance**: [FERPA/privacy concerns with columns]
-**Financial**: [Specific financial risks from data quality]
-**Operational**: [Process failures possible]
-**Reputational**: [Consequences of wrong decisions]
-**Opportunity**: [Impossible insights listed]
+                            st.plotly_chart(fig, width='stretch', key=f"academic_viz_{i}")
+                        else:
+                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
 
-## 8. Visualization Recommendations
-1. **[Chart Type]** of [Column X] vs [Column Y] → Reveals: [Specific insight]
-2. **[Chart Type]** of [Columns] grouped by [Column] → Shows: [Pattern]
-3. **[Chart Type]** for [Columns] → Identifies: [Issue]
-4. **[Chart Type]** tracking [Metrics] over [Time column] → Monitors: [KPI]
-5. **[Chart Type]** with [Dimensions] → Supports: [Decision]
+                        # Display AI insight
+                        insight = viz_spec.get('insight', '')
+                        if insight:
+                            st.markdown(f"""
+                            <div class="insight-card">
+                                <div class="insight-title">🎓 Academic Insight</div>
+                                <div class="insight-text">{insight}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-**CONSISTENCY RULES:**
-- Always reference actual column names in brackets
-- Use quantitative evidence (percentages, counts)
-- Follow section templates exactly
-- Be deterministic and factual"""
+                        st.divider()
 
-                else:
-                    # Quick mode - focused analysis (optimized for large datasets)
-                    # For large datasets, reduce the missing data table size
-                    missing_data_rows = 5 if is_large_dataset else 10
+                # Display key findings
+                st.markdown("### 🔍 Key Academic Findings")
+                findings = academic_analysis.get('key_findings', [])
+                for i, finding in enumerate(findings, 1):
+                    st.markdown(f"**Finding {i}:** {finding}")
 
-                    # Get additional context for quick mode
-                    complete_cols = len([col for col in df.columns if df[col].notna().all()])
-                    total_missing = df.isnull().sum().sum()
+                st.divider()
 
-                    # Get examples of each type
-                    numeric_sample = ', '.join(numeric_cols[:3]) if numeric_cols else 'None'
-                    categorical_sample = ', '.join(categorical_cols[:3]) if categorical_cols else 'None'
+                # Display recommendations
+                st.markdown("### 💡 Academic Intervention Recommendations")
+                recommendations = academic_analysis.get('recommendations', [])
 
-                    prompt = f"""You are a data profiling expert. Provide quick, structured analysis of this student dataset.
+                for i, rec in enumerate(recommendations, 1):
+                    # Color code by priority (first = high priority)
+                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
 
-**REPRODUCIBILITY INSTRUCTIONS:**
-1. Use ONLY provided data - no assumptions
-2. Follow exact section structure below
-3. Cite specific column names
-4. Be factual and deterministic
-5. Keep output consistent across runs
+                    with st.container():
+                        st.markdown(f"""
+                        <div class="recommendation-card">
+                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
+                            <div class="recommendation-text">{rec}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
 
-**DATASET SUMMARY:**
-- Rows: {len(df):,} | Columns: {len(df.columns)} | Completeness: {completeness:.1f}%
-- Missing Cells: {total_missing:,} | Duplicates: {duplicate_rows:,}
-- Complete Columns: {complete_cols}/{len(df.columns)}
+        elif not st.session_state.ollama_connected:
+            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered academic analysis.")
 
-**COLUMN TYPES:**
-- Numeric: {len(numeric_cols)} (Examples: {numeric_sample})
-- Categorical: {len(categorical_cols)} (Examples: {categorical_sample})
-- High Cardinality: {len(high_cardinality_cols)} (IDs)
+    # ====================================================================================
+    # TAB 6: HOUSING INSIGHTS - AI-DRIVEN
+    # ====================================================================================
+    with tabs[5]:
+        st.header("🏠 Housing Insights - AI-Driven Deep Analysis")
+        st.caption("The AI analyzes housing patterns, occupancy trends, and their impact on student success")
 
-**COLUMNS (First 25):** {columns_sample}
+        # Check for housing data
+        housing_col = None
+        for col in ['room_number', 'housing_status', 'residence_hall', 'housing', 'residence', 'dormitory']:
+            if col in df.columns:
+                housing_col = col
+                break
 
-**TOP MISSING DATA ({missing_data_rows} most affected):**
-{missing_df.head(missing_data_rows).to_string(index=False)}
+        if housing_col:
+            on_campus = df[df[housing_col].notna()].shape[0]
+            off_campus = df[df[housing_col].isna()].shape[0]
+            housing_utilization = (on_campus / len(df) * 100) if len(df) > 0 else 0
 
-**OUTPUT FORMAT (Follow exactly - 250 words max):**
+            # Calculate housing impact on GPA if GPA column exists
+            gpa_col = None
+            for col in ['gpa', 'cumulative_gpa', 'cgpa']:
+                if col in df.columns:
+                    gpa_col = col
+                    break
 
-## 1. Dataset Overview
-[2-3 sentence factual description of dataset purpose and scope]
+            on_campus_gpa = 0
+            off_campus_gpa = 0
+            if gpa_col:
+                on_campus_gpa = df[df[housing_col].notna()][gpa_col].mean()
+                off_campus_gpa = df[df[housing_col].isna()][gpa_col].mean()
 
-## 2. Data Domains Identified
-- 📚 **Academic** ({len([c for c in df.columns if any(x in c.lower() for x in ['grade', 'gpa', 'course'])])} cols): [List actual column names]
-- 💰 **Financial** ({len([c for c in df.columns if any(x in c.lower() for x in ['amount', 'fee', 'aid'])])} cols): [List actual column names]
-- 👤 **Demographics** ({len([c for c in df.columns if any(x in c.lower() for x in ['age', 'gender', 'name'])])} cols): [List actual column names]
-- 📊 **Other**: [Any other domains with column names]
+            # Housing-focused metrics
+            col1, col2, col3, col4 = st.columns(4)
 
-## 3. Top 3 Quality Concerns
-1. **[Issue Type]**: [Specific columns affected] - [Impact]
-2. **[Issue Type]**: [Specific columns affected] - [Impact]
-3. **[Issue Type]**: [Specific columns affected] - [Impact]
+            with col1:
+                st.metric("On-Campus Residents", f"{on_campus:,}",
+                         f"{housing_utilization:.1f}%")
 
-## 4. Key Findings
-- [Finding based on missing data table with %]
-- [Finding based on completeness metric with %]
-- [Finding based on column analysis with count]
+            with col2:
+                st.metric("Off-Campus Students", f"{off_campus:,}",
+                         f"{(off_campus/len(df)*100):.1f}%")
 
-## 5. Immediate Actions
-1. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
-2. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
-3. **[Column/Domain]**: [Problem] → [Solution] → [Expected impact]
+            with col3:
+                if gpa_col and on_campus_gpa > 0:
+                    st.metric("On-Campus Avg GPA", f"{on_campus_gpa:.2f}",
+                             delta=f"{on_campus_gpa - off_campus_gpa:+.2f}" if off_campus_gpa > 0 else None)
+                else:
+                    st.metric("Housing Utilization", f"{housing_utilization:.1f}%")
 
-**RULES**: Use markdown (##). Always cite column names in brackets. Use quantitative data. Be deterministic."""
+            with col4:
+                if gpa_col and off_campus_gpa > 0:
+                    st.metric("Off-Campus Avg GPA", f"{off_campus_gpa:.2f}",
+                             delta=f"{off_campus_gpa - on_campus_gpa:+.2f}" if on_campus_gpa > 0 else None)
+                else:
+                    # Count unique residence halls if available
+                    unique_residences = df[housing_col].nunique()
+                    st.metric("Residence Options", f"{unique_residences:,}")
 
-                # Generate deterministic seed from dataset properties for reproducibility
-                # Same dataset will always produce same seed
-                import hashlib
-                dataset_signature = f"{len(df)}_{len(df.columns)}_{completeness:.1f}_{duplicate_rows}"
-                seed_value = int(hashlib.md5(dataset_signature.encode()).hexdigest()[:8], 16) % 1000000
+            st.divider()
 
-                # Query LLM with deterministic parameters for reproducible output
-                llm_insights = query_ollama(
-                    prompt,
-                    model,
-                    url,
-                    temperature=0.0,  # Zero temperature for maximum determinism
-                    num_predict=1000 if use_comprehensive else 400,  # Comprehensive needs more tokens for depth
-                    timeout=base_timeout,  # Dynamic: 240s for large datasets, 180s for normal
-                    auto_optimize=False,  # Use our custom timeout instead
-                    seed=seed_value  # Fixed seed based on dataset for reproducibility
-                )
+            # AI Analysis Button
+            if st.session_state.ollama_connected and st.button("🤖 Generate Housing Impact Analysis & Visualizations", key="housing_btn", type="primary", width='stretch'):
 
-                if llm_insights and not llm_insights.startswith('[ERROR]'):
-                    st.success("✅ Phase 2 complete: AI insights generated successfully!")
-                    st.info(f"🔒 **Reproducibility**: Analysis uses seed {seed_value} - same dataset will produce consistent results")
-                else:
-                    st.error(f"❌ LLM analysis failed: {llm_insights}")
-                    st.warning("💡 Troubleshooting:")
-                    st.warning(f"- Try switching to {'Quick' if use_comprehensive else 'Comprehensive'} mode")
-                    st.warning(f"- Large model ({model}) may need more time. Consider smaller model like 'qwen2:7b'")
-                    st.warning("- Check Ollama is running and not frozen")
-                    st.warning("- For very large datasets, try filtering some rows first")
-                    st.stop()
+                # Generate housing-focused analysis using hybrid approach
+                housing_analysis = generate_dynamic_visualizations_llm(
+                    metrics,
+                    df,
+                    st.session_state.selected_model,
+                    st.session_state.ollama_url,
+                    context_type="housing"  # Housing-focused context
+                )
 
-            # Display comprehensive profiling results
-            with st.spinner("🔄 Phase 3/3: Compiling profiling report..."):
-                st.info("📝 Finalizing report...")
+                if housing_analysis:
+                    # Display strategic overview
+                    st.markdown("### 🏠 Housing Impact Analysis")
+                    st.info(housing_analysis.get('strategic_overview', ''))
 
-                # Display LLM-generated insights
-                st.markdown("""
-                <div class="insight-card">
-                    <div class="insight-title">🤖 AI-Powered Data Profiling Report</div>
-                </div>
-                """, unsafe_allow_html=True)
+                    st.divider()
 
-                st.markdown(llm_insights)
-
-                # Add metadata
-                st.caption(f"Generated using {model} | Mode: {'Comprehensive' if use_comprehensive else 'Quick'} | {len(df.columns)} columns analyzed | Seed: {seed_value} (reproducible)")
-
-                st.success("✅ Phase 3 complete: Generative Data Profiling finished!")
-
-                # Store profiling results in session state for visualization
-                st.session_state['profiling_results'] = {
-                    'insights': llm_insights,
-                    'mode': 'Comprehensive' if use_comprehensive else 'Quick',
-                    'completeness': completeness,
-                    'duplicate_rows': duplicate_rows,
-                    'columns_with_nulls': columns_with_nulls,
-                    'numeric_cols': len(numeric_cols),
-                    'categorical_cols': len(categorical_cols),
-                    'datetime_cols': len(datetime_cols),
-                    'high_cardinality': len(high_cardinality_cols),
-                    'low_cardinality': len(low_cardinality_cols),
-                    'total_missing': total_missing,
-                    'complete_cols': complete_cols
-                }
+                    # Display visualizations with insights
+                    st.markdown("### 📊 AI-Recommended Housing Visualizations")
+                    viz_list = housing_analysis.get('visualizations', [])
+                    st.caption(f"The AI analyzed your data and recommends {len(viz_list)} housing-related visualizations")
 
-        st.divider()
+                    for i, viz_spec in enumerate(viz_list):
+                        with st.container():
+                            st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
+                            st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Housing performance indicator')}")
 
-        # ========== VISUALIZE DATA PROFILING BUTTON ==========
-        if 'profiling_results' in st.session_state and st.button("📊 Visualize Data Profiling", key="viz_profiling_btn", type="secondary", width='stretch'):
-            st.subheader("📊 Data Profiling Visualization Dashboard")
-            st.caption("AI-generated visual insights from profiling analysis")
+                            # Build and display chart
+                            fig = build_dynamic_chart(viz_spec, df)
+                            if fig:
+                                st.plotly_chart(fig, width='stretch', key=f"housing_viz_{i}")
+                            else:
+                                st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
 
-            profile_data = st.session_state['profiling_results']
+                            # Display AI insight
+                            insight = viz_spec.get('insight', '')
+                            if insight:
+                                st.markdown(f"""
+                                <div class="insight-card">
+                                    <div class="insight-title">🏠 Housing Insight</div>
+                                    <div class="insight-text">{insight}</div>
+                                </div>
+                                """, unsafe_allow_html=True)
 
-            # Create visual dashboard similar to Data Lineage tab
-            st.markdown("---")
+                            st.divider()
 
-            # KPI Cards Row 1
-            col1, col2, col3, col4, col5 = st.columns(5)
+                    # Display key findings
+                    st.markdown("### 🔍 Key Housing Findings")
+                    findings = housing_analysis.get('key_findings', [])
+                    for i, finding in enumerate(findings, 1):
+                        st.markdown(f"**Finding {i}:** {finding}")
 
-            with col1:
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #10b981, #059669); border-radius: 12px;
-                            padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                    <div style='font-size: 2rem; margin-bottom: 5px;'>✅</div>
-                    <div style='font-size: 2rem; font-weight: bold; color: white;'>{profile_data['completeness']:.1f}%</div>
-                    <div style='font-size: 0.85rem; color: #d1fae5; margin-top: 5px;'>Data Completeness</div>
-                </div>
-                """, unsafe_allow_html=True)
+                    st.divider()
 
-            with col2:
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #6366f1, #4f46e5); border-radius: 12px;
-                            padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                    <div style='font-size: 2rem; margin-bottom: 5px;'>📊</div>
-                    <div style='font-size: 2rem; font-weight: bold; color: white;'>{len(df.columns)}</div>
-                    <div style='font-size: 0.85rem; color: #c7d2fe; margin-top: 5px;'>Total Attributes</div>
-                </div>
-                """, unsafe_allow_html=True)
+                    # Display recommendations
+                    st.markdown("### 💡 Housing Strategy Recommendations")
+                    recommendations = housing_analysis.get('recommendations', [])
 
-            with col3:
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #f59e0b, #d97706); border-radius: 12px;
-                            padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                    <div style='font-size: 2rem; margin-bottom: 5px;'>⚠️</div>
-                    <div style='font-size: 2rem; font-weight: bold; color: white;'>{profile_data['columns_with_nulls']}</div>
-                    <div style='font-size: 0.85rem; color: #fef3c7; margin-top: 5px;'>Columns w/ Nulls</div>
-                </div>
-                """, unsafe_allow_html=True)
+                    for i, rec in enumerate(recommendations, 1):
+                        # Color code by priority (first = high priority)
+                        priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
 
-            with col4:
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #ec4899, #db2777); border-radius: 12px;
-                            padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                    <div style='font-size: 2rem; margin-bottom: 5px;'>🔄</div>
-                    <div style='font-size: 2rem; font-weight: bold; color: white;'>{profile_data['duplicate_rows']:,}</div>
-                    <div style='font-size: 0.85rem; color: #fce7f3; margin-top: 5px;'>Duplicate Rows</div>
-                </div>
-                """, unsafe_allow_html=True)
+                        with st.container():
+                            st.markdown(f"""
+                            <div class="recommendation-card">
+                                <div class="recommendation-priority">{priority_color} Priority {i}</div>
+                                <div class="recommendation-text">{rec}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-            with col5:
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #8b5cf6, #7c3aed); border-radius: 12px;
-                            padding: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                    <div style='font-size: 2rem; margin-bottom: 5px;'>📁</div>
-                    <div style='font-size: 2rem; font-weight: bold; color: white;'>{len(df):,}</div>
-                    <div style='font-size: 0.85rem; color: #ede9fe; margin-top: 5px;'>Total Records</div>
-                </div>
-                """, unsafe_allow_html=True)
+            elif not st.session_state.ollama_connected:
+                st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered housing analysis.")
+        else:
+            st.info("Housing data not available in current dataset. Please ensure your dataset includes housing-related columns (e.g., 'room_number', 'housing_status', 'residence_hall').")
 
-            st.markdown("---")
+    # ====================================================================================
+    # TAB 7: FINANCIAL INTELLIGENCE - AI-DRIVEN
+    # ====================================================================================
+    with tabs[6]:
+        st.header("💰 Financial Intelligence - AI-Driven Deep Analysis")
+        st.caption("The AI analyzes financial sustainability, aid effectiveness, and revenue optimization strategies")
 
-            # Three-column layout for Data Composition
-            st.markdown("### 🎨 Data Composition Breakdown")
+        # Check for financial data
+        aid_col = None
+        for col in ['financial_aid_monetary_amount', 'financial_aid', 'aid', 'scholarship', 'scholarship_amount']:
+            if col in df.columns:
+                aid_col = col
+                break
 
-            col1, col2, col3 = st.columns(3)
+        tuition_col = None
+        for col in ['tuition_fees', 'tuition', 'fees', 'annual_tuition']:
+            if col in df.columns:
+                tuition_col = col
+                break
 
-            with col1:
-                st.markdown("""
-                <div style='background: rgba(99, 102, 241, 0.1); border: 2px solid #6366f1;
-                            border-radius: 12px; padding: 20px; height: 100%;'>
-                    <h4 style='text-align: center; background: linear-gradient(135deg, #6366f1, #4f46e5);
-                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
-                        🔢 Numeric Columns
-                    </h4>
-                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
-                        Quantitative measurements and metrics
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+        # Calculate financial metrics
+        total_tuition = metrics.get('total_tuition', 0)
+        total_aid = metrics.get('total_aid', 0)
+        aid_coverage_pct = (total_aid / total_tuition * 100) if total_tuition > 0 else 0
 
-                st.metric("Count", profile_data['numeric_cols'],
-                         delta=f"{(profile_data['numeric_cols']/len(df.columns)*100):.1f}% of total")
+        aid_recipients = 0
+        avg_aid_amount = 0
+        net_revenue = total_tuition - total_aid
 
-                # Show numeric column examples
-                numeric_cols_list = df.select_dtypes(include=['number']).columns.tolist()[:10]
-                if numeric_cols_list:
-                    st.markdown("**Examples:**")
-                    for col in numeric_cols_list[:5]:
-                        st.markdown(f"""
-                        <div style='background: rgba(30, 41, 59, 0.8); border-left: 3px solid #6366f1;
-                                    padding: 8px; margin: 5px 0; font-size: 0.8rem;'>
-                            📊 {col}
-                        </div>
-                        """, unsafe_allow_html=True)
+        if aid_col and aid_col in df.columns:
+            aid_recipients = df[df[aid_col] > 0].shape[0]
+            avg_aid_amount = df[df[aid_col] > 0][aid_col].mean() if aid_recipients > 0 else 0
 
-            with col2:
-                st.markdown("""
-                <div style='background: rgba(245, 158, 11, 0.1); border: 2px solid #f59e0b;
-                            border-radius: 12px; padding: 20px; height: 100%;'>
-                    <h4 style='text-align: center; background: linear-gradient(135deg, #f59e0b, #d97706);
-                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
-                        📝 Categorical Columns
-                    </h4>
-                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
-                        Classifications and descriptive attributes
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+        # Financial-focused metrics
+        col1, col2, col3, col4 = st.columns(4)
 
-                st.metric("Count", profile_data['categorical_cols'],
-                         delta=f"{(profile_data['categorical_cols']/len(df.columns)*100):.1f}% of total")
+        with col1:
+            st.metric("Total Tuition", f"AED {total_tuition:,.0f}",
+                     help="Gross tuition revenue from all students")
 
-                # Show categorical column examples
-                categorical_cols_list = df.select_dtypes(include=['object']).columns.tolist()[:10]
-                if categorical_cols_list:
-                    st.markdown("**Examples:**")
-                    for col in categorical_cols_list[:5]:
-                        st.markdown(f"""
-                        <div style='background: rgba(30, 41, 59, 0.8); border-left: 3px solid #f59e0b;
-                                    padding: 8px; margin: 5px 0; font-size: 0.8rem;'>
-                            📝 {col}
-                        </div>
-                        """, unsafe_allow_html=True)
+        with col2:
+            st.metric("Financial Aid", f"AED {total_aid:,.0f}",
+                     delta=f"-{aid_coverage_pct:.1f}%",
+                     delta_color="inverse",
+                     help="Total aid distributed to students")
 
-            with col3:
-                st.markdown("""
-                <div style='background: rgba(16, 185, 129, 0.1); border: 2px solid #10b981;
-                            border-radius: 12px; padding: 20px; height: 100%;'>
-                    <h4 style='text-align: center; background: linear-gradient(135deg, #10b981, #059669);
-                               padding: 12px; border-radius: 8px; margin-bottom: 15px; color: white;'>
-                        🆔 Special Columns
-                    </h4>
-                    <p style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 15px; text-align: center;'>
-                        Identifiers and unique attributes
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+        with col3:
+            st.metric("Net Revenue", f"AED {net_revenue:,.0f}",
+                     help="Tuition revenue after aid distribution")
 
-                st.metric("High Cardinality", profile_data['high_cardinality'],
-                         help="Likely IDs, unique identifiers, or highly unique fields")
-                st.metric("Low Cardinality", profile_data['low_cardinality'],
-                         help="Likely categories, statuses, or classification fields")
-
-            st.markdown("---")
-
-            # Missing Data Heatmap-style visualization
-            st.markdown("### 🔍 Missing Data Analysis")
-
-            missing_by_col = df.isnull().sum()
-            missing_pct = (missing_by_col / len(df) * 100).round(2)
-            missing_df_viz = pd.DataFrame({
-                'Column': missing_by_col.index,
-                'Missing Count': missing_by_col.values,
-                'Missing %': missing_pct.values
-            }).sort_values('Missing Count', ascending=False).head(20)
-
-            # Create bar chart for missing data
-            if len(missing_df_viz[missing_df_viz['Missing Count'] > 0]) > 0:
-                missing_display = missing_df_viz[missing_df_viz['Missing Count'] > 0].head(15)
-
-                fig_missing = px.bar(
-                    missing_display,
-                    x='Missing %',
-                    y='Column',
-                    orientation='h',
-                    title="Top 15 Columns with Missing Data",
-                    color='Missing %',
-                    color_continuous_scale='reds',
-                    labels={'Missing %': 'Missing Percentage (%)'}
-                )
-                fig_missing.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font=dict(color='white'),
-                    height=500,
-                    yaxis={'categoryorder': 'total ascending'}
-                )
-                st.plotly_chart(fig_missing, width='stretch')
+        with col4:
+            if aid_recipients > 0:
+                st.metric("Aid Recipients", f"{aid_recipients:,}",
+                         f"{(aid_recipients/len(df)*100):.1f}%",
+                         help="Students receiving financial aid")
             else:
-                st.success("✅ No missing data detected! This dataset is 100% complete.")
+                st.metric("Aid Coverage", f"{aid_coverage_pct:.1f}%",
+                         help="Aid as percentage of tuition revenue")
 
-            st.markdown("---")
+        st.divider()
 
-            # Data Type Distribution
-            st.markdown("### 📊 Data Type Distribution")
+        # AI Analysis Button
+        if st.session_state.ollama_connected and st.button("🤖 Generate Financial Sustainability Analysis & Visualizations", key="finance_btn", type="primary", width='stretch'):
 
-            col1, col2 = st.columns(2)
+            # Generate financial-focused analysis using hybrid approach
+            financial_analysis = generate_dynamic_visualizations_llm(
+                metrics,
+                df,
+                st.session_state.selected_model,
+                st.session_state.ollama_url,
+                context_type="financial"  # Financial-focused context
+            )
 
-            with col1:
-                # Pie chart for column types
-                type_data = pd.DataFrame({
-                    'Type': ['Numeric', 'Categorical', 'Datetime'],
-                    'Count': [profile_data['numeric_cols'], profile_data['categorical_cols'], profile_data['datetime_cols']]
-                })
-                type_data = type_data[type_data['Count'] > 0]
-
-                fig_types = px.pie(
-                    type_data,
-                    values='Count',
-                    names='Type',
-                    title='Column Type Distribution',
-                    color_discrete_sequence=['#6366f1', '#f59e0b', '#10b981']
-                )
-                fig_types.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font=dict(color='white'),
-                    height=400
-                )
-                st.plotly_chart(fig_types, width='stretch')
+            if financial_analysis:
+                # Display strategic overview
+                st.markdown("### 💰 Financial Sustainability Analysis")
+                st.info(financial_analysis.get('strategic_overview', ''))
 
-            with col2:
-                # Bar chart for cardinality distribution
-                cardinality_data = pd.DataFrame({
-                    'Category': ['High Cardinality\n(Unique IDs)', 'Low Cardinality\n(Categories)', 'Other'],
-                    'Count': [
-                        profile_data['high_cardinality'],
-                        profile_data['low_cardinality'],
-                        len(df.columns) - profile_data['high_cardinality'] - profile_data['low_cardinality']
-                    ]
-                })
+                st.divider()
 
-                fig_card = px.bar(
-                    cardinality_data,
-                    x='Category',
-                    y='Count',
-                    title='Cardinality Distribution',
-                    color='Count',
-                    color_continuous_scale='viridis'
-                )
-                fig_card.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font=dict(color='white'),
-                    height=400,
-                    showlegend=False
-                )
-                st.plotly_chart(fig_card, width='stretch')
-
-            st.markdown("---")
-
-            # ========== ADVANCED VISUALIZATIONS ==========
-            st.markdown("### 🔬 Advanced Statistical Analysis")
-
-            # Correlation Heatmap for Numeric Columns
-            numeric_cols_viz = df.select_dtypes(include=['number']).columns.tolist()
-            if len(numeric_cols_viz) >= 2:
-                st.markdown("#### 🔗 Correlation Heatmap (Top 15 Numeric Columns)")
-                st.caption("Identify relationships between numeric variables")
-
-                # Limit to top 15 for readability
-                corr_data = df[numeric_cols_viz[:15]].corr()
-
-                fig_corr = px.imshow(
-                    corr_data,
-                    labels=dict(color="Correlation"),
-                    x=corr_data.columns,
-                    y=corr_data.columns,
-                    color_continuous_scale='RdBu_r',
-                    zmin=-1, zmax=1,
-                    title="Correlation Matrix - Strong correlations indicate relationships"
-                )
-                fig_corr.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font=dict(color='white', size=9),
-                    height=600
-                )
-                st.plotly_chart(fig_corr, width='stretch')
-
-                # Highlight strong correlations
-                strong_corr = []
-                for i in range(len(corr_data.columns)):
-                    for j in range(i+1, len(corr_data.columns)):
-                        corr_val = corr_data.iloc[i, j]
-                        if abs(corr_val) > 0.7:
-                            strong_corr.append((corr_data.columns[i], corr_data.columns[j], corr_val))
-
-                if strong_corr:
-                    st.info(f"**💡 Strong Correlations Detected (>0.7):**")
-                    for col1, col2, val in strong_corr[:5]:
-                        emoji = "🔴" if val > 0 else "🔵"
-                        st.markdown(f"{emoji} **{col1}** ↔ **{col2}**: {val:.3f}")
-
-            st.markdown("---")
-
-            # Distribution Analysis for Top Numeric Columns
-            if numeric_cols_viz:
-                st.markdown("#### 📊 Distribution Analysis (Top 6 Numeric Columns)")
-                st.caption("Understand data spread, skewness, and normality")
-
-                col1, col2, col3 = st.columns(3)
-                cols = [col1, col2, col3]
-
-                for idx, col_name in enumerate(numeric_cols_viz[:6]):
-                    with cols[idx % 3]:
-                        fig_dist = px.histogram(
-                            df,
-                            x=col_name,
-                            nbins=30,
-                            title=f"{col_name[:20]}...",
-                            marginal="box"  # Add box plot on top
-                        )
-                        fig_dist.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                            font=dict(color='white'),
-                            height=300,
-                            showlegend=False
-                        )
-                        st.plotly_chart(fig_dist, width='stretch')
+                # Display visualizations with insights
+                st.markdown("### 📊 AI-Recommended Financial Visualizations")
+                viz_list = financial_analysis.get('visualizations', [])
+                st.caption(f"The AI analyzed your data and recommends {len(viz_list)} financial visualizations")
 
-                        # Show statistics
-                        skew = df[col_name].skew()
-                        skew_label = "Right-skewed" if skew > 0.5 else "Left-skewed" if skew < -0.5 else "Normal"
-                        st.caption(f"Skew: {skew:.2f} ({skew_label})")
+                for i, viz_spec in enumerate(viz_list):
+                    with st.container():
+                        st.markdown(f"#### {viz_spec.get('title', f'Visualization {i+1}')}")
+                        st.caption(f"**Why this matters:** {viz_spec.get('reasoning', 'Financial performance indicator')}")
 
-            st.markdown("---")
+                        # Build and display chart
+                        fig = build_dynamic_chart(viz_spec, df)
+                        if fig:
+                            st.plotly_chart(fig, width='stretch', key=f"financial_viz_{i}")
+                        else:
+                            st.warning(f"⚠️ Could not generate chart for: {viz_spec.get('data_column', 'unknown')}")
 
-            # Outlier Box Plots
-            if numeric_cols_viz:
-                st.markdown("#### 📦 Outlier Detection (Box Plots)")
-                st.caption("Identify outliers using IQR method (points beyond whiskers)")
+                        # Display AI insight
+                        insight = viz_spec.get('insight', '')
+                        if insight:
+                            st.markdown(f"""
+                            <div class="insight-card">
+                                <div class="insight-title">💰 Financial Insight</div>
+                                <div class="insight-text">{insight}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
 
-                col1, col2 = st.columns(2)
+                        st.divider()
 
-                for idx, col_name in enumerate(numeric_cols_viz[:4]):
-                    with col1 if idx % 2 == 0 else col2:
-                        fig_box = px.box(
-                            df,
-                            y=col_name,
-                            title=f"Outliers in {col_name[:25]}",
-                            points="outliers"  # Show only outlier points
-                        )
-                        fig_box.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                            font=dict(color='white'),
-                            height=350
-                        )
-                        st.plotly_chart(fig_box, width='stretch')
-
-                        # Calculate outlier count
-                        Q1 = df[col_name].quantile(0.25)
-                        Q3 = df[col_name].quantile(0.75)
-                        IQR = Q3 - Q1
-                        outlier_count = ((df[col_name] < (Q1 - 1.5 * IQR)) | (df[col_name] > (Q3 + 1.5 * IQR))).sum()
-                        if outlier_count > 0:
-                            st.warning(f"⚠️ {outlier_count} outliers detected ({(outlier_count/len(df)*100):.2f}%)")
-                        else:
-                            st.success(f"✅ No outliers detected")
-
-            st.markdown("---")
-
-            # Data Completeness by Column Type
-            st.markdown("#### 🎯 Completeness Breakdown by Column Type")
-            st.caption("Which column types have better data quality?")
-
-            completeness_by_type = []
-            for col_type, cols in [
-                ('Numeric', numeric_cols_viz),
-                ('Categorical', df.select_dtypes(include=['object']).columns.tolist()),
-                ('Datetime', df.select_dtypes(include=['datetime64']).columns.tolist())
-            ]:
-                if cols:
-                    type_completeness = (df[cols].count().sum() / (len(df) * len(cols)) * 100)
-                    completeness_by_type.append({
-                        'Column Type': col_type,
-                        'Completeness %': type_completeness,
-                        'Column Count': len(cols)
-                    })
+                # Display key findings
+                st.markdown("### 🔍 Key Financial Findings")
+                findings = financial_analysis.get('key_findings', [])
+                for i, finding in enumerate(findings, 1):
+                    st.markdown(f"**Finding {i}:** {finding}")
 
-            if completeness_by_type:
-                comp_df = pd.DataFrame(completeness_by_type)
-                fig_comp = px.bar(
-                    comp_df,
-                    x='Column Type',
-                    y='Completeness %',
-                    color='Completeness %',
-                    color_continuous_scale='greens',
-                    title='Data Completeness by Column Type',
-                    text='Completeness %'
-                )
-                fig_comp.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                fig_comp.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font=dict(color='white'),
-                    height=400,
-                    yaxis_range=[0, 105]
-                )
-                st.plotly_chart(fig_comp, width='stretch')
+                st.divider()
 
-            st.markdown("---")
+                # Display recommendations
+                st.markdown("### 💡 Financial Strategy Recommendations")
+                recommendations = financial_analysis.get('recommendations', [])
 
-            # Quality Score Gauge
-            st.markdown("#### 🎯 Overall Data Quality Score")
+                for i, rec in enumerate(recommendations, 1):
+                    # Color code by priority (first = high priority)
+                    priority_color = "🔴" if i == 1 else "🟠" if i == 2 else "🟢"
 
-            col1, col2, col3 = st.columns([2, 2, 1])
+                    with st.container():
+                        st.markdown(f"""
+                        <div class="recommendation-card">
+                            <div class="recommendation-priority">{priority_color} Priority {i}</div>
+                            <div class="recommendation-text">{rec}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
 
-            with col1:
-                quality_score = profile_data['completeness']
-                fig_gauge = go.Figure(go.Indicator(
-                    mode="gauge+number+delta",
-                    value=quality_score,
-                    title={'text': "Data Quality Score", 'font': {'color': 'white'}},
-                    delta={'reference': 90, 'increasing': {'color': "green"}},
-                    gauge={
-                        'axis': {'range': [0, 100], 'tickcolor': 'white'},
-                        'bar': {'color': "#10b981" if quality_score >= 90 else "#f59e0b" if quality_score >= 70 else "#ef4444"},
-                        'steps': [
-                            {'range': [0, 70], 'color': "rgba(239, 68, 68, 0.3)"},
-                            {'range': [70, 90], 'color': "rgba(245, 158, 11, 0.3)"},
-                            {'range': [90, 100], 'color': "rgba(16, 185, 129, 0.3)"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "white", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ))
-                fig_gauge.update_layout(
-                    paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                    font={'color': 'white'},
-                    height=400
-                )
-                st.plotly_chart(fig_gauge, width='stretch')
+        elif not st.session_state.ollama_connected:
+            st.warning("⚠️ Please connect to Ollama first (see sidebar) to generate AI-powered financial analysis.")
 
-            with col2:
-                st.markdown("**Quality Score Interpretation:**")
-                if quality_score >= 90:
-                    st.success("🌟 **EXCELLENT** (90-100%)\nData is highly reliable for analysis and decision-making")
-                elif quality_score >= 70:
-                    st.warning("⚠️ **GOOD** (70-90%)\nData is usable but has some quality issues to address")
-                else:
-                    st.error("🚨 **NEEDS IMPROVEMENT** (<70%)\nSignificant data quality issues require immediate attention")
+    # ====================================================================================
+    # TAB 8: DEMOGRAPHICS DEEP DIVE - AI-DRIVEN
+    # ====================================================================================
+    with tabs[7]:
+        render_demographics_tab(df, metrics)
 
-                st.markdown(f"""
-                **Score Components:**
-                - Completeness: {profile_data['completeness']:.1f}%
-                - Missing Cells: {profile_data['total_missing']:,}
-                - Duplicates: {profile_data['duplicate_rows']:,}
-                - Columns with Nulls: {profile_data['columns_with_nulls']}/{len(df.columns)}
-                """)
+    # ====================================================================================
+    # TAB 9: RISK & SUCCESS ANALYSIS - AI-DRIVEN
+    # ====================================================================================
+    with tabs[8]:
+        render_risk_success_tab(df, metrics)
 
-        st.divider()
+    # ====================================================================================
+    # TAB 10: DATA LINEAGE & GENERATIVE DATA PROFILING
+    # ====================================================================================
+    with tabs[9]:
+        st.header("🔗 Data Lineage & Architecture")
 
-        # ========== DATA QUALITY INDICATORS ==========
-        st.subheader("📊 Data Quality Dashboard")
+        st.info("📊 Dataset Overview - Comprehensive Statistics")
 
-        col1, col2, col3 = st.columns(3)
+        # Overall table statistics
+        col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            duplicate_rows = df.duplicated().sum()
-            st.markdown(f"""
-            <div class="insight-card">
-                <h4 style="color: #6366f1;">🔄 Duplicate Rows</h4>
-                <p style="color: #e2e8f0; font-size: 1.2rem;">
-                    {duplicate_rows:,} ({(duplicate_rows/len(df)*100):.2f}%)
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Total Records", f"{len(df):,}")
 
         with col2:
-            columns_with_nulls = df.isnull().any().sum()
-            st.markdown(f"""
-            <div class="insight-card">
-                <h4 style="color: #f59e0b;">⚠️ Columns with Nulls</h4>
-                <p style="color: #e2e8f0; font-size: 1.2rem;">
-                    {columns_with_nulls} / {len(df.columns)}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Total Columns", len(df.columns))
 
         with col3:
-            numeric_cols_count = len(df.select_dtypes(include=['number']).columns)
-            st.markdown(f"""
-            <div class="insight-card">
-                <h4 style="color: #10b981;">🔢 Numeric Columns</h4>
-                <p style="color: #e2e8f0; font-size: 1.2rem;">
-                    {numeric_cols_count} / {len(df.columns)}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            completeness = (df.count().sum() / (len(df) * len(df.columns)) * 100)
+            st.metric("Completeness", f"{completeness:.1f}%")
+
+        with col4:
+            memory_usage = get_deep_memory_mb(df)
+            st.metric("Memory Usage", f"{memory_usage:.2f} MB")
 
         st.divider()
 
-        # ========== COLUMN-LEVEL PROFILING ==========
-        with st.expander("📋 Column-Level Analysis", expanded=False):
-            st.markdown("#### Detailed Column Profiling")
+        render_generative_profiling(df, model, url, completeness)
 
-            # Select column to profile
-            profile_column = st.selectbox("Select Column to Profile", df.columns, key="profile_col")
+        st.divider()
 
-            if profile_column:
-                col1, col2 = st.columns(2)
+        # ========== DATA QUALITY INDICATORS ==========
+        st.subheader("📊 Data Quality Dashboard")
 
-                with col1:
-                    # Basic stats
-                    st.markdown("**Basic Statistics**")
-                    stats_df = pd.DataFrame({
-                        'Metric': ['Count', 'Unique Values', 'Null Count', 'Null %', 'Most Common'],
-                        'Value': [
-                            f"{df[profile_column].count():,}",
-                            f"{df[profile_column].nunique():,}",
-                            f"{df[profile_column].isnull().sum():,}",
-                            f"{(df[profile_column].isnull().sum() / len(df) * 100):.2f}%",
-                            str(df[profile_column].mode()[0]) if len(df[profile_column].mode()) > 0 else 'N/A'
-                        ]
-                    })
-                    st.dataframe(stats_df, width='stretch', hide_index=True)
-
-                    # Numeric statistics if applicable
-                    if pd.api.types.is_numeric_dtype(df[profile_column]):
-                        st.markdown("**Numeric Statistics**")
-                        numeric_stats = pd.DataFrame({
-                            'Metric': ['Mean', 'Median', 'Std Dev', 'Min', 'Max', 'Q1', 'Q3'],
-                            'Value': [
-                                f"{df[profile_column].mean():.2f}",
-                                f"{df[profile_column].median():.2f}",
-                                f"{df[profile_column].std():.2f}",
-                                f"{df[profile_column].min():.2f}",
-                                f"{df[profile_column].max():.2f}",
-                                f"{df[profile_column].quantile(0.25):.2f}",
-                                f"{df[profile_column].quantile(0.75):.2f}"
-                            ]
-                        })
-                        st.dataframe(numeric_stats, width='stretch', hide_index=True)
+        # Shared with the profiling report; recomputed only when a new dataset is loaded
+        primitives = get_profile_primitives(df)
 
-                with col2:
-                    # Value distribution
-                    st.markdown("**Value Distribution (Top 10)**")
-                    value_counts = df[profile_column].value_counts().head(10)
-
-                    if pd.api.types.is_numeric_dtype(df[profile_column]):
-                        # Histogram for numeric columns
-                        fig_dist = px.histogram(
-                            df, x=profile_column,
-                            nbins=30,
-                            title=f"Distribution of {profile_column}"
-                        )
-                        fig_dist.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                            font=dict(color='white'),
-                            height=300
-                        )
-                        st.plotly_chart(fig_dist, width='stretch')
-                    else:
-                        # Bar chart for categorical columns
-                        fig_dist = px.bar(
-                            x=value_counts.index.astype(str),
-                            y=value_counts.values,
-                            title=f"Top 10 Values in {profile_column}"
-                        )
-                        fig_dist.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                            font=dict(color='white'),
-                            height=300,
-                            xaxis_title="Value",
-                            yaxis_title="Count"
-                        )
-                        st.plotly_chart(fig_dist, width='stretch')
+        duplicate_rows = primitives['duplicate_rows']
+        columns_with_nulls = primitives['columns_with_nulls']
+        numeric_cols_count = len(primitives['numeric_cols'])
 
-        # ========== CARDINALITY ANALYSIS ==========
-        with st.expander("🔍 Cardinality Analysis", expanded=False):
-            st.markdown("#### Column Cardinality (Uniqueness)")
+        # All three indicator cards are rendered as one flex row (single markdown element)
+        quality_cards = [
+            ("#6366f1", "🔄 Duplicate Rows", f"{duplicate_rows:,} ({(duplicate_rows/len(df)*100):.2f}%)"),
+            ("#f59e0b", "⚠️ Columns with Nulls", f"{columns_with_nulls} / {len(df.columns)}"),
+            ("#10b981", "🔢 Numeric Columns", f"{numeric_cols_count} / {len(df.columns)}")
+        ]
+        st.markdown(
+            "<div style='display: flex; gap: 1rem;'>" + "".join(
+                f"<div class='insight-card' style='flex: 1;'>"
+                f"<h4 style='color: {color};'>{title}</h4>"
+                f"<p style='color: #e2e8f0; font-size: 1.2rem;'>{value}</p>"
+                f"</div>"
+                for color, title, value in quality_cards
+            ) + "</div>",
+            unsafe_allow_html=True
+        )
 
-            cardinality_df = pd.DataFrame({
-                'Column': df.columns,
-                'Unique Values': [df[col].nunique() for col in df.columns],
-                'Cardinality %': [(df[col].nunique() / len(df) * 100) for col in df.columns]
-            })
-            cardinality_df = cardinality_df.sort_values('Unique Values', ascending=False)
-
-            fig_card = px.bar(
-                cardinality_df.head(15),
-                x='Column',
-                y='Unique Values',
-                title="Top 15 Columns by Cardinality",
-                color='Cardinality %',
-                color_continuous_scale='viridis'
-            )
-            fig_card.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(30, 41, 59, 0.85)',
-                font=dict(color='white'),
-                height=400
-            )
-            st.plotly_chart(fig_card, width='stretch')
+        st.divider()
+
+        # ========== COLUMN-LEVEL PROFILING ==========
+        render_column_level_analysis(df, primitives, model, url)
 
-            st.dataframe(cardinality_df, width='stretch', height=300)
+        # ========== CARDINALITY ANALYSIS ==========
+        render_cardinality_analysis(df, primitives)
 
         # ========== ALL COLUMNS TABLE ==========
-        with st.expander("📋 View All Columns", expanded=False):
-            st.dataframe(
-                pd.DataFrame({
-                    'Column': df.columns,
-                    'Type': df.dtypes.astype(str),
-                    'Non-Null Count': df.count(),
-                    'Null Count': df.isnull().sum(),
-                    'Null %': (df.isnull().sum() / len(df) * 100).round(2),
-                    'Unique Values': [df[col].nunique() for col in df.columns]
-                }),
-                width='stretch',
-                height=400
-            )
+        render_all_columns_table(df, primitives)
 
         st.divider()
 
@@ -13689,9 +14545,13 @@ Provide exactly 8 sections using markdown headers (##). Be specific, factual, an
                 try:
                     with st.spinner(f"🔍 Discovering insights, patterns, and generating recommendations... (this may take {timeout_msg})"):
 
-                        # Step 1: Auto-discover insights
-                        st.info("📊 Step 1/2: Analyzing data quality, correlations, trends, outliers, and patterns...")
-                        auto_insights = auto_discover_insights(df, model, url)
+                        # Insights and recommendations are generated concurrently from shared statistics
+                        st.info("📊 Analyzing data quality, correlations, trends, outliers, and patterns, and generating actionable business recommendations...")
+                        # Key findings stream in as they are generated; recommendations finish in the background
+                        insights_stream_placeholder = st.empty()
+                        auto_insights, recommendations = generate_insights_and_recommendations(
+                            df, model, url, stream_placeholder=insights_stream_placeholder
+                        )
 
                         if not auto_insights:
                             st.error("❌ Failed to generate insights. Please try again.")
@@ -13699,14 +14559,8 @@ Provide exactly 8 sections using markdown headers (##). Be specific, factual, an
                             st.stop()
 
                         st.session_state.ai_insights['auto_insights'] = auto_insights
-                        st.success("✅ Step 1 complete: Insights discovered!")
-
-                        # Step 2: Generate recommendations
-                        st.info("💡 Step 2/2: Generating actionable business recommendations...")
-                        recommendations = generate_business_recommendations(df, auto_insights, model, url)
-
                         st.session_state.ai_insights['recommendations'] = recommendations
-                        st.success("✅ Step 2 complete: Recommendations generated!")
+                        st.success("✅ Insights discovered and recommendations generated!")
 
                         st.session_state['generating_insights'] = False
                         st.rerun()
@@ -13809,46 +14663,38 @@ Provide exactly 8 sections using markdown headers (##). Be specific, factual, an
                         recommendations = st.session_state.ai_insights['recommendations']
 
                         if recommendations:
-                            # Group by priority
-                            high_priority = [r for r in recommendations if r['priority'] == 'HIGH']
-                            medium_priority = [r for r in recommendations if r['priority'] == 'MEDIUM']
-                            low_priority = [r for r in recommendations if r['priority'] == 'LOW']
+                            # Group by priority in a single pass
+                            priority_groups = {priority: [] for priority in RECOMMENDATION_PRIORITY_COLORS}
+                            for rec in recommendations:
+                                if rec['priority'] in priority_groups:
+                                    priority_groups[rec['priority']].append(rec)
+                            high_priority = priority_groups['HIGH']
+                            medium_priority = priority_groups['MEDIUM']
+                            low_priority = priority_groups['LOW']
 
                             # Display HIGH priority first
                             if high_priority:
                                 st.markdown("### 🔴 High Priority")
-                                for idx, rec in enumerate(high_priority, 1):
-                                    with st.container():
-                                        st.markdown(f"""
-                                        <div style='background: rgba(239, 68, 68, 0.1); border-left: 4px solid #ef4444; padding: 15px; margin: 10px 0; border-radius: 8px;'>
-                                            <p style='margin: 0; color: #e2e8f0;'><strong>{idx}. {rec['recommendation']}</strong></p>
-                                            <p style='margin: 5px 0 0 0; color: #94a3b8; font-size: 0.85rem;'>Category: {rec['category']}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                                st.markdown(
+                                    build_recommendation_cards_html(high_priority, 'HIGH'),
+                                    unsafe_allow_html=True
+                                )
 
                             # Display MEDIUM priority
                             if medium_priority:
                                 st.markdown("### 🟡 Medium Priority")
-                                for idx, rec in enumerate(medium_priority, 1):
-                                    with st.container():
-                                        st.markdown(f"""
-                                        <div style='background: rgba(245, 158, 11, 0.1); border-left: 4px solid #f59e0b; padding: 15px; margin: 10px 0; border-radius: 8px;'>
-                                            <p style='margin: 0; color: #e2e8f0;'><strong>{idx}. {rec['recommendation']}</strong></p>
-                                            <p style='margin: 5px 0 0 0; color: #94a3b8; font-size: 0.85rem;'>Category: {rec['category']}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                                st.markdown(
+                                    build_recommendation_cards_html(medium_priority, 'MEDIUM'),
+                                    unsafe_allow_html=True
+                                )
 
                             # Display LOW priority
                             if low_priority:
                                 st.markdown("### 🟢 Low Priority")
-                                for idx, rec in enumerate(low_priority, 1):
-                                    with st.container():
-                                        st.markdown(f"""
-                                        <div style='background: rgba(16, 185, 129, 0.1); border-left: 4px solid #10b981; padding: 15px; margin: 10px 0; border-radius: 8px;'>
-                                            <p style='margin: 0; color: #e2e8f0;'><strong>{idx}. {rec['recommendation']}</strong></p>
-                                            <p style='margin: 5px 0 0 0; color: #94a3b8; font-size: 0.85rem;'>Category: {rec['category']}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
+                                st.markdown(
+                                    build_recommendation_cards_html(low_priority, 'LOW'),
+                                    unsafe_allow_html=True
+                                )
                         else:
                             st.info("No recommendations generated yet")
                     else:
@@ -13881,36 +14727,26 @@ Provide exactly 8 sections using markdown headers (##). Be specific, factual, an
             if st.button("🤖 Ask AI", key="qa_btn"):
                 if user_question.strip():
                     with st.spinner("🔄 AI is analyzing your question..."):
-                        # Prepare data context
-                        data_summary = {
-                            'total_records': len(df),
-                            'columns': df.columns.tolist()[:30],
-                            'sample_stats': {}
-                        }
-
-                        # Add numeric column stats
-                        numeric_cols = df.select_dtypes(include=[np.number]).columns[:10]
-                        for col in numeric_cols:
-                            data_summary['sample_stats'][col] = {
-                                'mean': float(df[col].mean()),
-                                'min': float(df[col].min()),
-                                'max': float(df[col].max())
-                            }
-
-                        prompt = f"""You are analyzing a student dataset with {len(df):,} records.
-
-**Available Metrics:**
-{json.dumps(metrics, indent=2)}
-
-**Data Summary:**
-{json.dumps(data_summary, indent=2)[:1000]}
-
+                        # Data context is cached per dataset; only the question changes per request
+                        prompt = get_qa_prompt_prefix(df, metrics) + f"""
 **User Question:**
 {user_question}
 
 Provide a clear, data-driven answer based on the available metrics and data summary. If you need specific data that's not provided, explain what insights you can provide with available information."""
 
-                        response = query_ollama(prompt, model, url, temperature=0.5, num_predict=600, auto_optimize=True)
+                        # Per-request timeout sized for the endpoint; a timed-out request is retried once with half the tokens.
+                        # The Cloudflare value is pre-divided because _build_ollama_options scales it back up.
+                        is_cloudflare = "cloudflare" in url.lower() or "exalio" in url.lower()
+                        response = query_ollama_with_retry(
+                            prompt, model, url,
+                            num_predict=600,
+                            temperature=0.5,
+                            timeout=(
+                                QA_TIMEOUT_CLOUDFLARE_SECONDS // CLOUDFLARE_TIMEOUT_MULTIPLIER
+                                if is_cloudflare else QA_TIMEOUT_LOCAL_SECONDS
+                            ),
+                            auto_optimize=True
+                        )
 
                         if response and not response.startswith('[ERROR]'):
                             st.markdown(f"""
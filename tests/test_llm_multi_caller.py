@@ -0,0 +1,87 @@
+"""Tests for section batching in llm_multi_caller (no Ollama server needed)"""
+
+import copy
+
+import llm_multi_caller
+from configs import SECTIONS_REGISTRY
+from llm_multi_caller import build_batched_prompt, execute_batched, parse_batched_response
+
+
+def _sections(count=3):
+    """Executive summary sections with their final prompts filled in"""
+    sections = copy.deepcopy(SECTIONS_REGISTRY['executive_summary'][:count])
+    for section in sections:
+        section['final_prompt'] = section['prompt_template'].replace('{context}', 'Total Records: 2,550')
+    return sections
+
+
+def _answer(name):
+    return f"{name}: 42% of 2,550 students, with a $1.2M impact on revenue and retention over the next year."
+
+
+def _reply(names):
+    """A realistic model reply: preamble, markdown inside the answers, blank lines"""
+    blocks = [f"<<<SECTION {name}>>>\n{_answer(name)}\n- detail one\n- detail two\n<<<END>>>" for name in names]
+    return "Sure! Here are the sections.\n\n" + "\n\n".join(blocks) + "\n\nLet me know if you need more."
+
+
+def _fake_llm(calls, batched_reply):
+    """Stand-in for call_llm_with_retry: the batched prompt gets batched_reply, single prompts a plain answer"""
+    def call(prompt, **options):
+        calls.append(prompt)
+        response = batched_reply if '<<<SECTION section_name>>>' in prompt else _answer('single')
+        return {'success': True, 'response': response, 'tokens': 30, 'time': 0.1, 'error': None}
+    return call
+
+
+def test_batched_prompt_overrides_section_output_directives():
+    sections = _sections()
+    prompt = build_batched_prompt(sections)
+
+    assert 'no headers, no labels' not in prompt
+    assert 'OUTPUT ONLY' not in prompt
+    for section in sections:
+        assert f"between <<<SECTION {section['name']}>>> and <<<END>>>" in prompt
+
+
+def test_parse_realistic_batched_reply():
+    names = [section['name'] for section in _sections()]
+    answers = parse_batched_response(_reply(names))
+
+    assert list(answers) == names
+    assert answers[names[0]].startswith(f"{names[0]}: 42%")
+    assert answers[names[0]].endswith("- detail two")
+
+
+def test_parse_tolerates_marker_spacing_and_case():
+    answers = parse_batched_response("<<< section big_picture >>>\nText\n<<< end >>>")
+
+    assert answers == {'big_picture': 'Text'}
+
+
+def test_execute_batched_answers_all_sections_in_one_call(monkeypatch):
+    sections = _sections()
+    calls = []
+    monkeypatch.setattr(
+        llm_multi_caller, 'call_llm_with_retry',
+        _fake_llm(calls, _reply([section['name'] for section in sections]))
+    )
+
+    results = execute_batched(sections, {'batch_size': 3})
+
+    assert len(calls) == 1
+    assert all(results[section['name']]['success'] for section in sections)
+
+
+def test_execute_batched_falls_back_for_sections_missing_from_reply(monkeypatch):
+    sections = _sections()
+    calls = []
+    monkeypatch.setattr(llm_multi_caller, 'call_llm_with_retry', _fake_llm(calls, _reply([sections[0]['name']])))
+
+    results = execute_batched(sections, {'batch_size': 3})
+
+    # One batch call plus one dedicated call per unanswered section
+    assert len(calls) == 3
+    assert results[sections[0]['name']]['response'].startswith(sections[0]['name'])
+    for section in sections[1:]:
+        assert results[section['name']]['response'].startswith('single')
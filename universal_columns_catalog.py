@@ -13,17 +13,34 @@ Features:
 - Semantic grouping for analysis patterns
 """
 
-from typing import Dict, List, Optional, Any
+import re
+import sys
+import json
+import difflib
+import functools
+from bisect import bisect_left
+from typing import Dict, List, Optional, Any, Callable, Iterable, NamedTuple, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# Optional: orjson for faster catalog serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # ENUMS FOR SEMANTIC CATEGORIES
 # ═════════════════════════════════════════════════════════════════════════════
 
-class ColumnCategory(Enum):
-    """Semantic categories for columns"""
+class ColumnCategory(str, Enum):
+    """Semantic categories for columns (str mixin: members hash and compare as their value in C)"""
     # Student Analytics Categories
     IDENTIFIER = "identifier"
     PERSONAL_INFO = "personal_info"
@@ -51,8 +68,8 @@ class ColumnCategory(Enum):
     PERFORMANCE_MONITORING = "performance_monitoring"
 
 
-class DataType(Enum):
-    """Data types for validation"""
+class DataType(str, Enum):
+    """Data types for validation (str mixin: members hash and compare as their value in C)"""
     STRING = "string"
     INTEGER = "integer"
     FLOAT = "float"
@@ -67,1389 +84,1714 @@ class DataType(Enum):
 # COLUMN DEFINITION CLASS
 # ═════════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class ColumnDefinition:
-    """Definition of a single column with metadata"""
-    name: str                           # Primary column name
-    category: ColumnCategory            # Semantic category
-    data_type: DataType                 # Expected data type
-    description: str                    # Business description
-    aliases: List[str] = None          # Alternative names
-    nullable: bool = True               # Can contain null values
-    validation_rules: Dict[str, Any] = None  # Validation constraints
-    business_logic: str = None         # Business rules and calculations
-    used_for: List[str] = None         # Common use cases
-
-    def __post_init__(self):
-        """Initialize default values"""
-        if self.aliases is None:
-            self.aliases = []
-        if self.validation_rules is None:
-            self.validation_rules = {}
-        if self.used_for is None:
-            self.used_for = []
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-# UNIVERSAL COLUMNS CATALOG
-# ═════════════════════════════════════════════════════════════════════════════
-
-UNIVERSAL_COLUMNS_CATALOG = {
-
-    # ═══════════════════════════════════════════════════════════════════
-    # IDENTIFIERS
-    # ═══════════════════════════════════════════════════════════════════
-
-    "student_id": ColumnDefinition(
-        name="student_id",
-        category=ColumnCategory.IDENTIFIER,
-        data_type=DataType.STRING,
-        description="Unique student identifier",
-        aliases=["studentid", "id", "student_number"],
-        nullable=False,
-        used_for=["primary_key", "unique_counting", "joins"]
-    ),
-
-    "emirates_id": ColumnDefinition(
-        name="emirates_id",
-        category=ColumnCategory.IDENTIFIER,
-        data_type=DataType.STRING,
-        description="UAE National ID number",
-        aliases=["eid", "national_id"],
-        nullable=True,
-        used_for=["uae_national_identification", "compliance"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # PERSONAL INFORMATION
-    # ═══════════════════════════════════════════════════════════════════
-
-    "first_name_en": ColumnDefinition(
-        name="first_name_en",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student first name in English",
-        aliases=["firstname_en", "given_name"],
-        used_for=["student_identification", "communications"]
-    ),
-
-    "last_name_en": ColumnDefinition(
-        name="last_name_en",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student last name in English",
-        aliases=["lastname_en", "family_name", "surname"],
-        used_for=["student_identification", "communications"]
-    ),
-
-    "first_name_ar": ColumnDefinition(
-        name="first_name_ar",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student first name in Arabic",
-        aliases=["firstname_ar"],
-        used_for=["localization", "official_documents"]
-    ),
-
-    "last_name_ar": ColumnDefinition(
-        name="last_name_ar",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student last name in Arabic",
-        aliases=["lastname_ar"],
-        used_for=["localization", "official_documents"]
-    ),
-
-    "middle_name": ColumnDefinition(
-        name="middle_name",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student middle name",
-        aliases=["middlename"],
-        used_for=["full_name_construction"]
-    ),
-
-    "email_address": ColumnDefinition(
-        name="email_address",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student email address (unified field)",
-        aliases=["email"],
-        business_logic="Aggregated from university_email or personal_email",
-        used_for=["communications", "contact"]
-    ),
-
-    "university_email": ColumnDefinition(
-        name="university_email",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="University-issued email address",
-        aliases=["institutional_email"],
-        used_for=["official_communications", "contact"]
-    ),
-
-    "personal_email": ColumnDefinition(
-        name="personal_email",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student's personal email address",
-        used_for=["alternative_contact", "communications"]
-    ),
-
-    "phone_number": ColumnDefinition(
-        name="phone_number",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.STRING,
-        description="Student contact phone number",
-        aliases=["phone", "mobile", "contact_number"],
-        used_for=["communications", "contact"]
-    ),
-
-    "date_of_birth": ColumnDefinition(
-        name="date_of_birth",
-        category=ColumnCategory.PERSONAL_INFO,
-        data_type=DataType.DATE,
-        description="Student date of birth",
-        aliases=["dob", "birthdate"],
-        used_for=["age_calculation", "demographics"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DEMOGRAPHIC INFORMATION
-    # ═══════════════════════════════════════════════════════════════════
-
-    "gender": ColumnDefinition(
-        name="gender",
-        category=ColumnCategory.DEMOGRAPHIC,
-        data_type=DataType.CATEGORICAL,
-        description="Student gender",
-        aliases=["sex"],
-        validation_rules={"allowed_values": ["Male", "Female", "Other"]},
-        used_for=["demographic_analysis", "diversity_metrics"]
-    ),
-
-    "nationality": ColumnDefinition(
-        name="nationality",
-        category=ColumnCategory.DEMOGRAPHIC,
-        data_type=DataType.STRING,
-        description="Student nationality (country code or name)",
-        aliases=["country", "citizenship"],
-        used_for=["diversity_analysis", "regional_grouping", "uae_vs_international"]
-    ),
-
-    "age_at_first_enrollment": ColumnDefinition(
-        name="age_at_first_enrollment",
-        category=ColumnCategory.DEMOGRAPHIC,
-        data_type=DataType.INTEGER,
-        description="Student age at first enrollment",
-        aliases=["enrollment_age", "starting_age"],
-        validation_rules={"min": 16, "max": 100},
-        used_for=["cohort_analysis", "demographic_segmentation"]
-    ),
-
-    "total_in_region": ColumnDefinition(
-        name="total_in_region",
-        category=ColumnCategory.DEMOGRAPHIC,
-        data_type=DataType.INTEGER,
-        description="Total students from same region",
-        business_logic="Aggregated count by region",
-        used_for=["regional_analysis", "diversity_metrics"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # ACADEMIC PERFORMANCE
-    # ═══════════════════════════════════════════════════════════════════
-
-    "cumulative_gpa": ColumnDefinition(
-        name="cumulative_gpa",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.FLOAT,
-        description="Overall cumulative GPA (0.0-4.0 scale)",
-        aliases=["gpa", "cgpa", "overall_gpa"],
-        nullable=True,
-        validation_rules={"min": 0.0, "max": 4.0},
-        business_logic="Performance tiers: High (>=3.5), Mid (2.5-3.5), At-risk (<2.5)",
-        used_for=[
-            "performance_analysis",
-            "risk_scoring",
-            "uae_vs_international_comparison",
-            "housing_impact_analysis",
-            "aid_correlation"
-        ]
-    ),
-
-    "term_gpa": ColumnDefinition(
-        name="term_gpa",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.FLOAT,
-        description="Single term/semester GPA",
-        aliases=["semester_gpa", "current_gpa"],
-        validation_rules={"min": 0.0, "max": 4.0},
-        used_for=["term_performance_tracking"]
-    ),
-
-    "major_gpa": ColumnDefinition(
-        name="major_gpa",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.FLOAT,
-        description="Major-specific GPA",
-        aliases=["program_gpa"],
-        validation_rules={"min": 0.0, "max": 4.0},
-        used_for=["program_performance_analysis"]
-    ),
-
-    "grade_point": ColumnDefinition(
-        name="grade_point",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.FLOAT,
-        description="Average grade point value",
-        aliases=["avg_grade_point"],
-        used_for=["grade_distribution_analysis"]
-    ),
-
-    "academic_standing": ColumnDefinition(
-        name="academic_standing",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.CATEGORICAL,
-        description="Academic status (Good Standing, Probation, etc.)",
-        aliases=["standing", "status"],
-        validation_rules={"allowed_values": ["Good Standing", "Academic Probation", "Academic Warning", "Dismissed"]},
-        used_for=["risk_identification", "intervention_targeting"]
-    ),
-
-    "academic_program": ColumnDefinition(
-        name="academic_program",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.CATEGORICAL,
-        description="Degree program or major",
-        aliases=["program", "major", "degree_program"],
-        used_for=["program_analysis", "cohort_comparison"]
-    ),
-
-    "gpa_trend": ColumnDefinition(
-        name="gpa_trend",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.STRING,
-        description="GPA trajectory over time (Improving, Declining, Stable)",
-        validation_rules={"allowed_values": ["Improving", "Declining", "Stable"]},
-        business_logic="Calculated from term-by-term GPA changes",
-        used_for=["performance_tracking", "intervention_targeting"]
-    ),
+class ValidationRules(NamedTuple):
+    """Validation constraints for a column (unset constraints are None / empty)"""
+    min: Optional[float] = None                 # Minimum allowed value
+    max: Optional[float] = None                 # Maximum allowed value
+    allowed_values: Tuple[str, ...] = ()        # Allowed categorical values (declared order)
+    currency: Optional[str] = None              # Currency code for monetary columns
+    allowed_value_set: frozenset = frozenset()  # allowed_values as a set, for O(1) membership tests
 
-    "avg_gpa": ColumnDefinition(
-        name="avg_gpa",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="Average GPA (aggregated metric)",
-        business_logic="Mean of cumulative_gpa across a group",
-        used_for=["group_comparisons", "cohort_analysis"]
-    ),
 
-    "std_gpa": ColumnDefinition(
-        name="std_gpa",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="GPA standard deviation (aggregated metric)",
-        business_logic="Standard deviation of cumulative_gpa across a group",
-        used_for=["variability_analysis", "consistency_tracking"]
-    ),
+NO_VALIDATION_RULES = ValidationRules()
 
-    "min_gpa": ColumnDefinition(
-        name="min_gpa",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="Minimum GPA in group (aggregated metric)",
-        business_logic="Minimum cumulative_gpa in a group",
-        used_for=["range_analysis", "at_risk_identification"]
-    ),
 
-    "max_gpa": ColumnDefinition(
-        name="max_gpa",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="Maximum GPA in group (aggregated metric)",
-        business_logic="Maximum cumulative_gpa in a group",
-        used_for=["range_analysis", "top_performer_identification"]
-    ),
+# Flyweight pool for the immutable tuples held by column definitions: many columns share
+# identical use-case tag sets and validation rules, which then share one object
+_FLYWEIGHT_POOL: Dict[tuple, tuple] = {}
 
-    "avg_credits": ColumnDefinition(
-        name="avg_credits",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="Average credits attempted (aggregated metric)",
-        business_logic="Mean of credits_attempted across a group",
-        used_for=["enrollment_intensity_analysis"]
-    ),
 
-    "avg_progress": ColumnDefinition(
-        name="avg_progress",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.FLOAT,
-        description="Average degree progress (aggregated metric)",
-        business_logic="Mean of degree_progress_pct across a group",
-        used_for=["completion_tracking", "cohort_analysis"]
-    ),
+def _pooled(value: tuple) -> tuple:
+    """Return the pooled instance equal to an immutable tuple (adding it on first sight)"""
+    return _FLYWEIGHT_POOL.setdefault(value, value)
 
-    "high_performer_rate": ColumnDefinition(
-        name="high_performer_rate",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.PERCENTAGE,
-        description="Percentage of high performers in group",
-        business_logic="(Students with GPA >= 3.5 / Total Students) * 100",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["performance_benchmarking", "program_comparison"]
-    ),
 
-    "credits_attempted": ColumnDefinition(
-        name="credits_attempted",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.INTEGER,
-        description="Total credits attempted/pursued",
-        aliases=["credits", "total_credits"],
-        validation_rules={"min": 0},
-        business_logic="Used to calculate degree progress and enrollment intensity",
-        used_for=["progress_tracking", "cohort_comparison"]
-    ),
+# __slots__ dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-    "degree_progress_pct": ColumnDefinition(
-        name="degree_progress_pct",
-        category=ColumnCategory.ACADEMIC_PERFORMANCE,
-        data_type=DataType.PERCENTAGE,
-        description="Percentage of degree completed (0-100)",
-        aliases=["progress_pct", "completion_pct"],
-        validation_rules={"min": 0, "max": 100},
-        used_for=["retention_analysis", "graduation_prediction"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # ENROLLMENT STATUS
-    # ═══════════════════════════════════════════════════════════════════
-
-    "enrollment_enrollment_status": ColumnDefinition(
-        name="enrollment_enrollment_status",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.CATEGORICAL,
-        description="Current enrollment status",
-        aliases=["enrollment_status", "status", "student_status"],
-        validation_rules={"allowed_values": ["Active", "Graduated", "Suspended", "Withdrawn", "Leave of Absence"]},
-        business_logic="Filters: Active vs Graduated for current vs historical cohorts",
-        used_for=["active_filtering", "retention_metrics", "graduation_tracking"]
-    ),
-
-    "enrollment_type": ColumnDefinition(
-        name="enrollment_type",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.CATEGORICAL,
-        description="Enrollment category (Full-time, Part-time, Level)",
-        aliases=["type", "program_type"],
-        used_for=["cohort_grouping", "program_comparison"]
-    ),
-
-    "enrollment_date": ColumnDefinition(
-        name="enrollment_date",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.DATE,
-        description="Initial admission/enrollment date",
-        aliases=["admission_date", "start_date"],
-        used_for=["cohort_assignment", "tenure_calculation"]
-    ),
-
-    "cohort_year": ColumnDefinition(
-        name="cohort_year",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.INTEGER,
-        description="Year of admission/cohort",
-        aliases=["admission_year", "entry_year"],
-        business_logic="Primary grouping variable for year-on-year comparisons",
-        used_for=[
-            "cohort_analysis",
-            "retention_tracking",
-            "yoy_comparison"
-        ]
-    ),
-
-    "cohort_term": ColumnDefinition(
-        name="cohort_term",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.STRING,
-        description="Admission semester/term (Fall, Spring, Summer)",
-        aliases=["admission_term", "entry_term"],
-        used_for=["sub_cohort_classification"]
-    ),
-
-    "expected_graduation": ColumnDefinition(
-        name="expected_graduation",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.DATE,
-        description="Projected graduation date",
-        aliases=["expected_grad_date", "projected_graduation"],
-        used_for=["retention_tracking", "progress_monitoring"]
-    ),
-
-    "actual_graduation_date": ColumnDefinition(
-        name="actual_graduation_date",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.DATE,
-        description="Actual graduation completion date",
-        aliases=["graduation_date", "completion_date"],
-        used_for=["graduation_tracking", "completion_analysis"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # FINANCIAL INFORMATION
-    # ═══════════════════════════════════════════════════════════════════
-
-    "enrollment_tuition_amount": ColumnDefinition(
-        name="enrollment_tuition_amount",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CURRENCY,
-        description="Total tuition charged (AED)",
-        aliases=["tuition", "tuition_amount", "tuition_charged"],
-        validation_rules={"min": 0, "currency": "AED"},
-        used_for=["financial_metrics", "revenue_tracking"]
-    ),
-
-    "financial_aid_monetary_amount": ColumnDefinition(
-        name="financial_aid_monetary_amount",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CURRENCY,
-        description="Financial aid awarded (AED)",
-        aliases=["aid_amount", "financial_aid", "aid"],
-        validation_rules={"min": 0, "currency": "AED"},
-        business_logic="Primary financial metric for aid analysis and equity studies",
-        used_for=[
-            "aid_recipient_identification",
-            "aid_vs_gpa_correlation",
-            "aid_distribution_equity",
-            "aided_vs_non_aided_comparison"
-        ]
-    ),
-
-    "scholarship_type": ColumnDefinition(
-        name="scholarship_type",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CATEGORICAL,
-        description="Type of scholarship/aid received",
-        aliases=["aid_type"],
-        used_for=["aid_classification", "scholarship_analysis"]
-    ),
-
-    "scholarship_amount": ColumnDefinition(
-        name="scholarship_amount",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CURRENCY,
-        description="Scholarship value (AED)",
-        aliases=["scholarship"],
-        validation_rules={"min": 0, "currency": "AED"},
-        business_logic="Component of total financial aid",
-        used_for=["scholarship_tracking"]
-    ),
 
-    "sponsorship_type": ColumnDefinition(
-        name="sponsorship_type",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CATEGORICAL,
-        description="Type of sponsorship",
-        used_for=["sponsorship_classification"]
-    ),
-
-    "account_balance": ColumnDefinition(
-        name="account_balance",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CURRENCY,
-        description="Outstanding balance (AED)",
-        aliases=["balance_due", "outstanding_balance"],
-        validation_rules={"currency": "AED"},
-        used_for=["financial_obligations", "collection_tracking"]
-    ),
-
-    "has_aid": ColumnDefinition(
-        name="has_aid",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.BOOLEAN,
-        description="Binary indicator if student received aid",
-        business_logic="Derived: True if financial_aid_monetary_amount > 0",
-        used_for=["aided_vs_non_aided_comparison"]
-    ),
-
-    "balance_due": ColumnDefinition(
-        name="balance_due",
-        category=ColumnCategory.FINANCIAL,
-        data_type=DataType.CURRENCY,
-        description="Outstanding balance owed by student (AED)",
-        aliases=["outstanding_balance"],
-        validation_rules={"currency": "AED"},
-        used_for=["collections", "financial_health"]
-    ),
-
-    "aid_rate": ColumnDefinition(
-        name="aid_rate",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.PERCENTAGE,
-        description="Percentage of students receiving aid in group",
-        business_logic="(Students with aid / Total Students) * 100",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["aid_distribution_analysis", "equity_metrics"]
-    ),
-
-    "collection_pct": ColumnDefinition(
-        name="collection_pct",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.PERCENTAGE,
-        description="Collection rate percentage",
-        business_logic="(Amount Collected / Amount Due) * 100",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["financial_health", "collection_tracking"]
-    ),
-
-    "collection_range": ColumnDefinition(
-        name="collection_range",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.STRING,
-        description="Collection range category",
-        used_for=["collection_segmentation"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # HOUSING INFORMATION
-    # ═══════════════════════════════════════════════════════════════════
-
-    "room_number": ColumnDefinition(
-        name="room_number",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.STRING,
-        description="Campus housing room identifier",
-        aliases=["room", "housing_room"],
-        nullable=True,
-        business_logic="not null = Housed students; null = Non-housed students",
-        used_for=[
-            "housing_status_identification",
-            "housed_vs_non_housed_comparison",
-            "housing_impact_analysis"
-        ]
-    ),
-
-    "housing_status": ColumnDefinition(
-        name="housing_status",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.CATEGORICAL,
-        description="Housing occupancy status",
-        aliases=["occupancy_status"],
-        validation_rules={"allowed_values": ["Occupied", "Vacant", "Reserved"]},
-        used_for=["housing_assignment_tracking"]
-    ),
-
-    "rent_amount": ColumnDefinition(
-        name="rent_amount",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.CURRENCY,
-        description="Expected monthly/total rent (AED)",
-        aliases=["rent"],
-        validation_rules={"min": 0, "currency": "AED"},
-        used_for=["housing_revenue_projection"]
-    ),
-
-    "rent_paid": ColumnDefinition(
-        name="rent_paid",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.CURRENCY,
-        description="Rent payment collected (AED)",
-        validation_rules={"min": 0, "currency": "AED"},
-        used_for=["housing_revenue_tracking"]
-    ),
-
-    "fee_paid": ColumnDefinition(
-        name="fee_paid",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.CURRENCY,
-        description="Fees collected (AED)",
-        validation_rules={"min": 0, "currency": "AED"},
-        business_logic="Aggregated with rent_paid for total housing payments",
-        used_for=["total_payment_calculation"]
-    ),
-
-    "occupancy_status": ColumnDefinition(
-        name="occupancy_status",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.CATEGORICAL,
-        description="Current occupancy status of housing",
-        aliases=["housing_occupancy"],
-        validation_rules={"allowed_values": ["Occupied", "Vacant", "Reserved", "Maintenance"]},
-        used_for=["occupancy_tracking", "capacity_planning"]
-    ),
-
-    "has_meal_plan": ColumnDefinition(
-        name="has_meal_plan",
-        category=ColumnCategory.HOUSING,
-        data_type=DataType.BOOLEAN,
-        description="Indicator if student has meal plan",
-        used_for=["dining_services", "housing_services"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # GRADES & ACADEMIC TRACKING
-    # ═══════════════════════════════════════════════════════════════════
-
-    "is_passing_grade": ColumnDefinition(
-        name="is_passing_grade",
-        category=ColumnCategory.GRADES,
-        data_type=DataType.BOOLEAN,
-        description="Indicator of passing grade",
-        used_for=["passing_rate_calculation"]
-    ),
-
-    "is_dfw_grade": ColumnDefinition(
-        name="is_dfw_grade",
-        category=ColumnCategory.GRADES,
-        data_type=DataType.BOOLEAN,
-        description="Indicator of D, F, or W (withdrawal) grade",
-        business_logic="Risk indicator for academic intervention",
-        used_for=["dfw_rate_calculation", "at_risk_identification"]
-    ),
-
-    "terms_enrolled": ColumnDefinition(
-        name="terms_enrolled",
-        category=ColumnCategory.GRADES,
-        data_type=DataType.INTEGER,
-        description="Number of terms/semesters attended",
-        aliases=["semesters_enrolled"],
-        validation_rules={"min": 0},
-        used_for=["tenure_tracking", "progression_analysis"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # STUDENT SUCCESS & RISK
-    # ═══════════════════════════════════════════════════════════════════
-
-    "is_first_generation": ColumnDefinition(
-        name="is_first_generation",
-        category=ColumnCategory.RISK_SUCCESS,
-        data_type=DataType.BOOLEAN,
-        description="Indicator if first-generation college student",
-        aliases=["first_gen"],
-        business_logic="Key demographic for success factor analysis",
-        used_for=[
-            "first_gen_comparison",
-            "equity_analysis",
-            "support_targeting"
-        ]
-    ),
-
-    "risk_score": ColumnDefinition(
-        name="risk_score",
-        category=ColumnCategory.RISK_SUCCESS,
-        data_type=DataType.FLOAT,
-        description="Calculated risk metric (0-100)",
-        business_logic="Derived from GPA, aid status, enrollment, and other factors",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["risk_assessment", "intervention_prioritization"]
-    ),
-
-    "risk_level": ColumnDefinition(
-        name="risk_level",
-        category=ColumnCategory.RISK_SUCCESS,
-        data_type=DataType.CATEGORICAL,
-        description="Risk categorization tier",
-        business_logic="Derived from risk_score: Critical (>75), High (50-75), Moderate (25-50), Low (<25)",
-        validation_rules={"allowed_values": ["Critical", "High", "Moderate", "Low"]},
-        used_for=["risk_tier_analysis", "intervention_planning"]
-    ),
-
-    "is_at_risk": ColumnDefinition(
-        name="is_at_risk",
-        category=ColumnCategory.RISK_SUCCESS,
-        data_type=DataType.BOOLEAN,
-        description="Binary indicator if student is at risk",
-        business_logic="Derived: True if risk_score >= 50 OR cumulative_gpa < 2.5",
-        used_for=["at_risk_identification", "intervention_targeting"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # ENGAGEMENT & SUPPORT
-    # ═══════════════════════════════════════════════════════════════════
-
-    "engagement_score": ColumnDefinition(
-        name="engagement_score",
-        category=ColumnCategory.ENGAGEMENT,
-        data_type=DataType.FLOAT,
-        description="Student engagement metric",
-        used_for=["engagement_tracking"]
-    ),
-
-    "attendance_rate": ColumnDefinition(
-        name="attendance_rate",
-        category=ColumnCategory.ENGAGEMENT,
-        data_type=DataType.PERCENTAGE,
-        description="Class attendance percentage",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["success_factor_analysis", "at_risk_support"]
-    ),
-
-    "advisor_meeting_count": ColumnDefinition(
-        name="advisor_meeting_count",
-        category=ColumnCategory.ENGAGEMENT,
-        data_type=DataType.INTEGER,
-        description="Number of advisor meetings attended",
-        aliases=["advising_sessions"],
-        validation_rules={"min": 0},
-        used_for=["support_utilization_tracking"]
-    ),
-
-    "counseling_visits_count": ColumnDefinition(
-        name="counseling_visits_count",
-        category=ColumnCategory.ENGAGEMENT,
-        data_type=DataType.INTEGER,
-        description="Counseling session count",
-        aliases=["counseling_sessions"],
-        validation_rules={"min": 0},
-        used_for=["support_services_tracking"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # INTERNATIONAL STUDENT INFORMATION
-    # ═══════════════════════════════════════════════════════════════════
-
-    "is_international": ColumnDefinition(
-        name="is_international",
-        category=ColumnCategory.INTERNATIONAL,
-        data_type=DataType.BOOLEAN,
-        description="Indicator of international student status",
-        business_logic="Derived from nationality != 'UAE'",
-        used_for=["uae_vs_international_comparison", "diversity_metrics"]
-    ),
-
-    "visa_status": ColumnDefinition(
-        name="visa_status",
-        category=ColumnCategory.INTERNATIONAL,
-        data_type=DataType.CATEGORICAL,
-        description="Visa type or status",
-        used_for=["international_student_classification"]
-    ),
-
-    "visa_expiry_date": ColumnDefinition(
-        name="visa_expiry_date",
-        category=ColumnCategory.INTERNATIONAL,
-        data_type=DataType.DATE,
-        description="Visa expiration date",
-        used_for=["compliance_tracking", "retention_risk"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DERIVED/CALCULATED FIELDS
-    # ═══════════════════════════════════════════════════════════════════
-
-    "region": ColumnDefinition(
-        name="region",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.CATEGORICAL,
-        description="Geographic region derived from nationality",
-        business_logic="Mapped from nationality codes to regions (GCC, MENA, Asia, etc.)",
-        used_for=["regional_analysis", "diversity_metrics"]
-    ),
-
-    "performance_tier": ColumnDefinition(
-        name="performance_tier",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.CATEGORICAL,
-        description="Performance tier from GPA",
-        business_logic="High (>=3.5), Mid (2.5-3.5), Low (<2.5)",
-        validation_rules={"allowed_values": ["High", "Mid", "Low"]},
-        used_for=["performance_segmentation"]
-    ),
-
-    "registration_status": ColumnDefinition(
-        name="registration_status",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.CATEGORICAL,
-        description="Registration status for current term",
-        used_for=["current_term_enrollment"]
-    ),
-
-    "application_status": ColumnDefinition(
-        name="application_status",
-        category=ColumnCategory.ENROLLMENT,
-        data_type=DataType.CATEGORICAL,
-        description="Application status (Accepted, Pending, Denied)",
-        validation_rules={"allowed_values": ["Accepted", "Pending", "Denied", "Withdrawn"]},
-        used_for=["admission_tracking", "enrollment_funnel"]
-    ),
-
-    "student_count": ColumnDefinition(
-        name="student_count",
-        category=ColumnCategory.DERIVED,
-        data_type=DataType.INTEGER,
-        description="Count of students in group (aggregated metric)",
-        business_logic="COUNT(student_id) or COUNT(DISTINCT student_id)",
-        used_for=["group_sizing", "cohort_analysis"]
-    ),
-
-    "last_activity_date": ColumnDefinition(
-        name="last_activity_date",
-        category=ColumnCategory.ENGAGEMENT,
-        data_type=DataType.DATE,
-        description="Last system activity date",
-        used_for=["engagement_monitoring", "inactive_identification"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA WAREHOUSE - RAW TABLES
-    # ═══════════════════════════════════════════════════════════════════
-
-    "RAW_STUDENT": ColumnDefinition(
-        name="RAW_STUDENT",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw student source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_ENROLLMENT": ColumnDefinition(
-        name="RAW_ENROLLMENT",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw enrollment source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_STUDENT_DEMOGRAPHIC": ColumnDefinition(
-        name="RAW_STUDENT_DEMOGRAPHIC",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw student demographics source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_STUDENT_GRADE": ColumnDefinition(
-        name="RAW_STUDENT_GRADE",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw student grades source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_FINANCIAL_AID_COUNSELING": ColumnDefinition(
-        name="RAW_FINANCIAL_AID_COUNSELING",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw financial aid and counseling source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_HOUSING_APPLICATION": ColumnDefinition(
-        name="RAW_HOUSING_APPLICATION",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw housing application source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_HOUSING_ASSIGNMENT": ColumnDefinition(
-        name="RAW_HOUSING_ASSIGNMENT",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw housing assignment source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    "RAW_RECREATION_ENROLLMENT": ColumnDefinition(
-        name="RAW_RECREATION_ENROLLMENT",
-        category=ColumnCategory.RAW_TABLE,
-        data_type=DataType.STRING,
-        description="Raw recreation enrollment source table",
-        used_for=["etl", "data_lineage"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA WAREHOUSE - DIMENSION TABLES
-    # ═══════════════════════════════════════════════════════════════════
-
-    "DIM_STUDENT": ColumnDefinition(
-        name="DIM_STUDENT",
-        category=ColumnCategory.DIMENSION_TABLE,
-        data_type=DataType.STRING,
-        description="Student dimension table (uppercase)",
-        used_for=["data_warehouse", "dimensional_modeling"]
-    ),
-
-    "dim_student": ColumnDefinition(
-        name="dim_student",
-        category=ColumnCategory.DIMENSION_TABLE,
-        data_type=DataType.STRING,
-        description="Student dimension table (lowercase)",
-        aliases=["DIM_STUDENT"],
-        used_for=["data_warehouse", "dimensional_modeling"]
-    ),
-
-    "dim_housing_room": ColumnDefinition(
-        name="dim_housing_room",
-        category=ColumnCategory.DIMENSION_TABLE,
-        data_type=DataType.STRING,
-        description="Housing room dimension table",
-        used_for=["data_warehouse", "dimensional_modeling"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA WAREHOUSE - FACT TABLES
-    # ═══════════════════════════════════════════════════════════════════
-
-    "fact_enrollment": ColumnDefinition(
-        name="fact_enrollment",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Enrollment fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    "fact_grades": ColumnDefinition(
-        name="fact_grades",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Grades fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    "fact_financial_aid": ColumnDefinition(
-        name="fact_financial_aid",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Financial aid fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    "fact_housing_applications": ColumnDefinition(
-        name="fact_housing_applications",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Housing applications fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    "fact_housing_occupancy": ColumnDefinition(
-        name="fact_housing_occupancy",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Housing occupancy fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    "fact_recreation": ColumnDefinition(
-        name="fact_recreation",
-        category=ColumnCategory.FACT_TABLE,
-        data_type=DataType.STRING,
-        description="Recreation fact table",
-        used_for=["data_warehouse", "analytics"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA WAREHOUSE - CURATED TABLES
-    # ═══════════════════════════════════════════════════════════════════
-
-    "student_360": ColumnDefinition(
-        name="student_360",
-        category=ColumnCategory.CURATED_TABLE,
-        data_type=DataType.STRING,
-        description="Student 360 view (curated analytics table)",
-        used_for=["analytics", "reporting"]
-    ),
-
-    "raw_sources": ColumnDefinition(
-        name="raw_sources",
-        category=ColumnCategory.CURATED_TABLE,
-        data_type=DataType.STRING,
-        description="List of raw data sources",
-        used_for=["data_lineage", "documentation"]
-    ),
-
-    "curated_sources": ColumnDefinition(
-        name="curated_sources",
-        category=ColumnCategory.CURATED_TABLE,
-        data_type=DataType.STRING,
-        description="List of curated data sources",
-        used_for=["data_lineage", "documentation"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA GOVERNANCE - CLASSIFICATION & SECURITY
-    # ═══════════════════════════════════════════════════════════════════
-
-    "data_classification": ColumnDefinition(
-        name="data_classification",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.CATEGORICAL,
-        description="Data sensitivity classification level",
-        validation_rules={"allowed_values": ["Public", "Internal", "Confidential", "Restricted"]},
-        used_for=["data_governance", "security", "compliance"]
-    ),
+# repr/eq are not generated: definitions are looked up by name and compared by identity
+@dataclass(frozen=True, repr=False, eq=False, **_DATACLASS_SLOTS)
+class ColumnDefinition:
+    """Definition of a single column with metadata (immutable, shared by every consumer)"""
+    name: str                           # Primary column name
+    category: ColumnCategory            # Semantic category
+    data_type: DataType                 # Expected data type
+    description: str                    # Business description
+    aliases: Tuple[str, ...] = ()       # Alternative names
+    nullable: bool = True               # Can contain null values
+    validation_rules: ValidationRules = NO_VALIDATION_RULES  # Validation constraints (dict literals are converted)
+    business_logic: Optional[str] = None  # Business rules and calculations
+    used_for: Tuple[str, ...] = ()      # Common use cases
+    derivation: Optional[Callable[[pd.DataFrame], Any]] = None  # Vectorized business_logic (frame -> values)
 
-    "data_owner": ColumnDefinition(
-        name="data_owner",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.STRING,
-        description="Person/team responsible for data ownership",
-        used_for=["data_governance", "accountability"]
-    ),
+    def __post_init__(self):
+        """
+        Freeze list arguments into tuples and validation dicts into ValidationRules, share
+        identical tuples through the flyweight pool, and intern the name, alias and
+        use-case strings (they are dict keys and membership-test targets)
+        """
+        rules = self.validation_rules
+        if not isinstance(rules, ValidationRules):
+            rules = dict(rules)
+            if 'allowed_values' in rules:
+                rules['allowed_values'] = tuple(sys.intern(value) for value in rules['allowed_values'])
+                rules['allowed_value_set'] = frozenset(rules['allowed_values'])
+            rules = ValidationRules(**rules)
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        object.__setattr__(self, 'aliases', _pooled(tuple(sys.intern(alias) for alias in self.aliases or ())))
+        object.__setattr__(self, 'validation_rules', _pooled(rules))
+        object.__setattr__(self, 'used_for', _pooled(tuple(sys.intern(use) for use in self.used_for or ())))
+
+    def __repr__(self) -> str:
+        return f"ColumnDefinition({self.name!r})"
 
-    "data_steward": ColumnDefinition(
-        name="data_steward",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.STRING,
-        description="Person/team responsible for data stewardship",
-        used_for=["data_governance", "data_quality"]
-    ),
 
-    "contains_pii": ColumnDefinition(
-        name="contains_pii",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.BOOLEAN,
-        description="Indicates if column contains personally identifiable information",
-        used_for=["privacy", "compliance", "gdpr"]
-    ),
+# ═════════════════════════════════════════════════════════════════════════════
+# DERIVATIONS (vectorized forms of the "Derived ..." business logic)
+# ═════════════════════════════════════════════════════════════════════════════
 
-    "gdpr_applicable": ColumnDefinition(
-        name="gdpr_applicable",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.BOOLEAN,
-        description="Indicates if GDPR regulations apply",
-        used_for=["privacy", "compliance"]
-    ),
+def _numeric(df: pd.DataFrame, column_name: str) -> pd.Series:
+    """A frame column as floats (non-numeric entries become NaN)"""
+    return pd.to_numeric(df[column_name], errors='coerce').astype(np.float64)
 
-    "access_level": ColumnDefinition(
-        name="access_level",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.CATEGORICAL,
-        description="Required access level for data",
-        validation_rules={"allowed_values": ["Public", "Authenticated", "Authorized", "Admin"]},
-        used_for=["security", "access_control"]
-    ),
 
-    "compliance_tags": ColumnDefinition(
-        name="compliance_tags",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.STRING,
-        description="Compliance framework tags (GDPR, FERPA, etc.)",
-        used_for=["compliance", "data_governance"]
-    ),
+def _derive_has_aid(df: pd.DataFrame) -> pd.Series:
+    """True if financial_aid_monetary_amount > 0"""
+    return _numeric(df, "financial_aid_monetary_amount").gt(0)
 
-    "retention_period": ColumnDefinition(
-        name="retention_period",
-        category=ColumnCategory.DATA_CLASSIFICATION,
-        data_type=DataType.STRING,
-        description="Data retention period (e.g., '7 years', 'permanent')",
-        used_for=["compliance", "data_lifecycle"]
-    ),
 
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA GOVERNANCE - TECHNICAL METADATA
-    # ═══════════════════════════════════════════════════════════════════
+def _derive_is_international(df: pd.DataFrame) -> pd.Series:
+    """True if nationality != 'UAE' (unknown nationality is not international)"""
+    nationality = df["nationality"]
+    return nationality.ne("UAE") & nationality.notna()
 
-    "source_table": ColumnDefinition(
-        name="source_table",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Source table name",
-        used_for=["data_lineage", "etl_documentation"]
-    ),
 
-    "source_tables": ColumnDefinition(
-        name="source_tables",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Multiple source table names",
-        used_for=["data_lineage", "etl_documentation"]
-    ),
+def _derive_is_at_risk(df: pd.DataFrame) -> pd.Series:
+    """True if risk_score >= 50 OR cumulative_gpa < 2.5"""
+    return _numeric(df, "risk_score").ge(50) | _numeric(df, "cumulative_gpa").lt(2.5)
 
-    "target_table": ColumnDefinition(
-        name="target_table",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Target table name",
-        used_for=["data_lineage", "etl_documentation"]
-    ),
 
-    "product_column": ColumnDefinition(
-        name="product_column",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Product/application column name",
-        used_for=["data_mapping", "integration"]
-    ),
+def _derive_risk_level(df: pd.DataFrame) -> pd.Series:
+    """Critical (>75), High (50-75), Moderate (25-50), Low (<25); missing scores stay missing"""
+    score = _numeric(df, "risk_score")
+    tiers = np.select(
+        [score > 75, score >= 50, score >= 25, score < 25],
+        ["Critical", "High", "Moderate", "Low"],
+        default=None
+    )
+    return pd.Series(tiers, index=df.index, dtype=object)
 
-    "standardized_name": ColumnDefinition(
-        name="standardized_name",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Standardized column name across systems",
-        used_for=["data_standardization", "integration"]
-    ),
 
-    "sql_logic": ColumnDefinition(
-        name="sql_logic",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="SQL transformation logic",
-        used_for=["etl_documentation", "data_transformation"]
-    ),
+def _derive_performance_tier(df: pd.DataFrame) -> pd.Series:
+    """High (>=3.5), Mid (2.5-3.5), Low (<2.5); missing GPAs stay missing"""
+    return pd.cut(
+        _numeric(df, "cumulative_gpa"),
+        bins=[-np.inf, 2.5, 3.5, np.inf],
+        labels=["Low", "Mid", "High"],
+        right=False
+    )
 
-    "transformation_type": ColumnDefinition(
-        name="transformation_type",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.CATEGORICAL,
-        description="Type of data transformation applied",
-        validation_rules={"allowed_values": ["Direct", "Calculated", "Aggregated", "Derived", "Lookup"]},
-        used_for=["etl_documentation", "data_lineage"]
-    ),
 
-    "validation_rules": ColumnDefinition(
-        name="validation_rules",
-        category=ColumnCategory.TECHNICAL_METADATA,
-        data_type=DataType.STRING,
-        description="Data validation rules and constraints",
-        used_for=["data_quality", "validation"]
-    ),
-
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA GOVERNANCE - BUSINESS METADATA
-    # ═══════════════════════════════════════════════════════════════════
-
-    "business_rule": ColumnDefinition(
-        name="business_rule",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="Business rule definition",
-        used_for=["business_logic", "documentation"]
-    ),
-
-    "business_rules": ColumnDefinition(
-        name="business_rules",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="Multiple business rules",
-        used_for=["business_logic", "documentation"]
-    ),
-
-    "business_impact": ColumnDefinition(
-        name="business_impact",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.CATEGORICAL,
-        description="Business impact level",
-        validation_rules={"allowed_values": ["Critical", "High", "Medium", "Low"]},
-        used_for=["impact_analysis", "prioritization"]
-    ),
-
-    "affected_dashboards": ColumnDefinition(
-        name="affected_dashboards",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="List of dashboards using this data",
-        used_for=["impact_analysis", "dependencies"]
-    ),
+# ═════════════════════════════════════════════════════════════════════════════
+# UNIVERSAL COLUMNS CATALOG
+# ═════════════════════════════════════════════════════════════════════════════
 
-    "affected_reports": ColumnDefinition(
-        name="affected_reports",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="List of reports using this data",
-        used_for=["impact_analysis", "dependencies"]
-    ),
+def _build_catalog() -> Dict[str, ColumnDefinition]:
+    """Build the universal catalog (called once, on first access to UNIVERSAL_COLUMNS_CATALOG)"""
+    return {
+
+        # ═══════════════════════════════════════════════════════════════════
+        # IDENTIFIERS
+        # ═══════════════════════════════════════════════════════════════════
+
+        "student_id": ColumnDefinition(
+            name="student_id",
+            category=ColumnCategory.IDENTIFIER,
+            data_type=DataType.STRING,
+            description="Unique student identifier",
+            aliases=["studentid", "id", "student_number"],
+            nullable=False,
+            used_for=["primary_key", "unique_counting", "joins"]
+        ),
+
+        "emirates_id": ColumnDefinition(
+            name="emirates_id",
+            category=ColumnCategory.IDENTIFIER,
+            data_type=DataType.STRING,
+            description="UAE National ID number",
+            aliases=["eid", "national_id"],
+            nullable=True,
+            used_for=["uae_national_identification", "compliance"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # PERSONAL INFORMATION
+        # ═══════════════════════════════════════════════════════════════════
+
+        "first_name_en": ColumnDefinition(
+            name="first_name_en",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student first name in English",
+            aliases=["firstname_en", "given_name"],
+            used_for=["student_identification", "communications"]
+        ),
+
+        "last_name_en": ColumnDefinition(
+            name="last_name_en",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student last name in English",
+            aliases=["lastname_en", "family_name", "surname"],
+            used_for=["student_identification", "communications"]
+        ),
+
+        "first_name_ar": ColumnDefinition(
+            name="first_name_ar",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student first name in Arabic",
+            aliases=["firstname_ar"],
+            used_for=["localization", "official_documents"]
+        ),
+
+        "last_name_ar": ColumnDefinition(
+            name="last_name_ar",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student last name in Arabic",
+            aliases=["lastname_ar"],
+            used_for=["localization", "official_documents"]
+        ),
+
+        "middle_name": ColumnDefinition(
+            name="middle_name",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student middle name",
+            aliases=["middlename"],
+            used_for=["full_name_construction"]
+        ),
+
+        "email_address": ColumnDefinition(
+            name="email_address",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student email address (unified field)",
+            aliases=["email"],
+            business_logic="Aggregated from university_email or personal_email",
+            used_for=["communications", "contact"]
+        ),
+
+        "university_email": ColumnDefinition(
+            name="university_email",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="University-issued email address",
+            aliases=["institutional_email"],
+            used_for=["official_communications", "contact"]
+        ),
+
+        "personal_email": ColumnDefinition(
+            name="personal_email",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student's personal email address",
+            used_for=["alternative_contact", "communications"]
+        ),
+
+        "phone_number": ColumnDefinition(
+            name="phone_number",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.STRING,
+            description="Student contact phone number",
+            aliases=["phone", "mobile", "contact_number"],
+            used_for=["communications", "contact"]
+        ),
+
+        "date_of_birth": ColumnDefinition(
+            name="date_of_birth",
+            category=ColumnCategory.PERSONAL_INFO,
+            data_type=DataType.DATE,
+            description="Student date of birth",
+            aliases=["dob", "birthdate"],
+            used_for=["age_calculation", "demographics"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DEMOGRAPHIC INFORMATION
+        # ═══════════════════════════════════════════════════════════════════
+
+        "gender": ColumnDefinition(
+            name="gender",
+            category=ColumnCategory.DEMOGRAPHIC,
+            data_type=DataType.CATEGORICAL,
+            description="Student gender",
+            aliases=["sex"],
+            validation_rules={"allowed_values": ["Male", "Female", "Other"]},
+            used_for=["demographic_analysis", "diversity_metrics"]
+        ),
+
+        "nationality": ColumnDefinition(
+            name="nationality",
+            category=ColumnCategory.DEMOGRAPHIC,
+            data_type=DataType.STRING,
+            description="Student nationality (country code or name)",
+            aliases=["country", "citizenship"],
+            used_for=["diversity_analysis", "regional_grouping", "uae_vs_international"]
+        ),
+
+        "age_at_first_enrollment": ColumnDefinition(
+            name="age_at_first_enrollment",
+            category=ColumnCategory.DEMOGRAPHIC,
+            data_type=DataType.INTEGER,
+            description="Student age at first enrollment",
+            aliases=["enrollment_age", "starting_age"],
+            validation_rules={"min": 16, "max": 100},
+            used_for=["cohort_analysis", "demographic_segmentation"]
+        ),
+
+        "total_in_region": ColumnDefinition(
+            name="total_in_region",
+            category=ColumnCategory.DEMOGRAPHIC,
+            data_type=DataType.INTEGER,
+            description="Total students from same region",
+            business_logic="Aggregated count by region",
+            used_for=["regional_analysis", "diversity_metrics"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # ACADEMIC PERFORMANCE
+        # ═══════════════════════════════════════════════════════════════════
+
+        "cumulative_gpa": ColumnDefinition(
+            name="cumulative_gpa",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.FLOAT,
+            description="Overall cumulative GPA (0.0-4.0 scale)",
+            aliases=["gpa", "cgpa", "overall_gpa"],
+            nullable=True,
+            validation_rules={"min": 0.0, "max": 4.0},
+            business_logic="Performance tiers: High (>=3.5), Mid (2.5-3.5), At-risk (<2.5)",
+            used_for=[
+                "performance_analysis",
+                "risk_scoring",
+                "uae_vs_international_comparison",
+                "housing_impact_analysis",
+                "aid_correlation"
+            ]
+        ),
+
+        "term_gpa": ColumnDefinition(
+            name="term_gpa",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.FLOAT,
+            description="Single term/semester GPA",
+            aliases=["semester_gpa", "current_gpa"],
+            validation_rules={"min": 0.0, "max": 4.0},
+            used_for=["term_performance_tracking"]
+        ),
+
+        "major_gpa": ColumnDefinition(
+            name="major_gpa",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.FLOAT,
+            description="Major-specific GPA",
+            aliases=["program_gpa"],
+            validation_rules={"min": 0.0, "max": 4.0},
+            used_for=["program_performance_analysis"]
+        ),
+
+        "grade_point": ColumnDefinition(
+            name="grade_point",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.FLOAT,
+            description="Average grade point value",
+            aliases=["avg_grade_point"],
+            used_for=["grade_distribution_analysis"]
+        ),
+
+        "academic_standing": ColumnDefinition(
+            name="academic_standing",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.CATEGORICAL,
+            description="Academic status (Good Standing, Probation, etc.)",
+            aliases=["standing", "status"],
+            validation_rules={"allowed_values": ["Good Standing", "Academic Probation", "Academic Warning", "Dismissed"]},
+            used_for=["risk_identification", "intervention_targeting"]
+        ),
+
+        "academic_program": ColumnDefinition(
+            name="academic_program",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.CATEGORICAL,
+            description="Degree program or major",
+            aliases=["program", "major", "degree_program"],
+            used_for=["program_analysis", "cohort_comparison"]
+        ),
+
+        "gpa_trend": ColumnDefinition(
+            name="gpa_trend",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.STRING,
+            description="GPA trajectory over time (Improving, Declining, Stable)",
+            validation_rules={"allowed_values": ["Improving", "Declining", "Stable"]},
+            business_logic="Calculated from term-by-term GPA changes",
+            used_for=["performance_tracking", "intervention_targeting"]
+        ),
+
+        "avg_gpa": ColumnDefinition(
+            name="avg_gpa",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="Average GPA (aggregated metric)",
+            business_logic="Mean of cumulative_gpa across a group",
+            used_for=["group_comparisons", "cohort_analysis"]
+        ),
+
+        "std_gpa": ColumnDefinition(
+            name="std_gpa",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="GPA standard deviation (aggregated metric)",
+            business_logic="Standard deviation of cumulative_gpa across a group",
+            used_for=["variability_analysis", "consistency_tracking"]
+        ),
+
+        "min_gpa": ColumnDefinition(
+            name="min_gpa",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="Minimum GPA in group (aggregated metric)",
+            business_logic="Minimum cumulative_gpa in a group",
+            used_for=["range_analysis", "at_risk_identification"]
+        ),
+
+        "max_gpa": ColumnDefinition(
+            name="max_gpa",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="Maximum GPA in group (aggregated metric)",
+            business_logic="Maximum cumulative_gpa in a group",
+            used_for=["range_analysis", "top_performer_identification"]
+        ),
+
+        "avg_credits": ColumnDefinition(
+            name="avg_credits",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="Average credits attempted (aggregated metric)",
+            business_logic="Mean of credits_attempted across a group",
+            used_for=["enrollment_intensity_analysis"]
+        ),
+
+        "avg_progress": ColumnDefinition(
+            name="avg_progress",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.FLOAT,
+            description="Average degree progress (aggregated metric)",
+            business_logic="Mean of degree_progress_pct across a group",
+            used_for=["completion_tracking", "cohort_analysis"]
+        ),
+
+        "high_performer_rate": ColumnDefinition(
+            name="high_performer_rate",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.PERCENTAGE,
+            description="Percentage of high performers in group",
+            business_logic="(Students with GPA >= 3.5 / Total Students) * 100",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["performance_benchmarking", "program_comparison"]
+        ),
+
+        "credits_attempted": ColumnDefinition(
+            name="credits_attempted",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.INTEGER,
+            description="Total credits attempted/pursued",
+            aliases=["credits", "total_credits"],
+            validation_rules={"min": 0},
+            business_logic="Used to calculate degree progress and enrollment intensity",
+            used_for=["progress_tracking", "cohort_comparison"]
+        ),
+
+        "degree_progress_pct": ColumnDefinition(
+            name="degree_progress_pct",
+            category=ColumnCategory.ACADEMIC_PERFORMANCE,
+            data_type=DataType.PERCENTAGE,
+            description="Percentage of degree completed (0-100)",
+            aliases=["progress_pct", "completion_pct"],
+            validation_rules={"min": 0, "max": 100},
+            used_for=["retention_analysis", "graduation_prediction"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # ENROLLMENT STATUS
+        # ═══════════════════════════════════════════════════════════════════
+
+        "enrollment_enrollment_status": ColumnDefinition(
+            name="enrollment_enrollment_status",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.CATEGORICAL,
+            description="Current enrollment status",
+            aliases=["enrollment_status", "status", "student_status"],
+            validation_rules={"allowed_values": ["Active", "Graduated", "Suspended", "Withdrawn", "Leave of Absence"]},
+            business_logic="Filters: Active vs Graduated for current vs historical cohorts",
+            used_for=["active_filtering", "retention_metrics", "graduation_tracking"]
+        ),
+
+        "enrollment_type": ColumnDefinition(
+            name="enrollment_type",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.CATEGORICAL,
+            description="Enrollment category (Full-time, Part-time, Level)",
+            aliases=["type", "program_type"],
+            used_for=["cohort_grouping", "program_comparison"]
+        ),
+
+        "enrollment_date": ColumnDefinition(
+            name="enrollment_date",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.DATE,
+            description="Initial admission/enrollment date",
+            aliases=["admission_date", "start_date"],
+            used_for=["cohort_assignment", "tenure_calculation"]
+        ),
+
+        "cohort_year": ColumnDefinition(
+            name="cohort_year",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.INTEGER,
+            description="Year of admission/cohort",
+            aliases=["admission_year", "entry_year"],
+            business_logic="Primary grouping variable for year-on-year comparisons",
+            used_for=[
+                "cohort_analysis",
+                "retention_tracking",
+                "yoy_comparison"
+            ]
+        ),
+
+        "cohort_term": ColumnDefinition(
+            name="cohort_term",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.STRING,
+            description="Admission semester/term (Fall, Spring, Summer)",
+            aliases=["admission_term", "entry_term"],
+            used_for=["sub_cohort_classification"]
+        ),
+
+        "expected_graduation": ColumnDefinition(
+            name="expected_graduation",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.DATE,
+            description="Projected graduation date",
+            aliases=["expected_grad_date", "projected_graduation"],
+            used_for=["retention_tracking", "progress_monitoring"]
+        ),
+
+        "actual_graduation_date": ColumnDefinition(
+            name="actual_graduation_date",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.DATE,
+            description="Actual graduation completion date",
+            aliases=["graduation_date", "completion_date"],
+            used_for=["graduation_tracking", "completion_analysis"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # FINANCIAL INFORMATION
+        # ═══════════════════════════════════════════════════════════════════
+
+        "enrollment_tuition_amount": ColumnDefinition(
+            name="enrollment_tuition_amount",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CURRENCY,
+            description="Total tuition charged (AED)",
+            aliases=["tuition", "tuition_amount", "tuition_charged"],
+            validation_rules={"min": 0, "currency": "AED"},
+            used_for=["financial_metrics", "revenue_tracking"]
+        ),
+
+        "financial_aid_monetary_amount": ColumnDefinition(
+            name="financial_aid_monetary_amount",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CURRENCY,
+            description="Financial aid awarded (AED)",
+            aliases=["aid_amount", "financial_aid", "aid"],
+            validation_rules={"min": 0, "currency": "AED"},
+            business_logic="Primary financial metric for aid analysis and equity studies",
+            used_for=[
+                "aid_recipient_identification",
+                "aid_vs_gpa_correlation",
+                "aid_distribution_equity",
+                "aided_vs_non_aided_comparison"
+            ]
+        ),
+
+        "scholarship_type": ColumnDefinition(
+            name="scholarship_type",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CATEGORICAL,
+            description="Type of scholarship/aid received",
+            aliases=["aid_type"],
+            used_for=["aid_classification", "scholarship_analysis"]
+        ),
+
+        "scholarship_amount": ColumnDefinition(
+            name="scholarship_amount",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CURRENCY,
+            description="Scholarship value (AED)",
+            aliases=["scholarship"],
+            validation_rules={"min": 0, "currency": "AED"},
+            business_logic="Component of total financial aid",
+            used_for=["scholarship_tracking"]
+        ),
+
+        "sponsorship_type": ColumnDefinition(
+            name="sponsorship_type",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CATEGORICAL,
+            description="Type of sponsorship",
+            used_for=["sponsorship_classification"]
+        ),
+
+        "account_balance": ColumnDefinition(
+            name="account_balance",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CURRENCY,
+            description="Outstanding balance (AED)",
+            aliases=["balance_due", "outstanding_balance"],
+            validation_rules={"currency": "AED"},
+            used_for=["financial_obligations", "collection_tracking"]
+        ),
+
+        "has_aid": ColumnDefinition(
+            name="has_aid",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.BOOLEAN,
+            description="Binary indicator if student received aid",
+            business_logic="Derived: True if financial_aid_monetary_amount > 0",
+            used_for=["aided_vs_non_aided_comparison"],
+            derivation=_derive_has_aid
+        ),
+
+        "balance_due": ColumnDefinition(
+            name="balance_due",
+            category=ColumnCategory.FINANCIAL,
+            data_type=DataType.CURRENCY,
+            description="Outstanding balance owed by student (AED)",
+            aliases=["outstanding_balance"],
+            validation_rules={"currency": "AED"},
+            used_for=["collections", "financial_health"]
+        ),
+
+        "aid_rate": ColumnDefinition(
+            name="aid_rate",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.PERCENTAGE,
+            description="Percentage of students receiving aid in group",
+            business_logic="(Students with aid / Total Students) * 100",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["aid_distribution_analysis", "equity_metrics"]
+        ),
+
+        "collection_pct": ColumnDefinition(
+            name="collection_pct",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.PERCENTAGE,
+            description="Collection rate percentage",
+            business_logic="(Amount Collected / Amount Due) * 100",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["financial_health", "collection_tracking"]
+        ),
+
+        "collection_range": ColumnDefinition(
+            name="collection_range",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.STRING,
+            description="Collection range category",
+            used_for=["collection_segmentation"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # HOUSING INFORMATION
+        # ═══════════════════════════════════════════════════════════════════
+
+        "room_number": ColumnDefinition(
+            name="room_number",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.STRING,
+            description="Campus housing room identifier",
+            aliases=["room", "housing_room"],
+            nullable=True,
+            business_logic="not null = Housed students; null = Non-housed students",
+            used_for=[
+                "housing_status_identification",
+                "housed_vs_non_housed_comparison",
+                "housing_impact_analysis"
+            ]
+        ),
+
+        "housing_status": ColumnDefinition(
+            name="housing_status",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.CATEGORICAL,
+            description="Housing occupancy status",
+            aliases=["occupancy_status"],
+            validation_rules={"allowed_values": ["Occupied", "Vacant", "Reserved"]},
+            used_for=["housing_assignment_tracking"]
+        ),
+
+        "rent_amount": ColumnDefinition(
+            name="rent_amount",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.CURRENCY,
+            description="Expected monthly/total rent (AED)",
+            aliases=["rent"],
+            validation_rules={"min": 0, "currency": "AED"},
+            used_for=["housing_revenue_projection"]
+        ),
+
+        "rent_paid": ColumnDefinition(
+            name="rent_paid",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.CURRENCY,
+            description="Rent payment collected (AED)",
+            validation_rules={"min": 0, "currency": "AED"},
+            used_for=["housing_revenue_tracking"]
+        ),
+
+        "fee_paid": ColumnDefinition(
+            name="fee_paid",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.CURRENCY,
+            description="Fees collected (AED)",
+            validation_rules={"min": 0, "currency": "AED"},
+            business_logic="Aggregated with rent_paid for total housing payments",
+            used_for=["total_payment_calculation"]
+        ),
+
+        "occupancy_status": ColumnDefinition(
+            name="occupancy_status",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.CATEGORICAL,
+            description="Current occupancy status of housing",
+            aliases=["housing_occupancy"],
+            validation_rules={"allowed_values": ["Occupied", "Vacant", "Reserved", "Maintenance"]},
+            used_for=["occupancy_tracking", "capacity_planning"]
+        ),
+
+        "has_meal_plan": ColumnDefinition(
+            name="has_meal_plan",
+            category=ColumnCategory.HOUSING,
+            data_type=DataType.BOOLEAN,
+            description="Indicator if student has meal plan",
+            used_for=["dining_services", "housing_services"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # GRADES & ACADEMIC TRACKING
+        # ═══════════════════════════════════════════════════════════════════
+
+        "is_passing_grade": ColumnDefinition(
+            name="is_passing_grade",
+            category=ColumnCategory.GRADES,
+            data_type=DataType.BOOLEAN,
+            description="Indicator of passing grade",
+            used_for=["passing_rate_calculation"]
+        ),
+
+        "is_dfw_grade": ColumnDefinition(
+            name="is_dfw_grade",
+            category=ColumnCategory.GRADES,
+            data_type=DataType.BOOLEAN,
+            description="Indicator of D, F, or W (withdrawal) grade",
+            business_logic="Risk indicator for academic intervention",
+            used_for=["dfw_rate_calculation", "at_risk_identification"]
+        ),
+
+        "terms_enrolled": ColumnDefinition(
+            name="terms_enrolled",
+            category=ColumnCategory.GRADES,
+            data_type=DataType.INTEGER,
+            description="Number of terms/semesters attended",
+            aliases=["semesters_enrolled"],
+            validation_rules={"min": 0},
+            used_for=["tenure_tracking", "progression_analysis"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # STUDENT SUCCESS & RISK
+        # ═══════════════════════════════════════════════════════════════════
+
+        "is_first_generation": ColumnDefinition(
+            name="is_first_generation",
+            category=ColumnCategory.RISK_SUCCESS,
+            data_type=DataType.BOOLEAN,
+            description="Indicator if first-generation college student",
+            aliases=["first_gen"],
+            business_logic="Key demographic for success factor analysis",
+            used_for=[
+                "first_gen_comparison",
+                "equity_analysis",
+                "support_targeting"
+            ]
+        ),
+
+        "risk_score": ColumnDefinition(
+            name="risk_score",
+            category=ColumnCategory.RISK_SUCCESS,
+            data_type=DataType.FLOAT,
+            description="Calculated risk metric (0-100)",
+            business_logic="Derived from GPA, aid status, enrollment, and other factors",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["risk_assessment", "intervention_prioritization"]
+        ),
+
+        "risk_level": ColumnDefinition(
+            name="risk_level",
+            category=ColumnCategory.RISK_SUCCESS,
+            data_type=DataType.CATEGORICAL,
+            description="Risk categorization tier",
+            business_logic="Derived from risk_score: Critical (>75), High (50-75), Moderate (25-50), Low (<25)",
+            validation_rules={"allowed_values": ["Critical", "High", "Moderate", "Low"]},
+            used_for=["risk_tier_analysis", "intervention_planning"],
+            derivation=_derive_risk_level
+        ),
+
+        "is_at_risk": ColumnDefinition(
+            name="is_at_risk",
+            category=ColumnCategory.RISK_SUCCESS,
+            data_type=DataType.BOOLEAN,
+            description="Binary indicator if student is at risk",
+            business_logic="Derived: True if risk_score >= 50 OR cumulative_gpa < 2.5",
+            used_for=["at_risk_identification", "intervention_targeting"],
+            derivation=_derive_is_at_risk
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # ENGAGEMENT & SUPPORT
+        # ═══════════════════════════════════════════════════════════════════
+
+        "engagement_score": ColumnDefinition(
+            name="engagement_score",
+            category=ColumnCategory.ENGAGEMENT,
+            data_type=DataType.FLOAT,
+            description="Student engagement metric",
+            used_for=["engagement_tracking"]
+        ),
+
+        "attendance_rate": ColumnDefinition(
+            name="attendance_rate",
+            category=ColumnCategory.ENGAGEMENT,
+            data_type=DataType.PERCENTAGE,
+            description="Class attendance percentage",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["success_factor_analysis", "at_risk_support"]
+        ),
+
+        "advisor_meeting_count": ColumnDefinition(
+            name="advisor_meeting_count",
+            category=ColumnCategory.ENGAGEMENT,
+            data_type=DataType.INTEGER,
+            description="Number of advisor meetings attended",
+            aliases=["advising_sessions"],
+            validation_rules={"min": 0},
+            used_for=["support_utilization_tracking"]
+        ),
+
+        "counseling_visits_count": ColumnDefinition(
+            name="counseling_visits_count",
+            category=ColumnCategory.ENGAGEMENT,
+            data_type=DataType.INTEGER,
+            description="Counseling session count",
+            aliases=["counseling_sessions"],
+            validation_rules={"min": 0},
+            used_for=["support_services_tracking"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # INTERNATIONAL STUDENT INFORMATION
+        # ═══════════════════════════════════════════════════════════════════
+
+        "is_international": ColumnDefinition(
+            name="is_international",
+            category=ColumnCategory.INTERNATIONAL,
+            data_type=DataType.BOOLEAN,
+            description="Indicator of international student status",
+            business_logic="Derived from nationality != 'UAE'",
+            used_for=["uae_vs_international_comparison", "diversity_metrics"],
+            derivation=_derive_is_international
+        ),
+
+        "visa_status": ColumnDefinition(
+            name="visa_status",
+            category=ColumnCategory.INTERNATIONAL,
+            data_type=DataType.CATEGORICAL,
+            description="Visa type or status",
+            used_for=["international_student_classification"]
+        ),
+
+        "visa_expiry_date": ColumnDefinition(
+            name="visa_expiry_date",
+            category=ColumnCategory.INTERNATIONAL,
+            data_type=DataType.DATE,
+            description="Visa expiration date",
+            used_for=["compliance_tracking", "retention_risk"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DERIVED/CALCULATED FIELDS
+        # ═══════════════════════════════════════════════════════════════════
+
+        "region": ColumnDefinition(
+            name="region",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.CATEGORICAL,
+            description="Geographic region derived from nationality",
+            business_logic="Mapped from nationality codes to regions (GCC, MENA, Asia, etc.)",
+            used_for=["regional_analysis", "diversity_metrics"]
+        ),
+
+        "performance_tier": ColumnDefinition(
+            name="performance_tier",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.CATEGORICAL,
+            description="Performance tier from GPA",
+            business_logic="High (>=3.5), Mid (2.5-3.5), Low (<2.5)",
+            validation_rules={"allowed_values": ["High", "Mid", "Low"]},
+            used_for=["performance_segmentation"],
+            derivation=_derive_performance_tier
+        ),
+
+        "registration_status": ColumnDefinition(
+            name="registration_status",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.CATEGORICAL,
+            description="Registration status for current term",
+            used_for=["current_term_enrollment"]
+        ),
+
+        "application_status": ColumnDefinition(
+            name="application_status",
+            category=ColumnCategory.ENROLLMENT,
+            data_type=DataType.CATEGORICAL,
+            description="Application status (Accepted, Pending, Denied)",
+            validation_rules={"allowed_values": ["Accepted", "Pending", "Denied", "Withdrawn"]},
+            used_for=["admission_tracking", "enrollment_funnel"]
+        ),
+
+        "student_count": ColumnDefinition(
+            name="student_count",
+            category=ColumnCategory.DERIVED,
+            data_type=DataType.INTEGER,
+            description="Count of students in group (aggregated metric)",
+            business_logic="COUNT(student_id) or COUNT(DISTINCT student_id)",
+            used_for=["group_sizing", "cohort_analysis"]
+        ),
+
+        "last_activity_date": ColumnDefinition(
+            name="last_activity_date",
+            category=ColumnCategory.ENGAGEMENT,
+            data_type=DataType.DATE,
+            description="Last system activity date",
+            used_for=["engagement_monitoring", "inactive_identification"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA WAREHOUSE - RAW TABLES
+        # ═══════════════════════════════════════════════════════════════════
+
+        "RAW_STUDENT": ColumnDefinition(
+            name="RAW_STUDENT",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw student source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_ENROLLMENT": ColumnDefinition(
+            name="RAW_ENROLLMENT",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw enrollment source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_STUDENT_DEMOGRAPHIC": ColumnDefinition(
+            name="RAW_STUDENT_DEMOGRAPHIC",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw student demographics source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_STUDENT_GRADE": ColumnDefinition(
+            name="RAW_STUDENT_GRADE",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw student grades source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_FINANCIAL_AID_COUNSELING": ColumnDefinition(
+            name="RAW_FINANCIAL_AID_COUNSELING",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw financial aid and counseling source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_HOUSING_APPLICATION": ColumnDefinition(
+            name="RAW_HOUSING_APPLICATION",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw housing application source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_HOUSING_ASSIGNMENT": ColumnDefinition(
+            name="RAW_HOUSING_ASSIGNMENT",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw housing assignment source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        "RAW_RECREATION_ENROLLMENT": ColumnDefinition(
+            name="RAW_RECREATION_ENROLLMENT",
+            category=ColumnCategory.RAW_TABLE,
+            data_type=DataType.STRING,
+            description="Raw recreation enrollment source table",
+            used_for=["etl", "data_lineage"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA WAREHOUSE - DIMENSION TABLES
+        # ═══════════════════════════════════════════════════════════════════
+
+        "DIM_STUDENT": ColumnDefinition(
+            name="DIM_STUDENT",
+            category=ColumnCategory.DIMENSION_TABLE,
+            data_type=DataType.STRING,
+            description="Student dimension table (uppercase)",
+            used_for=["data_warehouse", "dimensional_modeling"]
+        ),
+
+        "dim_student": ColumnDefinition(
+            name="dim_student",
+            category=ColumnCategory.DIMENSION_TABLE,
+            data_type=DataType.STRING,
+            description="Student dimension table (lowercase)",
+            aliases=["DIM_STUDENT"],
+            used_for=["data_warehouse", "dimensional_modeling"]
+        ),
+
+        "dim_housing_room": ColumnDefinition(
+            name="dim_housing_room",
+            category=ColumnCategory.DIMENSION_TABLE,
+            data_type=DataType.STRING,
+            description="Housing room dimension table",
+            used_for=["data_warehouse", "dimensional_modeling"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA WAREHOUSE - FACT TABLES
+        # ═══════════════════════════════════════════════════════════════════
+
+        "fact_enrollment": ColumnDefinition(
+            name="fact_enrollment",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Enrollment fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        "fact_grades": ColumnDefinition(
+            name="fact_grades",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Grades fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        "fact_financial_aid": ColumnDefinition(
+            name="fact_financial_aid",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Financial aid fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        "fact_housing_applications": ColumnDefinition(
+            name="fact_housing_applications",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Housing applications fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        "fact_housing_occupancy": ColumnDefinition(
+            name="fact_housing_occupancy",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Housing occupancy fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        "fact_recreation": ColumnDefinition(
+            name="fact_recreation",
+            category=ColumnCategory.FACT_TABLE,
+            data_type=DataType.STRING,
+            description="Recreation fact table",
+            used_for=["data_warehouse", "analytics"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA WAREHOUSE - CURATED TABLES
+        # ═══════════════════════════════════════════════════════════════════
+
+        "student_360": ColumnDefinition(
+            name="student_360",
+            category=ColumnCategory.CURATED_TABLE,
+            data_type=DataType.STRING,
+            description="Student 360 view (curated analytics table)",
+            used_for=["analytics", "reporting"]
+        ),
+
+        "raw_sources": ColumnDefinition(
+            name="raw_sources",
+            category=ColumnCategory.CURATED_TABLE,
+            data_type=DataType.STRING,
+            description="List of raw data sources",
+            used_for=["data_lineage", "documentation"]
+        ),
+
+        "curated_sources": ColumnDefinition(
+            name="curated_sources",
+            category=ColumnCategory.CURATED_TABLE,
+            data_type=DataType.STRING,
+            description="List of curated data sources",
+            used_for=["data_lineage", "documentation"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA GOVERNANCE - CLASSIFICATION & SECURITY
+        # ═══════════════════════════════════════════════════════════════════
+
+        "data_classification": ColumnDefinition(
+            name="data_classification",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.CATEGORICAL,
+            description="Data sensitivity classification level",
+            validation_rules={"allowed_values": ["Public", "Internal", "Confidential", "Restricted"]},
+            used_for=["data_governance", "security", "compliance"]
+        ),
+
+        "data_owner": ColumnDefinition(
+            name="data_owner",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.STRING,
+            description="Person/team responsible for data ownership",
+            used_for=["data_governance", "accountability"]
+        ),
+
+        "data_steward": ColumnDefinition(
+            name="data_steward",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.STRING,
+            description="Person/team responsible for data stewardship",
+            used_for=["data_governance", "data_quality"]
+        ),
+
+        "contains_pii": ColumnDefinition(
+            name="contains_pii",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.BOOLEAN,
+            description="Indicates if column contains personally identifiable information",
+            used_for=["privacy", "compliance", "gdpr"]
+        ),
+
+        "gdpr_applicable": ColumnDefinition(
+            name="gdpr_applicable",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.BOOLEAN,
+            description="Indicates if GDPR regulations apply",
+            used_for=["privacy", "compliance"]
+        ),
+
+        "access_level": ColumnDefinition(
+            name="access_level",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.CATEGORICAL,
+            description="Required access level for data",
+            validation_rules={"allowed_values": ["Public", "Authenticated", "Authorized", "Admin"]},
+            used_for=["security", "access_control"]
+        ),
+
+        "compliance_tags": ColumnDefinition(
+            name="compliance_tags",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.STRING,
+            description="Compliance framework tags (GDPR, FERPA, etc.)",
+            used_for=["compliance", "data_governance"]
+        ),
+
+        "retention_period": ColumnDefinition(
+            name="retention_period",
+            category=ColumnCategory.DATA_CLASSIFICATION,
+            data_type=DataType.STRING,
+            description="Data retention period (e.g., '7 years', 'permanent')",
+            used_for=["compliance", "data_lifecycle"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA GOVERNANCE - TECHNICAL METADATA
+        # ═══════════════════════════════════════════════════════════════════
+
+        "source_table": ColumnDefinition(
+            name="source_table",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Source table name",
+            used_for=["data_lineage", "etl_documentation"]
+        ),
+
+        "source_tables": ColumnDefinition(
+            name="source_tables",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Multiple source table names",
+            used_for=["data_lineage", "etl_documentation"]
+        ),
+
+        "target_table": ColumnDefinition(
+            name="target_table",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Target table name",
+            used_for=["data_lineage", "etl_documentation"]
+        ),
+
+        "product_column": ColumnDefinition(
+            name="product_column",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Product/application column name",
+            used_for=["data_mapping", "integration"]
+        ),
+
+        "standardized_name": ColumnDefinition(
+            name="standardized_name",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Standardized column name across systems",
+            used_for=["data_standardization", "integration"]
+        ),
+
+        "sql_logic": ColumnDefinition(
+            name="sql_logic",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="SQL transformation logic",
+            used_for=["etl_documentation", "data_transformation"]
+        ),
+
+        "transformation_type": ColumnDefinition(
+            name="transformation_type",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.CATEGORICAL,
+            description="Type of data transformation applied",
+            validation_rules={"allowed_values": ["Direct", "Calculated", "Aggregated", "Derived", "Lookup"]},
+            used_for=["etl_documentation", "data_lineage"]
+        ),
+
+        "validation_rules": ColumnDefinition(
+            name="validation_rules",
+            category=ColumnCategory.TECHNICAL_METADATA,
+            data_type=DataType.STRING,
+            description="Data validation rules and constraints",
+            used_for=["data_quality", "validation"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA GOVERNANCE - BUSINESS METADATA
+        # ═══════════════════════════════════════════════════════════════════
+
+        "business_rule": ColumnDefinition(
+            name="business_rule",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="Business rule definition",
+            used_for=["business_logic", "documentation"]
+        ),
+
+        "business_rules": ColumnDefinition(
+            name="business_rules",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="Multiple business rules",
+            used_for=["business_logic", "documentation"]
+        ),
+
+        "business_impact": ColumnDefinition(
+            name="business_impact",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.CATEGORICAL,
+            description="Business impact level",
+            validation_rules={"allowed_values": ["Critical", "High", "Medium", "Low"]},
+            used_for=["impact_analysis", "prioritization"]
+        ),
+
+        "affected_dashboards": ColumnDefinition(
+            name="affected_dashboards",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="List of dashboards using this data",
+            used_for=["impact_analysis", "dependencies"]
+        ),
+
+        "affected_reports": ColumnDefinition(
+            name="affected_reports",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="List of reports using this data",
+            used_for=["impact_analysis", "dependencies"]
+        ),
+
+        "direct_downstream": ColumnDefinition(
+            name="direct_downstream",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="Direct downstream dependencies",
+            used_for=["dependency_tracking", "impact_analysis"]
+        ),
+
+        "indirect_downstream": ColumnDefinition(
+            name="indirect_downstream",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="Indirect downstream dependencies",
+            used_for=["dependency_tracking", "impact_analysis"]
+        ),
+
+        "ROI": ColumnDefinition(
+            name="ROI",
+            category=ColumnCategory.BUSINESS_METADATA,
+            data_type=DataType.STRING,
+            description="Return on investment metric",
+            used_for=["business_value", "prioritization"]
+        ),
+
+        # ═══════════════════════════════════════════════════════════════════
+        # DATA GOVERNANCE - PERFORMANCE & MONITORING
+        # ═══════════════════════════════════════════════════════════════════
+
+        "refresh_schedule": ColumnDefinition(
+            name="refresh_schedule",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.STRING,
+            description="Data refresh schedule (e.g., 'Daily 2AM', 'Hourly')",
+            used_for=["etl_scheduling", "data_freshness"]
+        ),
+
+        "last_run": ColumnDefinition(
+            name="last_run",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.DATE,
+            description="Last execution timestamp",
+            used_for=["monitoring", "job_tracking"]
+        ),
+
+        "next_run": ColumnDefinition(
+            name="next_run",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.DATE,
+            description="Next scheduled execution timestamp",
+            used_for=["scheduling", "planning"]
+        ),
+
+        "last_change": ColumnDefinition(
+            name="last_change",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.DATE,
+            description="Last modified timestamp",
+            used_for=["change_tracking", "audit"]
+        ),
+
+        "last_audit": ColumnDefinition(
+            name="last_audit",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.DATE,
+            description="Last audit timestamp",
+            used_for=["compliance", "audit_trail"]
+        ),
+
+        "last_check": ColumnDefinition(
+            name="last_check",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.DATE,
+            description="Last quality check timestamp",
+            used_for=["data_quality", "monitoring"]
+        ),
+
+        "change_frequency": ColumnDefinition(
+            name="change_frequency",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.STRING,
+            description="How often data changes (e.g., 'Daily', 'Weekly')",
+            used_for=["monitoring", "refresh_planning"]
+        ),
+
+        "job_name": ColumnDefinition(
+            name="job_name",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.STRING,
+            description="ETL job name",
+            used_for=["job_tracking", "monitoring"]
+        ),
+
+        "sla_status": ColumnDefinition(
+            name="sla_status",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.CATEGORICAL,
+            description="Service level agreement status",
+            validation_rules={"allowed_values": ["Met", "At Risk", "Breached", "N/A"]},
+            used_for=["sla_monitoring", "performance_tracking"]
+        ),
+
+        "success_rate": ColumnDefinition(
+            name="success_rate",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.PERCENTAGE,
+            description="Job success rate percentage",
+            validation_rules={"min": 0, "max": 100},
+            used_for=["reliability_monitoring", "quality_metrics"]
+        ),
+
+        "avg_query_time": ColumnDefinition(
+            name="avg_query_time",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.FLOAT,
+            description="Average query execution time (seconds)",
+            used_for=["performance_monitoring", "optimization"]
+        ),
+
+        "records_processed": ColumnDefinition(
+            name="records_processed",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.INTEGER,
+            description="Number of records processed in last run",
+            used_for=["volume_tracking", "monitoring"]
+        ),
+
+        "source_records": ColumnDefinition(
+            name="source_records",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.INTEGER,
+            description="Number of records in source",
+            used_for=["reconciliation", "data_quality"]
+        ),
+
+        "target_records": ColumnDefinition(
+            name="target_records",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.INTEGER,
+            description="Number of records in target",
+            used_for=["reconciliation", "data_quality"]
+        ),
+
+        "variance_pct": ColumnDefinition(
+            name="variance_pct",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.PERCENTAGE,
+            description="Variance percentage between source and target",
+            validation_rules={"min": 0},
+            used_for=["data_quality", "reconciliation"]
+        ),
+
+        "index_count": ColumnDefinition(
+            name="index_count",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.INTEGER,
+            description="Number of indexes on table",
+            used_for=["performance_optimization", "monitoring"]
+        ),
+
+        "storage_mb": ColumnDefinition(
+            name="storage_mb",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.FLOAT,
+            description="Storage size in megabytes",
+            used_for=["capacity_planning", "cost_management"]
+        ),
+
+        "growth_rate": ColumnDefinition(
+            name="growth_rate",
+            category=ColumnCategory.PERFORMANCE_MONITORING,
+            data_type=DataType.PERCENTAGE,
+            description="Data growth rate percentage",
+            used_for=["capacity_planning", "forecasting"]
+        ),
+    }
 
-    "direct_downstream": ColumnDefinition(
-        name="direct_downstream",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="Direct downstream dependencies",
-        used_for=["dependency_tracking", "impact_analysis"]
-    ),
 
-    "indirect_downstream": ColumnDefinition(
-        name="indirect_downstream",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="Indirect downstream dependencies",
-        used_for=["dependency_tracking", "impact_analysis"]
-    ),
+# ═════════════════════════════════════════════════════════════════════════════
+# COLUMN MAPPING & RESOLUTION SYSTEM
+# ═════════════════════════════════════════════════════════════════════════════
 
-    "ROI": ColumnDefinition(
-        name="ROI",
-        category=ColumnCategory.BUSINESS_METADATA,
-        data_type=DataType.STRING,
-        description="Return on investment metric",
-        used_for=["business_value", "prioritization"]
-    ),
+def build_alias_index(catalog: Dict[str, ColumnDefinition]) -> Dict[str, str]:
+    """
+    Build the lowercase name/alias -> canonical name index for a catalog
+
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
+
+    Returns:
+        Dict mapping every lowercased canonical name and alias to its canonical name
+    """
+    alias_to_canonical = {}
+    for canonical_name, col_def in catalog.items():
+        # Map canonical name to itself
+        alias_to_canonical[canonical_name.lower()] = canonical_name
+        # Map all aliases to canonical name
+        for alias in col_def.aliases:
+            alias_to_canonical[alias.lower()] = canonical_name
+    return alias_to_canonical
+
+
+def build_name_index(
+    catalog: Dict[str, ColumnDefinition],
+    key: Callable[[ColumnDefinition], Any]
+) -> Dict[Any, Tuple[str, ...]]:
+    """
+    Build an inverted index from a column attribute to the canonical names that have it
+
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
+        key: Function returning the attribute to index by (e.g. the category)
+
+    Returns:
+        Dict mapping each attribute value to a tuple of names, in catalog order
+    """
+    index = {}
+    for canonical_name, col_def in catalog.items():
+        index.setdefault(key(col_def), []).append(canonical_name)
+    return {value: tuple(names) for value, names in index.items()}
+
+
+def build_use_case_index(catalog: Dict[str, ColumnDefinition]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Build an inverted index from each used_for tag to the canonical names tagged with it
+
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
+
+    Returns:
+        Dict mapping each analysis type to a tuple of names, in catalog order
+    """
+    index = {}
+    for canonical_name, col_def in catalog.items():
+        for use in col_def.used_for:
+            index.setdefault(use, []).append(canonical_name)
+    return {use: tuple(names) for use, names in index.items()}
+
+
+NUMERIC_DATA_TYPES = (DataType.INTEGER, DataType.FLOAT, DataType.PERCENTAGE, DataType.CURRENCY)
+
+
+def build_range_rules(catalog: Dict[str, ColumnDefinition]) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """
+    Flatten the min/max rules of a catalog's numeric columns into parallel arrays
+
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
+
+    Returns:
+        (names, mins, maxs); a missing bound is -inf / +inf
+    """
+    names, mins, maxs = [], [], []
+    for canonical_name, col_def in catalog.items():
+        rules = col_def.validation_rules
+        if col_def.data_type in NUMERIC_DATA_TYPES and (rules.min is not None or rules.max is not None):
+            names.append(canonical_name)
+            mins.append(-np.inf if rules.min is None else rules.min)
+            maxs.append(np.inf if rules.max is None else rules.max)
+    return tuple(names), np.array(mins, dtype=np.float64), np.array(maxs, dtype=np.float64)
+
+
+def compile_validator(col_def: ColumnDefinition) -> Callable[[Any], bool]:
+    """
+    Build a single-value validator specialized on the rules a column actually has
+
+    Args:
+        col_def: Column definition
+
+    Returns:
+        Function value -> bool with the same semantics as ColumnMapper.validate_value
+    """
+    nullable = col_def.nullable
+    rules = col_def.validation_rules
+    allowed = rules.allowed_value_set
+    has_range = rules.min is not None or rules.max is not None
+    lo = -np.inf if rules.min is None else rules.min
+    hi = np.inf if rules.max is None else rules.max
+
+    if allowed and not has_range:
+        return lambda value: nullable if value is None else value in allowed
+    if has_range and not allowed:
+        return lambda value: nullable if value is None else not (value < lo or value > hi)
+    if not allowed and not has_range:
+        return lambda value: nullable if value is None else True
+
+    def validate(value: Any) -> bool:
+        if value is None:
+            return nullable
+        return not (value < lo or value > hi) and value in allowed
+    return validate
 
-    # ═══════════════════════════════════════════════════════════════════
-    # DATA GOVERNANCE - PERFORMANCE & MONITORING
-    # ═══════════════════════════════════════════════════════════════════
 
-    "refresh_schedule": ColumnDefinition(
-        name="refresh_schedule",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.STRING,
-        description="Data refresh schedule (e.g., 'Daily 2AM', 'Hourly')",
-        used_for=["etl_scheduling", "data_freshness"]
-    ),
+def build_validators(catalog: Dict[str, ColumnDefinition]) -> Dict[str, Callable[[Any], bool]]:
+    """Compile one validator per column of a catalog (canonical name -> validator)"""
+    return {canonical_name: compile_validator(col_def) for canonical_name, col_def in catalog.items()}
 
-    "last_run": ColumnDefinition(
-        name="last_run",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.DATE,
-        description="Last execution timestamp",
-        used_for=["monitoring", "job_tracking"]
-    ),
 
-    "next_run": ColumnDefinition(
-        name="next_run",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.DATE,
-        description="Next scheduled execution timestamp",
-        used_for=["scheduling", "planning"]
-    ),
+def build_categorical_dtypes(catalog: Dict[str, ColumnDefinition]) -> Dict[str, pd.CategoricalDtype]:
+    """
+    Build one unordered pandas CategoricalDtype per categorical column with allowed values
 
-    "last_change": ColumnDefinition(
-        name="last_change",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.DATE,
-        description="Last modified timestamp",
-        used_for=["change_tracking", "audit"]
-    ),
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
 
-    "last_audit": ColumnDefinition(
-        name="last_audit",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.DATE,
-        description="Last audit timestamp",
-        used_for=["compliance", "audit_trail"]
-    ),
+    Returns:
+        Dict of canonical name -> CategoricalDtype over the declared allowed values
+    """
+    return {
+        canonical_name: pd.CategoricalDtype(list(col_def.validation_rules.allowed_values), ordered=False)
+        for canonical_name, col_def in catalog.items()
+        if col_def.data_type == DataType.CATEGORICAL and col_def.validation_rules.allowed_values
+    }
 
-    "last_check": ColumnDefinition(
-        name="last_check",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.DATE,
-        description="Last quality check timestamp",
-        used_for=["data_quality", "monitoring"]
-    ),
 
-    "change_frequency": ColumnDefinition(
-        name="change_frequency",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.STRING,
-        description="How often data changes (e.g., 'Daily', 'Weekly')",
-        used_for=["monitoring", "refresh_planning"]
-    ),
+def build_catalog_frame(catalog: Dict[str, ColumnDefinition]) -> pd.DataFrame:
+    """
+    Build a one-row-per-column DataFrame of catalog metadata, indexed by canonical name
 
-    "job_name": ColumnDefinition(
-        name="job_name",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.STRING,
-        description="ETL job name",
-        used_for=["job_tracking", "monitoring"]
-    ),
+    Args:
+        catalog: Column catalog (canonical name -> ColumnDefinition)
 
-    "sla_status": ColumnDefinition(
-        name="sla_status",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.CATEGORICAL,
-        description="Service level agreement status",
-        validation_rules={"allowed_values": ["Met", "At Risk", "Breached", "N/A"]},
-        used_for=["sla_monitoring", "performance_tracking"]
-    ),
+    Returns:
+        DataFrame with category, data_type, nullable, n_aliases and n_tags columns
+    """
+    frame = pd.DataFrame({
+        'name': list(catalog),
+        'category': [col_def.category.value for col_def in catalog.values()],
+        'data_type': [col_def.data_type.value for col_def in catalog.values()],
+        'nullable': [col_def.nullable for col_def in catalog.values()],
+        'n_aliases': [len(col_def.aliases) for col_def in catalog.values()],
+        'n_tags': [len(col_def.used_for) for col_def in catalog.values()],
+    })
+    return frame.set_index('name')
 
-    "success_rate": ColumnDefinition(
-        name="success_rate",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.PERCENTAGE,
-        description="Job success rate percentage",
-        validation_rules={"min": 0, "max": 100},
-        used_for=["reliability_monitoring", "quality_metrics"]
-    ),
 
-    "avg_query_time": ColumnDefinition(
-        name="avg_query_time",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.FLOAT,
-        description="Average query execution time (seconds)",
-        used_for=["performance_monitoring", "optimization"]
-    ),
+# Catalog names and aliases are identifiers; this splits text into candidate tokens
+_IDENTIFIER_PATTERN = re.compile(r"[a-z0-9_]+")
 
-    "records_processed": ColumnDefinition(
-        name="records_processed",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.INTEGER,
-        description="Number of records processed in last run",
-        used_for=["volume_tracking", "monitoring"]
-    ),
 
-    "source_records": ColumnDefinition(
-        name="source_records",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.INTEGER,
-        description="Number of records in source",
-        used_for=["reconciliation", "data_quality"]
-    ),
+class AliasTextMatcher:
+    """
+    Find every known column name/alias inside a block of text in one pass
 
-    "target_records": ColumnDefinition(
-        name="target_records",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.INTEGER,
-        description="Number of records in target",
-        used_for=["reconciliation", "data_quality"]
-    ),
+    Catalog names and aliases are identifiers ([a-z0-9_]), so the lowercased text is
+    split into identifier tokens with one compiled regex and each token is looked up
+    in the alias index. Aliases only match as whole words: "id" is not found inside
+    "consider" or "student_id", and "paid" does not match "unpaid". Matching is
+    case-insensitive.
+    """
 
-    "variance_pct": ColumnDefinition(
-        name="variance_pct",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.PERCENTAGE,
-        description="Variance percentage between source and target",
-        validation_rules={"min": 0},
-        used_for=["data_quality", "reconciliation"]
-    ),
+    __slots__ = ("_alias_to_canonical",)
 
-    "index_count": ColumnDefinition(
-        name="index_count",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.INTEGER,
-        description="Number of indexes on table",
-        used_for=["performance_optimization", "monitoring"]
-    ),
+    def __init__(self, alias_to_canonical: Dict[str, str]):
+        """Build the matcher from a lowercase alias -> canonical name index"""
+        self._alias_to_canonical = alias_to_canonical
 
-    "storage_mb": ColumnDefinition(
-        name="storage_mb",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.FLOAT,
-        description="Storage size in megabytes",
-        used_for=["capacity_planning", "cost_management"]
-    ),
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Scan text for aliases
 
-    "growth_rate": ColumnDefinition(
-        name="growth_rate",
-        category=ColumnCategory.PERFORMANCE_MONITORING,
-        data_type=DataType.PERCENTAGE,
-        description="Data growth rate percentage",
-        used_for=["capacity_planning", "forecasting"]
-    ),
-}
+        Args:
+            text: Free text (schema dump, LLM column list, ...)
 
+        Returns:
+            List of (end_index, canonical_name) ordered by end index, where end_index
+            is the position of the last character of the matched alias
+        """
+        lookup = self._alias_to_canonical.get
+        hits = []
+        for match in _IDENTIFIER_PATTERN.finditer(text.lower()):
+            canonical = lookup(match.group())
+            if canonical is not None:
+                hits.append((match.end() - 1, canonical))
+        return hits
+
+
+# Column info layout, filled with str.format_map; the optional lines are appended only
+# when the definition has business logic / use cases
+COLUMN_INFO_TEMPLATE = (
+    "Column: {name}\n"
+    "Category: {category}\n"
+    "Data Type: {data_type}\n"
+    "Description: {description}\n"
+    "Aliases: {aliases}\n"
+    "Nullable: {nullable}"
+)
+COLUMN_INFO_BUSINESS_LOGIC_LINE = "\nBusiness Logic: {business_logic}"
+COLUMN_INFO_USED_FOR_LINE = "\nUsed For: {used_for}"
+
+
+@functools.lru_cache(maxsize=256)
+def format_column_info(col_def: ColumnDefinition) -> str:
+    """
+    Format a column definition for display (cached per definition, so every alias of a
+    column shares one formatted string)
+    """
+    template = COLUMN_INFO_TEMPLATE
+    if col_def.business_logic:
+        template += COLUMN_INFO_BUSINESS_LOGIC_LINE
+    if col_def.used_for:
+        template += COLUMN_INFO_USED_FOR_LINE
+    return template.format_map({
+        'name': col_def.name,
+        'category': col_def.category.value,
+        'data_type': col_def.data_type.value,
+        'description': col_def.description,
+        'aliases': ', '.join(col_def.aliases) if col_def.aliases else 'None',
+        'nullable': col_def.nullable,
+        'business_logic': col_def.business_logic,
+        'used_for': ', '.join(col_def.used_for),
+    }).strip()
 
-# ═════════════════════════════════════════════════════════════════════════════
-# COLUMN MAPPING & RESOLUTION SYSTEM
-# ═════════════════════════════════════════════════════════════════════════════
 
 class ColumnMapper:
     """Semantic column mapping and resolution system"""
 
     def __init__(self, catalog: Dict[str, ColumnDefinition] = None):
         """Initialize with column catalog"""
-        self.catalog = catalog or UNIVERSAL_COLUMNS_CATALOG
+        self.catalog = catalog or _lazy("UNIVERSAL_COLUMNS_CATALOG")
         self._build_alias_map()
 
     def _build_alias_map(self):
         """Build reverse mapping from aliases to canonical names"""
-        self.alias_to_canonical = {}
-        for canonical_name, col_def in self.catalog.items():
-            # Map canonical name to itself
-            self.alias_to_canonical[canonical_name] = canonical_name
-            # Map all aliases to canonical name
-            for alias in col_def.aliases:
-                self.alias_to_canonical[alias.lower()] = canonical_name
+        if self.catalog is _lazy("UNIVERSAL_COLUMNS_CATALOG"):
+            # The universal catalog's index is built once and shared (see _ALIAS_TO_CANONICAL)
+            self.alias_to_canonical = _lazy("_ALIAS_TO_CANONICAL")
+            self.validators = _lazy("_VALIDATORS")
+        else:
+            self.alias_to_canonical = build_alias_index(self.catalog)
+            self.validators = build_validators(self.catalog)
 
     def resolve(self, column_name: str) -> Optional[str]:
         """
@@ -1461,7 +1803,34 @@ class ColumnMapper:
         Returns:
             Canonical column name, or None if not found
         """
-        return self.alias_to_canonical.get(column_name.lower())
+        # Index keys are lowercase: try the name as given before paying for .lower()
+        return self.alias_to_canonical.get(column_name) or self.alias_to_canonical.get(column_name.lower())
+
+    def resolve_many(self, column_names: Iterable[str]) -> List[Optional[str]]:
+        """
+        Resolve many column names (or aliases) in one call
+
+        Args:
+            column_names: Column names or aliases to resolve
+
+        Returns:
+            Canonical name for each input, or None where it is not found
+        """
+        alias_to_canonical = self.alias_to_canonical
+        return [alias_to_canonical.get(name) or alias_to_canonical.get(name.lower()) for name in column_names]
+
+    def filter_known(self, column_names: Iterable[str]) -> List[str]:
+        """
+        Keep only the names (or aliases) that resolve to a catalog column
+
+        Args:
+            column_names: Column names or aliases
+
+        Returns:
+            The known names, unchanged and in input order
+        """
+        alias_to_canonical = self.alias_to_canonical
+        return [name for name in column_names if name in alias_to_canonical or name.lower() in alias_to_canonical]
 
     def get_definition(self, column_name: str) -> Optional[ColumnDefinition]:
         """
@@ -1488,6 +1857,8 @@ class ColumnMapper:
         Returns:
             List of ColumnDefinition objects
         """
+        if self.catalog is _lazy("UNIVERSAL_COLUMNS_CATALOG"):
+            return [self.catalog[name] for name in _lazy("_BY_CATEGORY").get(category, ())]
         return [col_def for col_def in self.catalog.values()
                 if col_def.category == category]
 
@@ -1501,6 +1872,8 @@ class ColumnMapper:
         Returns:
             List of canonical column names
         """
+        if self.catalog is _lazy("UNIVERSAL_COLUMNS_CATALOG"):
+            return list(_lazy("_BY_USE_CASE").get(analysis_type, ()))
         return [name for name, col_def in self.catalog.items()
                 if analysis_type in col_def.used_for]
 
@@ -1515,26 +1888,46 @@ class ColumnMapper:
         Returns:
             True if valid, False otherwise
         """
-        col_def = self.get_definition(column_name)
-        if not col_def:
+        canonical = self.resolve(column_name)
+        if not canonical:
             return False
+        return self.validators[canonical](value)
 
-        if value is None:
-            return col_def.nullable
+    def validate_series(self, column_name: str, values: Any) -> np.ndarray:
+        """
+        Validate a whole column of values against column validation rules at once
+
+        Args:
+            column_name: Column name or alias
+            values: pandas Series or array-like of values
 
+        Returns:
+            Boolean array, True where the value is valid (all False for unknown columns;
+            non-numeric values in a range-checked column are invalid)
+        """
+        values = pd.Series(values)
+        col_def = self.get_definition(column_name)
+        if not col_def:
+            return np.zeros(len(values), dtype=bool)
+
+        nulls = values.isna().to_numpy()
+        valid = np.ones(len(values), dtype=bool)
         rules = col_def.validation_rules
 
         # Check min/max for numeric types
-        if 'min' in rules and value < rules['min']:
-            return False
-        if 'max' in rules and value > rules['max']:
-            return False
+        if rules.min is not None or rules.max is not None:
+            numeric = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            valid &= ~np.isnan(numeric)
+            if rules.min is not None:
+                valid &= ~(numeric < rules.min)
+            if rules.max is not None:
+                valid &= ~(numeric > rules.max)
 
         # Check allowed values for categorical
-        if 'allowed_values' in rules and value not in rules['allowed_values']:
-            return False
+        if rules.allowed_value_set:
+            valid &= values.isin(rules.allowed_values).to_numpy()
 
-        return True
+        return np.where(nulls, col_def.nullable, valid)
 
     def get_column_info(self, column_name: str) -> str:
         """
@@ -1549,21 +1942,68 @@ class ColumnMapper:
         col_def = self.get_definition(column_name)
         if not col_def:
             return f"Column '{column_name}' not found in catalog"
+        return format_column_info(col_def)
 
-        info = f"""
-Column: {col_def.name}
-Category: {col_def.category.value}
-Data Type: {col_def.data_type.value}
-Description: {col_def.description}
-Aliases: {', '.join(col_def.aliases) if col_def.aliases else 'None'}
-Nullable: {col_def.nullable}
-"""
-        if col_def.business_logic:
-            info += f"Business Logic: {col_def.business_logic}\n"
-        if col_def.used_for:
-            info += f"Used For: {', '.join(col_def.used_for)}\n"
 
-        return info.strip()
+# ═════════════════════════════════════════════════════════════════════════════
+# LAZY CATALOG & INDEXES
+# ═════════════════════════════════════════════════════════════════════════════
+
+# The catalog and its read-only indexes are built on first access (PEP 562 module
+# __getattr__) and then stored as ordinary module globals, so importing the module
+# for its enums or column groups does not construct the ~140 definitions:
+# - _ALIAS_TO_CANONICAL: lowercase name/alias -> canonical name (single dict lookup)
+# - _BY_CATEGORY / _BY_DTYPE: category / data type -> names, in catalog order
+# - _BY_USE_CASE: used_for tag (analysis type) -> names, in catalog order
+# - _SORTED_ALIASES: every lowercase name/alias, sorted, for bisect prefix search
+# - _RANGE_RULES: (names, mins, maxs) of numeric columns with min/max rules, as flat
+#   arrays so a whole frame is range-checked with one broadcast comparison
+# - _VALIDATORS: canonical name -> validator compiled for that column's rules
+# - _CATEGORICAL_DTYPES: categorical column -> CategoricalDtype over its allowed values
+# - CATALOG_DF: catalog metadata as a DataFrame indexed by canonical name, for merge-based
+#   annotation of column lists (shared between callers, so treat it as read-only)
+# - _ALIAS_MATCHER: AliasTextMatcher over every name/alias, for scanning free text
+_LAZY_ATTRIBUTES: Dict[str, Callable[[], Any]] = {
+    "UNIVERSAL_COLUMNS_CATALOG": lambda: _build_catalog(),
+    "_ALIAS_TO_CANONICAL": lambda: MappingProxyType(
+        build_alias_index(_lazy("UNIVERSAL_COLUMNS_CATALOG"))
+    ),
+    "_BY_CATEGORY": lambda: MappingProxyType(
+        build_name_index(_lazy("UNIVERSAL_COLUMNS_CATALOG"), lambda col_def: col_def.category)
+    ),
+    "_BY_DTYPE": lambda: MappingProxyType(
+        build_name_index(_lazy("UNIVERSAL_COLUMNS_CATALOG"), lambda col_def: col_def.data_type)
+    ),
+    "_BY_USE_CASE": lambda: MappingProxyType(
+        build_use_case_index(_lazy("UNIVERSAL_COLUMNS_CATALOG"))
+    ),
+    "_SORTED_ALIASES": lambda: tuple(sorted(_lazy("_ALIAS_TO_CANONICAL"))),
+    "_RANGE_RULES": lambda: build_range_rules(_lazy("UNIVERSAL_COLUMNS_CATALOG")),
+    "_VALIDATORS": lambda: MappingProxyType(build_validators(_lazy("UNIVERSAL_COLUMNS_CATALOG"))),
+    "_CATEGORICAL_DTYPES": lambda: MappingProxyType(
+        build_categorical_dtypes(_lazy("UNIVERSAL_COLUMNS_CATALOG"))
+    ),
+    "CATALOG_DF": lambda: build_catalog_frame(_lazy("UNIVERSAL_COLUMNS_CATALOG")),
+    "_ALIAS_MATCHER": lambda: AliasTextMatcher(_lazy("_ALIAS_TO_CANONICAL")),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build a lazy module attribute on first access and cache it in the module globals"""
+    builder = _LAZY_ATTRIBUTES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Module-internal access to a lazy attribute (bare global lookups bypass __getattr__)"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -1616,31 +2056,295 @@ COLUMN_GROUPS = {
     ],
 }
 
+# Read-only views of COLUMN_GROUPS: tuples for ordered access, frozensets for membership tests
+_COLUMN_GROUP_TUPLES: Dict[str, Tuple[str, ...]] = {group: tuple(cols) for group, cols in COLUMN_GROUPS.items()}
+_COLUMN_GROUP_SETS: Dict[str, frozenset] = {group: frozenset(cols) for group, cols in COLUMN_GROUPS.items()}
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # UTILITY FUNCTIONS
 # ═════════════════════════════════════════════════════════════════════════════
 
+_DEFAULT_MAPPER: Optional[ColumnMapper] = None
+
+
 def get_mapper() -> ColumnMapper:
-    """Get a configured ColumnMapper instance"""
-    return ColumnMapper(UNIVERSAL_COLUMNS_CATALOG)
+    """
+    Get the shared ColumnMapper for the universal catalog.
+
+    The catalog is static, so its alias map is built once on first use and every
+    later call (including resolve_column and get_columns_by_category) reuses it.
+    """
+    global _DEFAULT_MAPPER
+    if _DEFAULT_MAPPER is None:
+        _DEFAULT_MAPPER = ColumnMapper(_lazy("UNIVERSAL_COLUMNS_CATALOG"))
+    return _DEFAULT_MAPPER
 
 
 def get_columns_by_category(category: ColumnCategory) -> List[str]:
     """Get list of column names in a category"""
-    mapper = get_mapper()
-    return [col_def.name for col_def in mapper.get_by_category(category)]
+    return list(_lazy("_BY_CATEGORY").get(category, ()))
+
+
+def get_columns_by_data_type(data_type: DataType) -> List[str]:
+    """Get list of column names with a data type"""
+    return list(_lazy("_BY_DTYPE").get(data_type, ()))
+
+
+def find_columns(
+    category: Optional[ColumnCategory] = None,
+    data_type: Optional[DataType] = None,
+    used_for: Optional[str] = None
+) -> List[str]:
+    """
+    Find the columns matching every given filter (e.g. all boolean columns used for risk analysis)
+
+    Each filter is answered from its inverted index, and the results are intersected by
+    walking the smallest one, so no filter scans the catalog.
+
+    Args:
+        category: Semantic category to match
+        data_type: Data type to match
+        used_for: Analysis type (used_for tag) to match
+
+    Returns:
+        Canonical names in catalog order (the whole catalog when no filter is given)
+    """
+    selections = []
+    if category is not None:
+        selections.append(_lazy("_BY_CATEGORY").get(category, ()))
+    if data_type is not None:
+        selections.append(_lazy("_BY_DTYPE").get(data_type, ()))
+    if used_for is not None:
+        selections.append(_lazy("_BY_USE_CASE").get(used_for, ()))
+    if not selections:
+        return list(_lazy("UNIVERSAL_COLUMNS_CATALOG"))
+
+    selections.sort(key=len)
+    others = [frozenset(names) for names in selections[1:]]
+    return [name for name in selections[0] if all(name in names for names in others)]
 
 
 def resolve_column(column_name: str) -> Optional[str]:
     """Quick resolve a column name to canonical form"""
-    mapper = get_mapper()
-    return mapper.resolve(column_name)
+    alias_to_canonical = _lazy("_ALIAS_TO_CANONICAL")
+    return alias_to_canonical.get(column_name) or alias_to_canonical.get(column_name.lower())
+
+
+def resolve_columns(column_names: Iterable[str]) -> List[Optional[str]]:
+    """
+    Resolve many column names to canonical form in one call
+
+    Args:
+        column_names: Column names or aliases (e.g. a DataFrame header)
+
+    Returns:
+        Canonical name for each input, or None where it is not in the catalog
+    """
+    alias_to_canonical = _lazy("_ALIAS_TO_CANONICAL")
+    return [alias_to_canonical.get(name) or alias_to_canonical.get(str(name).lower()) for name in column_names]
+
+
+def rename_to_canonical(df: Any) -> Any:
+    """
+    Rename a DataFrame's catalog columns to their canonical names
+
+    Columns that are not in the catalog keep their names. A column is left as is
+    when its canonical name is already taken by another column, so the result
+    never has duplicate column names.
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        New DataFrame with renamed columns
+    """
+    existing = set(df.columns)
+    rename_map = {}
+    for name, canonical in zip(df.columns, resolve_columns(df.columns)):
+        if canonical and canonical != name and canonical not in existing:
+            rename_map[name] = canonical
+            existing.add(canonical)
+    return df.rename(columns=rename_map)
+
+
+def count_out_of_range_values(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Count values outside the catalog min/max rules for every numeric catalog column in a frame
+
+    All checked columns are converted to one float block and compared against the
+    flattened bounds in a single broadcast, instead of validating value by value.
+    Non-numeric entries and nulls are not counted.
+
+    Args:
+        df: DataFrame with canonical column names
+
+    Returns:
+        Dict of column name -> number of out-of-range values (columns with none are omitted)
+    """
+    names, mins, maxs = _lazy("_RANGE_RULES")
+    positions = [i for i, name in enumerate(names) if name in df.columns]
+    if not positions or len(df) == 0:
+        return {}
+
+    checked = [names[i] for i in positions]
+    values = df[checked].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    out_of_range = ((values < mins[positions]) | (values > maxs[positions])).sum(axis=0)
+    return {name: int(count) for name, count in zip(checked, out_of_range) if count}
+
 
+def categorical_dtype_for(column_name: str) -> Optional[pd.CategoricalDtype]:
+    """
+    Get the precomputed CategoricalDtype of a categorical catalog column
 
-def get_column_group(group_name: str) -> List[str]:
-    """Get a predefined column group"""
-    return COLUMN_GROUPS.get(group_name, [])
+    Casting at load time stores the column as small integer codes instead of
+    Python strings, and every frame shares the same categories:
+
+        dtypes = {col: categorical_dtype_for(col) for col in df.columns}
+        df = df.astype({col: dtype for col, dtype in dtypes.items() if dtype is not None})
+
+    Values outside the allowed values become NaN in the cast, so run validation first
+    if those values need to be reported.
+
+    Args:
+        column_name: Canonical column name
+
+    Returns:
+        CategoricalDtype, or None if the column has no fixed set of allowed values
+    """
+    return _lazy("_CATEGORICAL_DTYPES").get(column_name)
+
+
+def find_columns_in_text(text: str) -> List[Tuple[int, str]]:
+    """
+    Find every catalog column mentioned in a block of text
+
+    Args:
+        text: Free text such as a raw schema or an LLM-generated column list
+
+    Returns:
+        List of (end_index, canonical_name) for each alias occurrence (whole-word match)
+    """
+    return _lazy("_ALIAS_MATCHER").find(text)
+
+
+def suggest_column_names(prefix: str, limit: int = 20) -> List[str]:
+    """
+    Suggest catalog names and aliases starting with a prefix (for autocomplete)
+
+    Args:
+        prefix: Typed prefix (case-insensitive)
+        limit: Maximum number of suggestions
+
+    Returns:
+        Matching lowercase names/aliases in alphabetical order
+    """
+    sorted_aliases = _lazy("_SORTED_ALIASES")
+    prefix = prefix.lower()
+    suggestions = []
+    # Matches form one contiguous run starting at the prefix's insertion point
+    for alias in sorted_aliases[bisect_left(sorted_aliases, prefix):]:
+        if not alias.startswith(prefix) or len(suggestions) >= limit:
+            break
+        suggestions.append(alias)
+    return suggestions
+
+
+def fuzzy_resolve_column(column_name: str, cutoff: float = 0.8) -> Optional[str]:
+    """
+    Resolve a column name to canonical form, tolerating small typos
+
+    Args:
+        column_name: Column name or alias, possibly misspelled
+        cutoff: Minimum similarity ratio (0-1) for a fuzzy match
+
+    Returns:
+        Canonical column name, or None if nothing is close enough
+    """
+    canonical = resolve_column(column_name)
+    if canonical:
+        return canonical
+    matches = difflib.get_close_matches(column_name.lower(), _lazy("_SORTED_ALIASES"), n=1, cutoff=cutoff)
+    return _lazy("_ALIAS_TO_CANONICAL")[matches[0]] if matches else None
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add every derivable catalog column that a frame is missing
+
+    A derived column is added when its source columns (canonical names) are present;
+    columns the frame already has are never overwritten.
+
+    Args:
+        df: DataFrame with canonical column names
+
+    Returns:
+        New DataFrame with the derived columns appended (the input frame is not modified)
+    """
+    derived = {}
+    for canonical_name, col_def in _lazy("UNIVERSAL_COLUMNS_CATALOG").items():
+        if col_def.derivation is None or canonical_name in df.columns:
+            continue
+        try:
+            derived[canonical_name] = col_def.derivation(df)
+        except KeyError:
+            continue  # a source column is missing
+    return df.assign(**derived) if derived else df
+
+
+def get_column_group(group_name: str) -> Tuple[str, ...]:
+    """Get a predefined column group (read-only tuple)"""
+    return _COLUMN_GROUP_TUPLES.get(group_name, ())
+
+
+def in_column_group(column_name: str, group_name: str) -> bool:
+    """Check whether a canonical column name belongs to a predefined column group"""
+    return column_name in _COLUMN_GROUP_SETS.get(group_name, frozenset())
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_dict() -> Dict[str, Dict[str, Any]]:
+    """
+    Plain-Python (JSON-ready) form of the universal catalog, built once
+
+    Enums become their string values and only the validation rules that are set
+    are included. The result is shared between callers, so treat it as read-only.
+
+    Returns:
+        Dict of canonical name -> column definition fields
+    """
+    catalog = {}
+    for canonical_name, col_def in _lazy("UNIVERSAL_COLUMNS_CATALOG").items():
+        rules = col_def.validation_rules
+        catalog[canonical_name] = {
+            "name": col_def.name,
+            "category": col_def.category.value,
+            "data_type": col_def.data_type.value,
+            "description": col_def.description,
+            "aliases": list(col_def.aliases),
+            "nullable": col_def.nullable,
+            "validation_rules": {
+                field: list(value) if isinstance(value, tuple) else value
+                for field, value in rules._asdict().items()
+                if field != "allowed_value_set" and value is not None and value != ()
+            },
+            "business_logic": col_def.business_logic,
+            "used_for": list(col_def.used_for),
+        }
+    return catalog
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_json_bytes() -> bytes:
+    """
+    UTF-8 JSON snapshot of the universal catalog, serialized once (orjson when installed)
+
+    Returns:
+        JSON bytes of catalog_dict()
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(catalog_dict())
+    return json.dumps(catalog_dict(), ensure_ascii=False).encode("utf-8")
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -1679,5 +2383,5 @@ if __name__ == "__main__":
     print(mapper.get_column_info('cumulative_gpa'))
 
     print("\n" + "=" * 80)
-    print(f"Total columns in catalog: {len(UNIVERSAL_COLUMNS_CATALOG)}")
+    print(f"Total columns in catalog: {len(_lazy('UNIVERSAL_COLUMNS_CATALOG'))}")
     print("=" * 80)
@@ -15,10 +15,285 @@ Usage from any tab:
 """
 
 import streamlit as st
+import numpy as np
+import pandas as pd
 from context_builder import build_universal_context
-from llm_multi_caller import generate_with_llm
-from typing import Dict, Any, Optional
+from llm_multi_caller import generate_with_llm, resolve_num_ctx, warm_up_model
+from configs import SECTIONS_REGISTRY
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+import hashlib
 import importlib
+import io
+import json
+import threading
+import time
+import weakref
+
+# Optional: orjson for faster cache key canonicalization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: xxhash for faster DataFrame fingerprints (falls back to blake2b)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# Context configuration used when a tab does not pass config_overrides
+DEFAULT_CONTEXT_CONFIG = {
+    'enable_layers': ['all'],
+    'domain': 'auto',
+    'depth': 'standard'
+}
+
+# Tabs generated concurrently by generate_many_tab_insights (each tab already runs its
+# sections on up to 5 threads, so this multiplies the load on the Ollama server)
+TAB_GENERATION_WORKERS = 2
+
+# Built contexts kept in session state (one per dataset/context config combination)
+CONTEXT_CACHE_MAX_ENTRIES = 8
+
+# Generated tab results kept in session state, and how long they stay valid
+INSIGHTS_CACHE_MAX_ENTRIES = 32
+INSIGHTS_CACHE_TTL_SECONDS = 1800
+
+# Sections answered per LLM call (see llm_multi_caller.execute_batched)
+SECTION_BATCH_SIZE = 3
+
+# How often a tab generating in the background checks whether its result is ready
+BACKGROUND_POLL_SECONDS = 2
+
+# Shared by all sessions; background generations outlive the script run that started them
+_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=TAB_GENERATION_WORKERS, thread_name_prefix='tab-insights')
+
+
+# ============================================================================
+# TAB CONFIGURATION
+# ============================================================================
+
+@functools.lru_cache(maxsize=32)
+def load_sections_config(tab_name: str) -> list:
+    """
+    Load the sections configuration of a tab, once per process.
+
+    Built-in tabs come from configs.SECTIONS_REGISTRY; other tabs are imported from
+    configs/<tab_name>_config.py.
+
+    Args:
+        tab_name: Name of tab config
+
+    Returns:
+        The <TAB_NAME>_SECTIONS list
+
+    Raises:
+        ImportError / AttributeError if the config module or variable does not exist
+    """
+    if tab_name in SECTIONS_REGISTRY:
+        return SECTIONS_REGISTRY[tab_name]
+
+    config_module = importlib.import_module(f'configs.{tab_name}_config')
+    return getattr(config_module, f'{tab_name.upper()}_SECTIONS')
+
+
+# ============================================================================
+# CACHES
+# ============================================================================
+
+class BoundedCache:
+    """
+    Size- and age-bounded mapping for session state caches.
+
+    Holds at most maxsize entries (the least recently used one is evicted first) and
+    treats entries older than ttl seconds as missing, so long sessions keep a fixed
+    memory envelope.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, value), least recently used first
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            return False
+        return True
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return self._entries[key][1]
+
+    def __setitem__(self, key, value):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+def get_insights_cache() -> BoundedCache:
+    """Session cache of generated tab results (see build_insights_cache_key)"""
+    return st.session_state.setdefault(
+        'tab_insights_cache', BoundedCache(INSIGHTS_CACHE_MAX_ENTRIES, INSIGHTS_CACHE_TTL_SECONDS)
+    )
+
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def compute_dataframe_fingerprint(df) -> str:
+    """
+    Content fingerprint of a DataFrame (values, index and column names).
+
+    Unlike a tab-name key, the fingerprint changes whenever the data changes, so a cached
+    result is never served for a different dataset.
+
+    Hashing reads the whole frame, so the fingerprint of the active DataFrame is kept in
+    session state behind a weak reference and reused on every rerun until the frame is
+    replaced (frames are not modified in place once loaded).
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        Hex digest string
+    """
+    cached = st.session_state.get('dataframe_fingerprint')
+    if cached is not None and cached[0]() is df:
+        return cached[1]
+
+    fingerprint = hash_dataframe(df)
+    st.session_state.dataframe_fingerprint = (weakref.ref(df), fingerprint)
+    return fingerprint
+
+
+def _hash_column(column: pd.Series) -> np.ndarray:
+    """Row hashes of one column; values that cannot be hashed (lists, dicts) are hashed as str()"""
+    try:
+        return pd.util.hash_pandas_object(column, index=False).to_numpy()
+    except TypeError:
+        return pd.util.hash_pandas_object(column.astype(str), index=False).to_numpy()
+
+
+def hash_dataframe(df) -> str:
+    """
+    Compute the fingerprint of compute_dataframe_fingerprint() (uncached).
+
+    With xxhash installed, numeric, boolean and datetime columns are fed to xxh3 straight
+    from their buffers and only the other columns and the index go through
+    pd.util.hash_pandas_object. Otherwise the row hashes of the whole frame are digested
+    with blake2b.
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        Hex digest string
+    """
+    if not XXHASH_AVAILABLE:
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Some column holds unhashable values: hash column by column instead
+            digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+            for _, column in df.items():
+                digest.update(_hash_column(column).tobytes())
+        digest.update('|'.join(map(str, df.columns)).encode())
+        return digest.hexdigest()
+
+    digest = xxhash.xxh3_128()
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for _, column in df.items():
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufcmM':
+            digest.update(np.ascontiguousarray(column.to_numpy()).view(np.uint8))
+        else:
+            digest.update(_hash_column(column).tobytes())
+    digest.update('|'.join(f'{name}:{dtype}' for name, dtype in df.dtypes.items()).encode())
+    return digest.hexdigest()
+
+
+def canonical_json(obj: Any) -> str:
+    """Key-sorted JSON encoding of obj (for cache keys), using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True, default=str)
+
+
+def build_insights_cache_key(
+    tab_name: str,
+    df_fingerprint: str,
+    context_config: Dict[str, Any],
+    model: str
+) -> Tuple[str, str, str, str]:
+    """
+    Cache key for a tab's generated insights: tab, data, context configuration and model.
+
+    Args:
+        tab_name: Name of tab config
+        df_fingerprint: Result of compute_dataframe_fingerprint()
+        context_config: Context configuration passed to build_universal_context()
+        model: Ollama model name
+
+    Returns:
+        Hashable key for get_insights_cache()
+    """
+    return (tab_name, df_fingerprint, canonical_json(context_config), model)
+
+
+def get_universal_context(
+    df,
+    context_config: Dict[str, Any],
+    df_fingerprint: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    build_universal_context() output, cached in session state per dataset and context config.
+
+    Every tab of a session analyses the same DataFrame, so the context is built once and
+    shared instead of being rebuilt for each tab. The cache keeps the most recent
+    CONTEXT_CACHE_MAX_ENTRIES contexts.
+
+    Args:
+        df: pandas DataFrame with data
+        context_config: Context configuration
+        df_fingerprint: compute_dataframe_fingerprint(df), if already known
+
+    Returns:
+        Context dictionary (shared; treat as read-only)
+    """
+    if df_fingerprint is None:
+        df_fingerprint = compute_dataframe_fingerprint(df)
+    cache_key = (df_fingerprint, canonical_json(context_config))
+
+    context_cache = st.session_state.setdefault(
+        'universal_context_cache', BoundedCache(CONTEXT_CACHE_MAX_ENTRIES, INSIGHTS_CACHE_TTL_SECONDS)
+    )
+    if cache_key in context_cache:
+        return context_cache[cache_key]
+
+    context = build_universal_context(df, config=context_config)
+    context_cache[cache_key] = context
+    return context
 
 
 # ============================================================================
@@ -31,7 +306,9 @@ def generate_tab_insights(
     model: str,
     url: str,
     config_overrides: Optional[Dict[str, Any]] = None,
-    use_cache: bool = True
+    use_cache: bool = True,
+    placeholders: Optional[Dict[str, Any]] = None,
+    include_context: bool = False
 ) -> Dict[str, Any]:
     """
     Universal function to generate LLM-driven insights for ANY tab.
@@ -49,62 +326,288 @@ def generate_tab_insights(
         model: Ollama model name (e.g., 'llama3.1')
         url: Ollama server URL (e.g., 'http://localhost:11434')
         config_overrides: Optional dict to override context config
-        use_cache: Whether to use Streamlit session state cache
+        use_cache: Whether to use the session's bounded insights cache
+        placeholders: Optional Streamlit placeholders keyed by section name; responses
+            are streamed into them while they are generated
+        include_context: Whether to attach the full built context (large; for debugging)
 
     Returns:
         Dict containing:
             - sections: Dict of section results
             - metadata: Generation metadata
-            - context: The built context (for debugging)
+            - context_summary: The parts of the context shown by display_context_summary()
+            - context: The built context (only with include_context=True)
             - config_used: The configuration used
     """
 
-    # Check cache first
-    cache_key = f'{tab_name}_insights'
-    if use_cache and cache_key in st.session_state.llm_cache:
-        return st.session_state.llm_cache[cache_key]
+    context_config = config_overrides or DEFAULT_CONTEXT_CONFIG
+
+    # Check cache first (keyed on the data itself, not just the tab)
+    df_fingerprint = compute_dataframe_fingerprint(df)
+    cache_key = build_insights_cache_key(tab_name, df_fingerprint, context_config, model)
+    insights_cache = get_insights_cache()
+    if use_cache and cache_key in insights_cache:
+        result = insights_cache[cache_key]
+    else:
+        # Step 1: Build universal context (works with ANY dataset; shared between tabs)
+        context = get_universal_context(df, context_config, df_fingerprint)
+
+        # Steps 2-3: Load tab configuration and generate
+        result = generate_insights_from_context(context, tab_name, model, url, context_config, placeholders)
+        if result['config_used'] is None:
+            _report_missing_config(tab_name)
+        elif use_cache:
+            insights_cache[cache_key] = result
+
+    if include_context:
+        return {**result, 'context': get_universal_context(df, context_config, df_fingerprint)}
+    return result
+
+
+def generate_many_tab_insights(
+    df,
+    tab_names: List[str],
+    model: str,
+    url: str,
+    config_overrides: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    max_workers: int = TAB_GENERATION_WORKERS
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate insights for several tabs at once.
+
+    The context is built once and shared, and the tabs that are not cached yet are
+    generated concurrently instead of one after another.
 
-    # Step 1: Build universal context (works with ANY dataset)
-    context_config = config_overrides or {
-        'enable_layers': ['all'],
-        'domain': 'auto',
-        'depth': 'standard'
+    Args:
+        df: pandas DataFrame with data
+        tab_names: Names of tab configs
+        model: Ollama model name
+        url: Ollama server URL
+        config_overrides: Optional dict to override context config
+        use_cache: Whether to use Streamlit session state cache
+        max_workers: Number of tabs generated at the same time
+
+    Returns:
+        Dict mapping tab name to its result (same shape as generate_tab_insights)
+    """
+    context_config = config_overrides or DEFAULT_CONTEXT_CONFIG
+    df_fingerprint = compute_dataframe_fingerprint(df)
+    cache_keys = {
+        tab_name: build_insights_cache_key(tab_name, df_fingerprint, context_config, model)
+        for tab_name in tab_names
     }
 
-    context = build_universal_context(df, config=context_config)
+    results = {}
+    pending = []
+    insights_cache = get_insights_cache()
+    for tab_name in tab_names:
+        if use_cache and cache_keys[tab_name] in insights_cache:
+            results[tab_name] = insights_cache[cache_keys[tab_name]]
+        else:
+            pending.append(tab_name)
+
+    if pending:
+        context = get_universal_context(df, context_config, df_fingerprint)
+        # Worker threads only call Ollama; session state and UI are touched on this thread
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = {
+                tab_name: executor.submit(generate_insights_from_context, context, tab_name, model, url, context_config)
+                for tab_name in pending
+            }
+            for tab_name, future in futures.items():
+                result = future.result()
+                results[tab_name] = result
+                if result['config_used'] is None:
+                    _report_missing_config(tab_name)
+                elif use_cache:
+                    insights_cache[cache_keys[tab_name]] = result
+
+    return results
+
+
+# ============================================================================
+# BACKGROUND GENERATION
+# ============================================================================
+
+def get_inflight_generations() -> Dict[str, Any]:
+    """Futures of the tab generations running in the background, keyed by insights cache key"""
+    if 'inflight_tab_insights' not in st.session_state:
+        st.session_state.inflight_tab_insights = {}
+    return st.session_state.inflight_tab_insights
+
+
+def start_background_tab_insights(
+    df,
+    tab_name: str,
+    model: str,
+    url: str,
+    config_overrides: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Start generating a tab's insights without blocking the script run.
+
+    The context is built (or taken from the context cache) on the calling thread, and
+    only the LLM calls run in the background. Call collect_background_tab_insights() on
+    later reruns to move the finished result into the insights cache.
+
+    Args:
+        df: pandas DataFrame with data
+        tab_name: Name of tab config
+        model: Ollama model name
+        url: Ollama server URL
+        config_overrides: Optional dict to override context config
+
+    Returns:
+        The insights cache key the result will be stored under
+    """
+    context_config = config_overrides or DEFAULT_CONTEXT_CONFIG
+    df_fingerprint = compute_dataframe_fingerprint(df)
+    cache_key = build_insights_cache_key(tab_name, df_fingerprint, context_config, model)
+
+    inflight = get_inflight_generations()
+    if cache_key not in inflight and cache_key not in get_insights_cache():
+        context = get_universal_context(df, context_config, df_fingerprint)
+        inflight[cache_key] = _BACKGROUND_EXECUTOR.submit(
+            generate_insights_from_context, context, tab_name, model, url, context_config
+        )
+    return cache_key
+
+
+def collect_background_tab_insights(cache_key: str, tab_name: str) -> bool:
+    """
+    Move a finished background generation into the insights cache.
+
+    Args:
+        cache_key: Key returned by start_background_tab_insights()
+        tab_name: Name of tab config (for error reporting)
+
+    Returns:
+        True while the generation is still running
+    """
+    inflight = get_inflight_generations()
+    future = inflight.get(cache_key)
+    if future is None:
+        return False
+    if not future.done():
+        return True
+
+    del inflight[cache_key]
+    try:
+        result = future.result()
+    except Exception as e:
+        st.error(f"Error generating insights: {e}")
+        return False
+
+    if result['config_used'] is None:
+        _report_missing_config(tab_name)
+    else:
+        get_insights_cache()[cache_key] = result
+    return False
+
+
+def ensure_model_warm(model: str, url: str, num_ctx: int):
+    """
+    Load the model on the Ollama server in a background thread, once per session and
+    (url, model, num_ctx), so the first Generate click does not wait for the model to load.
+    num_ctx must match the generation's, or Ollama reloads the model for the first call.
+    """
+    if 'warmed_models' not in st.session_state:
+        st.session_state.warmed_models = set()
+    if (url, model, num_ctx) in st.session_state.warmed_models:
+        return
+
+    st.session_state.warmed_models.add((url, model, num_ctx))
+    threading.Thread(
+        target=warm_up_model, args=(model, url, num_ctx), daemon=True, name='ollama-warm-up'
+    ).start()
+
+
+def _report_missing_config(tab_name: str):
+    """Show where the configuration of a tab was expected"""
+    st.error(f"Configuration not found for tab: {tab_name}")
+    st.error(f"Expected file: configs/{tab_name}_config.py")
+    st.error(f"Expected variable: {tab_name.upper()}_SECTIONS")
 
-    # Step 2: Load tab-specific configuration
+
+def summarize_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lightweight handle on a built context: just what display_context_summary() reads.
+
+    Args:
+        context: Context from build_universal_context()
+
+    Returns:
+        Dict with 'intelligent_metrics' and 'layers_present'
+    """
+    return {
+        'intelligent_metrics': context.get('intelligent_metrics', {}),
+        'layers_present': [key for key in context if key.endswith('_discovery') or key == 'intelligent_metrics']
+    }
+
+
+def build_model_config(model: str, url: str, stream: bool) -> Dict[str, Any]:
+    """Model configuration passed to generate_with_llm() for a tab"""
+    return {
+        'model': model,
+        'url': url,
+        'enable_parallel': True,
+        'enable_coherence': True,
+        'batch_size': SECTION_BATCH_SIZE,
+        'stream': stream
+    }
+
+
+def generate_insights_from_context(
+    context: Dict[str, Any],
+    tab_name: str,
+    model: str,
+    url: str,
+    context_config: Dict[str, Any],
+    placeholders: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Load a tab's configuration and generate its sections from an already built context.
+
+    Does not touch Streamlit unless placeholders are given, so without them it can run
+    on worker threads.
+
+    Args:
+        context: Context from build_universal_context()
+        tab_name: Name of tab config
+        model: Ollama model name
+        url: Ollama server URL
+        context_config: Context configuration the context was built with
+        placeholders: Optional Streamlit placeholders to stream section responses into
+
+    Returns:
+        Result dict as returned by generate_tab_insights (config_used is None when the
+        tab configuration was not found)
+    """
     try:
-        # Dynamic import of tab configuration
-        config_module = importlib.import_module(f'configs.{tab_name}_config')
-        sections_config = getattr(config_module, f'{tab_name.upper()}_SECTIONS')
+        sections_config = load_sections_config(tab_name)
     except (ImportError, AttributeError) as e:
-        st.error(f"Configuration not found for tab: {tab_name}")
-        st.error(f"Expected file: configs/{tab_name}_config.py")
-        st.error(f"Expected variable: {tab_name.upper()}_SECTIONS")
         return {
             'sections': {},
             'metadata': {'error': str(e)},
-            'context': context,
+            'context_summary': summarize_context(context),
             'config_used': None
         }
 
     # Step 3: Generate with LLM
-    model_config = {
-        'model': model,
-        'url': url,
-        'enable_parallel': True,
-        'enable_coherence': True
-    }
+    model_config = build_model_config(model, url, stream=placeholders is not None)
 
+    # generate_with_llm writes each section's final prompt onto the section dicts; the loaded
+    # config is shared by every session (and the background pool), so hand it a private copy
     result = generate_with_llm(
         context=context,
-        sections_config=sections_config,
-        model_config=model_config
+        sections_config=copy.deepcopy(sections_config),
+        model_config=model_config,
+        placeholders=placeholders
     )
 
-    # Add context and config to result
-    result['context'] = context
+    # Add a context summary and the config to result (the full context stays in the context cache)
+    result['context_summary'] = summarize_context(context)
     result['config_used'] = {
         'tab_name': tab_name,
         'sections_count': len(sections_config),
@@ -112,10 +615,6 @@ def generate_tab_insights(
         'model_config': model_config
     }
 
-    # Cache result
-    if use_cache:
-        st.session_state.llm_cache[cache_key] = result
-
     return result
 
 
@@ -123,51 +622,59 @@ def generate_tab_insights(
 # DISPLAY HELPER FUNCTIONS
 # ============================================================================
 
+# Columns of the per-section quality table
+_QUALITY_COLS = ("Section", "Quality Score", "Valid", "Tokens", "Issues")
+
+
 def display_tab_insights(result: Dict[str, Any], sections_config: list):
     """
     Display tab insights in a standardized format.
 
+    All sections are rendered as one Markdown element, and their quality metrics as one
+    table, instead of several elements per section.
+
     Args:
         result: Result from generate_tab_insights()
         sections_config: The sections configuration used
     """
 
-    if 'error' in result.get('metadata', {}):
-        st.error(f"Generation failed: {result['metadata']['error']}")
+    metadata = result.get('metadata', {})
+    if 'error' in metadata:
+        st.error(f"Generation failed: {metadata['error']}")
         return
 
-    # Display each section
+    # Display all sections at once
+    section_results = result['sections']
+    buf = io.StringIO()
+    quality_rows = []
     for section in sections_config:
-        section_name = section['name']
-        section_result = result['sections'].get(section_name, {})
-
-        st.markdown(f"#### {section['title']}")
+        section_result = section_results.get(section['name'], {})
 
+        buf.write(f"#### {section['title']}\n\n")
         if section_result.get('success'):
-            # Display content
-            st.markdown(section_result['response'])
+            buf.write(section_result['response'])
 
-            # Show validation info in expander
-            validation = section_result.get('validation', {})
+            validation = section_result.get('validation')
             if validation:
-                with st.expander("📊 Quality Metrics", expanded=False):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Quality Score", f"{validation['score']}/100")
-                    with col2:
-                        st.metric("Valid", "✅" if validation['valid'] else "❌")
-                    with col3:
-                        st.metric("Tokens", section_result.get('tokens', 0))
-
-                    if validation.get('issues'):
-                        st.caption(f"Issues: {', '.join(validation['issues'])}")
+                quality_rows.append((
+                    section['title'],
+                    f"{validation['score']}/100",
+                    "✅" if validation['valid'] else "❌",
+                    section_result.get('tokens', 0),
+                    ", ".join(validation.get('issues', ()))
+                ))
         else:
-            st.error(f"❌ Failed: {section_result.get('error', 'Unknown error')}")
+            buf.write(f"❌ **Failed:** {section_result.get('error', 'Unknown error')}")
+        buf.write("\n\n---\n\n")
+
+    st.markdown(buf.getvalue())
 
-        st.divider()
+    # Show validation info in expander
+    if quality_rows:
+        with st.expander("📊 Quality Metrics", expanded=False):
+            st.dataframe(pd.DataFrame(quality_rows, columns=_QUALITY_COLS), hide_index=True, width="stretch")
 
     # Display metadata
-    metadata = result.get('metadata', {})
     if metadata:
         with st.expander("⚙️ Generation Metadata", expanded=False):
             col1, col2, col3, col4 = st.columns(4)
@@ -188,7 +695,7 @@ def display_context_summary(context: Dict[str, Any]):
     Display a summary of the built context for debugging/transparency.
 
     Args:
-        context: Context from build_universal_context()
+        context: Context from build_universal_context(), or its summarize_context() summary
     """
 
     st.markdown("### 🔍 Context Analysis Summary")
@@ -207,7 +714,7 @@ def display_context_summary(context: Dict[str, Any]):
 
     # Show layers enabled
     st.caption("**Enabled Layers:**")
-    layers_present = [key for key in context.keys() if key.endswith('_discovery') or key == 'intelligent_metrics']
+    layers_present = context.get('layers_present') or summarize_context(context)['layers_present']
     st.caption(", ".join([layer.replace('_', ' ').title() for layer in layers_present]))
 
     # Show sample calculated metrics
@@ -233,7 +740,8 @@ def create_llm_driven_tab(
     model: str,
     url: str,
     ollama_connected: bool,
-    show_context_summary: bool = False
+    show_context_summary: bool = False,
+    run_in_background: bool = False
 ):
     """
     Complete ready-to-use tab implementation.
@@ -250,6 +758,8 @@ def create_llm_driven_tab(
         url: Ollama server URL
         ollama_connected: Whether Ollama is connected
         show_context_summary: Whether to show context analysis summary
+        run_in_background: Generate without blocking the page (sections are shown once
+            all of them are done, instead of being streamed)
     """
 
     st.header(tab_title)
@@ -259,31 +769,67 @@ def create_llm_driven_tab(
         st.warning("⚠️ Connect to Ollama to enable AI-driven insights")
         return
 
+    # Preload the model with the context window the Generate button will use
+    try:
+        tab_sections = load_sections_config(tab_name)
+    except (ImportError, AttributeError):
+        tab_sections = []
+    streaming = bool(tab_sections) and not run_in_background
+    ensure_model_warm(
+        model, url, resolve_num_ctx(tab_sections, build_model_config(model, url, streaming), streaming)
+    )
+
+    cache_key = build_insights_cache_key(tab_name, compute_dataframe_fingerprint(df), DEFAULT_CONTEXT_CONFIG, model)
+
     # Generate button
-    if st.button(f"🤖 {button_text}", key=f"{tab_name}_generate", type="primary"):
+    clicked = st.button(f"🤖 {button_text}", key=f"{tab_name}_generate", type="primary")
+    if clicked and run_in_background:
+        start_background_tab_insights(df=df, tab_name=tab_name, model=model, url=url)
+    elif clicked:
         with st.spinner("🔄 Analyzing data and generating insights..."):
+            # Stream each section into its own placeholder while it is generated
+            progress = st.empty()
+            placeholders = None
+            if tab_sections:
+                placeholders = {}
+                with progress.container():
+                    for section in tab_sections:
+                        st.markdown(f"#### {section['title']}")
+                        placeholders[section['name']] = st.empty()
+
             # Generate insights
             result = generate_tab_insights(
                 df=df,
                 tab_name=tab_name,
                 model=model,
-                url=url
+                url=url,
+                placeholders=placeholders
             )
+            progress.empty()  # the finished sections are rendered from the cache below
 
             # Show context summary if requested
-            if show_context_summary and 'context' in result:
-                display_context_summary(result['context'])
+            if show_context_summary and 'context_summary' in result:
+                display_context_summary(result['context_summary'])
                 st.divider()
 
-    # Display cached results if available
-    cache_key = f'{tab_name}_insights'
-    if cache_key in st.session_state.llm_cache:
-        result = st.session_state.llm_cache[cache_key]
+    # Poll a background generation; the page stays usable while it runs
+    if collect_background_tab_insights(cache_key, tab_name):
+        @st.fragment(run_every=BACKGROUND_POLL_SECONDS)
+        def _poll_background_generation():
+            future = get_inflight_generations().get(cache_key)
+            if future is None or future.done():
+                st.rerun()
+            st.info("🔄 Generating insights in the background...")
+
+        _poll_background_generation()
+
+    # Display cached results for the current data if available
+    result = get_insights_cache().get(cache_key)
+    if result is not None:
 
         # Load config to get sections
         try:
-            config_module = importlib.import_module(f'configs.{tab_name}_config')
-            sections_config = getattr(config_module, f'{tab_name.upper()}_SECTIONS')
+            sections_config = load_sections_config(tab_name)
 
             display_tab_insights(result, sections_config)
         except Exception as e: